@@ -0,0 +1,187 @@
+from abc import ABC
+from datetime import datetime
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.declarative import DeclarativeMeta
+
+
+class IAsyncRepository(ABC):
+    """
+    Base class for repositories backed by a SQLAlchemy AsyncSession.
+    Mirrors IRepository, with every database call awaited so that queries
+    do not block the event loop.
+    """
+
+    def __init__(
+        self,
+        urn: str = None,
+        user_urn: str = None,
+        api_name: str = None,
+        user_id: str = None,
+        model: DeclarativeMeta = None,
+        session: AsyncSession = None,
+    ) -> None:
+        self._urn = urn
+        self._user_urn = user_urn
+        self._api_name = api_name
+        self._user_id = user_id
+        self._logger = logger.bind(
+            urn=self._urn,
+            user_urn=self._user_urn,
+            api_name=self._api_name,
+            user_id=self._user_id,
+        )
+        self._model = model
+        self._session = session
+        if not self._session:
+            raise RuntimeError("DB session not found")
+
+    @property
+    def urn(self):
+        return self._urn
+
+    @urn.setter
+    def urn(self, value):
+        self._urn = value
+
+    @property
+    def user_urn(self):
+        return self._user_urn
+
+    @user_urn.setter
+    def user_urn(self, value):
+        self._user_urn = value
+
+    @property
+    def api_name(self):
+        return self._api_name
+
+    @api_name.setter
+    def api_name(self, value):
+        self._api_name = value
+
+    @property
+    def logger(self):
+        return self._logger
+
+    @logger.setter
+    def logger(self, value):
+        self._logger = value
+
+    @property
+    def user_id(self):
+        return self._user_id
+
+    @user_id.setter
+    def user_id(self, value):
+        self._user_id = value
+
+    @property
+    def model(self):
+        return self._model
+
+    @model.setter
+    def model(self, value):
+        self._model = value
+
+    @property
+    def session(self):
+        return self._session
+
+    @session.setter
+    def session(self, value):
+        if not isinstance(value, AsyncSession):
+            raise ValueError(
+                "session must be a SQLAlchemy AsyncSession instance"
+            )
+        self._session = value
+
+    async def create_record(
+        self,
+        record: DeclarativeMeta,
+        commit: bool = True,
+    ) -> DeclarativeMeta:
+        """
+        Add a record. With commit=False the record is only flushed, so that
+        further writes can join the same transaction before commit().
+        """
+        start_time = datetime.now()
+        self.session.add(record)
+        if commit:
+            await self.session.commit()
+        else:
+            await self.session.flush()
+
+        end_time = datetime.now()
+        execution_time = end_time - start_time
+        self.logger.info(f"Execution time: {execution_time} seconds")
+
+        return record
+
+    async def retrieve_record_by_id(
+        self,
+        id: str,
+        is_deleted: bool = False
+    ) -> DeclarativeMeta:
+        start_time = datetime.now()
+        record = await self.session.scalar(
+            select(self.model)
+            .where(self.model.id == id, self.model.is_deleted == is_deleted)
+            .limit(1)
+        )
+        end_time = datetime.now()
+        execution_time = end_time - start_time
+        self.logger.info(f"Execution time: {execution_time} seconds")
+
+        return record if record else None
+
+    async def retrieve_record_by_urn(
+        self,
+        urn: str,
+        is_deleted: bool = False,
+    ) -> DeclarativeMeta:
+
+        start_time = datetime.now()
+        record = await self.session.scalar(
+            select(self.model)
+            .where(self.model.urn == urn, self.model.is_deleted == is_deleted)
+            .limit(1)
+        )
+        end_time = datetime.now()
+        execution_time = end_time - start_time
+        self.logger.info(f"Execution time: {execution_time} seconds")
+
+        return record if record else None
+
+    async def update_record(
+        self,
+        id: str,
+        new_data: dict,
+    ) -> DeclarativeMeta:
+
+        start_time = datetime.now()
+        record = await self.session.scalar(
+            select(self.model)
+            .where(self.model.id == id)
+            .limit(1)
+        )
+
+        if not record:
+            raise ValueError(f"{self.model.__name__} with id {id} not found")
+
+        for attr, value in new_data.items():
+            setattr(record, attr, value)
+
+        await self.session.commit()
+        end_time = datetime.now()
+        execution_time = end_time - start_time
+        self.logger.info(f"Execution time: {execution_time} seconds")
+
+        return record
+
+    async def commit(self) -> None:
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class ICacheCodec(ABC):
+    """
+    Interface for codecs turning cached values into Redis payloads.
+    Implementations must read every format written during a rollout,
+    including the headerless JSON written before codecs were introduced.
+    """
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """
+        Serialize a value for the cache.
+        Args:
+            value (Any): JSON-compatible value.
+        Returns:
+            bytes: Payload to store.
+        """
+        pass
+
+    @abstractmethod
+    def decode(self, payload: bytes | str) -> Any:
+        """
+        Deserialize a cached payload.
+        Args:
+            payload (bytes | str): Payload read from the cache.
+        Returns:
+            Any: The cached value.
+        Raises:
+            ValueError: If the payload cannot be read.
+        """
+        pass
@@ -0,0 +1,57 @@
+from abc import ABC, abstractmethod
+
+from dtos.stores.rate_limit.result import RateLimitResultDTO
+
+
+class IRateLimitStore(ABC):
+    """
+    Interface for rate limit counter stores used by RateLimitMiddleware.
+    Implementations must make each check atomic for concurrent callers.
+    """
+
+    @abstractmethod
+    async def check_sliding_window(
+        self, key: str, limit: int, window: int
+    ) -> RateLimitResultDTO:
+        """
+        Record a request for `key` if it fits in the sliding window.
+        Args:
+            key (str): Unique identifier for the client/endpoint.
+            limit (int): Maximum allowed requests in the window.
+            window (int): Window size in seconds.
+        Returns:
+            RateLimitResultDTO: Decision with remaining quota.
+        """
+        pass
+
+    @abstractmethod
+    async def check_fixed_window(
+        self, key: str, limit: int, window: int
+    ) -> RateLimitResultDTO:
+        """
+        Count a request for `key` in the current fixed window. Only a
+        counter and the window start are kept per key.
+        Args:
+            key (str): Unique identifier for the client/endpoint.
+            limit (int): Maximum allowed requests in the window.
+            window (int): Window size in seconds.
+        Returns:
+            RateLimitResultDTO: Decision with remaining quota.
+        """
+        pass
+
+    @abstractmethod
+    async def check_token_bucket(
+        self, key: str, capacity: int, refill_rate: float
+    ) -> RateLimitResultDTO:
+        """
+        Take a token from the bucket for `key`. Only the token count and
+        the last refill time are kept per key.
+        Args:
+            key (str): Unique identifier for the client/endpoint.
+            capacity (int): Bucket size, i.e. the allowed burst.
+            refill_rate (float): Tokens added per second.
+        Returns:
+            RateLimitResultDTO: Decision with remaining tokens.
+        """
+        pass
@@ -0,0 +1,48 @@
+"""meal_daily_summary table
+
+Revision ID: 4d8b6f2e9a17
+Revises: e3a91c5d27b4
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4d8b6f2e9a17'
+down_revision: Union[str, Sequence[str], None] = 'e3a91c5d27b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'meal_daily_summary',
+        sa.Column('id', sa.BigInteger, primary_key=True),
+        sa.Column(
+            'user_id',
+            sa.BigInteger,
+            sa.ForeignKey('user.id'),
+            nullable=False,
+        ),
+        sa.Column('day', sa.Date, nullable=False),
+        sa.Column('meal_count', sa.Integer, nullable=False, default=0),
+        sa.Column('total_calories', sa.Float, nullable=False, default=0),
+        sa.Column('calories_unit', sa.String),
+        sa.Column('macros', sa.JSON, nullable=False),
+        sa.Column('micros', sa.JSON, nullable=False),
+        sa.Column('created_on', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_on', sa.DateTime(timezone=True)),
+        sa.UniqueConstraint(
+            'user_id', 'day', name='uq_meal_daily_summary_user_id_day'
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('meal_daily_summary')
@@ -0,0 +1,31 @@
+"""meal_name trigram index
+
+Revision ID: 7b2e4d9a1c3f
+Revises: 31c7fc3c6b39
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2e4d9a1c3f'
+down_revision: Union[str, Sequence[str], None] = '31c7fc3c6b39'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        """CREATE INDEX IF NOT EXISTS ix_meal_log_meal_name_trgm ON
+        "meal_log" USING gin (meal_name gin_trgm_ops)"""
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_meal_log_meal_name_trgm")
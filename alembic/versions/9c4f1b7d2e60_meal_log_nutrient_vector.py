@@ -0,0 +1,127 @@
+"""meal_log nutrient vector and nutrient lookup table
+
+Revision ID: 9c4f1b7d2e60
+Revises: 4d8b6f2e9a17
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4f1b7d2e60'
+down_revision: Union[str, Sequence[str], None] = '4d8b6f2e9a17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (id, name, unit, category); the id is the position + 1 in the vector.
+NUTRIENTS = [
+    (1, 'Protein', 'G', 'macros'),
+    (2, 'Total lipid (fat)', 'G', 'macros'),
+    (3, 'Carbohydrate, by difference', 'G', 'macros'),
+    (4, 'Vitamin C, total ascorbic acid', 'MG', 'micros'),
+    (5, 'Vitamin A, RAE', 'UG', 'micros'),
+    (6, 'Vitamin D (D2 + D3)', 'UG', 'micros'),
+    (7, 'Vitamin E (alpha-tocopherol)', 'MG', 'micros'),
+    (8, 'Vitamin K (phylloquinone)', 'UG', 'micros'),
+    (9, 'Thiamin', 'MG', 'micros'),
+    (10, 'Riboflavin', 'MG', 'micros'),
+    (11, 'Niacin', 'MG', 'micros'),
+    (12, 'Vitamin B-6', 'MG', 'micros'),
+    (13, 'Folate, total', 'UG', 'micros'),
+    (14, 'Vitamin B-12', 'UG', 'micros'),
+    (15, 'Calcium, Ca', 'MG', 'micros'),
+    (16, 'Phosphorus, P', 'MG', 'micros'),
+    (17, 'Potassium, K', 'MG', 'micros'),
+    (18, 'Sodium, Na', 'MG', 'micros'),
+    (19, 'Zinc, Zn', 'MG', 'micros'),
+    (20, 'Copper, Cu', 'MG', 'micros'),
+    (21, 'Selenium, Se', 'UG', 'micros'),
+    (22, 'Cholesterol', 'MG', 'micros'),
+    (23, 'Fiber, total dietary', 'G', 'micros'),
+    (24, 'Total Sugars', 'G', 'micros'),
+]
+
+# Micrograms per unit.
+MASS_UNITS = {'G': 1e6, 'MG': 1e3, 'UG': 1.0}
+
+
+def _amount_sql(name: str, unit: str) -> str:
+    """
+    SQL for one vector element: the nutrient's amount in `unit` from the
+    JSON lists, or 0 when it is not listed.
+    """
+    scale = " ".join(
+        f"WHEN '{source}' THEN {factor / MASS_UNITS[unit]!r}"
+        for source, factor in MASS_UNITS.items()
+    )
+    return (
+        "COALESCE((SELECT sum((e->>'amount')::float8 * "
+        f"CASE upper(COALESCE(e->>'unit', '{unit}')) {scale} END) "
+        "FROM (SELECT json_array_elements("
+        "COALESCE(nutrients->'macros', '[]'::json)) "
+        "UNION ALL SELECT json_array_elements("
+        "COALESCE(nutrients->'micros', '[]'::json))) AS listed(e) "
+        f"WHERE e->>'name' = '{name}'), 0)"
+    )
+
+
+def _category_sql(category: str) -> str:
+    """SQL rebuilding one JSON nutrient list from the vector."""
+    return (
+        "COALESCE((SELECT json_agg(json_build_object("
+        "'name', n.name, 'amount', v.amount, 'unit', n.unit) ORDER BY n.id) "
+        "FROM unnest(nutrient_vector) WITH ORDINALITY AS v(amount, id) "
+        "JOIN nutrient n ON n.id = v.id "
+        f"WHERE v.amount <> 0 AND n.category = '{category}'), '[]'::json)"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    nutrient = op.create_table(
+        'nutrient',
+        sa.Column('id', sa.SmallInteger, primary_key=True,
+                  autoincrement=False),
+        sa.Column('name', sa.String, nullable=False, unique=True),
+        sa.Column('unit', sa.String, nullable=False),
+        sa.Column('category', sa.String, nullable=False),
+    )
+    op.bulk_insert(
+        nutrient,
+        [
+            {'id': id, 'name': name, 'unit': unit, 'category': category}
+            for id, name, unit, category in NUTRIENTS
+        ],
+    )
+
+    op.add_column(
+        'meal_log',
+        sa.Column('nutrient_vector', sa.ARRAY(sa.Float)),
+    )
+    vector = ", ".join(
+        _amount_sql(name.replace("'", "''"), unit)
+        for _, name, unit, _ in NUTRIENTS
+    )
+    op.execute(
+        f"UPDATE meal_log SET nutrient_vector = ARRAY[{vector}] "
+        "WHERE nutrients IS NOT NULL"
+    )
+    op.drop_column('meal_log', 'nutrients')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('meal_log', sa.Column('nutrients', sa.JSON))
+    op.execute(
+        "UPDATE meal_log SET nutrients = json_build_object("
+        f"'macros', {_category_sql('macros')}, "
+        f"'micros', {_category_sql('micros')}) "
+        "WHERE nutrient_vector IS NOT NULL"
+    )
+    op.drop_column('meal_log', 'nutrient_vector')
+    op.drop_table('nutrient')
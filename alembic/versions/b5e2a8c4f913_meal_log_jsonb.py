@@ -0,0 +1,54 @@
+"""meal_log ingredients and instructions as JSONB, GIN index on ingredients
+
+Revision ID: b5e2a8c4f913
+Revises: 9c4f1b7d2e60
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e2a8c4f913'
+down_revision: Union[str, Sequence[str], None] = '9c4f1b7d2e60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS = ('ingredients', 'instructions')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in COLUMNS:
+        op.alter_column(
+            'meal_log',
+            column,
+            type_=postgresql.JSONB,
+            postgresql_using=f'{column}::jsonb',
+        )
+    # jsonb_path_ops indexes only containment (@>), which is what ingredient
+    # filters use, in a smaller and faster index than the default opclass.
+    op.create_index(
+        'ix_meal_log_ingredients',
+        'meal_log',
+        ['ingredients'],
+        postgresql_using='gin',
+        postgresql_ops={'ingredients': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_meal_log_ingredients', table_name='meal_log')
+    for column in COLUMNS:
+        op.alter_column(
+            'meal_log',
+            column,
+            type_=sa.JSON,
+            postgresql_using=f'{column}::json',
+        )
@@ -0,0 +1,35 @@
+"""meal_log (user_id, created_on) partial index
+
+Revision ID: e3a91c5d27b4
+Revises: 7b2e4d9a1c3f
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a91c5d27b4'
+down_revision: Union[str, Sequence[str], None] = '7b2e4d9a1c3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """CREATE INDEX IF NOT EXISTS ix_meal_log_user_id_created_on ON
+        "meal_log" (user_id, created_on) WHERE is_deleted = false"""
+    )
+    op.execute(
+        """CREATE INDEX IF NOT EXISTS ix_meal_log_created_on ON
+        "meal_log" (created_on)"""
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_meal_log_created_on")
+    op.execute("DROP INDEX IF EXISTS ix_meal_log_user_id_created_on")
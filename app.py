@@ -2,6 +2,7 @@
 Main FastAPI application entry point. Sets up middleware, routers,
 and configuration for the CalCount API.
 """
+import asyncio
 import os
 import uvicorn
 
@@ -10,9 +11,9 @@ from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 from http import HTTPStatus
 from loguru import logger
+from typing import Set
 
 from constants.default import Default
 from controllers.user import router as UserRouter
@@ -28,7 +29,21 @@ from middlewares.security_headers import (
 )
 from middlewares.request_context import RequestContextMiddleware
 
-app = FastAPI()
+from responses.dto import DTOResponse
+
+from start_utils import (
+    RATE_LIMIT_STORE,
+    async_redis_session,
+    usda_client,
+)
+
+from stores.rate_limit.memory_store import MemoryRateLimitStore
+from stores.rate_limit.redis_store import RedisRateLimitStore
+
+from utilities.meal_details_cache import MealDetailsCacheUtility
+from utilities.negative_cache import NegativeCacheUtility
+
+app = FastAPI(default_response_class=DTOResponse)
 
 load_dotenv()
 HOST = os.getenv("HOST")
@@ -57,6 +72,13 @@ RATE_LIMIT_BURST_LIMIT: int = int(
         Default.RATE_LIMIT_BURST_LIMIT,
     )
 )
+RATE_LIMIT_STRATEGIES: Set[str] = {
+    strategy.strip().lower()
+    for strategy in os.getenv(
+        "RATE_LIMIT_STRATEGIES",
+        Default.RATE_LIMIT_STRATEGIES,
+    ).split(",")
+}
 
 
 @app.exception_handler(RequestValidationError)
@@ -74,7 +96,7 @@ async def validation_exception_handler(request, exc):
         "responseKey": "error_bad_input",
         "errors": exc.errors(),
     }
-    return JSONResponse(
+    return DTOResponse(
         status_code=HTTPStatus.BAD_REQUEST,
         content=response_payload,
     )
@@ -111,10 +133,19 @@ rate_limit_config = RateLimitConfig(
     requests_per_minute=RATE_LIMIT_REQUESTS_PER_MINUTE,
     requests_per_hour=RATE_LIMIT_REQUESTS_PER_HOUR,
     burst_limit=RATE_LIMIT_BURST_LIMIT,
-    enable_sliding_window=True,
-    enable_token_bucket=False
+    enable_sliding_window="sliding_window" in RATE_LIMIT_STRATEGIES,
+    enable_token_bucket="token_bucket" in RATE_LIMIT_STRATEGIES,
+    enable_fixed_window="fixed_window" in RATE_LIMIT_STRATEGIES,
+)
+if RATE_LIMIT_STORE == "memory":
+    rate_limit_store = MemoryRateLimitStore()
+else:
+    rate_limit_store = RedisRateLimitStore(cache=async_redis_session)
+app.add_middleware(
+    RateLimitMiddleware,
+    config=rate_limit_config,
+    store=rate_limit_store,
 )
-app.add_middleware(RateLimitMiddleware, config=rate_limit_config)
 app.add_middleware(AuthenticationMiddleware)
 app.add_middleware(RequestContextMiddleware)
 logger.info("Initialised middleware stack")
@@ -133,6 +164,14 @@ async def on_startup():
     Application startup event handler.
     """
     logger.info("Application startup event triggered")
+    logger.info("Starting meal details cache invalidation listener")
+    app.state.meal_details_listener = asyncio.create_task(
+        MealDetailsCacheUtility.listen(async_redis_session)
+    )
+    logger.info("Starting negative cache stats reporter")
+    app.state.negative_cache_reporter = asyncio.create_task(
+        NegativeCacheUtility.report()
+    )
 
 
 @app.on_event("shutdown")
@@ -141,6 +180,26 @@ async def on_shutdown():
     Application shutdown event handler.
     """
     logger.info("Application shutdown event triggered")
+    logger.info("Stopping meal details cache invalidation listener")
+    app.state.meal_details_listener.cancel()
+    try:
+        await app.state.meal_details_listener
+    except asyncio.CancelledError:
+        pass
+    logger.info("Stopped meal details cache invalidation listener")
+    logger.info("Stopping negative cache stats reporter")
+    app.state.negative_cache_reporter.cancel()
+    try:
+        await app.state.negative_cache_reporter
+    except asyncio.CancelledError:
+        pass
+    logger.info("Stopped negative cache stats reporter")
+    logger.info("Closing USDA FoodData Central HTTP client")
+    await usda_client.aclose()
+    logger.info("Closed USDA FoodData Central HTTP client")
+    logger.info("Closing async Redis connection")
+    await async_redis_session.aclose()
+    logger.info("Closed async Redis connection")
 
 if __name__ == "__main__":
     uvicorn.run("app:app", host=HOST, port=PORT, reload=True)
@@ -0,0 +1,184 @@
+"""
+Benchmark of meal_log read and filter cost before and after the JSONB
+migration: JSON ingredients with name-keyed JSON nutrients, filtered in
+Python, versus JSONB ingredients behind a GIN index with a nutrient vector,
+filtered in SQL.
+
+Both layouts are loaded into temporary tables of the configured Postgres
+database, so nothing is written to meal_log.
+
+Usage:
+    python -m benchmarks.meal_log_jsonb [--rows N] [--repeat N]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import (
+    ARRAY,
+    BigInteger,
+    Column,
+    Float,
+    JSON,
+    MetaData,
+    Table,
+    select,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from start_utils import async_engine
+
+
+INGREDIENT: str = "Ingredient 42"
+MIN_PROTEIN: float = 30.0
+VOCABULARY: int = 500
+
+metadata = MetaData()
+before = Table(
+    "bench_meal_log_json",
+    metadata,
+    Column("id", BigInteger, primary_key=True),
+    Column("ingredients", JSON),
+    Column("nutrients", JSON),
+    prefixes=["TEMPORARY"],
+)
+after = Table(
+    "bench_meal_log_jsonb",
+    metadata,
+    Column("id", BigInteger, primary_key=True),
+    Column("ingredients", JSONB),
+    Column("nutrient_vector", ARRAY(Float)),
+    prefixes=["TEMPORARY"],
+)
+
+
+async def load(connection: AsyncConnection, rows: int) -> None:
+    """Create both tables with the same `rows` synthetic meals."""
+    await connection.run_sync(metadata.create_all)
+    await connection.execute(
+        text(
+            "INSERT INTO bench_meal_log_json (id, ingredients, nutrients) "
+            "SELECT g, "
+            "(SELECT json_agg(json_build_object("
+            "'name', 'Ingredient ' || ((g * 7 + k * 13) % :vocabulary), "
+            "'quantity_grams', 50, 'portionDescription', '1 cup', "
+            "'amount', 1, 'unit', 'CUP')) "
+            "FROM generate_series(1, 3 + g % 6) k), "
+            "json_build_object("
+            "'macros', json_build_array("
+            "json_build_object('name', 'Protein', "
+            "'amount', (g % 40)::float8, 'unit', 'G'), "
+            "json_build_object('name', 'Carbohydrate, by difference', "
+            "'amount', (g % 90)::float8, 'unit', 'G')), "
+            "'micros', json_build_array("
+            "json_build_object('name', 'Sodium, Na', "
+            "'amount', (g % 900)::float8, 'unit', 'MG'))) "
+            "FROM generate_series(1, :rows) g"
+        ),
+        {"rows": rows, "vocabulary": VOCABULARY},
+    )
+    await connection.execute(
+        text(
+            "INSERT INTO bench_meal_log_jsonb "
+            "(id, ingredients, nutrient_vector) "
+            "SELECT id, ingredients::jsonb, "
+            "ARRAY[(nutrients->'macros'->0->>'amount')::float8, 0, "
+            "(nutrients->'macros'->1->>'amount')::float8] "
+            "|| array_fill(0::float8, ARRAY[14]) "
+            "|| ARRAY[(nutrients->'micros'->0->>'amount')::float8] "
+            "|| array_fill(0::float8, ARRAY[6]) "
+            "FROM bench_meal_log_json"
+        )
+    )
+    await connection.execute(
+        text(
+            "CREATE INDEX ON bench_meal_log_jsonb "
+            "USING gin (ingredients jsonb_path_ops)"
+        )
+    )
+    await connection.execute(text("ANALYZE bench_meal_log_json"))
+    await connection.execute(text("ANALYZE bench_meal_log_jsonb"))
+
+
+async def read_before(connection: AsyncConnection) -> int:
+    result = await connection.execute(
+        select(before.c.ingredients, before.c.nutrients)
+    )
+    return len(result.all())
+
+
+async def read_after(connection: AsyncConnection) -> int:
+    result = await connection.execute(
+        select(after.c.ingredients, after.c.nutrient_vector)
+    )
+    return len(result.all())
+
+
+async def filter_before(connection: AsyncConnection) -> int:
+    """Fetch every meal and filter in Python, as without SQL filters."""
+    result = await connection.execute(
+        select(before.c.id, before.c.ingredients, before.c.nutrients)
+    )
+    matches = 0
+    for _, ingredients, nutrients in result:
+        if not any(item["name"] == INGREDIENT for item in ingredients):
+            continue
+        protein = next(
+            (
+                item["amount"] for item in nutrients["macros"]
+                if item["name"] == "Protein"
+            ),
+            0,
+        )
+        if protein >= MIN_PROTEIN:
+            matches += 1
+    return matches
+
+
+async def filter_after(connection: AsyncConnection) -> int:
+    """Filter in SQL, as AsyncMealLogRepository._filters does."""
+    result = await connection.execute(
+        select(after.c.id).where(
+            after.c.ingredients.contains([{"name": INGREDIENT}]),
+            after.c.nutrient_vector[1] >= MIN_PROTEIN,
+        )
+    )
+    return len(result.all())
+
+
+async def measure(connection: AsyncConnection, case, repeat: int):
+    """Return the median time of `case` in milliseconds and its result."""
+    value = await case(connection)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await case(connection)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), value
+
+
+async def main(rows: int, repeat: int) -> None:
+    async with async_engine.connect() as connection:
+        await load(connection, rows)
+        cases = {
+            "read JSON + JSON nutrients": read_before,
+            "read JSONB + nutrient vector": read_after,
+            "filter in Python (JSON)": filter_before,
+            "filter in SQL (JSONB + GIN)": filter_after,
+        }
+        for name, case in cases.items():
+            median, value = await measure(connection, case, repeat)
+            print(f"{name:<30} {median:9.1f} ms  ({value} rows)")
+        await connection.rollback()
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(rows=args.rows, repeat=args.repeat))
@@ -0,0 +1,123 @@
+"""
+Microbenchmark of per-request middleware overhead: four pass-through
+BaseHTTPMiddleware layers versus four equivalent pure ASGI layers, each
+setting one response header, in front of a trivial route.
+
+Requests are driven straight through the ASGI interface (no server, no
+HTTP client) so the numbers isolate the middleware cost.
+
+Usage:
+    python -m benchmarks.middleware_overhead [--requests N] [--layers N]
+"""
+import argparse
+import asyncio
+import time
+
+from fastapi import FastAPI, Request
+from starlette.datastructures import MutableHeaders
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class HeaderBaseHTTPMiddleware(BaseHTTPMiddleware):
+
+    async def dispatch(self, request: Request, call_next):
+        request.state.marker = True
+        response = await call_next(request)
+        response.headers["X-Benchmark"] = "1"
+        return response
+
+
+class HeaderASGIMiddleware:
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        scope.setdefault("state", {})["marker"] = True
+
+        async def send_with_header(message: Message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Benchmark"] = "1"
+            await send(message)
+
+        await self.app(scope, receive, send_with_header)
+
+
+def build_app(middleware_class: type = None, layers: int = 4) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    if middleware_class is not None:
+        for _ in range(layers):
+            app.add_middleware(middleware_class)
+    return app
+
+
+async def drive(app: ASGIApp, requests: int) -> float:
+    """
+    Send `requests` GET /ping requests through the app and return the mean
+    time per request in microseconds.
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"benchmark")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("benchmark", 80),
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        pass
+
+    for _ in range(min(requests, 500)):
+        await app(dict(scope), receive, send)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    elapsed = time.perf_counter() - start
+    return elapsed / requests * 1_000_000
+
+
+async def main(requests: int, layers: int) -> None:
+    results = {
+        "no middleware": await drive(build_app(), requests),
+        f"{layers} x BaseHTTPMiddleware": await drive(
+            build_app(HeaderBaseHTTPMiddleware, layers), requests
+        ),
+        f"{layers} x pure ASGI": await drive(
+            build_app(HeaderASGIMiddleware, layers), requests
+        ),
+    }
+    baseline = results["no middleware"]
+    for name, mean in results.items():
+        print(
+            f"{name:<28} {mean:8.1f} us/request "
+            f"(+{mean - baseline:6.1f} us middleware)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--layers", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(requests=args.requests, layers=args.layers))
@@ -45,4 +45,11 @@ class CacheConfiguration:
             host=self.config.get("host", {}),
             port=self.config.get("port", {}),
             password=self.config.get("password", {}),
+            single_flight=self.config.get("single_flight", {}),
+            instructions=self.config.get("instructions", {}),
+            session_state=self.config.get("session_state", {}),
+            meal_name_index=self.config.get("meal_name_index", {}),
+            meal_details=self.config.get("meal_details", {}),
+            codec=self.config.get("codec", {}),
+            negative=self.config.get("negative", {}),
         )
@@ -48,4 +48,16 @@ class DBConfiguration:
             port=self.config.get("port"),
             database=self.config.get("database"),
             connection_string=self.config.get("connection_string"),
+            async_connection_string=self.config.get(
+                "async_connection_string",
+                "postgresql+asyncpg://{user_name}:{password}@{host}:{port}"
+                "/{database}",
+            ),
+            pool_size=self.config.get("pool_size", 10),
+            max_overflow=self.config.get("max_overflow", 20),
+            sync_pool_size=self.config.get("sync_pool_size", 2),
+            sync_max_overflow=self.config.get("sync_max_overflow", 3),
+            pool_timeout=self.config.get("pool_timeout", 30),
+            pool_recycle=self.config.get("pool_recycle", 1800),
+            pool_pre_ping=self.config.get("pool_pre_ping", True),
         )
@@ -0,0 +1,40 @@
+import json
+
+from dtos.configurations.llm import LLMConfigurationDTO
+
+from start_utils import logger
+
+
+class LLMConfiguration:
+    """
+    Singleton loader and manager for LLM configuration.
+    Loads configuration from config/llm/config.json.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(LLMConfiguration, cls).__new__(cls)
+            cls._instance.config = {}
+            cls._instance.load_config()
+        return cls._instance
+
+    def load_config(self):
+        """
+        Load LLM configuration from JSON file.
+        Logs if the file is not found or cannot be decoded.
+        """
+        try:
+            with open("config/llm/config.json", "r") as file:
+                self.config = json.load(file)
+            logger.debug("LLM config loaded successfully.")
+        except FileNotFoundError:
+            logger.debug("LLM config file not found.")
+        except json.JSONDecodeError:
+            logger.debug("Error decoding LLM config file.")
+
+    def get_config(self):
+        """
+        Return the LLM configuration as a DTO.
+        """
+        return LLMConfigurationDTO(**self.config)
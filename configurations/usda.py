@@ -39,4 +39,13 @@ class USDAConfiguration:
         """
         return USDAConfigurationDTO(
             url=self.config.get("url"),
+            connect_timeout=self.config.get("connect_timeout", 3.0),
+            read_timeout=self.config.get("read_timeout", 10.0),
+            write_timeout=self.config.get("write_timeout", 5.0),
+            pool_timeout=self.config.get("pool_timeout", 2.0),
+            max_connections=self.config.get("max_connections", 20),
+            max_keepalive_connections=self.config.get(
+                "max_keepalive_connections", 10
+            ),
+            keepalive_expiry=self.config.get("keepalive_expiry", 30.0),
         )
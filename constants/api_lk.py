@@ -16,3 +16,5 @@ class APILK:
     ADD_MEAL: Final[str] = "ADD_MEAL"
     MEAL_HISTORY: Final[str] = "MEAL_HISTORY"
     MEAL_RECOMMENDATION: Final[str] = "MEAL_RECOMMENDATION"
+    MEAL_SUMMARY: Final[str] = "MEAL_SUMMARY"
+    MEAL_STATS: Final[str] = "MEAL_STATS"
@@ -6,3 +6,5 @@ class Table:
     USER: Final[str] = "user"
     PROFILE: Final[str] = "profile"
     MEAL_LOG: Final[str] = "meal_log"
+    MEAL_DAILY_SUMMARY: Final[str] = "meal_daily_summary"
+    NUTRIENT: Final[str] = "nutrient"
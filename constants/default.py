@@ -15,6 +15,17 @@ class Default:
     RATE_LIMIT_REQUESTS_PER_MINUTE: Final[int] = 60
     RATE_LIMIT_REQUESTS_PER_HOUR: Final[int] = 1000
     RATE_LIMIT_BURST_LIMIT: Final[int] = 10
+    RATE_LIMIT_STORE: Final[str] = "redis"
+    RATE_LIMIT_STRATEGIES: Final[str] = "sliding_window"
+    RATE_LIMIT_MEMORY_SHARDS: Final[int] = 16
+    RATE_LIMIT_MEMORY_MAX_KEYS: Final[int] = 100000
+    MEAL_HISTORY_PAGE_SIZE: Final[int] = 100
+    MEAL_HISTORY_MAX_PAGE_SIZE: Final[int] = 500
+    MEAL_HISTORY_STREAM_BATCH_SIZE: Final[int] = 200
+    MEAL_SUMMARY_MAX_DAYS: Final[int] = 366
+    MEAL_STATS_MAX_DAYS: Final[int] = 366
+    MEAL_STATS_WINDOW_DAYS: Final[int] = 7
+    MEAL_STATS_MAX_WINDOW_DAYS: Final[int] = 90
     SECURITY_CONFIGURATION: Final[Dict[str, Any]] = {
             "rate_limiting": {
                 "requests_per_minute": 60,
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 
 
 class Nutrients:
@@ -32,3 +32,41 @@ class Nutrients:
             "Fiber, total dietary",
             "Total Sugars"
         ]
+
+    # Position i of meal_log.nutrient_vector holds the amount of nutrient
+    # id i + 1 of the nutrient table. Append new nutrients only.
+    VECTOR: List[str] = MACROS_LIST + MICROS_LIST
+
+    UNITS: Dict[str, str] = {
+        "Protein": "G",
+        "Total lipid (fat)": "G",
+        "Carbohydrate, by difference": "G",
+        "Vitamin C, total ascorbic acid": "MG",
+        "Vitamin A, RAE": "UG",
+        "Vitamin D (D2 + D3)": "UG",
+        "Vitamin E (alpha-tocopherol)": "MG",
+        "Vitamin K (phylloquinone)": "UG",
+        "Thiamin": "MG",
+        "Riboflavin": "MG",
+        "Niacin": "MG",
+        "Vitamin B-6": "MG",
+        "Folate, total": "UG",
+        "Vitamin B-12": "UG",
+        "Calcium, Ca": "MG",
+        "Phosphorus, P": "MG",
+        "Potassium, K": "MG",
+        "Sodium, Na": "MG",
+        "Zinc, Zn": "MG",
+        "Copper, Cu": "MG",
+        "Selenium, Se": "UG",
+        "Cholesterol": "MG",
+        "Fiber, total dietary": "G",
+        "Total Sugars": "G",
+    }
+
+    # Micrograms per unit, to convert amounts to the unit in UNITS.
+    MASS_UNITS: Dict[str, float] = {
+        "G": 1e6,
+        "MG": 1e3,
+        "UG": 1.0,
+    }
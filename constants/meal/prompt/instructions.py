@@ -3,6 +3,10 @@ from typing import Final
 
 class MealInstructionsPrompt:
 
+    # Bump whenever INSTRUCTIONS_PROMPT changes so cached instructions
+    # generated from the previous prompt are no longer served.
+    VERSION: Final[str] = "1"
+
     INSTRUCTIONS_PROMPT: Final[str] = """
         You are a professional culinary assistant that generates detailed
         recipe instructions with precise ingredient specifications.
@@ -9,6 +9,8 @@ from controllers.apis.v1.meal.history import FetchMealHistoryController
 from controllers.apis.v1.meal.recommendation import (
     FetchMealRecommendationController
 )
+from controllers.apis.v1.meal.stats import FetchMealStatsController
+from controllers.apis.v1.meal.summary import FetchMealSummaryController
 
 from start_utils import logger
 
@@ -53,3 +55,21 @@ router.add_api_route(
     name=APILK.MEAL_RECOMMENDATION,
 )
 logger.debug(f"Registered {FetchMealRecommendationController.__name__} route.")
+
+logger.debug(f"Registering {FetchMealSummaryController.__name__} route.")
+router.add_api_route(
+    path="/summary",
+    endpoint=FetchMealSummaryController().get,
+    methods=[HTTPMethod.GET.value],
+    name=APILK.MEAL_SUMMARY,
+)
+logger.debug(f"Registered {FetchMealSummaryController.__name__} route.")
+
+logger.debug(f"Registering {FetchMealStatsController.__name__} route.")
+router.add_api_route(
+    path="/stats",
+    endpoint=FetchMealStatsController().get,
+    methods=[HTTPMethod.GET.value],
+    name=APILK.MEAL_STATS,
+)
+logger.debug(f"Registered {FetchMealStatsController.__name__} route.")
@@ -1,8 +1,9 @@
 from fastapi import Request, Depends
-from fastapi.responses import JSONResponse
 from http import HTTPStatus
+from httpx import AsyncClient
 from redis import Redis
-from sqlalchemy.orm import Session
+from redis.asyncio import Redis as AsyncRedis
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Callable
 
 from controllers.apis.v1.meal.abstraction import IV1MealAPIController
@@ -10,10 +11,16 @@ from controllers.apis.v1.meal.abstraction import IV1MealAPIController
 from constants.api_lk import APILK
 from constants.api_status import APIStatus
 
-from dependencies.cache import CacheDependency
-from dependencies.db import DBDependency
-from dependencies.repositiories.meal_log import MealLogRepositoryDependency
+from dependencies.cache import AsyncCacheDependency, CacheDependency
+from dependencies.db import AsyncDBDependency
+from dependencies.repositiories.async_meal_daily_summary import (
+    AsyncMealDailySummaryRepositoryDependency,
+)
+from dependencies.repositiories.async_meal_log import (
+    AsyncMealLogRepositoryDependency,
+)
 from dependencies.services.apis.v1.meal.add import AddMealServiceDependency
+from dependencies.usda import USDAClientDependency
 from dependencies.utilities.dictionary import DictionaryUtilityDependency
 
 from dtos.requests.apis.v1.meal.add import AddMealRequestDTO
@@ -23,7 +30,12 @@ from errors.bad_input_error import BadInputError
 from errors.not_found_error import NotFoundError
 from errors.unexpected_response_error import UnexpectedResponseError
 
-from repositories.meal_log import MealLogRepository
+from repositories.async_meal_daily_summary import (
+    AsyncMealDailySummaryRepository,
+)
+from repositories.async_meal_log import AsyncMealLogRepository
+
+from responses.dto import DTOResponse
 
 from utilities.dictionary import DictionaryUtility
 
@@ -97,10 +109,10 @@ class AddMealController(IV1MealAPIController):
         self,
         request: Request,
         request_payload: AddMealRequestDTO,
-        session: Session = Depends(DBDependency.derive),
+        session: AsyncSession = Depends(AsyncDBDependency.derive),
         cache: Redis = Depends(CacheDependency.derive),
         meal_log_repository: Callable = Depends(
-            MealLogRepositoryDependency.derive
+            AsyncMealLogRepositoryDependency.derive
         ),
         add_meal_service_factory: Callable = Depends(
             AddMealServiceDependency.derive
@@ -108,7 +120,12 @@ class AddMealController(IV1MealAPIController):
         dictionary_utility: Callable = Depends(
             DictionaryUtilityDependency.derive
         ),
-    ) -> JSONResponse:
+        usda_client: AsyncClient = Depends(USDAClientDependency.derive),
+        async_cache: AsyncRedis = Depends(AsyncCacheDependency.derive),
+        meal_daily_summary_repository: Callable = Depends(
+            AsyncMealDailySummaryRepositoryDependency.derive
+        ),
+    ) -> DTOResponse:
         try:
             self.logger.debug("Fetching request URN")
             self.urn: str = request.state.urn
@@ -128,12 +145,25 @@ class AddMealController(IV1MealAPIController):
                     user_id=self.user_id,
                 )
             )
-            self.meal_log_repository: MealLogRepository = meal_log_repository(
-                urn=self.urn,
-                user_urn=self.user_urn,
-                api_name=self.api_name,
-                user_id=self.user_id,
-                session=session,
+            self.meal_log_repository: AsyncMealLogRepository = (
+                meal_log_repository(
+                    urn=self.urn,
+                    user_urn=self.user_urn,
+                    api_name=self.api_name,
+                    user_id=self.user_id,
+                    session=session,
+                )
+            )
+            self.meal_daily_summary_repository: (
+                AsyncMealDailySummaryRepository
+            ) = (
+                meal_daily_summary_repository(
+                    urn=self.urn,
+                    user_urn=self.user_urn,
+                    api_name=self.api_name,
+                    user_id=self.user_id,
+                    session=session,
+                )
             )
 
             self.logger.debug("Validating request")
@@ -155,6 +185,11 @@ class AddMealController(IV1MealAPIController):
                 user_id=self.user_id,
                 meal_log_repository=self.meal_log_repository,
                 cache=cache,
+                usda_client=usda_client,
+                async_cache=async_cache,
+                meal_daily_summary_repository=(
+                    self.meal_daily_summary_repository
+                ),
             )
             response_dto: BaseResponseDTO = await service.run(
                 request_dto=request_payload
@@ -197,9 +232,11 @@ class AddMealController(IV1MealAPIController):
             httpStatusCode = HTTPStatus.INTERNAL_SERVER_ERROR
             self.logger.debug("Prepared response metadata")
 
-        return JSONResponse(
-            content=self.dictionary_utility.convert_dict_keys_to_camel_case(
-                response_dto.model_dump()
+        return DTOResponse(
+            content=response_dto.model_copy(
+                update=self.dictionary_utility.convert_dict_keys_to_camel_case(
+                    {"data": response_dto.data, "errors": response_dto.errors}
+                )
             ),
             status_code=httpStatusCode,
         )
@@ -1,10 +1,12 @@
+import orjson
+
 from datetime import date
 from fastapi import Query, Request, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response, StreamingResponse
 from http import HTTPStatus
 from redis import Redis
-from sqlalchemy.orm import Session
-from typing import Callable
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, AsyncIterator, Callable, Optional
 
 from controllers.apis.v1.meal.abstraction import IV1MealAPIController
 
@@ -12,8 +14,10 @@ from constants.api_lk import APILK
 from constants.api_status import APIStatus
 
 from dependencies.cache import CacheDependency
-from dependencies.db import DBDependency
-from dependencies.repositiories.meal_log import MealLogRepositoryDependency
+from dependencies.db import AsyncDBDependency
+from dependencies.repositiories.async_meal_log import (
+    AsyncMealLogRepositoryDependency,
+)
 from dependencies.services.apis.v1.meal.history import (
     FetchMealHistoryServiceDependency,
 )
@@ -26,7 +30,12 @@ from errors.bad_input_error import BadInputError
 from errors.not_found_error import NotFoundError
 from errors.unexpected_response_error import UnexpectedResponseError
 
-from repositories.meal_log import MealLogRepository
+from repositories.async_meal_log import AsyncMealLogRepository
+
+from start_utils import AsyncSessionLocal
+
+from responses.dto import DTOResponse
+
 from utilities.dictionary import DictionaryUtility
 
 
@@ -95,6 +104,65 @@ class FetchMealHistoryController(IV1MealAPIController):
     def dictionary_utility(self, value):
         self._dictionary_utility = value
 
+    async def stream_history(
+        self,
+        request_payload: FetchMealHistoryRequestDTO,
+        cache: Redis,
+        meal_log_repository: Callable,
+        fetch_meal_history_service_factory: Callable,
+        urn: str,
+        user_urn: str,
+        api_name: str,
+        user_id: str,
+        logger: Any,
+        dictionary_utility: DictionaryUtility,
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield the meal history as NDJSON, one line per day.
+
+        The request-scoped session is closed before a streaming body is
+        sent, so the stream reads through a session of its own. The body
+        is iterated after `get` has returned, when the shared controller
+        may already be serving another request, so every request-scoped
+        value is passed in rather than read from `self`.
+        """
+        async with AsyncSessionLocal() as session:
+            service = fetch_meal_history_service_factory(
+                urn=urn,
+                user_urn=user_urn,
+                api_name=api_name,
+                user_id=user_id,
+                meal_log_repository=meal_log_repository(
+                    urn=urn,
+                    user_urn=user_urn,
+                    api_name=api_name,
+                    user_id=user_id,
+                    session=session,
+                ),
+                cache=cache,
+            )
+            try:
+                async for day in service.stream(request_dto=request_payload):
+                    yield orjson.dumps(
+                        dictionary_utility.convert_dict_keys_to_camel_case(
+                            day
+                        )
+                    ) + b"\n"
+            except Exception as err:
+                logger.error(
+                    f"{err.__class__} error occured while streaming meal "
+                    f"history: {err}"
+                )
+                yield DTOResponse(
+                    content=BaseResponseDTO(
+                        transactionUrn=urn,
+                        status=APIStatus.FAILED,
+                        responseMessage="Failed to fetch meal history.",
+                        responseKey="error_internal_server_error",
+                        data={},
+                    )
+                ).body + b"\n"
+
     async def get(
         self,
         request: Request,
@@ -113,10 +181,35 @@ class FetchMealHistoryController(IV1MealAPIController):
             description="The to date",
             alias="to_date",
         ),
-        session: Session = Depends(DBDependency.derive),
+        cursor: Optional[str] = Query(
+            default=None,
+            description="Cursor of the next page, from a previous page",
+            alias="cursor",
+        ),
+        limit: Optional[int] = Query(
+            default=None,
+            description="Page size; enables cursor pagination",
+            alias="limit",
+        ),
+        stream: bool = Query(
+            default=False,
+            description="Stream day groups as NDJSON",
+            alias="stream",
+        ),
+        ingredient: Optional[str] = Query(
+            default=None,
+            description="Only meals with an ingredient of this name",
+            alias="ingredient",
+        ),
+        min_protein: Optional[float] = Query(
+            default=None,
+            description="Only meals with at least this much protein (G)",
+            alias="min_protein",
+        ),
+        session: AsyncSession = Depends(AsyncDBDependency.derive),
         cache: Redis = Depends(CacheDependency.derive),
-        meal_log_repository: MealLogRepository = Depends(
-            MealLogRepositoryDependency.derive
+        meal_log_repository: AsyncMealLogRepository = Depends(
+            AsyncMealLogRepositoryDependency.derive
         ),
         fetch_meal_history_service_factory: Callable = Depends(
             FetchMealHistoryServiceDependency.derive
@@ -124,7 +217,7 @@ class FetchMealHistoryController(IV1MealAPIController):
         dictionary_utility: DictionaryUtility = Depends(
             DictionaryUtilityDependency.derive
         ),
-    ) -> JSONResponse:
+    ) -> Response:
         try:
             self.logger.debug("Fetching request URN")
             self.urn: str = request.state.urn
@@ -136,6 +229,11 @@ class FetchMealHistoryController(IV1MealAPIController):
                 reference_number=reference_number,
                 from_date=from_date,
                 to_date=to_date,
+                cursor=cursor,
+                limit=limit,
+                stream=stream,
+                ingredient=ingredient,
+                min_protein=min_protein,
             )
             self.logger.debug("Request payload validated")
 
@@ -153,12 +251,14 @@ class FetchMealHistoryController(IV1MealAPIController):
                     user_id=self.user_id,
                 )
             )
-            self.meal_log_repository: MealLogRepository = meal_log_repository(
-                urn=self.urn,
-                user_urn=self.user_urn,
-                api_name=self.api_name,
-                user_id=self.user_id,
-                session=session,
+            self.meal_log_repository: AsyncMealLogRepository = (
+                meal_log_repository(
+                    urn=self.urn,
+                    user_urn=self.user_urn,
+                    api_name=self.api_name,
+                    user_id=self.user_id,
+                    session=session,
+                )
             )
 
             self.logger.debug("Validating request")
@@ -172,6 +272,26 @@ class FetchMealHistoryController(IV1MealAPIController):
             )
             self.logger.debug("Verified request")
 
+            if request_payload.stream:
+                self.logger.debug("Streaming meal history")
+                return StreamingResponse(
+                    self.stream_history(
+                        request_payload=request_payload,
+                        cache=cache,
+                        meal_log_repository=meal_log_repository,
+                        fetch_meal_history_service_factory=(
+                            fetch_meal_history_service_factory
+                        ),
+                        urn=self.urn,
+                        user_urn=self.user_urn,
+                        api_name=self.api_name,
+                        user_id=self.user_id,
+                        logger=self.logger,
+                        dictionary_utility=self.dictionary_utility,
+                    ),
+                    media_type="application/x-ndjson",
+                )
+
             self.logger.debug("Running fetch meal service")
             response_dto: BaseResponseDTO = (
                 await fetch_meal_history_service_factory(
@@ -225,9 +345,11 @@ class FetchMealHistoryController(IV1MealAPIController):
             httpStatusCode = HTTPStatus.INTERNAL_SERVER_ERROR
             self.logger.debug("Prepared response metadata")
 
-        return JSONResponse(
-            content=self.dictionary_utility.convert_dict_keys_to_camel_case(
-                response_dto.model_dump()
+        return DTOResponse(
+            content=response_dto.model_copy(
+                update=self.dictionary_utility.convert_dict_keys_to_camel_case(
+                    {"data": response_dto.data, "errors": response_dto.errors}
+                )
             ),
             status_code=httpStatusCode,
         )
@@ -1,9 +1,8 @@
 from fastapi import Query, Request, Depends
-from fastapi.responses import JSONResponse
 from http import HTTPStatus
 from pydantic import ValidationError
 from redis import Redis
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Callable
 
 from controllers.apis.v1.meal.abstraction import IV1MealAPIController
@@ -12,8 +11,10 @@ from constants.api_lk import APILK
 from constants.api_status import APIStatus
 
 from dependencies.cache import CacheDependency
-from dependencies.db import DBDependency
-from dependencies.repositiories.meal_log import MealLogRepositoryDependency
+from dependencies.db import AsyncDBDependency
+from dependencies.repositiories.async_meal_log import (
+    AsyncMealLogRepositoryDependency,
+)
 from dependencies.services.apis.v1.meal.recommendation import (
     FetchMealRecommendationServiceDependency,
 )
@@ -28,7 +29,10 @@ from errors.bad_input_error import BadInputError
 from errors.not_found_error import NotFoundError
 from errors.unexpected_response_error import UnexpectedResponseError
 
-from repositories.meal_log import MealLogRepository
+from repositories.async_meal_log import AsyncMealLogRepository
+
+from responses.dto import DTOResponse
+
 from utilities.dictionary import DictionaryUtility
 
 
@@ -110,10 +114,10 @@ class FetchMealRecommendationController(IV1MealAPIController):
             description="The food category",
             alias="food_category",
         ),
-        session: Session = Depends(DBDependency.derive),
+        session: AsyncSession = Depends(AsyncDBDependency.derive),
         cache: Redis = Depends(CacheDependency.derive),
-        meal_log_repository: MealLogRepository = Depends(
-            MealLogRepositoryDependency.derive
+        meal_log_repository: AsyncMealLogRepository = Depends(
+            AsyncMealLogRepositoryDependency.derive
         ),
         fetch_meal_recommendation_service_factory: Callable = Depends(
             FetchMealRecommendationServiceDependency.derive
@@ -121,7 +125,7 @@ class FetchMealRecommendationController(IV1MealAPIController):
         dictionary_utility: DictionaryUtility = Depends(
             DictionaryUtilityDependency.derive
         ),
-    ) -> JSONResponse:
+    ) -> DTOResponse:
         try:
 
             self.logger.debug("Fetching request URN")
@@ -144,12 +148,14 @@ class FetchMealRecommendationController(IV1MealAPIController):
                 )
             )
 
-            self.meal_log_repository: MealLogRepository = meal_log_repository(
-                urn=self.urn,
-                user_urn=self.user_urn,
-                api_name=self.api_name,
-                user_id=self.user_id,
-                session=session,
+            self.meal_log_repository: AsyncMealLogRepository = (
+                meal_log_repository(
+                    urn=self.urn,
+                    user_urn=self.user_urn,
+                    api_name=self.api_name,
+                    user_id=self.user_id,
+                    session=session,
+                )
             )
 
             self.logger.debug("Validating request payload")
@@ -245,9 +251,11 @@ class FetchMealRecommendationController(IV1MealAPIController):
             httpStatusCode = HTTPStatus.INTERNAL_SERVER_ERROR
             self.logger.debug("Prepared response metadata")
 
-        return JSONResponse(
-            content=self.dictionary_utility.convert_dict_keys_to_camel_case(
-                response_dto.model_dump()
+        return DTOResponse(
+            content=response_dto.model_copy(
+                update=self.dictionary_utility.convert_dict_keys_to_camel_case(
+                    {"data": response_dto.data, "errors": response_dto.errors}
+                )
             ),
             status_code=httpStatusCode,
         )
@@ -1,7 +1,7 @@
 from fastapi import Request, Depends
-from fastapi.responses import JSONResponse
 from http import HTTPStatus
-from sqlalchemy.orm import Session
+from redis.asyncio import Redis as AsyncRedis
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Callable
 
 from controllers.user.abstraction import IUserController
@@ -9,8 +9,11 @@ from controllers.user.abstraction import IUserController
 from constants.api_lk import APILK
 from constants.api_status import APIStatus
 
-from dependencies.db import DBDependency
-from dependencies.repositiories.user import UserRepositoryDependency
+from dependencies.cache import AsyncCacheDependency
+from dependencies.db import AsyncDBDependency
+from dependencies.repositiories.async_user import (
+    AsyncUserRepositoryDependency,
+)
 from dependencies.services.user.login import UserLoginServiceDependency
 from dependencies.utilities.dictionary import DictionaryUtilityDependency
 from dependencies.utilities.jwt import JWTUtilityDependency
@@ -22,7 +25,10 @@ from errors.bad_input_error import BadInputError
 from errors.not_found_error import NotFoundError
 from errors.unexpected_response_error import UnexpectedResponseError
 
-from repositories.user import UserRepository
+from repositories.async_user import AsyncUserRepository
+
+from responses.dto import DTOResponse
+
 from utilities.dictionary import DictionaryUtility
 from utilities.jwt import JWTUtility
 
@@ -102,9 +108,9 @@ class UserLoginController(IUserController):
         self,
         request: Request,
         request_payload: UserLoginRequestDTO,
-        session: Session = Depends(DBDependency.derive),
-        user_repository: UserRepository = Depends(
-            UserRepositoryDependency.derive
+        session: AsyncSession = Depends(AsyncDBDependency.derive),
+        user_repository: AsyncUserRepository = Depends(
+            AsyncUserRepositoryDependency.derive
         ),
         user_login_service_factory: Callable = Depends(
             UserLoginServiceDependency.derive
@@ -114,8 +120,9 @@ class UserLoginController(IUserController):
         ),
         jwt_utility: JWTUtility = Depends(
             JWTUtilityDependency.derive
-        )
-    ) -> JSONResponse:
+        ),
+        cache: AsyncRedis = Depends(AsyncCacheDependency.derive),
+    ) -> DTOResponse:
         try:
 
             self.logger.debug("Fetching request URN")
@@ -139,7 +146,7 @@ class UserLoginController(IUserController):
                 api_name=self.api_name,
                 user_id=self.user_id,
             )
-            self.user_repository: UserRepository = user_repository(
+            self.user_repository: AsyncUserRepository = user_repository(
                 urn=self.urn,
                 user_urn=self.user_urn,
                 api_name=self.api_name,
@@ -166,6 +173,7 @@ class UserLoginController(IUserController):
                 user_id=self.user_id,
                 jwt_utility=self.jwt_utility,
                 user_repository=self.user_repository,
+                cache=cache,
             ).run(request_dto=request_payload)
 
             self.logger.debug("Preparing response metadata")
@@ -205,9 +213,11 @@ class UserLoginController(IUserController):
             httpStatusCode = HTTPStatus.INTERNAL_SERVER_ERROR
             self.logger.debug("Prepared response metadata")
 
-        return JSONResponse(
-            content=self.dictionary_utility.convert_dict_keys_to_camel_case(
-                response_dto.model_dump()
+        return DTOResponse(
+            content=response_dto.model_copy(
+                update=self.dictionary_utility.convert_dict_keys_to_camel_case(
+                    {"data": response_dto.data, "errors": response_dto.errors}
+                )
             ),
             status_code=httpStatusCode,
         )
@@ -1,7 +1,6 @@
 from fastapi import Request, Depends
-from fastapi.responses import JSONResponse
 from http import HTTPStatus
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Callable
 
 from controllers.user.abstraction import IUserController
@@ -9,11 +8,13 @@ from controllers.user.abstraction import IUserController
 from constants.api_lk import APILK
 from constants.api_status import APIStatus
 
-from dependencies.db import DBDependency
+from dependencies.db import AsyncDBDependency
 from dependencies.services.user.register import (
     UserRegistrationServiceDependency,
 )
-from dependencies.repositiories.user import UserRepositoryDependency
+from dependencies.repositiories.async_user import (
+    AsyncUserRepositoryDependency,
+)
 from dependencies.utilities.dictionary import DictionaryUtilityDependency
 
 from dtos.requests.user.registration import UserRegistrationRequestDTO
@@ -24,7 +25,10 @@ from errors.bad_input_error import BadInputError
 from errors.not_found_error import NotFoundError
 from errors.unexpected_response_error import UnexpectedResponseError
 
-from repositories.user import UserRepository
+from repositories.async_user import AsyncUserRepository
+
+from responses.dto import DTOResponse
+
 from utilities.dictionary import DictionaryUtility
 
 
@@ -100,9 +104,9 @@ class UserRegistrationController(IUserController):
         self,
         request: Request,
         request_payload: UserRegistrationRequestDTO,
-        session: Session = Depends(DBDependency.derive),
-        user_repository: UserRepository = Depends(
-            UserRepositoryDependency.derive
+        session: AsyncSession = Depends(AsyncDBDependency.derive),
+        user_repository: AsyncUserRepository = Depends(
+            AsyncUserRepositoryDependency.derive
         ),
         user_registration_service_factory: Callable = Depends(
             UserRegistrationServiceDependency.derive
@@ -110,7 +114,7 @@ class UserRegistrationController(IUserController):
         dictionary_utility: DictionaryUtility = Depends(
             DictionaryUtilityDependency.derive
         ),
-    ) -> JSONResponse:
+    ) -> DTOResponse:
 
         try:
 
@@ -132,7 +136,7 @@ class UserRegistrationController(IUserController):
                     user_id=self.user_id,
                 )
             )
-            self.user_repository: UserRepository = user_repository(
+            self.user_repository: AsyncUserRepository = user_repository(
                 urn=self.urn,
                 user_urn=self.user_urn,
                 api_name=self.api_name,
@@ -197,9 +201,11 @@ class UserRegistrationController(IUserController):
             httpStatusCode = HTTPStatus.INTERNAL_SERVER_ERROR
             self.logger.debug("Prepared response metadata")
 
-        return JSONResponse(
-            content=self.dictionary_utility.convert_dict_keys_to_camel_case(
-                response_dto.model_dump()
+        return DTOResponse(
+            content=response_dto.model_copy(
+                update=self.dictionary_utility.convert_dict_keys_to_camel_case(
+                    {"data": response_dto.data, "errors": response_dto.errors}
+                )
             ),
             status_code=httpStatusCode,
         )
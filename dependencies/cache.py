@@ -1,6 +1,7 @@
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
 
-from start_utils import redis_session, logger
+from start_utils import async_redis_session, redis_session, logger
 
 
 class CacheDependency:
@@ -16,3 +17,20 @@ class CacheDependency:
         """
         logger.debug("CacheDependency: returning redis_session instance")
         return redis_session
+
+
+class AsyncCacheDependency:
+    """
+    Dependency provider for the async Redis cache session.
+    Provides the shared async Redis session for DI.
+    """
+    @staticmethod
+    def derive() -> AsyncRedis:
+        """
+        Returns the shared async Redis session instance.
+        Logs when the async cache dependency is derived.
+        """
+        logger.debug(
+            "AsyncCacheDependency: returning async_redis_session instance"
+        )
+        return async_redis_session
@@ -1,18 +1,59 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session as SQLAlchemySession
+from typing import AsyncIterator, Iterator
 
-from start_utils import db_session, logger
+from start_utils import AsyncSessionLocal, Session, logger
 
 
 class DBDependency:
     """
-    Dependency provider for SQLAlchemy DB session.
-    Provides the shared DB session for DI.
+    Dependency provider for SQLAlchemy DB sessions.
+    Provides one session per request for DI.
     """
     @staticmethod
-    def derive() -> Session:
+    def derive() -> Iterator[SQLAlchemySession]:
         """
-        Returns the shared SQLAlchemy DB session instance.
-        Logs when the DB dependency is derived.
+        Yields a new SQLAlchemy DB session scoped to the request.
+        Commits when the request succeeds, rolls back when it raises,
+        and returns the connection to the pool in either case.
         """
-        logger.debug("DBDependency: returning db_session instance")
-        return db_session
+        logger.debug("DBDependency: opening request-scoped session")
+        session: SQLAlchemySession = Session()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            logger.debug("DBDependency: rolling back request-scoped session")
+            session.rollback()
+            raise
+        finally:
+            session.close()
+            logger.debug("DBDependency: closed request-scoped session")
+
+
+class AsyncDBDependency:
+    """
+    Dependency provider for SQLAlchemy AsyncSession.
+    Provides one async session per request for DI.
+    """
+    @staticmethod
+    async def derive() -> AsyncIterator[AsyncSession]:
+        """
+        Yields a new SQLAlchemy AsyncSession scoped to the request.
+        Commits when the request succeeds, rolls back when it raises,
+        and returns the connection to the pool in either case.
+        """
+        logger.debug("AsyncDBDependency: opening request-scoped session")
+        session: AsyncSession = AsyncSessionLocal()
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            logger.debug(
+                "AsyncDBDependency: rolling back request-scoped session"
+            )
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+            logger.debug("AsyncDBDependency: closed request-scoped session")
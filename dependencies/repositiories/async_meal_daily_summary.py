@@ -0,0 +1,44 @@
+from typing import Callable
+
+from repositories.async_meal_daily_summary import (
+    AsyncMealDailySummaryRepository,
+)
+from start_utils import logger
+
+
+class AsyncMealDailySummaryRepositoryDependency:
+    """
+    Dependency provider for AsyncMealDailySummaryRepository.
+    Provides a factory for creating AsyncMealDailySummaryRepository
+    instances with DI.
+    """
+
+    @staticmethod
+    def derive() -> Callable:
+        """
+        Returns a factory function that creates an
+        AsyncMealDailySummaryRepository with the given parameters.
+        Logs when the factory is created and when a repository is instantiated.
+        """
+        logger.debug(
+            "AsyncMealDailySummaryRepositoryDependency factory created"
+        )
+
+        def factory(
+            urn,
+            user_urn,
+            api_name,
+            session,
+            user_id,
+        ):
+            logger.info(
+                "Instantiating AsyncMealDailySummaryRepository"
+            )
+            return AsyncMealDailySummaryRepository(
+                urn=urn,
+                user_urn=user_urn,
+                api_name=api_name,
+                session=session,
+                user_id=user_id,
+            )
+        return factory
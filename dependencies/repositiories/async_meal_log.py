@@ -0,0 +1,39 @@
+from typing import Callable
+
+from repositories.async_meal_log import AsyncMealLogRepository
+from start_utils import logger
+
+
+class AsyncMealLogRepositoryDependency:
+    """
+    Dependency provider for AsyncMealLogRepository.
+    Provides a factory for creating AsyncMealLogRepository instances with DI.
+    """
+
+    @staticmethod
+    def derive() -> Callable:
+        """
+        Returns a factory function that creates an AsyncMealLogRepository
+        with the given parameters.
+        Logs when the factory is created and when a repository is instantiated.
+        """
+        logger.debug("AsyncMealLogRepositoryDependency factory created")
+
+        def factory(
+            urn,
+            user_urn,
+            api_name,
+            session,
+            user_id,
+        ):
+            logger.info(
+                "Instantiating AsyncMealLogRepository"
+            )
+            return AsyncMealLogRepository(
+                urn=urn,
+                user_urn=user_urn,
+                api_name=api_name,
+                session=session,
+                user_id=user_id,
+            )
+        return factory
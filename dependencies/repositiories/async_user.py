@@ -0,0 +1,39 @@
+from typing import Callable
+
+from repositories.async_user import AsyncUserRepository
+from start_utils import logger
+
+
+class AsyncUserRepositoryDependency:
+    """
+    Dependency provider for AsyncUserRepository.
+    Provides a factory for creating AsyncUserRepository instances with DI.
+    """
+
+    @staticmethod
+    def derive() -> Callable:
+        """
+        Returns a factory function that creates an AsyncUserRepository
+        with the given parameters.
+        Logs when the factory is created and when a repository is instantiated.
+        """
+        logger.debug("AsyncUserRepositoryDependency factory created")
+
+        def factory(
+            urn,
+            user_urn,
+            api_name,
+            session,
+            user_id,
+        ):
+            logger.info(
+                "Instantiating AsyncUserRepository"
+            )
+            return AsyncUserRepository(
+                urn=urn,
+                user_urn=user_urn,
+                api_name=api_name,
+                session=session,
+                user_id=user_id,
+            )
+        return factory
@@ -28,6 +28,9 @@ class AddMealServiceDependency(IDependency):
             user_id,
             meal_log_repository,
             cache,
+            usda_client,
+            async_cache,
+            meal_daily_summary_repository,
         ):
             logger.info(
                 "Instantiating AddMealService"
@@ -39,5 +42,8 @@ class AddMealServiceDependency(IDependency):
                 user_id=user_id,
                 meal_log_repository=meal_log_repository,
                 cache=cache,
+                usda_client=usda_client,
+                async_cache=async_cache,
+                meal_daily_summary_repository=meal_daily_summary_repository,
             )
         return factory
@@ -28,6 +28,8 @@ class FetchMealServiceDependency(IDependency):
             user_id,
             meal_log_repository,
             cache,
+            usda_client,
+            async_cache,
         ):
             logger.info(
                 "Instantiating FetchMealService"
@@ -39,5 +41,7 @@ class FetchMealServiceDependency(IDependency):
                 user_id=user_id,
                 meal_log_repository=meal_log_repository,
                 cache=cache,
+                usda_client=usda_client,
+                async_cache=async_cache,
             )
         return factory
@@ -0,0 +1,43 @@
+from typing import Callable
+
+from abstractions.dependency import IDependency
+
+from services.apis.v1.meal.stats import FetchMealStatsService
+
+from start_utils import logger
+
+
+class FetchMealStatsServiceDependency(IDependency):
+    """
+    Dependency provider for FetchMealStatsService.
+    Provides a factory for creating FetchMealStatsService instances with DI.
+    """
+    @staticmethod
+    def derive() -> Callable:
+        """
+        Returns a factory function that creates a FetchMealStatsService with
+        the given parameters.
+        Logs when the factory is created and when a service is instantiated.
+        """
+        logger.debug("FetchMealStatsServiceDependency factory created")
+
+        def factory(
+            urn,
+            user_urn,
+            api_name,
+            user_id,
+            meal_log_repository,
+            cache,
+        ):
+            logger.info(
+                "Instantiating FetchMealStatsService"
+            )
+            return FetchMealStatsService(
+                urn=urn,
+                user_urn=user_urn,
+                api_name=api_name,
+                user_id=user_id,
+                meal_log_repository=meal_log_repository,
+                cache=cache,
+            )
+        return factory
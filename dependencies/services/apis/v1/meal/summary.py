@@ -0,0 +1,43 @@
+from typing import Callable
+
+from abstractions.dependency import IDependency
+
+from services.apis.v1.meal.summary import FetchMealSummaryService
+
+from start_utils import logger
+
+
+class FetchMealSummaryServiceDependency(IDependency):
+    """
+    Dependency provider for FetchMealSummaryService.
+    Provides a factory for creating FetchMealSummaryService instances with DI.
+    """
+    @staticmethod
+    def derive() -> Callable:
+        """
+        Returns a factory function that creates a FetchMealSummaryService with
+        the given parameters.
+        Logs when the factory is created and when a service is instantiated.
+        """
+        logger.debug("FetchMealSummaryServiceDependency factory created")
+
+        def factory(
+            urn,
+            user_urn,
+            api_name,
+            user_id,
+            meal_daily_summary_repository,
+            cache,
+        ):
+            logger.info(
+                "Instantiating FetchMealSummaryService"
+            )
+            return FetchMealSummaryService(
+                urn=urn,
+                user_urn=user_urn,
+                api_name=api_name,
+                user_id=user_id,
+                meal_daily_summary_repository=meal_daily_summary_repository,
+                cache=cache,
+            )
+        return factory
@@ -28,6 +28,7 @@ class UserLoginServiceDependency(IDependency):
             user_id,
             jwt_utility,
             user_repository,
+            cache,
         ):
             logger.info(
                 "Instantiating UserLoginService"
@@ -39,5 +40,6 @@ class UserLoginServiceDependency(IDependency):
                 user_id=user_id,
                 user_repository=user_repository,
                 jwt_utility=jwt_utility,
+                cache=cache,
             )
         return factory
@@ -28,6 +28,7 @@ class UserLogoutServiceDependency(IDependency):
             user_id,
             jwt_utility,
             user_repository,
+            cache,
         ):
             logger.info(
                 "Instantiating UserLogoutService"
@@ -39,5 +40,6 @@ class UserLogoutServiceDependency(IDependency):
                 user_id=user_id,
                 user_repository=user_repository,
                 jwt_utility=jwt_utility,
+                cache=cache,
             )
         return factory
@@ -0,0 +1,18 @@
+from httpx import AsyncClient
+
+from start_utils import usda_client, logger
+
+
+class USDAClientDependency:
+    """
+    Dependency provider for the USDA FoodData Central HTTP client.
+    Provides the shared, connection-pooled async client for DI.
+    """
+    @staticmethod
+    def derive() -> AsyncClient:
+        """
+        Returns the shared USDA async HTTP client instance.
+        Logs when the USDA client dependency is derived.
+        """
+        logger.debug("USDAClientDependency: returning usda_client instance")
+        return usda_client
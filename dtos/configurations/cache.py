@@ -4,6 +4,104 @@ DTO for cache configuration settings.
 from pydantic import BaseModel
 
 
+class SingleFlightConfigurationDTO(BaseModel):
+    """
+    DTO for request coalescing (single-flight) settings.
+    Fields:
+        lock_timeout_seconds (int): Expiry of the cross-worker leader lock.
+        wait_timeout_seconds (float): How long followers wait for a result.
+        poll_interval_seconds (float): Delay between result key polls.
+        result_ttl_seconds (int): Lifetime of the shared result key.
+    """
+    lock_timeout_seconds: int = 15
+    wait_timeout_seconds: float = 5.0
+    poll_interval_seconds: float = 0.1
+    result_ttl_seconds: int = 30
+
+
+class InstructionsCacheConfigurationDTO(BaseModel):
+    """
+    DTO for generated instructions cache settings.
+    Fields:
+        ttl_seconds (int): Lifetime of a cached set of instructions.
+        max_entries (int): Maximum number of cached instruction sets.
+    """
+    ttl_seconds: int = 604800
+    max_entries: int = 10000
+
+
+class SessionStateCacheConfigurationDTO(BaseModel):
+    """
+    DTO for cached user session state settings.
+    Fields:
+        ttl_seconds (int): Lifetime of a cached logged-in status.
+    """
+    ttl_seconds: int = 300
+
+
+class MealNameIndexConfigurationDTO(BaseModel):
+    """
+    DTO for the per-worker meal name vocabulary index settings.
+    Fields:
+        max_names (int): Largest vocabulary kept in memory; beyond it,
+            fuzzy search uses the database index instead.
+        refresh_seconds (int): Reload interval, to pick up names inserted
+            by other workers.
+    """
+    max_names: int = 50000
+    refresh_seconds: int = 300
+
+
+class MealDetailsCacheConfigurationDTO(BaseModel):
+    """
+    DTO for the two-tier meal details cache settings.
+    Fields:
+        ttl_seconds (int): Hard TTL: lifetime of a meal's details in
+            Redis, after which they are refetched before responding.
+        soft_ttl_seconds (int): Soft TTL: age after which cached details
+            are served stale while one worker refreshes them.
+        refresh_lock_seconds (int): Expiry of the cross-worker refresh
+            lock, and so the delay before a failed refresh is retried.
+        local_ttl_seconds (float): Lifetime of an entry in a worker's
+            local tier, bounding staleness if an invalidation is lost.
+        local_max_entries (int): Entries kept in a worker's local tier.
+    """
+    ttl_seconds: int = 86400
+    soft_ttl_seconds: int = 3600
+    refresh_lock_seconds: int = 30
+    local_ttl_seconds: float = 60
+    local_max_entries: int = 1024
+
+
+class CacheCodecConfigurationDTO(BaseModel):
+    """
+    DTO for cached payload serialization settings.
+    Fields:
+        compression_threshold_bytes (int): Serialized size from which
+            payloads are zstd-compressed.
+        compression_level (int): zstd compression level.
+    """
+    compression_threshold_bytes: int = 1024
+    compression_level: int = 3
+
+
+class NegativeCacheConfigurationDTO(BaseModel):
+    """
+    DTO for the negative cache of failed USDA searches.
+    Fields:
+        not_found_ttl_seconds (int): Lifetime of a cached search that
+            found no meal.
+        invalid_response_ttl_seconds (int): Lifetime of a cached search
+            that got a malformed response, kept short as these are
+            usually transient.
+        stats_log_seconds (int): Interval between logs of the negative
+            cache counters.
+    """
+    not_found_ttl_seconds: int = 600
+    invalid_response_ttl_seconds: int = 60
+    stats_log_seconds: int = 300
+
+
 class CacheConfigurationDTO(BaseModel):
     """
     DTO for cache configuration.
@@ -11,7 +109,37 @@ class CacheConfigurationDTO(BaseModel):
         host (str): Redis host.
         port (int): Redis port.
         password (str): Redis password.
+        single_flight (SingleFlightConfigurationDTO): Coalescing settings.
+        instructions (InstructionsCacheConfigurationDTO): Instructions
+            cache settings.
+        session_state (SessionStateCacheConfigurationDTO): Session state
+            cache settings.
+        meal_name_index (MealNameIndexConfigurationDTO): Meal name index
+            settings.
+        meal_details (MealDetailsCacheConfigurationDTO): Meal details
+            cache settings.
+        codec (CacheCodecConfigurationDTO): Cached payload serialization
+            settings.
+        negative (NegativeCacheConfigurationDTO): Negative cache
+            settings.
     """
     host: str
     port: int
     password: str
+    single_flight: SingleFlightConfigurationDTO = (
+        SingleFlightConfigurationDTO()
+    )
+    instructions: InstructionsCacheConfigurationDTO = (
+        InstructionsCacheConfigurationDTO()
+    )
+    session_state: SessionStateCacheConfigurationDTO = (
+        SessionStateCacheConfigurationDTO()
+    )
+    meal_name_index: MealNameIndexConfigurationDTO = (
+        MealNameIndexConfigurationDTO()
+    )
+    meal_details: MealDetailsCacheConfigurationDTO = (
+        MealDetailsCacheConfigurationDTO()
+    )
+    codec: CacheCodecConfigurationDTO = CacheCodecConfigurationDTO()
+    negative: NegativeCacheConfigurationDTO = NegativeCacheConfigurationDTO()
@@ -14,6 +14,23 @@ class DBConfigurationDTO(BaseModel):
         port (int): Database port.
         database (str): Database name.
         connection_string (str): Full DB connection string.
+        async_connection_string (str): Full DB connection string for the
+            asyncio driver.
+        pool_size (int): Connections kept open in the async engine's
+            pool, which serves every request.
+        max_overflow (int): Extra async connections allowed beyond
+            pool_size.
+        sync_pool_size (int): Connections kept open in the sync engine's
+            pool, used only outside the request path.
+        sync_max_overflow (int): Extra sync connections allowed beyond
+            sync_pool_size.
+        pool_timeout (int): Seconds to wait for a pooled connection.
+        pool_recycle (int): Seconds after which connections are recycled.
+        pool_pre_ping (bool): Whether to test connections on checkout.
+
+    Each worker opens up to pool_size + max_overflow + sync_pool_size +
+    sync_max_overflow Postgres connections (35 by default), so size
+    max_connections for that times the number of workers.
     """
     user_name: str
     password: str
@@ -21,3 +38,13 @@ class DBConfigurationDTO(BaseModel):
     port: int
     database: str
     connection_string: str
+    async_connection_string: str = (
+        "postgresql+asyncpg://{user_name}:{password}@{host}:{port}/{database}"
+    )
+    pool_size: int = 10
+    max_overflow: int = 20
+    sync_pool_size: int = 2
+    sync_max_overflow: int = 3
+    pool_timeout: int = 30
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
@@ -0,0 +1,19 @@
+"""
+DTO for LLM (Google Gemini) configuration settings.
+"""
+from pydantic import BaseModel
+
+
+class LLMConfigurationDTO(BaseModel):
+    """
+    DTO for LLM configuration.
+    Fields:
+        model (str): Gemini model name.
+        max_concurrency (int): Maximum concurrent LLM calls per worker.
+        max_queue_depth (int): Maximum callers waiting for a free slot.
+        timeout_seconds (float): Total budget for queueing plus the call.
+    """
+    model: str = "gemini-2.5-flash"
+    max_concurrency: int = 4
+    max_queue_depth: int = 16
+    timeout_seconds: float = 20.0
@@ -9,5 +9,19 @@ class USDAConfigurationDTO(BaseModel):
     DTO for USDA API configuration.
     Fields:
         url (str): USDA API base URL.
+        connect_timeout (float): Seconds to wait for a connection.
+        read_timeout (float): Seconds to wait for response data.
+        write_timeout (float): Seconds to wait while sending the request.
+        pool_timeout (float): Seconds to wait for a free pooled connection.
+        max_connections (int): Maximum open connections to the USDA host.
+        max_keepalive_connections (int): Idle connections kept alive.
+        keepalive_expiry (float): Seconds an idle connection is kept.
     """
     url: str
+    connect_timeout: float = 3.0
+    read_timeout: float = 10.0
+    write_timeout: float = 5.0
+    pool_timeout: float = 2.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
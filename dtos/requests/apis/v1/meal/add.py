@@ -13,10 +13,13 @@ class AddMealRequestDTO(IRequestDTO):
         meal_name (str): Name of the meal (validated).
         servings (int): Number of servings (validated).
         get_instructions (bool): Whether to fetch instructions.
+        bypass_negative_cache (bool): Whether to search USDA even if the
+            meal recently was not found.
     """
     meal_name: str
     servings: int
     get_instructions: bool
+    bypass_negative_cache: bool = False
 
     @field_validator('meal_name')
     @classmethod
@@ -5,6 +5,8 @@ from datetime import date
 from pydantic import field_validator, Field
 from typing import Optional
 
+from constants.default import Default
+
 from dtos.requests.abstraction import IRequestDTO
 
 
@@ -14,9 +16,24 @@ class FetchMealHistoryRequestDTO(IRequestDTO):
     Fields:
         from_date (date): Start date for history (validated).
         to_date (date): End date for history (validated).
+        cursor (str, optional): Opaque cursor from a previous page.
+        limit (int, optional): Page size; enables keyset pagination.
+        stream (bool): Stream day groups as NDJSON instead of one response.
+        ingredient (str, optional): Only meals with this ingredient.
+        min_protein (float, optional): Only meals with at least this much
+            protein per serving, in grams.
     """
     from_date: Optional[date] = Field(default=date.today())
     to_date: Optional[date] = Field(default=date.today())
+    cursor: Optional[str] = Field(default=None)
+    limit: Optional[int] = Field(
+        default=None, ge=1, le=Default.MEAL_HISTORY_MAX_PAGE_SIZE
+    )
+    stream: bool = Field(default=False)
+    ingredient: Optional[str] = Field(
+        default=None, min_length=1, max_length=200
+    )
+    min_protein: Optional[float] = Field(default=None, ge=0)
 
     @field_validator('from_date', 'to_date')
     @classmethod
@@ -0,0 +1,51 @@
+"""
+DTO for fetch meal stats request payload, with validation for date fields.
+"""
+from datetime import date
+from pydantic import field_validator, Field
+from typing import Optional
+
+from constants.default import Default
+
+from dtos.requests.abstraction import IRequestDTO
+
+
+class FetchMealStatsRequestDTO(IRequestDTO):
+    """
+    DTO for fetch meal stats request.
+    Fields:
+        from_date (date): First day of the stats (validated).
+        to_date (date): Last day of the stats (validated).
+        window (int): Days in the rolling average.
+    """
+    from_date: Optional[date] = Field(default=date.today())
+    to_date: Optional[date] = Field(default=date.today())
+    window: int = Field(
+        default=Default.MEAL_STATS_WINDOW_DAYS,
+        ge=1,
+        le=Default.MEAL_STATS_MAX_WINDOW_DAYS,
+    )
+
+    @field_validator('from_date', 'to_date')
+    @classmethod
+    def validate_dates(cls, v, info):
+        if not v:
+            raise ValueError(f"{info.field_name} is required.")
+        if not isinstance(v, date):
+            raise ValueError(f"{info.field_name} must be a valid date.")
+        return v
+
+    @field_validator('to_date')
+    @classmethod
+    def validate_date_range(cls, v, info):
+        from_date = info.data.get('from_date') if info.data else None
+        if from_date and v < from_date:
+            raise ValueError('to_date cannot be before from_date.')
+        if from_date and (v - from_date).days >= Default.MEAL_STATS_MAX_DAYS:
+            raise ValueError(
+                f"The date range cannot exceed "
+                f"{Default.MEAL_STATS_MAX_DAYS} days."
+            )
+        if v > date.today():
+            raise ValueError('to_date cannot be in the future.')
+        return v
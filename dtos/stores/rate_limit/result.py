@@ -0,0 +1,26 @@
+"""
+DTO for the outcome of a single rate limit check.
+"""
+from pydantic import BaseModel, Field
+
+
+class RateLimitResultDTO(BaseModel):
+    """
+    DTO for a rate limit decision returned by a rate limit store.
+    Fields:
+        allowed (bool): Whether the request is within the limit.
+        limit (int): Maximum requests (or bucket capacity) for the key.
+        remaining (int): Requests left before the limit is reached.
+        reset_after (float): Seconds until the full quota is available.
+        retry_after (float): Seconds until the next request is allowed;
+            0 when the request was allowed.
+    """
+    allowed: bool = Field(..., description="Request is within the limit.")
+    limit: int = Field(..., description="Maximum requests for the key.")
+    remaining: int = Field(..., description="Requests left in the quota.")
+    reset_after: float = Field(
+        ..., description="Seconds until the full quota is available."
+    )
+    retry_after: float = Field(
+        0, description="Seconds until the next request is allowed."
+    )
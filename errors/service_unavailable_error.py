@@ -0,0 +1,24 @@
+"""
+Custom error for handling unavailable or overloaded dependencies in the
+application.
+"""
+from abstractions.error import IError
+
+
+class ServiceUnavailableError(IError):
+    """
+    Exception for service unavailable errors.
+    Args:
+        responseMessage (str): Description of the error.
+        responseKey (str): Key for programmatic error handling.
+        httpStatusCode (int): HTTP status code to return.
+    """
+
+    def __init__(
+        self, responseMessage: str, responseKey: str, httpStatusCode: int
+    ) -> None:
+
+        super().__init__()
+        self.responseMessage = responseMessage
+        self.responseKey = responseKey
+        self.httpStatusCode = httpStatusCode
@@ -0,0 +1,125 @@
+"""
+Backfill of the meal_daily_summary table from existing meal logs.
+
+Meal logs are streamed in (user_id, created_on) order and folded into one
+summary per user and UTC day, which replaces any stored summary of that day.
+The job is idempotent: re-running it rebuilds the same totals, so it can
+be run again after deploying to settle days that had meals added while it
+was running.
+
+Usage:
+    python -m jobs.backfill_meal_daily_summary [--batch-size N]
+        [--commit-every N]
+"""
+import argparse
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Final, Tuple
+
+from constants.default import Default
+
+from models.meal_daily_summary import MealDailySummary
+
+from repositories.async_meal_daily_summary import (
+    AsyncMealDailySummaryRepository,
+)
+from repositories.async_meal_log import AsyncMealLogRepository
+
+from start_utils import AsyncSessionLocal, logger
+
+from utilities.meal_day import MealDayUtility
+
+
+API_NAME: Final[str] = "BACKFILL_MEAL_DAILY_SUMMARY"
+COLUMNS: Final[Tuple[str, ...]] = (
+    "user_id",
+    "servings",
+    "nutrient_vector",
+    "total_calories",
+    "calories_unit",
+    "created_on",
+)
+
+
+async def backfill(
+    read_session: AsyncSession,
+    write_session: AsyncSession,
+    batch_size: int = Default.MEAL_HISTORY_STREAM_BATCH_SIZE,
+    commit_every: int = 500,
+) -> int:
+    """
+    Rebuild every daily summary from the meal logs.
+
+    Meal logs are read through a server-side cursor on `read_session`,
+    which must stay open across commits, so summaries are written and
+    committed on `write_session`.
+    Returns:
+        int: Number of summaries written.
+    """
+    meal_log_repository = AsyncMealLogRepository(
+        api_name=API_NAME,
+        session=read_session,
+    )
+    summary_repository = AsyncMealDailySummaryRepository(
+        api_name=API_NAME,
+        session=write_session,
+    )
+
+    written = 0
+    summary = None
+    async for meal_log in meal_log_repository.stream_records(
+        batch_size=batch_size,
+        columns=COLUMNS,
+    ):
+        day = MealDayUtility.day_of(meal_log.created_on)
+        if summary is None or (summary.user_id, summary.day) != (
+            meal_log.user_id, day
+        ):
+            if summary is not None:
+                await summary_repository.upsert_summary(summary)
+                written += 1
+                if written % commit_every == 0:
+                    await summary_repository.commit()
+                    logger.info(f"Backfilled {written} daily summaries")
+            summary = MealDailySummary(
+                user_id=meal_log.user_id,
+                day=day,
+                meal_count=0,
+                total_calories=0,
+                macros={},
+                micros={},
+            )
+        summary_repository.add_meal(summary, meal_log)
+
+    if summary is not None:
+        await summary_repository.upsert_summary(summary)
+        written += 1
+    await summary_repository.commit()
+    logger.info(f"Backfilled {written} daily summaries")
+    return written
+
+
+async def main(batch_size: int, commit_every: int) -> None:
+    async with AsyncSessionLocal() as read_session, \
+            AsyncSessionLocal() as write_session:
+        await backfill(
+            read_session=read_session,
+            write_session=write_session,
+            batch_size=batch_size,
+            commit_every=commit_every,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=Default.MEAL_HISTORY_STREAM_BATCH_SIZE,
+    )
+    parser.add_argument("--commit-every", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(
+        main(batch_size=args.batch_size, commit_every=args.commit_every)
+    )
@@ -1,38 +1,74 @@
-from fastapi import Request, Response
-from fastapi.responses import JSONResponse
+from fastapi import Request
 from http import HTTPStatus, HTTPMethod
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+from typing import Optional
 
 from constants.api_status import APIStatus
 
 from dtos.responses.base import BaseResponseDTO
 
-from repositories.user import UserRepository
+from repositories.async_user import AsyncUserRepository
 
-from start_utils import db_session, logger, unprotected_routes, callback_routes
+from responses.dto import DTOResponse
+
+from start_utils import (
+    AsyncSessionLocal,
+    async_redis_session,
+    logger,
+    unprotected_routes,
+    callback_routes,
+)
 
 from utilities.jwt import JWTUtility
+from utilities.session_state import SessionStateUtility
+
 
+class AuthenticationMiddleware:
+    """
+    Pure ASGI middleware that authenticates protected routes and stores
+    the caller's user_id and user_urn on `request.state`.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-class AuthenticationMiddleware(BaseHTTPMiddleware):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
 
-    async def dispatch(self, request: Request, call_next):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
+        response: Optional[DTOResponse] = await self.authenticate(
+            request=Request(scope)
+        )
+        if response is not None:
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+    async def authenticate(self, request: Request) -> Optional[DTOResponse]:
+        """
+        Authenticate the request.
+        Args:
+            request (Request): Incoming HTTP request.
+        Returns:
+            Optional[DTOResponse]: Error response when the request is
+            rejected, else None to continue with the request.
+        """
         logger.debug("Inside authentication middleware")
 
         urn: str = request.state.urn
         endpoint: str = request.url.path
 
         if request.method == HTTPMethod.OPTIONS:
-            return await call_next(request)
+            return None
 
         logger.debug(f"Received request for endpoint: {endpoint}")
 
         if endpoint in unprotected_routes.union(callback_routes):
 
             logger.debug("Accessing Unprotected Route", urn=request.state.urn)
-            response: Response = await call_next(request)
-            return response
+            return None
 
         logger.debug("Accessing Protected Route", urn=request.state.urn)
         token: str = request.headers.get("authorization")
@@ -48,8 +84,8 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             )
             httpStatusCode = HTTPStatus.UNAUTHORIZED
             logger.debug("Prepared response metadata", urn=request.state.urn)
-            return JSONResponse(
-                content=response_dto.model_dump(), status_code=httpStatusCode
+            return DTOResponse(
+                content=response_dto, status_code=httpStatusCode
             )
 
         try:
@@ -67,18 +103,31 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             logger.debug(
                 "Fetching user logged in status.", urn=request.state.urn
             )
-            user = UserRepository(
-                urn=urn, session=db_session
-            ).retrieve_record_by_id_and_is_logged_in(
-                id=user_data.get("user_id"),
-                is_logged_in=True,
-                is_deleted=False,
+            session_state_utility = SessionStateUtility(
+                urn=urn, cache=async_redis_session
             )
+            is_logged_in = await session_state_utility.get(
+                user_id=user_data.get("user_id")
+            )
+            if is_logged_in is None:
+                async with AsyncSessionLocal() as session:
+                    user = await AsyncUserRepository(
+                        urn=urn, session=session
+                    ).retrieve_record_by_id_and_is_logged_in(
+                        id=user_data.get("user_id"),
+                        is_logged_in=True,
+                        is_deleted=False,
+                    )
+                is_logged_in = bool(user)
+                await session_state_utility.fill(
+                    user_id=user_data.get("user_id"),
+                    is_logged_in=is_logged_in,
+                )
             logger.debug(
                 "Fetched user logged in status.", urn=request.state.urn
             )
 
-            if not user:
+            if not is_logged_in:
 
                 logger.debug(
                     "Preparing response metadata", urn=request.state.urn
@@ -93,8 +142,8 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
                 logger.debug(
                     "Prepared response metadata", urn=request.state.urn
                 )
-                return JSONResponse(
-                    content=response_dto.model_dump(),
+                return DTOResponse(
+                    content=response_dto,
                     status_code=httpStatusCode,
                 )
 
@@ -119,13 +168,11 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             )
             httpStatusCode = HTTPStatus.UNAUTHORIZED
             logger.debug("Prepared response metadata", urn=request.state.urn)
-            return JSONResponse(
-                content=response_dto.model_dump(), status_code=httpStatusCode
+            return DTOResponse(
+                content=response_dto, status_code=httpStatusCode
             )
 
         logger.debug(
             "Procceding with the request execution.", urn=request.state.urn
         )
-        response: Response = await call_next(request)
-
-        return response
+        return None
@@ -1,14 +1,17 @@
+import math
 import time
-import asyncio
 from typing import Dict, Optional, Tuple
-from collections import defaultdict, deque
 from fastapi import Request
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from http import HTTPStatus
 
+from abstractions.rate_limit_store import IRateLimitStore
 from constants.api_status import APIStatus
 from dtos.responses.base import BaseResponseDTO
+from dtos.stores.rate_limit.result import RateLimitResultDTO
+from responses.dto import DTOResponse
+from stores.rate_limit.memory_store import MemoryRateLimitStore
 from start_utils import (
     logger,
     RATE_LIMIT_BURST_LIMIT,
@@ -61,87 +64,18 @@ class RateLimitConfig:
         )
 
 
-class RateLimitStore:
+class RateLimitMiddleware:
     """
-    In-memory store for rate limiting data.
-    Handles sliding window counters and provides thread-safe access.
-    """
-    def __init__(self):
-        self._sliding_windows: Dict[str, deque] = defaultdict(deque)
-        self._lock = asyncio.Lock()
-        logger.debug("Initialized RateLimitStore")
-
-    async def check_sliding_window(
-        self, key: str, limit: int, window: int
-    ) -> Tuple[bool, int]:
-        """
-        Check sliding window rate limit for a given key.
-
-        Args:
-            key (str): Unique identifier for the client/endpoint.
-            limit (int): Maximum allowed requests in the window.
-            window (int): Window size in seconds.
-        Returns:
-            Tuple[bool, int]: (allowed, current_count)
-        """
-        async with self._lock:
-            now = time.time()
-            window_start = now - window
-
-            while (
-                self._sliding_windows[key] and
-                self._sliding_windows[key][0] < window_start
-            ):
-                self._sliding_windows[key].popleft()
-
-            if len(self._sliding_windows[key]) >= limit:
-                logger.info(
-                    "Sliding window limit exceeded",
-                    key=key,
-                    limit=limit,
-                    window=window,
-                    current_count=len(self._sliding_windows[key]),
-                )
-                return False, len(self._sliding_windows[key])
-
-            self._sliding_windows[key].append(now)
-            logger.debug(
-                "Sliding window incremented",
-                key=key,
-                current_count=len(self._sliding_windows[key]),
-            )
-            return True, len(self._sliding_windows[key])
-
-    async def cleanup_old_entries(self, max_age: int = 3600):
-        """
-        Clean up old rate limiting entries older than max_age seconds.
-        Args:
-            max_age (int): Maximum age in seconds for entries to keep.
-        """
-        async with self._lock:
-            now = time.time()
-            for key in list(self._sliding_windows.keys()):
-                while (
-                    self._sliding_windows[key] and
-                    self._sliding_windows[key][0] < now - max_age
-                ):
-                    self._sliding_windows[key].popleft()
-                if not self._sliding_windows[key]:
-                    del self._sliding_windows[key]
-            logger.debug("Cleaned up old rate limit entries", max_age=max_age)
-
-
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """
-    Rate limiting middleware with multiple strategies.
+    Pure ASGI rate limiting middleware with multiple strategies.
     Supports sliding window, token bucket, and fixed window algorithms.
     """
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         config: Optional[RateLimitConfig] = None,
         excluded_paths: Optional[set] = None,
         excluded_methods: Optional[set] = None,
+        store: Optional[IRateLimitStore] = None,
     ):
         """
         Initialize the RateLimitMiddleware.
@@ -150,28 +84,21 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             config (RateLimitConfig): Configuration for rate limiting.
             excluded_paths (set): Paths to exclude from rate limiting.
             excluded_methods (set): HTTP methods to exclude.
+            store (IRateLimitStore): Counter store; defaults to an
+            in-memory store local to this worker.
         """
-        super().__init__(app)
+        self.app = app
         self.config = config or RateLimitConfig()
         self.excluded_paths = (
             excluded_paths or unprotected_routes
         )
         self.excluded_methods = excluded_methods or {"OPTIONS"}
-        self.store = RateLimitStore()
+        self.store = store or MemoryRateLimitStore()
         logger.info(
             "RateLimitMiddleware initialized",
             config=self.config.__dict__,
+            store=type(self.store).__name__,
         )
-        asyncio.create_task(self._cleanup_task())
-
-    async def _cleanup_task(self):
-        """
-        Periodic cleanup of old rate limiting entries.
-        """
-        while True:
-            await asyncio.sleep(300)
-            await self.store.cleanup_old_entries()
-            logger.debug("Periodic rate limit cleanup executed")
 
     def _get_client_identifier(self, request: Request) -> str:
         """
@@ -216,57 +143,116 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     async def _check_rate_limits(
         self,
         key: str,
-    ) -> Tuple[bool, Dict[str, any]]:
+    ) -> Tuple[bool, Dict[str, RateLimitResultDTO]]:
         """
         Check all enabled rate limiting strategies for a given key.
         Args:
             key (str): Unique identifier for the client/endpoint.
         Returns:
-            Tuple[bool, Dict[str, any]]: (allowed, details per strategy)
+            Tuple[bool, Dict[str, RateLimitResultDTO]]: (allowed, result
+            per strategy)
         """
+        checks = []
+        if self.config.enable_sliding_window:
+            checks.append((
+                "sliding_minute",
+                self.store.check_sliding_window,
+                (
+                    f"{key}:sliding:minute",
+                    self.config.requests_per_minute,
+                    60,
+                ),
+            ))
+            checks.append((
+                "sliding_hour",
+                self.store.check_sliding_window,
+                (f"{key}:sliding:hour", self.config.requests_per_hour, 3600),
+            ))
+        if self.config.enable_fixed_window:
+            checks.append((
+                "fixed_minute",
+                self.store.check_fixed_window,
+                (
+                    f"{key}:fixed:minute",
+                    self.config.requests_per_minute,
+                    60,
+                ),
+            ))
+            checks.append((
+                "fixed_hour",
+                self.store.check_fixed_window,
+                (f"{key}:fixed:hour", self.config.requests_per_hour, 3600),
+            ))
+        if self.config.enable_token_bucket:
+            # The bucket allows bursts of up to burst_limit requests and
+            # refills at the sustained per-minute rate.
+            checks.append((
+                "token_bucket",
+                self.store.check_token_bucket,
+                (
+                    f"{key}:token_bucket",
+                    self.config.burst_limit,
+                    self.config.requests_per_minute / 60,
+                ),
+            ))
+
         results = {}
         logger.debug("Checking rate limits", key=key)
-
-        if self.config.enable_sliding_window:
-            allowed, count = await self.store.check_sliding_window(
-                f"{key}:sliding:minute",
-                self.config.requests_per_minute,
-                60
-            )
-            results["sliding_minute"] = {"allowed": allowed, "count": count}
-            if not allowed:
+        for strategy, check, args in checks:
+            result = await check(*args)
+            results[strategy] = result
+            if not result.allowed:
                 logger.info(
-                    "Sliding window minute limit exceeded",
+                    "Rate limit strategy exceeded",
                     key=key,
-                    count=count,
-                )
-                return False, results
-
-        if self.config.enable_sliding_window:
-            allowed, count = await self.store.check_sliding_window(
-                f"{key}:sliding:hour",
-                self.config.requests_per_hour,
-                3600
-            )
-            results["sliding_hour"] = {"allowed": allowed, "count": count}
-            if not allowed:
-                logger.info(
-                    "Sliding window hour limit exceeded", key=key, count=count
+                    strategy=strategy,
+                    retry_after=result.retry_after,
                 )
                 return False, results
 
         logger.debug("Rate limits passed", key=key, results=results)
         return True, results
 
-    async def dispatch(self, request: Request, call_next):
+    @staticmethod
+    def _rate_limit_headers(
+        results: Dict[str, RateLimitResultDTO],
+    ) -> Dict[str, str]:
         """
-        Process the request with rate limiting.
+        Build X-RateLimit-* headers from the most restrictive result.
         Args:
-            request (Request): Incoming HTTP request.
-            call_next: Next middleware or route handler.
+            results (Dict[str, RateLimitResultDTO]): Result per strategy.
         Returns:
-            Response: HTTP response, possibly a rate limit error.
+            Dict[str, str]: Rate limit headers, empty if nothing was checked.
+        """
+        if not results:
+            return {}
+        result = min(
+            results.values(),
+            key=lambda result: (
+                result.allowed, result.remaining, -result.reset_after
+            ),
+        )
+        return {
+            "X-RateLimit-Limit": str(result.limit),
+            "X-RateLimit-Remaining": str(result.remaining),
+            "X-RateLimit-Reset": str(
+                math.ceil(time.time() + result.reset_after)
+            ),
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
         """
+        Process the request with rate limiting.
+        Args:
+            scope (Scope): ASGI connection scope.
+            receive (Receive): ASGI receive channel.
+            send (Send): ASGI send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
         logger.info(
             "Received request for rate limiting",
             path=request.url.path,
@@ -281,16 +267,26 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 path=request.url.path,
                 method=request.method,
             )
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         key = self._get_rate_limit_key(request)
         allowed, results = await self._check_rate_limits(key)
 
+        rate_limit_headers = self._rate_limit_headers(results)
+
         if not allowed:
-            exceeded_limits = []
-            for strategy, result in results.items():
-                if not result.get("allowed", True):
-                    exceeded_limits.append(strategy)
+            exceeded_limits = [
+                strategy for strategy, result in results.items()
+                if not result.allowed
+            ]
+            retry_after = max(
+                1,
+                math.ceil(max(
+                    results[strategy].retry_after
+                    for strategy in exceeded_limits
+                )),
+            )
 
             response_dto = BaseResponseDTO(
                 transactionUrn=getattr(request.state, "urn", None),
@@ -299,7 +295,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 responseKey="error_rate_limit_exceeded",
                 data={
                     "exceeded_limits": exceeded_limits,
-                    "retry_after": 60,  # seconds
+                    "retry_after": retry_after,  # seconds
                 }
             )
 
@@ -315,33 +311,29 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 key=key,
                 exceeded_limits=exceeded_limits,
             )
-            return JSONResponse(
-                content=response_dto.model_dump(),
+            response = DTOResponse(
+                content=response_dto,
                 status_code=HTTPStatus.TOO_MANY_REQUESTS,
                 headers={
-                    "Retry-After": "60",
-                    "X-RateLimit-Limit": str(self.config.requests_per_minute),
-                    "X-RateLimit-Remaining": "0",
-                    "X-RateLimit-Reset": str(int(time.time()) + 60)
+                    "Retry-After": str(retry_after),
+                    **rate_limit_headers,
                 }
             )
+            await response(scope, receive, send)
+            return
 
-        response = await call_next(request)
-
-        remaining = max(0, self.config.requests_per_minute - 1)
-        reset_time = int(time.time()) + 60
+        async def send_with_rate_limit_headers(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in rate_limit_headers.items():
+                    headers[name] = value
 
-        response.headers["X-RateLimit-Limit"] = str(
-            self.config.requests_per_minute
-        )
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Reset"] = str(reset_time)
+                logger.info(
+                    "Request allowed, response sent",
+                    path=request.url.path,
+                    method=request.method,
+                    rate_limit_headers=rate_limit_headers,
+                )
+            await send(message)
 
-        logger.info(
-            "Request allowed, response sent",
-            path=request.url.path,
-            method=request.method,
-            remaining=remaining,
-            reset_time=reset_time,
-        )
-        return response
+        await self.app(scope, receive, send_with_rate_limit_headers)
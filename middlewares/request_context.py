@@ -1,31 +1,47 @@
 from datetime import datetime
 from ulid import ulid
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from start_utils import logger
 
 
-class RequestContextMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
+class RequestContextMiddleware:
+    """
+    Pure ASGI middleware that assigns a request URN and timestamp to
+    `request.state` and reports them in the response headers.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         logger.debug("Inside request context middleware")
 
         start_time: datetime = datetime.now()
         logger.debug("Generating request urn", urn=None)
         request_urn: str = ulid()
-        request.state.urn = request_urn
-        request.state.request_timestamp = start_time
+        state: dict = scope.setdefault("state", {})
+        state["urn"] = request_urn
+        state["request_timestamp"] = start_time
         logger.debug("Generated request urn", urn=request_urn)
 
-        response: Response = await call_next(request)
-
-        end_time: datetime = datetime.now()
-        process_time = end_time - start_time
-        logger.debug("Updating process time header", urn=request_urn)
-        response.headers["X-Process-Time"] = str(process_time)
-        response.headers["X-Request-URN"] = request_urn
-        logger.debug("Updated process time header", urn=request_urn)
-
-        return response
+        async def send_with_context(message: Message):
+            if message["type"] == "http.response.start":
+                end_time: datetime = datetime.now()
+                process_time = end_time - start_time
+                logger.debug(
+                    "Updating process time header", urn=request_urn
+                )
+                headers = MutableHeaders(scope=message)
+                headers["X-Process-Time"] = str(process_time)
+                headers["X-Request-URN"] = request_urn
+                logger.debug("Updated process time header", urn=request_urn)
+            await send(message)
+
+        await self.app(scope, receive, send_with_context)
@@ -1,5 +1,5 @@
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from start_utils import logger
 
@@ -91,15 +91,15 @@ class SecurityHeadersConfig:
         )
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """
-    Middleware to add security headers to all responses.
+    Pure ASGI middleware to add security headers to all responses.
     Adds CSP, HSTS, X-Frame-Options, X-Content-Type-Options,
     X-XSS-Protection, Referrer-Policy, and Permissions-Policy headers.
     """
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         content_security_policy: str = None,
         strict_transport_security: str = None,
         x_frame_options: str = "DENY",
@@ -125,7 +125,7 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             enable_hsts (bool): Enable HSTS header.
             enable_csp (bool): Enable CSP header.
         """
-        super().__init__(app)
+        self.app = app
         self.content_security_policy = (
             content_security_policy or self._get_default_csp()
         )
@@ -212,46 +212,57 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             "xr-spatial-tracking=()"
         )
 
-    async def dispatch(self, request: Request, call_next):
+    def _apply_headers(self, headers: MutableHeaders) -> None:
         """
-        Add security headers to the response.
+        Add security headers to the response headers.
         Args:
-            request (Request): Incoming HTTP request.
-            call_next: Next middleware or route handler.
-        Returns:
-            Response: HTTP response with security headers.
+            headers (MutableHeaders): Headers of the response start message.
         """
-        logger.debug(
-            "Applying security headers",
-            path=request.url.path,
-            method=request.method,
-        )
-        response = await call_next(request)
-
         if self.enable_csp:
-            response.headers["Content-Security-Policy"] = (
+            headers["Content-Security-Policy"] = (
                 self.content_security_policy
             )
 
         if self.enable_hsts:
-            response.headers["Strict-Transport-Security"] = (
+            headers["Strict-Transport-Security"] = (
                 self.strict_transport_security
             )
 
-        response.headers["X-Frame-Options"] = self.x_frame_options
-        response.headers["X-Content-Type-Options"] = (
-            self.x_content_type_options
-        )
-        response.headers["X-XSS-Protection"] = self.x_xss_protection
-        response.headers["Referrer-Policy"] = self.referrer_policy
-        response.headers["Permissions-Policy"] = self.permissions_policy
-        response.headers["X-Download-Options"] = "noopen"
-        response.headers["X-Permitted-Cross-Domain-Policies"] = "none"
+        headers["X-Frame-Options"] = self.x_frame_options
+        headers["X-Content-Type-Options"] = self.x_content_type_options
+        headers["X-XSS-Protection"] = self.x_xss_protection
+        headers["Referrer-Policy"] = self.referrer_policy
+        headers["Permissions-Policy"] = self.permissions_policy
+        headers["X-Download-Options"] = "noopen"
+        headers["X-Permitted-Cross-Domain-Policies"] = "none"
 
-        if "Server" in response.headers:
-            del response.headers["Server"]
+        if "Server" in headers:
+            del headers["Server"]
 
-        logger.info(
-            "Security headers applied"
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """
+        Add security headers to the response.
+        Args:
+            scope (Scope): ASGI connection scope.
+            receive (Receive): ASGI receive channel.
+            send (Send): ASGI send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        logger.debug(
+            "Applying security headers",
+            path=scope["path"],
+            method=scope["method"],
         )
-        return response
+
+        async def send_with_security_headers(message: Message):
+            if message["type"] == "http.response.start":
+                self._apply_headers(MutableHeaders(scope=message))
+                logger.info(
+                    "Security headers applied"
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_security_headers)
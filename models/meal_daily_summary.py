@@ -0,0 +1,61 @@
+"""
+SQLAlchemy model for the meal_daily_summary table, holding each user's
+per-day nutrition totals so that daily summaries are read without scanning
+meal logs.
+"""
+from datetime import datetime
+from sqlalchemy import (
+    Column,
+    BigInteger,
+    Date,
+    DateTime,
+    Float,
+    Integer,
+    JSON,
+    String,
+    ForeignKey,
+    UniqueConstraint,
+)
+
+from constants.db.table import Table
+
+from models import Base
+from models.user import User
+
+
+class MealDailySummary(Base):
+    """
+    SQLAlchemy model for one user's nutrition totals on one day.
+    Fields:
+        id (BigInteger): Primary key.
+        user_id (BigInteger): Foreign key to User.id.
+        day (date): UTC day the meals were logged on.
+        meal_count (int): Number of meals logged on the day.
+        total_calories (float): Sum of the meals' total calories.
+        calories_unit (str): Unit for calories.
+        macros (JSON): Macronutrient name -> {"amount", "unit"} totals.
+        micros (JSON): Micronutrient name -> {"amount", "unit"} totals.
+        created_on (datetime): Creation timestamp.
+        updated_on (datetime): Last update timestamp.
+    """
+    __tablename__ = Table.MEAL_DAILY_SUMMARY
+    __table_args__ = (
+        UniqueConstraint(
+            'user_id', 'day', name='uq_meal_daily_summary_user_id_day'
+        ),
+    )
+
+    id = Column(BigInteger, primary_key=True)
+    user_id = Column(BigInteger, ForeignKey(User.id), nullable=False)
+    day = Column(Date, nullable=False)
+    meal_count = Column(Integer, nullable=False, default=0)
+    total_calories = Column(Float, nullable=False, default=0)
+    calories_unit = Column(String)
+    macros = Column(JSON, nullable=False, default=dict)
+    micros = Column(JSON, nullable=False, default=dict)
+    created_on = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=datetime.utcnow
+    )
+    updated_on = Column(DateTime(timezone=True))
@@ -4,22 +4,28 @@ nutritional details.
 """
 from datetime import datetime
 from sqlalchemy import (
+    ARRAY,
     Column,
     BigInteger,
     String,
     DateTime,
     Boolean,
+    Float,
     Index,
     Integer,
-    JSON,
-    ForeignKey
+    ForeignKey,
+    text
 )
+from sqlalchemy.dialects.postgresql import JSONB
+from typing import Any, Dict
 
 from constants.db.table import Table
 
 from models import Base
 from models.user import User
 
+from utilities.nutrient_vector import NutrientVectorUtility
+
 
 class MealLog(Base):
     """
@@ -30,9 +36,10 @@ class MealLog(Base):
         user_id (BigInteger): Foreign key to User.id.
         meal_name (str): Name of the meal.
         servings (int): Number of servings.
-        nutrients (JSON): Nutritional information.
-        ingredients (JSON): List of ingredients.
-        instructions (JSON): Cooking instructions.
+        nutrient_vector (ARRAY[Float]): Per-serving nutrient amounts,
+            ordered by Nutrients.VECTOR. Read and written as `nutrients`.
+        ingredients (JSONB): List of ingredients.
+        instructions (JSONB): Cooking instructions.
         total_calories_per_serving (int): Calories per serving.
         calories_unit (str): Unit for calories.
         total_calories (int): Total calories for the meal.
@@ -55,9 +62,9 @@ class MealLog(Base):
     )
     meal_name = Column(String, index=True)
     servings = Column(Integer)
-    nutrients = Column(JSON)
-    ingredients = Column(JSON)
-    instructions = Column(JSON)
+    nutrient_vector = Column(ARRAY(Float))
+    ingredients = Column(JSONB)
+    instructions = Column(JSONB)
     total_calories_per_serving = Column(Integer)
     calories_unit = Column(String)
     total_calories = Column(Integer)
@@ -72,7 +79,34 @@ class MealLog(Base):
     updated_on = Column(DateTime(timezone=True))
     updated_by = Column(BigInteger)
 
+    @property
+    def nutrients(self) -> Dict[str, Any] | None:
+        """Nutritional information as {"macros": [...], "micros": [...]}."""
+        return NutrientVectorUtility.decode(self.nutrient_vector)
+
+    @nutrients.setter
+    def nutrients(self, value: Dict[str, Any] | None) -> None:
+        self.nutrient_vector = NutrientVectorUtility.encode(value)
+
 
 Index('ix_meal_log_urn', MealLog.urn)
 Index('ix_meal_log_meal_name', MealLog.meal_name)
+Index(
+    'ix_meal_log_meal_name_trgm',
+    MealLog.meal_name,
+    postgresql_using='gin',
+    postgresql_ops={'meal_name': 'gin_trgm_ops'},
+)
 Index('ix_meal_log_created_on', MealLog.created_on)
+Index(
+    'ix_meal_log_user_id_created_on',
+    MealLog.user_id,
+    MealLog.created_on,
+    postgresql_where=text('is_deleted = false'),
+)
+Index(
+    'ix_meal_log_ingredients',
+    MealLog.ingredients,
+    postgresql_using='gin',
+    postgresql_ops={'ingredients': 'jsonb_path_ops'},
+)
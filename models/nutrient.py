@@ -0,0 +1,26 @@
+"""
+SQLAlchemy model for the nutrient table, the lookup of names and units for
+the positions of meal_log.nutrient_vector.
+"""
+from sqlalchemy import Column, SmallInteger, String
+
+from constants.db.table import Table
+
+from models import Base
+
+
+class Nutrient(Base):
+    """
+    SQLAlchemy model for a tracked nutrient.
+    Fields:
+        id (SmallInteger): Primary key; position + 1 in the nutrient vector.
+        name (str): USDA nutrient name.
+        unit (str): Unit of the stored amounts.
+        category (str): "macros" or "micros".
+    """
+    __tablename__ = Table.NUTRIENT
+
+    id = Column(SmallInteger, primary_key=True, autoincrement=False)
+    name = Column(String, nullable=False, unique=True)
+    unit = Column(String, nullable=False)
+    category = Column(String, nullable=False)
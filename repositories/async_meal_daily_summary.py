@@ -0,0 +1,228 @@
+"""
+Async repository for the per-day nutrition rollup of meal logs, kept up to
+date as meals are added and read by the meal summary API.
+"""
+from datetime import date, datetime
+from sqlalchemy import Row, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List
+
+from models.meal_daily_summary import MealDailySummary
+from models.meal_log import MealLog
+
+from abstractions.async_repository import IAsyncRepository
+
+from utilities.meal_day import MealDayUtility
+from utilities.nutrient_vector import NutrientVectorUtility
+
+
+class AsyncMealDailySummaryRepository(IAsyncRepository):
+    """
+    Async repository for daily meal summaries.
+    Provides awaitable methods to fold meals into their day's totals and
+    to read totals over a date range.
+    """
+
+    def __init__(
+        self,
+        urn: str = None,
+        user_urn: str = None,
+        api_name: str = None,
+        session: AsyncSession = None,
+        user_id: str = None,
+    ):
+        super().__init__(
+            urn=urn,
+            user_urn=user_urn,
+            api_name=api_name,
+            user_id=user_id,
+            model=MealDailySummary,
+            session=session,
+        )
+        self.logger.debug(
+            f"AsyncMealDailySummaryRepository initialized for "
+            f"user_id={user_id}, urn={urn}, api_name={api_name}"
+        )
+
+    @staticmethod
+    def add_nutrients(
+        totals: Dict[str, Dict[str, Any]],
+        nutrients: List[Dict[str, Any]],
+        servings: int,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Add a meal's per-serving nutrients, times its servings, to totals.
+        Args:
+            totals (dict): Nutrient name -> {"amount", "unit"}.
+            nutrients (list): [{"name", "amount", "unit"}] of one serving.
+            servings (int): Servings eaten.
+        Returns:
+            dict: New totals; `totals` is left unchanged so that the JSON
+            column sees a new value.
+        """
+        totals = {name: dict(entry) for name, entry in (totals or {}).items()}
+        for nutrient in nutrients or []:
+            entry = totals.setdefault(
+                nutrient["name"],
+                {"amount": 0, "unit": nutrient.get("unit")},
+            )
+            entry["amount"] = round(
+                entry["amount"] + (nutrient.get("amount") or 0) * servings, 4
+            )
+        return totals
+
+    @classmethod
+    def add_meal(
+        cls,
+        summary: MealDailySummary,
+        meal_log: MealLog | Row,
+    ) -> MealDailySummary:
+        """
+        Fold one meal log into a day's summary.
+        Args:
+            summary (MealDailySummary): Summary of the meal's day.
+            meal_log (MealLog | Row): Meal log, or a row with servings,
+            nutrient_vector, total_calories and calories_unit.
+        Returns:
+            MealDailySummary: The updated summary.
+        """
+        nutrients = (
+            NutrientVectorUtility.decode(meal_log.nutrient_vector) or {}
+        )
+        servings = meal_log.servings or 1
+        summary.meal_count = (summary.meal_count or 0) + 1
+        summary.total_calories = (
+            (summary.total_calories or 0) + (meal_log.total_calories or 0)
+        )
+        summary.calories_unit = summary.calories_unit or meal_log.calories_unit
+        summary.macros = cls.add_nutrients(
+            summary.macros, nutrients.get("macros"), servings
+        )
+        summary.micros = cls.add_nutrients(
+            summary.micros, nutrients.get("micros"), servings
+        )
+        return summary
+
+    async def apply_meal(self, meal_log: MealLog) -> MealDailySummary:
+        """
+        Fold a new meal log into its day's summary, creating the summary on
+        the day's first meal. The row is locked until the caller commits,
+        so concurrent meals of the same day are applied one at a time.
+        Does not commit.
+        Args:
+            meal_log (MealLog): The meal log being added.
+        Returns:
+            MealDailySummary: The updated summary.
+        """
+        day = MealDayUtility.day_of(meal_log.created_on)
+        self.logger.info(
+            f"Applying meal to summary of user_id: {meal_log.user_id} "
+            f"on {day}"
+        )
+        start_time = datetime.now()
+        query = (
+            select(self.model)
+            .where(
+                self.model.user_id == meal_log.user_id,
+                self.model.day == day,
+            )
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        summary = await self.session.scalar(query)
+        if summary is None:
+            # The first meals of a day race to create the row; the losing
+            # insert is a no-op and then waits on the winner's lock.
+            await self.session.execute(
+                insert(self.model)
+                .values(
+                    user_id=meal_log.user_id,
+                    day=day,
+                    meal_count=0,
+                    total_calories=0,
+                    macros={},
+                    micros={},
+                    created_on=datetime.now(),
+                )
+                .on_conflict_do_nothing(
+                    constraint="uq_meal_daily_summary_user_id_day"
+                )
+            )
+            summary = await self.session.scalar(query)
+
+        self.add_meal(summary, meal_log)
+        summary.updated_on = datetime.now()
+        await self.session.flush()
+        end_time = datetime.now()
+        execution_time = end_time - start_time
+        self.logger.info(f"Execution time: {execution_time} seconds")
+
+        return summary
+
+    async def upsert_summary(self, summary: MealDailySummary) -> None:
+        """
+        Insert a summary, or replace the totals of the existing summary of
+        the same user and day. Does not commit.
+        Args:
+            summary (MealDailySummary): Transient summary with full totals.
+        """
+        now = datetime.now()
+        totals = {
+            "meal_count": summary.meal_count,
+            "total_calories": summary.total_calories,
+            "calories_unit": summary.calories_unit,
+            "macros": summary.macros,
+            "micros": summary.micros,
+            "updated_on": now,
+        }
+        await self.session.execute(
+            insert(self.model)
+            .values(
+                user_id=summary.user_id,
+                day=summary.day,
+                created_on=now,
+                **totals,
+            )
+            .on_conflict_do_update(
+                constraint="uq_meal_daily_summary_user_id_day",
+                set_=totals,
+            )
+        )
+
+    async def retrieve_by_user_id_date_range(
+        self,
+        user_id: int,
+        from_date: date,
+        to_date: date,
+    ) -> List[MealDailySummary]:
+        """
+        Retrieve a user's daily summaries within a date range.
+        Args:
+            user_id (int): User's ID.
+            from_date (date): First day, inclusive.
+            to_date (date): Last day, inclusive.
+        Returns:
+            list[MealDailySummary]: Summaries of days with meals, by day.
+        """
+        self.logger.info(
+            f"Retrieving meal summaries for user_id: {user_id} "
+            f"from {from_date} to {to_date}"
+        )
+        start_time = datetime.now()
+        records = (
+            await self.session.scalars(
+                select(self.model)
+                .where(
+                    self.model.user_id == user_id,
+                    self.model.day >= from_date,
+                    self.model.day <= to_date,
+                )
+                .order_by(self.model.day.asc())
+            )
+        ).all()
+        end_time = datetime.now()
+        execution_time = end_time - start_time
+        self.logger.info(f"Execution time: {execution_time} seconds")
+
+        return records
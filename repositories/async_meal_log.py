@@ -0,0 +1,586 @@
+"""
+Async repository for meal log data access, providing awaitable methods to
+query and manage meal logs through an AsyncSession.
+"""
+from datetime import datetime, timedelta
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    false,
+    func,
+    select,
+    true,
+    tuple_,
+)
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import (
+    AsyncIterator,
+    Dict,
+    Final,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from constants.default import Default
+from constants.meal.nutrients import Nutrients
+
+from models.meal_log import MealLog
+
+from abstractions.async_repository import IAsyncRepository
+from rapidfuzz import process, fuzz
+
+from utilities.meal_name_index import MealNameIndexUtility
+
+
+class AsyncMealLogRepository(IAsyncRepository):
+    """
+    Async repository for meal log data access and queries.
+    Provides awaitable methods to retrieve meal logs by various criteria.
+    """
+    TRIGRAM_CANDIDATES: Final[int] = 50
+
+    def __init__(
+        self,
+        urn: str = None,
+        user_urn: str = None,
+        api_name: str = None,
+        session: AsyncSession = None,
+        user_id: str = None,
+    ):
+        super().__init__(
+            urn=urn,
+            user_urn=user_urn,
+            api_name=api_name,
+            user_id=user_id,
+            model=MealLog,
+            session=session,
+        )
+        self.logger.debug(
+            f"AsyncMealLogRepository initialized for user_id={user_id}, "
+            f"urn={urn}, api_name={api_name}"
+        )
+
+    def _select(self, columns: Optional[Sequence[str]] = None) -> Select:
+        """
+        Select whole meal logs, or only the named columns when given.
+        Projected rows are plain tuples that the session does not track.
+        """
+        if not columns:
+            return select(self.model)
+        return select(*(getattr(self.model, column) for column in columns))
+
+    def _filters(
+        self,
+        ingredient: Optional[str] = None,
+        min_nutrients: Optional[Dict[str, float]] = None,
+    ) -> List[ColumnElement]:
+        """
+        SQL conditions for meals containing `ingredient` and holding at
+        least the given per-serving amount of each nutrient.
+
+        The ingredient test is JSONB containment, served by the GIN index
+        ix_meal_log_ingredients. Nutrient amounts are read from their
+        position in nutrient_vector (1-based in SQL).
+        """
+        filters = []
+        if ingredient:
+            filters.append(
+                self.model.ingredients.contains([{"name": ingredient}])
+            )
+        for name, amount in (min_nutrients or {}).items():
+            if name not in Nutrients.VECTOR:
+                raise ValueError(f"Unknown nutrient: {name}")
+            position = Nutrients.VECTOR.index(name) + 1
+            filters.append(self.model.nutrient_vector[position] >= amount)
+        return filters
+
+    def _history_query(
+        self,
+        user_id: int,
+        from_date: datetime,
+        to_date: datetime,
+        is_deleted: bool = False,
+        columns: Optional[Sequence[str]] = None,
+        ingredient: Optional[str] = None,
+        min_nutrients: Optional[Dict[str, float]] = None,
+    ) -> Select:
+        """
+        Select a user's meal logs created on or after `from_date` and before
+        the day after `to_date`, ordered by (created_on, id), optionally
+        narrowed by ingredient and minimum nutrient amounts.
+
+        The half-open bounds and the literal `is_deleted = false` let the
+        planner match the partial ix_meal_log_user_id_created_on index,
+        including for prepared statements.
+        """
+        return (
+            self._select(columns)
+            .where(
+                self.model.user_id == user_id,
+                self.model.created_on >= from_date,
+                self.model.created_on < to_date + timedelta(days=1),
+                self.model.is_deleted == (true() if is_deleted else false()),
+                *self._filters(
+                    ingredient=ingredient,
+                    min_nutrients=min_nutrients,
+                ),
+            )
+            .order_by(self.model.created_on.asc(), self.model.id.asc())
+        )
+
+    async def _all(
+        self,
+        query: Select,
+        columns: Optional[Sequence[str]] = None,
+    ) -> List[MealLog | Row]:
+        if columns:
+            return (await self.session.execute(query)).all()
+        return (await self.session.scalars(query)).all()
+
+    async def retrieve_record_by_meal_name(
+        self,
+        meal_name: str,
+        is_deleted: bool = False,
+    ) -> MealLog:
+        """
+        Retrieve a meal log by meal name.
+        Args:
+            meal_name (str): Name of the meal.
+            is_deleted (bool): Whether to include deleted records.
+        Returns:
+            MealLog: The meal log record if found, else None.
+        """
+        self.logger.info(f"Retrieving meal log by meal_name: {meal_name}")
+        start_time = datetime.now()
+        record = await self.session.scalar(
+            select(self.model)
+            .where(
+                self.model.meal_name == meal_name,
+                self.model.is_deleted == is_deleted
+            )
+            .limit(1)
+        )
+        end_time = datetime.now()
+        execution_time = end_time - start_time
+        self.logger.info(f"Execution time: {execution_time} seconds")
+
+        return record if record else None
+
+    async def retrieve_history_by_user_id(
+        self,
+        user_id: int,
+        is_deleted: bool = False,
+    ) -> List[MealLog]:
+        """
+        Retrieve meal history for a user by user ID.
+        Args:
+            user_id (int): User's ID.
+            is_deleted (bool): Whether to include deleted records.
+        Returns:
+            list[MealLog]: List of meal log records for the user.
+        """
+        self.logger.info(f"Retrieving meal history for user_id: {user_id}")
+        start_time = datetime.now()
+        records = (
+            await self.session.scalars(
+                select(self.model)
+                .where(
+                    self.model.user_id == user_id,
+                    self.model.is_deleted == is_deleted
+                )
+            )
+        ).all()
+        end_time = datetime.now()
+        execution_time = end_time - start_time
+        self.logger.info(f"Execution time: {execution_time} seconds")
+
+        return records if records else None
+
+    async def retrieve_history_by_user_id_date_range(
+        self,
+        user_id: int,
+        from_date: datetime,
+        to_date: datetime,
+        is_deleted: bool = False,
+        columns: Optional[Sequence[str]] = None,
+        ingredient: Optional[str] = None,
+        min_nutrients: Optional[Dict[str, float]] = None,
+    ) -> List[MealLog | Row]:
+        """
+        Retrieve meal history for a user within a date range.
+        Args:
+            user_id (int): User's ID.
+            from_date (datetime): Start date.
+            to_date (datetime): End date.
+            is_deleted (bool): Whether to include deleted records.
+            columns (Sequence[str], optional): Columns to select. When
+            given, untracked rows holding only these columns are returned.
+            ingredient (str, optional): Only meals with an ingredient of
+            this exact name.
+            min_nutrients (dict, optional): Nutrient name -> minimum
+            per-serving amount, in the unit of Nutrients.UNITS.
+        Returns:
+            list[MealLog | Row]: Meal log records, or rows, in the range.
+        """
+        self.logger.info(
+            f"Retrieving meal history for user_id: {user_id} "
+            f"from {from_date} to {to_date}"
+        )
+        start_time = datetime.now()
+        records = await self._all(
+            self._history_query(
+                user_id=user_id,
+                from_date=from_date,
+                to_date=to_date,
+                is_deleted=is_deleted,
+                columns=columns,
+                ingredient=ingredient,
+                min_nutrients=min_nutrients,
+            ),
+            columns,
+        )
+        end_time = datetime.now()
+        execution_time = end_time - start_time
+        self.logger.info(f"Execution time: {execution_time} seconds")
+
+        return records if records else None
+
+    async def retrieve_history_page_by_user_id_date_range(
+        self,
+        user_id: int,
+        from_date: datetime,
+        to_date: datetime,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        is_deleted: bool = False,
+        columns: Optional[Sequence[str]] = None,
+        ingredient: Optional[str] = None,
+        min_nutrients: Optional[Dict[str, float]] = None,
+    ) -> List[MealLog | Row]:
+        """
+        Retrieve one page of a user's meal history within a date range,
+        ordered by (created_on, id) and starting after the given key.
+        Args:
+            user_id (int): User's ID.
+            from_date (datetime): Start date.
+            to_date (datetime): End date.
+            limit (int): Maximum number of records to return.
+            after (tuple, optional): (created_on, id) of the last record of
+            the previous page.
+            is_deleted (bool): Whether to include deleted records.
+            columns (Sequence[str], optional): Columns to select. When
+            given, untracked rows holding only these columns are returned.
+            ingredient (str, optional): Only meals with an ingredient of
+            this exact name.
+            min_nutrients (dict, optional): Nutrient name -> minimum
+            per-serving amount, in the unit of Nutrients.UNITS.
+        Returns:
+            list[MealLog | Row]: Up to `limit` meal log records, or rows.
+        """
+        self.logger.info(
+            f"Retrieving meal history page for user_id: {user_id} "
+            f"from {from_date} to {to_date}, limit: {limit}"
+        )
+        start_time = datetime.now()
+        query = self._history_query(
+            user_id=user_id,
+            from_date=from_date,
+            to_date=to_date,
+            is_deleted=is_deleted,
+            columns=columns,
+            ingredient=ingredient,
+            min_nutrients=min_nutrients,
+        ).limit(limit)
+        if after is not None:
+            query = query.where(
+                tuple_(self.model.created_on, self.model.id) > tuple_(*after)
+            )
+        records = await self._all(query, columns)
+        end_time = datetime.now()
+        execution_time = end_time - start_time
+        self.logger.info(f"Execution time: {execution_time} seconds")
+
+        return records
+
+    async def stream_history_by_user_id_date_range(
+        self,
+        user_id: int,
+        from_date: datetime,
+        to_date: datetime,
+        is_deleted: bool = False,
+        batch_size: int = Default.MEAL_HISTORY_STREAM_BATCH_SIZE,
+        columns: Optional[Sequence[str]] = None,
+        ingredient: Optional[str] = None,
+        min_nutrients: Optional[Dict[str, float]] = None,
+    ) -> AsyncIterator[MealLog | Row]:
+        """
+        Stream a user's meal history within a date range, ordered by
+        (created_on, id), fetching `batch_size` rows at a time.
+        Args:
+            user_id (int): User's ID.
+            from_date (datetime): Start date.
+            to_date (datetime): End date.
+            is_deleted (bool): Whether to include deleted records.
+            batch_size (int): Rows fetched per round-trip.
+            columns (Sequence[str], optional): Columns to select. When
+            given, untracked rows holding only these columns are yielded.
+            ingredient (str, optional): Only meals with an ingredient of
+            this exact name.
+            min_nutrients (dict, optional): Nutrient name -> minimum
+            per-serving amount, in the unit of Nutrients.UNITS.
+        Yields:
+            MealLog | Row: Meal log records, or rows, in order.
+        """
+        self.logger.info(
+            f"Streaming meal history for user_id: {user_id} "
+            f"from {from_date} to {to_date}"
+        )
+        query = self._history_query(
+            user_id=user_id,
+            from_date=from_date,
+            to_date=to_date,
+            is_deleted=is_deleted,
+            columns=columns,
+            ingredient=ingredient,
+            min_nutrients=min_nutrients,
+        ).execution_options(yield_per=batch_size)
+        if columns:
+            result = await self.session.stream(query)
+        else:
+            result = await self.session.stream_scalars(query)
+        async for record in result:
+            yield record
+
+    async def stream_records(
+        self,
+        is_deleted: bool = False,
+        batch_size: int = Default.MEAL_HISTORY_STREAM_BATCH_SIZE,
+        columns: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[MealLog | Row]:
+        """
+        Stream every user's meal logs, ordered by (user_id, created_on, id),
+        fetching `batch_size` rows at a time.
+        Args:
+            is_deleted (bool): Whether to include deleted records.
+            batch_size (int): Rows fetched per round-trip.
+            columns (Sequence[str], optional): Columns to select. When
+            given, untracked rows holding only these columns are yielded.
+        Yields:
+            MealLog | Row: Meal log records, or rows, in order.
+        """
+        self.logger.info("Streaming all meal logs")
+        query = (
+            self._select(columns)
+            .where(
+                self.model.is_deleted == (true() if is_deleted else false())
+            )
+            .order_by(
+                self.model.user_id.asc(),
+                self.model.created_on.asc(),
+                self.model.id.asc(),
+            )
+            .execution_options(yield_per=batch_size)
+        )
+        if columns:
+            result = await self.session.stream(query)
+        else:
+            result = await self.session.stream_scalars(query)
+        async for record in result:
+            yield record
+
+    async def retrieve_record_by_user_id_date(
+        self,
+        user_id: int,
+        date: datetime,
+        is_deleted: bool = False,
+    ) -> List[MealLog]:
+        """
+        Retrieve meal logs for a user on a specific date.
+        Args:
+            user_id (int): User's ID.
+            date (datetime): The date to filter by.
+            is_deleted (bool): Whether to include deleted records.
+        Returns:
+            list[MealLog]: List of meal log records for the date.
+        """
+        self.logger.info(
+            f"Retrieving meal log for user_id: {user_id} "
+            f"on date: {date}"
+        )
+        start_time = datetime.now()
+        records = (
+            await self.session.scalars(
+                select(self.model)
+                .where(
+                    self.model.user_id == user_id,
+                    self.model.date == date,
+                    self.model.is_deleted == is_deleted
+                )
+            )
+        ).all()
+        end_time = datetime.now()
+        execution_time = end_time - start_time
+        self.logger.info(f"Execution time: {execution_time} seconds")
+
+        return records if records else None
+
+    async def retrieve_distinct_meal_names(
+        self,
+        is_deleted: bool = False,
+        limit: int = None,
+    ) -> List[str]:
+        """
+        Retrieve the distinct meal names.
+        Args:
+            is_deleted (bool): Whether to include deleted records.
+            limit (int): Maximum number of names to return.
+        Returns:
+            list[str]: Distinct meal names.
+        """
+        self.logger.info("Retrieving distinct meal names")
+        start_time = datetime.now()
+        query = (
+            select(self.model.meal_name)
+            .where(self.model.is_deleted == is_deleted)
+            .distinct()
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        names = (await self.session.scalars(query)).all()
+        end_time = datetime.now()
+        execution_time = end_time - start_time
+        self.logger.info(f"Execution time: {execution_time} seconds")
+
+        return names
+
+    async def search_meal_names(
+        self,
+        meal_name: str,
+        limit: int = 5,
+        threshold: int = 80,
+        is_deleted: bool = False,
+    ) -> List[Tuple[str, float]]:
+        """
+        Find the distinct meal names closest to `meal_name`.
+
+        Non-deleted names are matched against the worker's in-memory
+        meal name index, loaded on first use. When the index is unusable
+        (too many names) or deleted records are searched, candidates come
+        from the pg_trgm GIN index on meal_name (`%` similarity operator)
+        on PostgreSQL, or else from the distinct meal names. Candidates are
+        ranked with rapidfuzz.
+        Args:
+            meal_name (str): Name of the meal to search for.
+            limit (int): Maximum number of candidates to return.
+            threshold (int): Minimum rapidfuzz ratio (0-100).
+            is_deleted (bool): Whether to search deleted records.
+        Returns:
+            list[tuple[str, float]]: (meal_name, score), best first.
+        """
+        self.logger.info(
+            f"Searching meal names for: {meal_name}, limit: {limit}, "
+            f"threshold: {threshold}"
+        )
+        start_time = datetime.now()
+        if not is_deleted:
+            meal_name_index = MealNameIndexUtility(
+                urn=self.urn,
+                user_urn=self.user_urn,
+                api_name=self.api_name,
+                user_id=self.user_id,
+            )
+            if meal_name_index.is_stale:
+                meal_name_index.load(
+                    await self.retrieve_distinct_meal_names(
+                        limit=meal_name_index.max_names + 1,
+                    )
+                )
+            if meal_name_index.is_usable:
+                matches = meal_name_index.search(
+                    meal_name=meal_name,
+                    limit=limit,
+                    threshold=threshold,
+                )
+                end_time = datetime.now()
+                execution_time = end_time - start_time
+                self.logger.info(f"Execution time: {execution_time} seconds")
+                return matches
+
+        candidates = None
+        if self.session.get_bind().dialect.name == "postgresql":
+            try:
+                async with self.session.begin_nested():
+                    candidates = (
+                        await self.session.scalars(
+                            select(self.model.meal_name)
+                            .where(
+                                self.model.meal_name.op("%")(meal_name),
+                                self.model.is_deleted == is_deleted,
+                            )
+                            .group_by(self.model.meal_name)
+                            .order_by(
+                                func.similarity(
+                                    self.model.meal_name, meal_name
+                                ).desc()
+                            )
+                            .limit(self.TRIGRAM_CANDIDATES)
+                        )
+                    ).all()
+            except DBAPIError as err:
+                self.logger.warning(f"Trigram search unavailable: {err}")
+
+        if candidates is None:
+            candidates = await self.retrieve_distinct_meal_names(
+                is_deleted=is_deleted,
+            )
+
+        matches = [
+            (match, score) for match, score, _ in process.extract(
+                meal_name,
+                candidates,
+                scorer=fuzz.ratio,
+                limit=limit,
+                score_cutoff=threshold,
+            )
+        ]
+        end_time = datetime.now()
+        execution_time = end_time - start_time
+        self.logger.info(f"Execution time: {execution_time} seconds")
+
+        return matches
+
+    async def retrieve_record_by_fuzzy_meal_name(
+        self,
+        meal_name: str,
+        is_deleted: bool = False,
+        threshold: int = 80,
+    ) -> MealLog:
+        """
+        Retrieve the closest matching meal log by fuzzy meal name.
+        Args:
+            meal_name (str): Name of the meal to search for.
+            is_deleted (bool): Whether to include deleted records.
+            threshold (int): Fuzzy match threshold (default 80).
+        Returns:
+            MealLog: The closest matching meal log if found, else None.
+        """
+        self.logger.info(
+            f"Retrieving meal log by fuzzy meal_name: {meal_name}, "
+            f"threshold: {threshold}"
+        )
+        matches = await self.search_meal_names(
+            meal_name=meal_name,
+            limit=1,
+            threshold=threshold,
+            is_deleted=is_deleted,
+        )
+        if not matches:
+            return None
+        return await self.retrieve_record_by_meal_name(
+            meal_name=matches[0][0],
+            is_deleted=is_deleted,
+        )
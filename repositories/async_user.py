@@ -0,0 +1,171 @@
+"""
+Async repository for user data access, providing awaitable methods to query
+and manage users through an AsyncSession.
+"""
+from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from models.user import User
+
+from abstractions.async_repository import IAsyncRepository
+
+
+class AsyncUserRepository(IAsyncRepository):
+    """
+    Async repository for user data access and queries.
+    Provides awaitable methods to retrieve users by various criteria.
+    """
+
+    def __init__(
+        self,
+        urn: str = None,
+        user_urn: str = None,
+        api_name: str = None,
+        session: AsyncSession = None,
+        user_id: str = None,
+    ):
+        super().__init__(
+            urn=urn,
+            user_urn=user_urn,
+            api_name=api_name,
+            user_id=user_id,
+            model=User,
+            session=session,
+        )
+        self.logger.debug(
+            f"AsyncUserRepository initialized for user_id={user_id}, "
+            f"urn={urn}, api_name={api_name}"
+        )
+
+    async def retrieve_record_by_email_and_password(
+        self,
+        email: str,
+        password: str,
+        is_deleted: bool = False,
+    ) -> User:
+        """
+        Retrieve a user by email and password.
+        Args:
+            email (str): User's email address.
+            password (str): User's password (hashed).
+            is_deleted (bool): Whether to include deleted users.
+        Returns:
+            User: The user record if found, else None.
+        """
+        self.logger.info(f"Retrieving user by email: {email}")
+        start_time = datetime.now()
+        record = await self.session.scalar(
+            select(self.model)
+            .where(
+                self.model.email == email,
+                self.model.password == password,
+                self.model.is_deleted == is_deleted,
+            )
+            .limit(1)
+        )
+        end_time = datetime.now()
+        execution_time = end_time - start_time
+        self.logger.info(f"Execution time: {execution_time} seconds")
+
+        return record if record else None
+
+    async def retrieve_record_by_email(
+        self,
+        email: str,
+        is_deleted: bool = False,
+    ) -> User:
+        """
+        Retrieve a user by email.
+        Args:
+            email (str): User's email address.
+            is_deleted (bool): Whether to include deleted users.
+        Returns:
+            User: The user record if found, else None.
+        """
+        self.logger.info(f"Retrieving user by email: {email}")
+        start_time = datetime.now()
+        record = await self.session.scalar(
+            select(self.model)
+            .where(
+                self.model.email == email,
+                self.model.is_deleted == is_deleted,
+            )
+            .limit(1)
+        )
+        end_time = datetime.now()
+        execution_time = end_time - start_time
+        self.logger.info(f"Execution time: {execution_time} seconds")
+
+        return record if record else None
+
+    async def retrieve_record_by_id_and_is_logged_in(
+        self,
+        id: str,
+        is_logged_in: bool,
+        is_deleted: bool = False,
+    ) -> List[User]:
+        """
+        Retrieve users by ID and login status.
+        Args:
+            id (str): User's ID.
+            is_logged_in (bool): Login status to filter by.
+            is_deleted (bool): Whether to include deleted users.
+        Returns:
+            list[User]: List of user records matching the criteria.
+        """
+        self.logger.info(
+            f"Retrieving user by id: {id}, is_logged_in: {is_logged_in}"
+        )
+        start_time = datetime.now()
+        records = (
+            await self.session.scalars(
+                select(self.model)
+                .where(
+                    self.model.id == id,
+                    self.model.is_logged_in == is_logged_in,
+                    self.model.is_deleted == is_deleted,
+                )
+            )
+        ).all()
+        end_time = datetime.now()
+        execution_time = end_time - start_time
+        self.logger.info(f"Execution time: {execution_time} seconds")
+
+        return records
+
+    async def retrieve_record_by_id_is_logged_in(
+        self,
+        id: int,
+        is_logged_in: bool,
+        is_deleted: bool = False,
+    ) -> User:
+        """
+        Retrieve a user by ID and login status (single record).
+        Args:
+            id (int): User's ID.
+            is_logged_in (bool): Login status to filter by.
+            is_deleted (bool): Whether to include deleted users.
+        Returns:
+            User: The user record if found, else None.
+        """
+        self.logger.info(
+            f"Retrieving user by id: {id}, is_logged_in: {is_logged_in}"
+        )
+        start_time = datetime.now()
+        record = (
+            await self.session.execute(
+                select(self.model)
+                .where(
+                    self.model.id == id,
+                    self.model.is_logged_in == is_logged_in,
+                    self.model.is_deleted == is_deleted,
+                )
+            )
+        ).scalar_one_or_none()
+        end_time = datetime.now()
+        execution_time = end_time - start_time
+        self.logger.info(f"Execution time: {execution_time} seconds")
+
+        return record
@@ -3,6 +3,7 @@ Repository for meal log data access, providing methods to query and
 manage meal logs.
 """
 from datetime import datetime, timedelta
+from sqlalchemy import false, true
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -11,7 +12,6 @@ from models.meal_log import MealLog
 from abstractions.repository import IRepository
 from cachetools import LRUCache, cachedmethod
 from operator import attrgetter
-from rapidfuzz import process, fuzz
 
 
 class MealLogRepository(IRepository):
@@ -19,7 +19,6 @@ class MealLogRepository(IRepository):
     Repository for meal log data access and queries.
     Provides methods to retrieve meal logs by various criteria.
     """
-
     def __init__(
         self,
         urn: str = None,
@@ -177,10 +176,10 @@ class MealLogRepository(IRepository):
             .filter(
                 self.model.user_id == user_id,
                 self.model.created_on >= from_date,
-                self.model.created_on <= to_date + timedelta(days=1),
-                self.model.is_deleted == is_deleted
+                self.model.created_on < to_date + timedelta(days=1),
+                self.model.is_deleted == (true() if is_deleted else false()),
             )
-            .order_by(self.model.created_on.asc())
+            .order_by(self.model.created_on.asc(), self.model.id.asc())
             .all()
         )
         end_time = datetime.now()
@@ -223,35 +222,3 @@ class MealLogRepository(IRepository):
         self.logger.info(f"Execution time: {execution_time} seconds")
 
         return records if records else None
-
-    def retrieve_record_by_fuzzy_meal_name(
-        self,
-        meal_name: str,
-        is_deleted: bool = False,
-        threshold: int = 80,
-    ) -> MealLog:
-        """
-        Retrieve the closest matching meal log by fuzzy meal name.
-        Args:
-            meal_name (str): Name of the meal to search for.
-            is_deleted (bool): Whether to include deleted records.
-            threshold (int): Fuzzy match threshold (default 80).
-        Returns:
-            MealLog: The closest matching meal log if found, else None.
-        """
-        self.logger.info(
-            f"Retrieving meal log by fuzzy meal_name: {meal_name}, "
-            f"threshold: {threshold}"
-        )
-        all_meals = (
-            self._session.query(self.model)
-            .filter(self.model.is_deleted == is_deleted)
-            .all()
-        )
-        meal_names = [meal.meal_name for meal in all_meals]
-        match, score, idx = process.extractOne(
-            meal_name, meal_names, scorer=fuzz.ratio
-        )
-        if match and score >= threshold:
-            return all_meals[idx]
-        return None
@@ -0,0 +1,27 @@
+"""
+Response class rendering response DTOs straight to JSON bytes.
+"""
+import orjson
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from typing import Any
+
+
+class DTOResponse(ORJSONResponse):
+    """
+    JSON response for BaseResponseDTOs and plain JSON-compatible content.
+
+    A pydantic model is serialized in one pass by pydantic-core, without
+    dumping it to a dict first; other content is serialized by orjson.
+    Both handle datetimes, dates and UUIDs natively. It is the
+    application's default response class.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
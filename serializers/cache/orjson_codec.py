@@ -0,0 +1,53 @@
+import orjson
+import zstandard
+
+from typing import Any, Final
+
+from abstractions.cache_codec import ICacheCodec
+
+from start_utils import cache_configuration
+
+
+class OrjsonCacheCodec(ICacheCodec):
+    """
+    Codec writing orjson payloads, zstd-compressed from
+    `compression_threshold_bytes` up.
+
+    Each payload starts with a header byte naming its format. A payload
+    without one is JSON text written before the header existed; JSON text
+    never starts with a header byte, so both are read side by side.
+    """
+    HEADER_ORJSON: Final[int] = 0x01
+    HEADER_ORJSON_ZSTD: Final[int] = 0x02
+
+    def __init__(
+        self,
+        compression_threshold_bytes: int = (
+            cache_configuration.codec.compression_threshold_bytes
+        ),
+        compression_level: int = cache_configuration.codec.compression_level,
+    ) -> None:
+        self._compression_threshold_bytes = compression_threshold_bytes
+        self._compression_level = compression_level
+
+    def encode(self, value: Any) -> bytes:
+        body = orjson.dumps(value)
+        if len(body) < self._compression_threshold_bytes:
+            return bytes((self.HEADER_ORJSON,)) + body
+        return bytes((self.HEADER_ORJSON_ZSTD,)) + zstandard.compress(
+            body, self._compression_level
+        )
+
+    def decode(self, payload: bytes | str) -> Any:
+        if isinstance(payload, str) or not payload:
+            return orjson.loads(payload)
+        # A view avoids copying the body out of large payloads.
+        body = memoryview(payload)[1:]
+        if payload[0] == self.HEADER_ORJSON:
+            return orjson.loads(body)
+        if payload[0] == self.HEADER_ORJSON_ZSTD:
+            try:
+                return orjson.loads(zstandard.decompress(body))
+            except zstandard.ZstdError as err:
+                raise ValueError(f"Invalid zstd payload: {err}") from err
+        return orjson.loads(payload)
@@ -1,9 +1,11 @@
+import httpx
 import json
-import requests
 
 from http import HTTPStatus, HTTPMethod
 from langchain.output_parsers import PydanticOutputParser
 from pydantic import BaseModel
+from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
 from typing import Any, Dict, List
 
 from constants.meal.nutrients import Nutrients
@@ -16,11 +18,17 @@ from dtos.services.apis.v1.meal.recommendation import MealRecommendationDTO
 
 from errors.bad_input_error import BadInputError
 from errors.not_found_error import NotFoundError
+from errors.service_unavailable_error import ServiceUnavailableError
 from errors.unexpected_response_error import UnexpectedResponseError
 
 from services.apis.v1.abstraction import IV1APIService
 
-from start_utils import llm
+from start_utils import llm, USDA_API_KEY, usda_configuration
+
+from utilities.instructions_cache import InstructionsCacheUtility
+from utilities.llm import LLMUtility
+from utilities.negative_cache import NegativeCacheUtility
+from utilities.single_flight import SingleFlightUtility
 
 
 class IMealAPIService(IV1APIService):
@@ -36,13 +44,43 @@ class IMealAPIService(IV1APIService):
         user_urn: str = None,
         api_name: str = None,
         user_id: int = None,
+        usda_client: httpx.AsyncClient = None,
+        cache: Redis = None,
+        async_cache: AsyncRedis = None,
     ) -> None:
         super().__init__(urn, user_urn, api_name, user_id)
+        self._usda_client = usda_client
+        self._cache = cache
+        self._async_cache = async_cache
         self.logger.debug(
             f"IMealAPIService initialized for "
             f"user_id={user_id}, urn={urn}, api_name={api_name}"
         )
 
+    @property
+    def usda_client(self):
+        return self._usda_client
+
+    @usda_client.setter
+    def usda_client(self, value):
+        self._usda_client = value
+
+    @property
+    def cache(self):
+        return self._cache
+
+    @cache.setter
+    def cache(self, value):
+        self._cache = value
+
+    @property
+    def async_cache(self):
+        return self._async_cache
+
+    @async_cache.setter
+    def async_cache(self, value):
+        self._async_cache = value
+
     def run(self, request_dto: BaseModel) -> BaseResponseDTO:
         pass
 
@@ -56,7 +94,7 @@ class IMealAPIService(IV1APIService):
         try:
 
             self.logger.info(f"Making {method} request to {url}")
-            response = requests.request(
+            response: httpx.Response = await self.usda_client.request(
                 method, url, headers=headers, json=payload
             )
 
@@ -81,7 +119,7 @@ class IMealAPIService(IV1APIService):
                     httpStatusCode=response.status_code,
                 )
 
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
 
             self.logger.error(f"HTTP error: {e}")
             raise BadInputError(
@@ -90,7 +128,7 @@ class IMealAPIService(IV1APIService):
                 httpStatusCode=response.status_code,
             )
 
-        except requests.exceptions.RequestException as e:
+        except httpx.RequestError as e:
             self.logger.error(f"Request failed: {e}")
             raise UnexpectedResponseError(
                 responseMessage=f"Request failed: {e}",
@@ -98,6 +136,78 @@ class IMealAPIService(IV1APIService):
                 httpStatusCode=HTTPStatus.INTERNAL_SERVER_ERROR,
             )
 
+    async def search_meal_details(
+        self,
+        meal_name: str,
+        payload: dict = None,
+        bypass_negative_cache: bool = False,
+    ) -> dict:
+        """
+        Search USDA FoodData Central for a meal, coalescing concurrent
+        searches for the same normalized meal name into one USDA call.
+
+        Searches that recently found nothing or got a malformed response
+        fail again from the negative cache without calling USDA.
+
+        Args:
+            meal_name (str): Name of the meal to search for.
+            payload (dict): Request payload forwarded to the USDA API.
+            bypass_negative_cache (bool): Search USDA even if the meal
+                recently failed, and drop the cached failure.
+
+        Returns:
+            dict: The raw JSON response from the USDA search endpoint.
+
+        Raises:
+            NotFoundError: If USDA found no such meal.
+            UnexpectedResponseError: If USDA's response was malformed.
+        """
+        negative_cache = NegativeCacheUtility(
+            urn=self.urn,
+            user_urn=self.user_urn,
+            api_name=self.api_name,
+            user_id=self.user_id,
+            cache=self.async_cache,
+        )
+        if self.async_cache is not None:
+            if bypass_negative_cache:
+                await negative_cache.bypass(meal_name)
+            else:
+                cached_error = await negative_cache.get(meal_name)
+                if cached_error is not None:
+                    raise cached_error
+
+        single_flight_utility = SingleFlightUtility(
+            urn=self.urn,
+            user_urn=self.user_urn,
+            api_name=self.api_name,
+            user_id=self.user_id,
+            cache=self.cache,
+        )
+        query = single_flight_utility.normalize_key(meal_name)
+        url = usda_configuration.url.format(
+            query=query,
+            api_key=USDA_API_KEY
+        )
+
+        async def search() -> dict:
+            try:
+                return await self.make_api_request(
+                    url=url,
+                    method=HTTPMethod.GET,
+                    headers={"x-api-key": USDA_API_KEY},
+                    payload=payload
+                )
+            except (NotFoundError, UnexpectedResponseError) as err:
+                if self.async_cache is not None:
+                    await negative_cache.set(meal_name, err)
+                raise
+
+        return await single_flight_utility.run(
+            key=f"usda_search_{query}",
+            callable=search,
+        )
+
     async def select_food_record_with_ingredients_and_nutrients(
         self,
         data: List[Dict]
@@ -148,6 +258,21 @@ class IMealAPIService(IV1APIService):
         ingredients: List[Dict]
     ) -> InstructionsDTO:
 
+        instructions_cache = InstructionsCacheUtility(
+            urn=self.urn,
+            user_urn=self.user_urn,
+            api_name=self.api_name,
+            user_id=self.user_id,
+            cache=self.cache,
+        )
+        if self.cache is not None:
+            cached = instructions_cache.get(
+                meal_name=meal_name,
+                ingredients=ingredients,
+            )
+            if cached is not None:
+                return cached
+
         if not llm:
             return InstructionsDTO(
                 instructions=[]
@@ -158,8 +283,28 @@ class IMealAPIService(IV1APIService):
             meal_name=meal_name,
             ingredients=ingredients,
         )
-        llm_response = llm.invoke(prompt)
-        response: InstructionsDTO = parser.parse(llm_response.content)
+        try:
+            llm_response: str = await LLMUtility(
+                urn=self.urn,
+                user_urn=self.user_urn,
+                api_name=self.api_name,
+                user_id=self.user_id,
+                llm=llm,
+            ).invoke(prompt)
+        except ServiceUnavailableError as err:
+            self.logger.warning(
+                f"Skipping instructions: {err.responseMessage}"
+            )
+            return InstructionsDTO(
+                instructions=[]
+            )
+        response: InstructionsDTO = parser.parse(llm_response)
+        if self.cache is not None and response.instructions:
+            instructions_cache.set(
+                meal_name=meal_name,
+                ingredients=ingredients,
+                instructions=response,
+            )
         return response
 
     async def generate_meal_recommendation(
@@ -170,7 +315,7 @@ class IMealAPIService(IV1APIService):
 
         if not llm:
             return MealRecommendationDTO(
-                meal_recommendation=[]
+                meals=[]
             )
 
         parser = PydanticOutputParser(pydantic_object=MealRecommendationDTO)
@@ -178,8 +323,22 @@ class IMealAPIService(IV1APIService):
             food_category=food_category,
             past_meals_json=json.dumps(meal_history)
         )
-        llm_response = llm.invoke(prompt)
-        response: MealRecommendationDTO = parser.parse(llm_response.content)
+        try:
+            llm_response: str = await LLMUtility(
+                urn=self.urn,
+                user_urn=self.user_urn,
+                api_name=self.api_name,
+                user_id=self.user_id,
+                llm=llm,
+            ).invoke(prompt)
+        except ServiceUnavailableError as err:
+            self.logger.warning(
+                f"Skipping recommendations: {err.responseMessage}"
+            )
+            return MealRecommendationDTO(
+                meals=[]
+            )
+        response: MealRecommendationDTO = parser.parse(llm_response)
         return response
 
     async def extract_essential_nutrients(
@@ -304,11 +463,20 @@ class IMealAPIService(IV1APIService):
         )
 
         if not meal_data:
-            raise NotFoundError(
+            error = NotFoundError(
                 responseMessage="No meal data found",
                 responseKey="error_no_meal_data_found",
                 httpStatusCode=HTTPStatus.NOT_FOUND,
             )
+            if self.async_cache is not None:
+                await NegativeCacheUtility(
+                    urn=self.urn,
+                    user_urn=self.user_urn,
+                    api_name=self.api_name,
+                    user_id=self.user_id,
+                    cache=self.async_cache,
+                ).set(meal_name, error)
+            raise error
 
         total_calories, calories_unit = await self.calculate_total_calories(
             meal_data=meal_data
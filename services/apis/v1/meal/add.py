@@ -1,9 +1,10 @@
-import json
 import ulid
 
-from datetime import datetime
-from http import HTTPMethod, HTTPStatus
+from datetime import datetime, timezone
+from http import HTTPStatus
+from httpx import AsyncClient
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
 
 from constants.api_status import APIStatus
 
@@ -13,17 +14,22 @@ from dtos.responses.base import BaseResponseDTO
 from errors.unexpected_response_error import UnexpectedResponseError
 from models.meal_log import MealLog
 
-from repositories.meal_log import MealLogRepository
+from repositories.async_meal_daily_summary import (
+    AsyncMealDailySummaryRepository,
+)
+from repositories.async_meal_log import AsyncMealLogRepository
 
 from services.apis.v1.meal.abstraction import IMealAPIService
 
-from start_utils import USDA_API_KEY, usda_configuration
+from utilities.meal_details_cache import MealDetailsCacheUtility
+from utilities.meal_name_index import MealNameIndexUtility
 
 
 class AddMealService(IMealAPIService):
     """
     Service to add a new meal log for a user.
-    Fetches meal details, processes them, and stores the meal log.
+    Fetches meal details, processes them, and stores the meal log together
+    with its day's nutrition summary, in one transaction.
     """
     def __init__(
         self,
@@ -31,8 +37,11 @@ class AddMealService(IMealAPIService):
         user_urn: str = None,
         api_name: str = None,
         user_id: int = None,
-        meal_log_repository: MealLogRepository = None,
+        meal_log_repository: AsyncMealLogRepository = None,
         cache: Redis = None,
+        usda_client: AsyncClient = None,
+        async_cache: AsyncRedis = None,
+        meal_daily_summary_repository: AsyncMealDailySummaryRepository = None,
     ) -> None:
         super().__init__(urn, user_urn, api_name)
         self._urn = urn
@@ -41,6 +50,9 @@ class AddMealService(IMealAPIService):
         self._user_id = user_id
         self._meal_log_repository = meal_log_repository
         self._cache = cache
+        self._usda_client = usda_client
+        self._async_cache = async_cache
+        self._meal_daily_summary_repository = meal_daily_summary_repository
         self.logger.debug(
             f"AddMealService initialized for "
             f"user_id={user_id}, urn={urn}, api_name={api_name}"
@@ -94,18 +106,21 @@ class AddMealService(IMealAPIService):
     def meal_log_repository(self, value):
         self._meal_log_repository = value
 
+    @property
+    def meal_daily_summary_repository(self):
+        return self._meal_daily_summary_repository
+
+    @meal_daily_summary_repository.setter
+    def meal_daily_summary_repository(self, value):
+        self._meal_daily_summary_repository = value
+
     async def run(self, request_dto: AddMealRequestDTO) -> BaseResponseDTO:
 
         self.logger.info("Fetching meal details")
-        url = usda_configuration.url.format(
-                query=request_dto.meal_name,
-                api_key=USDA_API_KEY
-            )
-        meal_details: dict = await self.make_api_request(
-            url=url,
-            method=HTTPMethod.GET,
-            headers={"x-api-key": USDA_API_KEY},
-            payload=request_dto.model_dump()
+        meal_details: dict = await self.search_meal_details(
+            meal_name=request_dto.meal_name,
+            payload=request_dto.model_dump(exclude={"bypass_negative_cache"}),
+            bypass_negative_cache=request_dto.bypass_negative_cache,
         )
         self.logger.info("Meal details fetched")
 
@@ -142,16 +157,28 @@ class AddMealService(IMealAPIService):
             total_calories_per_serving=total_calories_per_serving,
             calories_unit=calories_unit,
             total_calories=total_calories,
-            created_on=datetime.now(),
+            created_on=datetime.now(timezone.utc),
             created_by=self.user_id
         )
-        meal_log: MealLog = self.meal_log_repository.create_record(
-            record=meal_log
-        )
+        try:
+            meal_log: MealLog = await self.meal_log_repository.create_record(
+                record=meal_log,
+                commit=False,
+            )
+            await self.meal_daily_summary_repository.apply_meal(
+                meal_log=meal_log
+            )
+            await self.meal_log_repository.commit()
+        except Exception:
+            await self.meal_log_repository.rollback()
+            raise
         self.logger.info("Meal added")
-
-        cache_key = f"meal_details_{request_dto.meal_name}"
-        self.cache.delete(cache_key)
+        MealNameIndexUtility(
+            urn=self.urn,
+            user_urn=self.user_urn,
+            api_name=self.api_name,
+            user_id=self.user_id,
+        ).add(meal_log.meal_name)
 
         data = {
                 "urn": meal_log.urn,
@@ -169,9 +196,17 @@ class AddMealService(IMealAPIService):
             }
 
         self.logger.info("Caching meal details")
-        data_to_cache = data.copy()
-        data_to_cache.pop("urn", None)
-        self.cache.set(cache_key, json.dumps(data_to_cache))
+        details = {
+            key: value for key, value in data.items()
+            if key not in ("urn", "servings", "total_calories")
+        }
+        MealDetailsCacheUtility(
+            urn=self.urn,
+            user_urn=self.user_urn,
+            api_name=self.api_name,
+            user_id=self.user_id,
+            cache=self.cache,
+        ).set(request_dto.meal_name, details)
 
         return BaseResponseDTO(
             transactionUrn=self.urn,
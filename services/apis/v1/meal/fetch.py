@@ -1,31 +1,41 @@
-from http import HTTPMethod
-import json
+import asyncio
+
+from httpx import AsyncClient
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+from typing import Any, Dict, Set
+
 from constants.api_status import APIStatus
 
 from dtos.requests.apis.v1.meal.fetch import FetchMealRequestDTO
 from dtos.responses.base import BaseResponseDTO
 
-from repositories.meal_log import MealLogRepository
+from repositories.async_meal_log import AsyncMealLogRepository
 
 from services.apis.v1.meal.abstraction import IMealAPIService
 
-from start_utils import USDA_API_KEY, usda_configuration
+from utilities.meal_details_cache import MealDetailsCacheUtility
 
 
 class FetchMealService(IMealAPIService):
     """
     Service to fetch meal details for a user from the USDA API.
     Handles caching, API requests, and data processing for meal details.
+    Stale cached details are returned at once and refreshed in the
+    background.
     """
+    _refreshes: Set[asyncio.Task] = set()
+
     def __init__(
         self,
         urn: str = None,
         user_urn: str = None,
         api_name: str = None,
         user_id: int = None,
-        meal_log_repository: MealLogRepository = None,
+        meal_log_repository: AsyncMealLogRepository = None,
         cache: Redis = None,
+        usda_client: AsyncClient = None,
+        async_cache: AsyncRedis = None,
     ) -> None:
         super().__init__(urn, user_urn, api_name)
         self._urn = urn
@@ -34,6 +44,8 @@ class FetchMealService(IMealAPIService):
         self._user_id = user_id
         self._meal_log_repository = meal_log_repository
         self._cache = cache
+        self._usda_client = usda_client
+        self._async_cache = async_cache
         self.logger.debug(
             f"FetchMealService initialized for "
             f"user_id={user_id}, urn={urn}, api_name={api_name}"
@@ -87,32 +99,43 @@ class FetchMealService(IMealAPIService):
     def cache(self, value):
         self._cache = value
 
-    async def run(self, request_dto: FetchMealRequestDTO) -> BaseResponseDTO:
-
-        cache_key = f"meal_details_{request_dto.meal_name}"
-        self.logger.info(f"Cache key: {cache_key}")
-        cached_data = self.cache.get(cache_key)
-        if cached_data:
-
-            self.logger.info("Meal details fetched from cache")
-            return BaseResponseDTO(
-                transactionUrn=self.urn,
-                status=APIStatus.SUCCESS,
-                responseMessage="Successfully fetched the meal details.",
-                responseKey="success_fetch_meal",
-                data=json.loads(cached_data),
-            )
+    @staticmethod
+    def serialize_meal_details(
+        details: Dict[str, Any],
+        servings: int,
+    ) -> Dict[str, Any]:
+        """
+        Build the response data from per-serving meal details.
+        Args:
+            details (dict): Cached per-serving details of the meal.
+            servings (int): Number of servings requested.
+        Returns:
+            dict: Response data with the totals for the servings.
+        """
+        return {
+            **details,
+            "servings": servings,
+            "total_calories": (
+                details.get("total_calories_per_serving", 0) * servings
+            ),
+        }
 
+    async def build_meal_details(
+        self,
+        request_dto: FetchMealRequestDTO,
+    ) -> Dict[str, Any]:
+        """
+        Fetch a meal from the USDA API and build its per-serving details.
+        Args:
+            request_dto (FetchMealRequestDTO): The request DTO.
+        Returns:
+            dict: Per-serving details, as cached.
+        """
         self.logger.info("Fetching meal details")
-        url = usda_configuration.url.format(
-                query=request_dto.meal_name,
-                api_key=USDA_API_KEY
-            )
-        meal_details = await self.make_api_request(
-            url=url,
-            method=HTTPMethod.GET,
-            headers={"x-api-key": USDA_API_KEY},
-            payload=request_dto.model_dump()
+        meal_details = await self.search_meal_details(
+            meal_name=request_dto.meal_name,
+            payload=request_dto.model_dump(exclude={"bypass_negative_cache"}),
+            bypass_negative_cache=request_dto.bypass_negative_cache,
         )
         self.logger.info("Meal details fetched")
 
@@ -133,27 +156,112 @@ class FetchMealService(IMealAPIService):
         if calories_unit is None:
             calories_unit = "KCAL"
 
-        total_calories = total_calories_per_serving * request_dto.servings
-
-        data = {
+        return {
                 "meal_name": request_dto.meal_name,
-                "servings": request_dto.servings,
                 "nutrients_per_serving": meal_data.get("nutrients"),
                 "ingredients_per_serving": meal_data.get("ingredients"),
                 "instructions_per_serving": meal_data.get("instructions"),
                 "total_calories_per_serving": total_calories_per_serving,
-                "total_calories": total_calories,
                 "calories_unit": calories_unit,
                 "source": "usda"
             }
 
+    async def refresh_meal_details(
+        self,
+        meal_details_cache: MealDetailsCacheUtility,
+        request_dto: FetchMealRequestDTO,
+    ) -> None:
+        """
+        Refetch stale meal details and cache them. Failures are logged and
+        the stale details are served until the next refresh.
+        Args:
+            meal_details_cache (MealDetailsCacheUtility): The cache.
+            request_dto (FetchMealRequestDTO): The request DTO.
+        """
+        try:
+            details = await self.build_meal_details(request_dto=request_dto)
+        except Exception as err:
+            self.logger.error(
+                f"{err.__class__} error occured while refreshing meal "
+                f"details: {err}"
+            )
+            return
+        meal_details_cache.set(request_dto.meal_name, details)
+        self.logger.info("Meal details refreshed")
+
+    def schedule_refresh(
+        self,
+        meal_details_cache: MealDetailsCacheUtility,
+        request_dto: FetchMealRequestDTO,
+    ) -> None:
+        """
+        Refresh meal details in the background, after the response.
+        """
+        task = asyncio.create_task(
+            self.refresh_meal_details(
+                meal_details_cache=meal_details_cache,
+                request_dto=request_dto,
+            )
+        )
+        # Keep a reference until the task is done.
+        FetchMealService._refreshes.add(task)
+        task.add_done_callback(FetchMealService._refreshes.discard)
+
+    async def run(self, request_dto: FetchMealRequestDTO) -> BaseResponseDTO:
+
+        meal_details_cache = MealDetailsCacheUtility(
+            urn=self.urn,
+            user_urn=self.user_urn,
+            api_name=self.api_name,
+            user_id=self.user_id,
+            cache=self.cache,
+        )
+        cached_details, stale = meal_details_cache.lookup(
+            request_dto.meal_name
+        )
+        if cached_details:
+
+            if stale and meal_details_cache.acquire_refresh(
+                request_dto.meal_name
+            ):
+                self.logger.info("Scheduling meal details refresh")
+                # Refresh the entry as it was cached, with or without
+                # instructions.
+                self.schedule_refresh(
+                    meal_details_cache=meal_details_cache,
+                    request_dto=request_dto.model_copy(
+                        update={
+                            "get_instructions": bool(
+                                cached_details.get("instructions_per_serving")
+                            ),
+                        }
+                    ),
+                )
+
+            self.logger.info("Meal details fetched from cache")
+            return BaseResponseDTO(
+                transactionUrn=self.urn,
+                status=APIStatus.SUCCESS,
+                responseMessage="Successfully fetched the meal details.",
+                responseKey="success_fetch_meal",
+                data=self.serialize_meal_details(
+                    details=cached_details,
+                    servings=request_dto.servings,
+                ),
+            )
+
+        details = await self.build_meal_details(request_dto=request_dto)
+
         self.logger.info("Caching meal details")
-        self.cache.set(cache_key, json.dumps(data))
+        meal_details_cache.set(request_dto.meal_name, details)
 
         return BaseResponseDTO(
             transactionUrn=self.urn,
             status=APIStatus.SUCCESS,
             responseMessage="Successfully fetched the meal details.",
             responseKey="success_fetch_meal",
-            data=data,
+            data=self.serialize_meal_details(
+                details=details,
+                servings=request_dto.servings,
+            ),
         )
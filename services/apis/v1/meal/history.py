@@ -1,16 +1,28 @@
+import base64
 import collections
+import json
 
+from datetime import datetime
+from http import HTTPStatus
 from redis import Redis
+from sqlalchemy import Row
+from typing import Any, AsyncIterator, Dict, Final, Tuple
 
 from constants.api_status import APIStatus
+from constants.default import Default
 
 from dtos.requests.apis.v1.meal.history import FetchMealHistoryRequestDTO
 from dtos.responses.base import BaseResponseDTO
 
-from repositories.meal_log import MealLogRepository
+from errors.bad_input_error import BadInputError
+from models.meal_log import MealLog
+
+from repositories.async_meal_log import AsyncMealLogRepository
 
 from services.apis.v1.meal.abstraction import IMealAPIService
 
+from utilities.nutrient_vector import NutrientVectorUtility
+
 
 class FetchMealHistoryService(IMealAPIService):
     """
@@ -18,7 +30,22 @@ class FetchMealHistoryService(IMealAPIService):
     Provides a list of all meals logged by the user, including nutrients,
     ingredients, instructions, and calories.
     This service is used to fetch the meal history for a user.
+
+    History can be read whole (legacy), one keyset page at a time when a
+    `limit` or `cursor` is given, or as a stream of day groups. Every path
+    selects only COLUMNS, as untracked rows.
     """
+    COLUMNS: Final[Tuple[str, ...]] = (
+        "id",
+        "meal_name",
+        "servings",
+        "nutrient_vector",
+        "ingredients",
+        "instructions",
+        "total_calories",
+        "calories_unit",
+        "created_on",
+    )
 
     def __init__(
         self,
@@ -26,7 +53,7 @@ class FetchMealHistoryService(IMealAPIService):
         user_urn: str = None,
         api_name: str = None,
         user_id: int = None,
-        meal_log_repository: MealLogRepository = None,
+        meal_log_repository: AsyncMealLogRepository = None,
         cache: Redis = None,
     ) -> None:
         super().__init__(urn, user_urn, api_name)
@@ -89,6 +116,79 @@ class FetchMealHistoryService(IMealAPIService):
     def cache(self, value):
         self._cache = value
 
+    @staticmethod
+    def encode_cursor(meal: MealLog | Row) -> str:
+        """
+        Encode the keyset position of a meal log as an opaque cursor.
+        Args:
+            meal (MealLog | Row): Last meal log of a page.
+        Returns:
+            str: URL-safe cursor.
+        """
+        payload = json.dumps(
+            {"created_on": meal.created_on.isoformat(), "id": meal.id},
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        """
+        Decode a cursor produced by encode_cursor.
+        Args:
+            cursor (str): Opaque cursor.
+        Returns:
+            tuple: (created_on, id) of the last meal log of a page.
+        Raises:
+            BadInputError: If the cursor is malformed.
+        """
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return (
+                datetime.fromisoformat(payload["created_on"]),
+                int(payload["id"]),
+            )
+        except (ValueError, KeyError, TypeError) as err:
+            raise BadInputError(
+                responseMessage="Invalid cursor.",
+                responseKey="error_invalid_cursor",
+                httpStatusCode=HTTPStatus.BAD_REQUEST,
+            ) from err
+
+    @staticmethod
+    def filters(request_dto: FetchMealHistoryRequestDTO) -> Dict[str, Any]:
+        """
+        Repository filters requested by the DTO; only the filters that are
+        set are returned.
+        """
+        filters = {}
+        if request_dto.ingredient:
+            filters["ingredient"] = request_dto.ingredient
+        if request_dto.min_protein is not None:
+            filters["min_nutrients"] = {"Protein": request_dto.min_protein}
+        return filters
+
+    @staticmethod
+    def serialize_meal(meal: MealLog | Row) -> Dict[str, Any]:
+        """
+        Build the response entry for one meal log.
+        Args:
+            meal (MealLog | Row): Meal log record, or a row of COLUMNS.
+        Returns:
+            dict: Meal entry of the history response.
+        """
+        return {
+            "meal_name": meal.meal_name,
+            "servings": meal.servings,
+            "nutrients": NutrientVectorUtility.decode(meal.nutrient_vector),
+            "ingredients": meal.ingredients,
+            "instructions": meal.instructions,
+            "total_calories": meal.total_calories,
+            "calories_unit": meal.calories_unit,
+            "created_on": str(meal.created_on),
+            "source": "usda"
+        }
+
     async def run(
         self,
         request_dto: FetchMealHistoryRequestDTO
@@ -102,18 +202,23 @@ class FetchMealHistoryService(IMealAPIService):
             BaseResponseDTO: The response DTO with meal history data.
         """
 
+        if request_dto.limit is not None or request_dto.cursor is not None:
+            return await self.run_page(request_dto=request_dto)
+
         from_date = request_dto.from_date
         to_date = request_dto.to_date
 
         self.logger.info(
             f"Fetching meal history for user_id={self.user_id}"
         )
-        meal_history = (
+        meal_history = await (
             self.meal_log_repository.retrieve_history_by_user_id_date_range(
                 user_id=self.user_id,
                 from_date=from_date,
                 to_date=to_date,
-                is_deleted=False
+                is_deleted=False,
+                columns=self.COLUMNS,
+                **self.filters(request_dto),
             )
         )
 
@@ -136,17 +241,9 @@ class FetchMealHistoryService(IMealAPIService):
                 f"Processing meal: {meal.meal_name} "
                 f"(servings: {meal.servings})"
             )
-            meal_history_data[str(meal.created_on.date())].append({
-                "meal_name": meal.meal_name,
-                "servings": meal.servings,
-                "nutrients": meal.nutrients,
-                "ingredients": meal.ingredients,
-                "instructions": meal.instructions,
-                "total_calories": meal.total_calories,
-                "calories_unit": meal.calories_unit,
-                "created_on": str(meal.created_on),
-                "source": "usda"
-            })
+            meal_history_data[str(meal.created_on.date())].append(
+                self.serialize_meal(meal)
+            )
 
         data = dict(meal_history_data)
 
@@ -158,3 +255,115 @@ class FetchMealHistoryService(IMealAPIService):
             responseKey="success_fetch_meal",
             data=data,
         )
+
+    async def run_page(
+        self,
+        request_dto: FetchMealHistoryRequestDTO
+    ) -> BaseResponseDTO:
+        """
+        Fetch one keyset page of the meal history for the user.
+        A day can span two pages; clients merge meals by date.
+        Args:
+            request_dto (FetchMealHistoryRequestDTO): The request DTO
+            containing the date range, cursor and limit.
+        Returns:
+            BaseResponseDTO: The response DTO with the page's meals grouped
+            by date and the cursor of the next page, if any.
+        """
+        limit = request_dto.limit or Default.MEAL_HISTORY_PAGE_SIZE
+        after = (
+            self.decode_cursor(request_dto.cursor)
+            if request_dto.cursor else None
+        )
+
+        self.logger.info(
+            f"Fetching meal history page for user_id={self.user_id}, "
+            f"limit={limit}"
+        )
+        meal_history = await (
+            self.meal_log_repository
+            .retrieve_history_page_by_user_id_date_range(
+                user_id=self.user_id,
+                from_date=request_dto.from_date,
+                to_date=request_dto.to_date,
+                limit=limit + 1,
+                after=after,
+                is_deleted=False,
+                columns=self.COLUMNS,
+                **self.filters(request_dto),
+            )
+        )
+
+        if not meal_history and after is None:
+            self.logger.info("No meal history found")
+            return BaseResponseDTO(
+                transactionUrn=self.urn,
+                status=APIStatus.SUCCESS,
+                responseMessage="No meal history found.",
+                responseKey="error_no_meal_history",
+                data=None,
+            )
+
+        has_more = len(meal_history) > limit
+        meal_history = meal_history[:limit]
+        self.logger.info(f"Fetched {len(meal_history)} meal records")
+
+        meal_history_data = collections.defaultdict(list)
+        for meal in meal_history:
+            meal_history_data[str(meal.created_on.date())].append(
+                self.serialize_meal(meal)
+            )
+
+        self.logger.info("Returning meal history page response")
+        return BaseResponseDTO(
+            transactionUrn=self.urn,
+            status=APIStatus.SUCCESS,
+            responseMessage="Successfully fetched the meal history.",
+            responseKey="success_fetch_meal",
+            data={
+                "meals": dict(meal_history_data),
+                "next_cursor": (
+                    self.encode_cursor(meal_history[-1])
+                    if has_more else None
+                ),
+            },
+        )
+
+    async def stream(
+        self,
+        request_dto: FetchMealHistoryRequestDTO
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the meal history for the user one day at a time, reading
+        rows in batches so that the whole history is never in memory.
+        Args:
+            request_dto (FetchMealHistoryRequestDTO): The request DTO
+            containing the from_date and to_date.
+        Yields:
+            dict: {"date": ..., "meals": [...]} for each day with meals.
+        """
+        self.logger.info(
+            f"Streaming meal history for user_id={self.user_id}"
+        )
+        current_date = None
+        meals = []
+        async for meal in (
+            self.meal_log_repository.stream_history_by_user_id_date_range(
+                user_id=self.user_id,
+                from_date=request_dto.from_date,
+                to_date=request_dto.to_date,
+                is_deleted=False,
+                columns=self.COLUMNS,
+                **self.filters(request_dto),
+            )
+        ):
+            meal_date = str(meal.created_on.date())
+            if meal_date != current_date and meals:
+                yield {"date": current_date, "meals": meals}
+                meals = []
+            current_date = meal_date
+            meals.append(self.serialize_meal(meal))
+
+        if meals:
+            yield {"date": current_date, "meals": meals}
+        self.logger.info("Finished streaming meal history")
@@ -1,7 +1,8 @@
-from typing import List
+from typing import Final, List, Tuple
 from datetime import date, timedelta
 
 from redis import Redis
+from sqlalchemy import Row
 
 from constants.api_status import APIStatus
 
@@ -12,23 +13,33 @@ from dtos.responses.base import BaseResponseDTO
 from dtos.services.apis.v1.meal.recommendation import MealRecommendationDTO
 
 from models.meal_log import MealLog
-from repositories.meal_log import MealLogRepository
+from repositories.async_meal_log import AsyncMealLogRepository
 
 from services.apis.v1.meal.abstraction import IMealAPIService
 
+from utilities.nutrient_vector import NutrientVectorUtility
+
 
 class FetchMealRecommendationService(IMealAPIService):
     """
     Service to generate meal recommendations for a user.
     Uses meal history and food category to suggest meals.
+    Only the COLUMNS the prompt needs are read from the meal history.
     """
+    COLUMNS: Final[Tuple[str, ...]] = (
+        "meal_name",
+        "servings",
+        "nutrient_vector",
+        "ingredients",
+    )
+
     def __init__(
         self,
         urn: str = None,
         user_urn: str = None,
         api_name: str = None,
         user_id: int = None,
-        meal_log_repository: MealLogRepository = None,
+        meal_log_repository: AsyncMealLogRepository = None,
         cache: Redis = None,
     ) -> None:
         super().__init__(urn, user_urn, api_name)
@@ -93,7 +104,7 @@ class FetchMealRecommendationService(IMealAPIService):
 
     async def process_meal_recommendation(
         self,
-        meal_history: List[MealLog],
+        meal_history: List[MealLog | Row],
         food_category: str
     ) -> MealRecommendationDTO:
 
@@ -106,7 +117,9 @@ class FetchMealRecommendationService(IMealAPIService):
             meal_history_data.append({
                 "meal_name": meal.meal_name,
                 "servings": meal.servings,
-                "nutrients": meal.nutrients,
+                "nutrients": NutrientVectorUtility.decode(
+                    meal.nutrient_vector
+                ),
                 "ingredients": meal.ingredients,
             })
 
@@ -128,12 +141,13 @@ class FetchMealRecommendationService(IMealAPIService):
         )
         from_date = date.today()
         to_date = date.today() - timedelta(days=7)
-        meal_history = (
+        meal_history = await (
             self.meal_log_repository.retrieve_history_by_user_id_date_range(
                 user_id=self.user_id,
                 from_date=from_date,
                 to_date=to_date,
-                is_deleted=False
+                is_deleted=False,
+                columns=self.COLUMNS,
             )
         )
 
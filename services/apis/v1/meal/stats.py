@@ -0,0 +1,150 @@
+from redis import Redis
+from typing import Final, Tuple
+
+from constants.api_status import APIStatus
+
+from dtos.requests.apis.v1.meal.stats import FetchMealStatsRequestDTO
+from dtos.responses.base import BaseResponseDTO
+
+from repositories.async_meal_log import AsyncMealLogRepository
+
+from services.apis.v1.meal.abstraction import IMealAPIService
+
+from utilities.nutrition_analytics import NutritionAnalyticsUtility
+
+
+class FetchMealStatsService(IMealAPIService):
+    """
+    Service to fetch nutrient statistics for a user.
+    Provides daily, weekly and rolling totals and averages of calories and
+    every tracked nutrient, computed column-wise over the meal logs of the
+    range.
+    """
+    COLUMNS: Final[Tuple[str, ...]] = (
+        "servings",
+        "nutrient_vector",
+        "total_calories",
+        "calories_unit",
+        "created_on",
+    )
+
+    def __init__(
+        self,
+        urn: str = None,
+        user_urn: str = None,
+        api_name: str = None,
+        user_id: int = None,
+        meal_log_repository: AsyncMealLogRepository = None,
+        cache: Redis = None,
+    ) -> None:
+        super().__init__(urn, user_urn, api_name)
+        self._urn = urn
+        self._user_urn = user_urn
+        self._api_name = api_name
+        self._user_id = user_id
+        self._meal_log_repository = meal_log_repository
+        self._cache = cache
+        self.logger.debug(
+            f"FetchMealStatsService initialized for "
+            f"user_id={user_id}, urn={urn}, api_name={api_name}"
+        )
+
+    @property
+    def urn(self):
+        return self._urn
+
+    @urn.setter
+    def urn(self, value):
+        self._urn = value
+
+    @property
+    def user_urn(self):
+        return self._user_urn
+
+    @user_urn.setter
+    def user_urn(self, value):
+        self._user_urn = value
+
+    @property
+    def api_name(self):
+        return self._api_name
+
+    @api_name.setter
+    def api_name(self, value):
+        self._api_name = value
+
+    @property
+    def user_id(self):
+        return self._user_id
+
+    @user_id.setter
+    def user_id(self, value):
+        self._user_id = value
+
+    @property
+    def meal_log_repository(self):
+        return self._meal_log_repository
+
+    @meal_log_repository.setter
+    def meal_log_repository(self, value):
+        self._meal_log_repository = value
+
+    @property
+    def cache(self):
+        return self._cache
+
+    @cache.setter
+    def cache(self, value):
+        self._cache = value
+
+    async def run(
+        self,
+        request_dto: FetchMealStatsRequestDTO
+    ) -> BaseResponseDTO:
+        """
+        Fetch the nutrient statistics for the user.
+        Args:
+            request_dto (FetchMealStatsRequestDTO): The request DTO
+            containing the from_date, to_date and rolling window.
+        Returns:
+            BaseResponseDTO: The response DTO with the statistics, one list
+            entry per day or week for every nutrient.
+        """
+        self.logger.info(
+            f"Fetching meal stats for user_id={self.user_id}"
+        )
+        meal_logs = await (
+            self.meal_log_repository.retrieve_history_by_user_id_date_range(
+                user_id=self.user_id,
+                from_date=request_dto.from_date,
+                to_date=request_dto.to_date,
+                columns=self.COLUMNS,
+            )
+        ) or []
+        self.logger.info(f"Fetched {len(meal_logs)} meal logs")
+
+        stats = NutritionAnalyticsUtility(
+            urn=self.urn,
+            user_urn=self.user_urn,
+            api_name=self.api_name,
+            user_id=self.user_id,
+        ).compute_stats(
+            meal_logs=meal_logs,
+            from_date=request_dto.from_date,
+            to_date=request_dto.to_date,
+            window=request_dto.window,
+        )
+
+        self.logger.info("Returning meal stats response")
+        return BaseResponseDTO(
+            transactionUrn=self.urn,
+            status=APIStatus.SUCCESS,
+            responseMessage="Successfully fetched the meal stats.",
+            responseKey="success_fetch_meal_stats",
+            data={
+                "from_date": str(request_dto.from_date),
+                "to_date": str(request_dto.to_date),
+                "window": request_dto.window,
+                **stats,
+            },
+        )
@@ -0,0 +1,161 @@
+from redis import Redis
+from typing import Any, Dict, List
+
+from constants.api_status import APIStatus
+
+from dtos.requests.apis.v1.meal.summary import FetchMealSummaryRequestDTO
+from dtos.responses.base import BaseResponseDTO
+
+from models.meal_daily_summary import MealDailySummary
+
+from repositories.async_meal_daily_summary import (
+    AsyncMealDailySummaryRepository,
+)
+
+from services.apis.v1.meal.abstraction import IMealAPIService
+
+
+class FetchMealSummaryService(IMealAPIService):
+    """
+    Service to fetch a user's daily nutrition totals.
+    Reads one pre-aggregated row per day instead of the day's meal logs.
+    """
+
+    def __init__(
+        self,
+        urn: str = None,
+        user_urn: str = None,
+        api_name: str = None,
+        user_id: int = None,
+        meal_daily_summary_repository: AsyncMealDailySummaryRepository = None,
+        cache: Redis = None,
+    ) -> None:
+        super().__init__(urn, user_urn, api_name)
+        self._urn = urn
+        self._user_urn = user_urn
+        self._api_name = api_name
+        self._user_id = user_id
+        self._meal_daily_summary_repository = meal_daily_summary_repository
+        self._cache = cache
+        self.logger.debug(
+            f"FetchMealSummaryService initialized for "
+            f"user_id={user_id}, urn={urn}, api_name={api_name}"
+        )
+
+    @property
+    def urn(self):
+        return self._urn
+
+    @urn.setter
+    def urn(self, value):
+        self._urn = value
+
+    @property
+    def user_urn(self):
+        return self._user_urn
+
+    @user_urn.setter
+    def user_urn(self, value):
+        self._user_urn = value
+
+    @property
+    def api_name(self):
+        return self._api_name
+
+    @api_name.setter
+    def api_name(self, value):
+        self._api_name = value
+
+    @property
+    def user_id(self):
+        return self._user_id
+
+    @user_id.setter
+    def user_id(self, value):
+        self._user_id = value
+
+    @property
+    def meal_daily_summary_repository(self):
+        return self._meal_daily_summary_repository
+
+    @meal_daily_summary_repository.setter
+    def meal_daily_summary_repository(self, value):
+        self._meal_daily_summary_repository = value
+
+    @property
+    def cache(self):
+        return self._cache
+
+    @cache.setter
+    def cache(self, value):
+        self._cache = value
+
+    @staticmethod
+    def serialize_nutrients(
+        totals: Dict[str, Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Convert nutrient totals to the {"name", "amount", "unit"} entries
+        used for meal nutrients.
+        """
+        return [
+            {"name": name, "amount": entry["amount"], "unit": entry["unit"]}
+            for name, entry in (totals or {}).items()
+        ]
+
+    @classmethod
+    def serialize_summary(cls, summary: MealDailySummary) -> Dict[str, Any]:
+        """
+        Build the response entry for one day.
+        Args:
+            summary (MealDailySummary): Summary of the day.
+        Returns:
+            dict: Day entry of the summary response.
+        """
+        return {
+            "date": str(summary.day),
+            "meal_count": summary.meal_count,
+            "total_calories": summary.total_calories,
+            "calories_unit": summary.calories_unit,
+            "macros": cls.serialize_nutrients(summary.macros),
+            "micros": cls.serialize_nutrients(summary.micros),
+        }
+
+    async def run(
+        self,
+        request_dto: FetchMealSummaryRequestDTO
+    ) -> BaseResponseDTO:
+        """
+        Fetch the daily nutrition totals for the user.
+        Args:
+            request_dto (FetchMealSummaryRequestDTO): The request DTO
+            containing the from_date and to_date.
+        Returns:
+            BaseResponseDTO: The response DTO with one entry per day that
+            has meals, and the total calories of the range.
+        """
+        self.logger.info(
+            f"Fetching meal summary for user_id={self.user_id}"
+        )
+        summaries = await (
+            self.meal_daily_summary_repository.retrieve_by_user_id_date_range(
+                user_id=self.user_id,
+                from_date=request_dto.from_date,
+                to_date=request_dto.to_date,
+            )
+        )
+        self.logger.info(f"Fetched {len(summaries)} daily summaries")
+
+        days = [self.serialize_summary(summary) for summary in summaries]
+
+        self.logger.info("Returning meal summary response")
+        return BaseResponseDTO(
+            transactionUrn=self.urn,
+            status=APIStatus.SUCCESS,
+            responseMessage="Successfully fetched the meal summary.",
+            responseKey="success_fetch_meal_summary",
+            data={
+                "days": days,
+                "total_calories": sum(day["total_calories"] for day in days),
+            },
+        )
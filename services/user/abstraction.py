@@ -1,9 +1,12 @@
 from pydantic import BaseModel
+from redis.asyncio import Redis as AsyncRedis
 
 from abstractions.service import IService
 
 from dtos.responses.base import BaseResponseDTO
 
+from utilities.session_state import SessionStateUtility
+
 
 class IUserService(IService):
     """
@@ -17,12 +20,46 @@ class IUserService(IService):
         user_urn: str = None,
         api_name: str = None,
         user_id: int = None,
+        cache: AsyncRedis = None,
     ) -> None:
         super().__init__(urn, user_urn, api_name, user_id)
+        self._cache = cache
         self.logger.debug(
             f"IUserService initialized for "
             f"user_id={user_id}, urn={urn}, api_name={api_name}"
         )
 
+    @property
+    def cache(self):
+        return self._cache
+
+    @cache.setter
+    def cache(self, value):
+        self._cache = value
+
+    async def update_session_state(
+        self,
+        user_id: int,
+        is_logged_in: bool,
+    ) -> None:
+        """
+        Overwrite the cached logged-in status read by the authentication
+        middleware, so a login or logout is seen by the next request.
+        Writing the state, rather than deleting it, keeps a request that
+        read the old state from caching it again.
+        Args:
+            user_id (int): ID of the user whose status changed.
+            is_logged_in (bool): The user's new status.
+        """
+        if self.cache is None:
+            return
+        await SessionStateUtility(
+            urn=self.urn,
+            user_urn=self.user_urn,
+            api_name=self.api_name,
+            user_id=self.user_id,
+            cache=self.cache,
+        ).set(user_id=user_id, is_logged_in=is_logged_in)
+
     def run(self, request_dto: BaseModel) -> BaseResponseDTO:
         pass
@@ -2,6 +2,7 @@ import bcrypt
 
 from datetime import datetime
 from http import HTTPStatus
+from redis.asyncio import Redis as AsyncRedis
 
 from constants.api_status import APIStatus
 
@@ -13,7 +14,7 @@ from dtos.responses.base import BaseResponseDTO
 
 from models.user import User
 
-from repositories.user import UserRepository
+from repositories.async_user import AsyncUserRepository
 
 from services.user.abstraction import IUserService
 
@@ -30,8 +31,9 @@ class UserLoginService(IUserService):
         user_urn: str = None,
         api_name: str = None,
         user_id: int = None,
-        user_repository: UserRepository = None,
+        user_repository: AsyncUserRepository = None,
         jwt_utility: JWTUtility = None,
+        cache: AsyncRedis = None,
     ) -> None:
         super().__init__(urn, user_urn, api_name)
         self._urn = urn
@@ -40,6 +42,7 @@ class UserLoginService(IUserService):
         self._user_id = user_id
         self._user_repository = user_repository
         self._jwt_utility = jwt_utility
+        self._cache = cache
         self.logger.debug(
             f"UserLoginService initialized for "
             f"user_id={user_id}, urn={urn}, api_name={api_name}"
@@ -97,7 +100,7 @@ class UserLoginService(IUserService):
 
         self.logger.debug("Fetching user")
         user: User = (
-            self.user_repository.retrieve_record_by_email(
+            await self.user_repository.retrieve_record_by_email(
                 email=request_dto.email,
                 is_deleted=False,
             )
@@ -122,7 +125,7 @@ class UserLoginService(IUserService):
             )
 
         self.logger.debug("Updating logged in status")
-        user: User = self.user_repository.update_record(
+        user: User = await self.user_repository.update_record(
             id=user.id,
             new_data={
                 "is_logged_in": True,
@@ -131,6 +134,7 @@ class UserLoginService(IUserService):
             },
         )
         self.logger.debug("Updated logged in status")
+        await self.update_session_state(user_id=user.id, is_logged_in=True)
 
         payload = {
             "user_id": user.id,
@@ -1,4 +1,5 @@
 from http import HTTPStatus
+from redis.asyncio import Redis as AsyncRedis
 
 from constants.api_status import APIStatus
 
@@ -8,7 +9,7 @@ from dtos.responses.base import BaseResponseDTO
 
 from models.user import User
 
-from repositories.user import UserRepository
+from repositories.async_user import AsyncUserRepository
 
 from services.user.abstraction import IUserService
 
@@ -25,8 +26,9 @@ class UserLogoutService(IUserService):
         user_urn: str = None,
         api_name: str = None,
         user_id: int = None,
-        user_repository: UserRepository = None,
+        user_repository: AsyncUserRepository = None,
         jwt_utility: JWTUtility = None,
+        cache: AsyncRedis = None,
     ) -> None:
         super().__init__(urn, user_urn, api_name)
         self._urn = urn
@@ -35,6 +37,7 @@ class UserLogoutService(IUserService):
         self._user_id = user_id
         self._user_repository = user_repository
         self._jwt_utility = jwt_utility
+        self._cache = cache
         self.logger.debug(
             f"UserLogoutService initialized for "
             f"user_id={user_id}, urn={urn}, api_name={api_name}"
@@ -91,8 +94,10 @@ class UserLogoutService(IUserService):
     async def run(self) -> dict:
 
         self.logger.debug("Fetching user")
-        user: User = self.user_repository.retrieve_record_by_id_is_logged_in(
-            id=self.user_id, is_logged_in=True
+        user: User = (
+            await self.user_repository.retrieve_record_by_id_is_logged_in(
+                id=self.user_id, is_logged_in=True
+            )
         )
         self.logger.debug("Fetched user")
 
@@ -104,13 +109,14 @@ class UserLogoutService(IUserService):
             )
 
         self.logger.debug("Updating logged out status")
-        user: User = self.user_repository.update_record(
+        user: User = await self.user_repository.update_record(
             id=user.id,
             new_data={
                 "is_logged_in": False,
             },
         )
         self.logger.debug("Updated logged out status")
+        await self.update_session_state(user_id=user.id, is_logged_in=False)
 
         return BaseResponseDTO(
             transactionUrn=self.urn,
@@ -14,7 +14,7 @@ from errors.bad_input_error import BadInputError
 
 from models.user import User
 
-from repositories.user import UserRepository
+from repositories.async_user import AsyncUserRepository
 
 from services.user.abstraction import IUserService
 
@@ -29,7 +29,7 @@ class UserRegistrationService(IUserService):
         user_urn: str = None,
         api_name: str = None,
         user_id: int = None,
-        user_repository: UserRepository = None,
+        user_repository: AsyncUserRepository = None,
     ) -> None:
         super().__init__(urn, user_urn, api_name)
         self._urn = urn
@@ -85,7 +85,7 @@ class UserRegistrationService(IUserService):
     async def run(self, request_dto: UserRegistrationRequestDTO) -> dict:
 
         self.logger.debug("Checking if user exists")
-        user: User = self.user_repository.retrieve_record_by_email(
+        user: User = await self.user_repository.retrieve_record_by_email(
             email=request_dto.email
         )
 
@@ -111,7 +111,9 @@ class UserRegistrationService(IUserService):
             created_on=datetime.now(),
         )
 
-        user: User = self.user_repository.create_record(record=user)
+        user: User = await self.user_repository.create_record(
+            record=user
+        )
         self.logger.debug("Preparing user data")
 
         return BaseResponseDTO(
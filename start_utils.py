@@ -2,18 +2,22 @@
 Startup utilities for CalCount: loads configuration, environment variables,
 and initializes core services (DB, Redis, LLM, logging).
 """
+import httpx
 import os
 import redis
+import redis.asyncio
 import sys
 
 from dotenv import load_dotenv
 from langchain_google_genai import ChatGoogleGenerativeAI
 from loguru import logger
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from configurations.cache import CacheConfiguration, CacheConfigurationDTO
 from configurations.db import DBConfiguration, DBConfigurationDTO
+from configurations.llm import LLMConfiguration, LLMConfigurationDTO
 from configurations.usda import USDAConfiguration, USDAConfigurationDTO
 
 from constants.default import Default
@@ -38,6 +42,7 @@ load_dotenv()
 logger.info("Loading Configurations")
 cache_configuration: CacheConfigurationDTO = CacheConfiguration().get_config()
 db_configuration: DBConfigurationDTO = DBConfiguration().get_config()
+llm_configuration: LLMConfigurationDTO = LLMConfiguration().get_config()
 usda_configuration: USDAConfigurationDTO = USDAConfiguration().get_config()
 logger.info("Loaded Configurations")
 
@@ -78,9 +83,15 @@ RATE_LIMIT_BURST_LIMIT: int = int(
         Default.RATE_LIMIT_BURST_LIMIT,
     )
 )
+RATE_LIMIT_STORE: str = os.getenv(
+    "RATE_LIMIT_STORE",
+    Default.RATE_LIMIT_STORE,
+)
 logger.info("Loaded environment variables")
 
 logger.info("Initializing PostgreSQL database connection")
+# The engines have separate pools: requests use the async one, so the sync
+# pool is kept small. A worker opens up to the sum of both pools' limits.
 engine = create_engine(
     db_configuration.connection_string.format(
         user_name=db_configuration.user_name,
@@ -88,10 +99,32 @@ engine = create_engine(
         host=db_configuration.host,
         port=db_configuration.port,
         database=db_configuration.database,
-    )
+    ),
+    pool_size=db_configuration.sync_pool_size,
+    max_overflow=db_configuration.sync_max_overflow,
+    pool_timeout=db_configuration.pool_timeout,
+    pool_recycle=db_configuration.pool_recycle,
+    pool_pre_ping=db_configuration.pool_pre_ping,
 )
 Session = sessionmaker(bind=engine)
-db_session = Session()
+async_engine = create_async_engine(
+    db_configuration.async_connection_string.format(
+        user_name=db_configuration.user_name,
+        password=db_configuration.password,
+        host=db_configuration.host,
+        port=db_configuration.port,
+        database=db_configuration.database,
+    ),
+    pool_size=db_configuration.pool_size,
+    max_overflow=db_configuration.max_overflow,
+    pool_timeout=db_configuration.pool_timeout,
+    pool_recycle=db_configuration.pool_recycle,
+    pool_pre_ping=db_configuration.pool_pre_ping,
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    expire_on_commit=False,
+)
 logger.info("Initialized PostgreSQL database connection")
 
 logger.info("Initializing Redis database connection")
@@ -103,12 +136,35 @@ redis_session = redis.Redis(
 if not redis_session:
     logger.error("No Redis session available")
     raise RuntimeError("No Redis session available")
+async_redis_session = redis.asyncio.Redis(
+    host=cache_configuration.host,
+    port=cache_configuration.port,
+    password=cache_configuration.password,
+)
 logger.info("Initialized Redis database connection")
 
+logger.info("Initializing USDA FoodData Central HTTP client")
+usda_client = httpx.AsyncClient(
+    timeout=httpx.Timeout(
+        connect=usda_configuration.connect_timeout,
+        read=usda_configuration.read_timeout,
+        write=usda_configuration.write_timeout,
+        pool=usda_configuration.pool_timeout,
+    ),
+    limits=httpx.Limits(
+        max_connections=usda_configuration.max_connections,
+        max_keepalive_connections=(
+            usda_configuration.max_keepalive_connections
+        ),
+        keepalive_expiry=usda_configuration.keepalive_expiry,
+    ),
+)
+logger.info("Initialized USDA FoodData Central HTTP client")
+
 logger.info("Initializing LLM (Google Gemini) if API key is present")
 if GOOGLE_API_KEY:
     llm = ChatGoogleGenerativeAI(
-        model="gemini-2.5-flash",
+        model=llm_configuration.model,
         google_api_key=GOOGLE_API_KEY,
     )
     logger.info("Initialized Google Gemini LLM")
@@ -125,5 +181,4 @@ unprotected_routes: set = {
 }
 callback_routes: set = set()
 
-db_session.commit()
-logger.info("Database session committed and startup complete")
+logger.info("Startup complete")
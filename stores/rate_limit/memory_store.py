@@ -0,0 +1,259 @@
+import asyncio
+import math
+import time
+
+from collections import OrderedDict, deque
+from typing import Any, Final, List, Optional
+
+from abstractions.rate_limit_store import IRateLimitStore
+
+from constants.default import Default
+
+from dtos.stores.rate_limit.result import RateLimitResultDTO
+
+from start_utils import logger
+
+
+class MemoryRateLimitStore(IRateLimitStore):
+    """
+    In-memory store for rate limiting data.
+    Handles sliding window, fixed window and token bucket counters. Limits
+    are per process, so use it for tests and single-worker runs.
+
+    Keys are spread over `shards` shards, each with its own lock and its
+    own LRU-ordered table, so checks for different clients do not contend.
+    Each shard holds at most `max_keys / shards` keys and evicts the least
+    recently used one beyond that. Entries carry an expiry time and are
+    dropped when touched after it; every access also drops a few expired
+    entries from the cold end of the shard, so idle keys leave without a
+    full sweep.
+    """
+    EXPIRE_PER_ACCESS: Final[int] = 2
+
+    def __init__(
+        self,
+        shards: int = Default.RATE_LIMIT_MEMORY_SHARDS,
+        max_keys: int = Default.RATE_LIMIT_MEMORY_MAX_KEYS,
+    ):
+        # key -> [expires_at, state]
+        self._shards: List[OrderedDict] = [
+            OrderedDict() for _ in range(shards)
+        ]
+        self._locks: List[asyncio.Lock] = [
+            asyncio.Lock() for _ in range(shards)
+        ]
+        self._max_keys_per_shard = max(1, max_keys // shards)
+        logger.debug(
+            "Initialized MemoryRateLimitStore",
+            shards=shards,
+            max_keys=max_keys,
+        )
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._shards)
+
+    def _shard(self, key: str) -> int:
+        return hash(key) % len(self._shards)
+
+    def _get_entry(
+        self, entries: OrderedDict, key: str, now: float
+    ) -> Optional[List[Any]]:
+        """
+        Return the live entry for `key`, marking it most recently used.
+        Expired entries for the key, and a few at the cold end of the
+        shard, are dropped on the way.
+        """
+        for _ in range(self.EXPIRE_PER_ACCESS):
+            if not entries:
+                break
+            oldest_key, oldest = next(iter(entries.items()))
+            if oldest[0] > now:
+                break
+            del entries[oldest_key]
+
+        entry = entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= now:
+            del entries[key]
+            return None
+        entries.move_to_end(key)
+        return entry
+
+    def _add_entry(
+        self, entries: OrderedDict, key: str, entry: List[Any]
+    ) -> None:
+        """
+        Insert a new entry, evicting least recently used keys over the cap.
+        """
+        entries[key] = entry
+        while len(entries) > self._max_keys_per_shard:
+            evicted_key, _ = entries.popitem(last=False)
+            logger.debug("Evicted rate limit key", key=evicted_key)
+
+    async def check_sliding_window(
+        self, key: str, limit: int, window: int
+    ) -> RateLimitResultDTO:
+        """
+        Check sliding window rate limit for a given key.
+
+        Args:
+            key (str): Unique identifier for the client/endpoint.
+            limit (int): Maximum allowed requests in the window.
+            window (int): Window size in seconds.
+        Returns:
+            RateLimitResultDTO: Decision with remaining quota.
+        """
+        shard = self._shard(key)
+        async with self._locks[shard]:
+            entries = self._shards[shard]
+            now = time.time()
+            entry = self._get_entry(entries, key, now)
+            if entry is None:
+                entry = [now + window, deque()]
+                self._add_entry(entries, key, entry)
+            requests = entry[1]
+
+            window_start = now - window
+            while requests and requests[0] < window_start:
+                requests.popleft()
+
+            if len(requests) >= limit:
+                logger.info(
+                    "Sliding window limit exceeded",
+                    key=key,
+                    limit=limit,
+                    window=window,
+                    current_count=len(requests),
+                )
+                return RateLimitResultDTO(
+                    allowed=False,
+                    limit=limit,
+                    remaining=0,
+                    reset_after=requests[-1] + window - now,
+                    retry_after=requests[0] + window - now,
+                )
+
+            requests.append(now)
+            entry[0] = now + window
+            logger.debug(
+                "Sliding window incremented",
+                key=key,
+                current_count=len(requests),
+            )
+            return RateLimitResultDTO(
+                allowed=True,
+                limit=limit,
+                remaining=limit - len(requests),
+                reset_after=float(window),
+            )
+
+    async def check_fixed_window(
+        self, key: str, limit: int, window: int
+    ) -> RateLimitResultDTO:
+        """
+        Check fixed window rate limit for a given key.
+
+        Args:
+            key (str): Unique identifier for the client/endpoint.
+            limit (int): Maximum allowed requests in the window.
+            window (int): Window size in seconds.
+        Returns:
+            RateLimitResultDTO: Decision with remaining quota.
+        """
+        shard = self._shard(key)
+        async with self._locks[shard]:
+            entries = self._shards[shard]
+            now = time.time()
+            window_start = now - now % window
+            # The entry expires when its window ends, so a live entry is
+            # always for the current window. State is the request count.
+            entry = self._get_entry(entries, key, now)
+            if entry is None:
+                entry = [window_start + window, 0]
+                self._add_entry(entries, key, entry)
+
+            reset_after = entry[0] - now
+            if entry[1] >= limit:
+                logger.info(
+                    "Fixed window limit exceeded",
+                    key=key,
+                    limit=limit,
+                    window=window,
+                    current_count=entry[1],
+                )
+                return RateLimitResultDTO(
+                    allowed=False,
+                    limit=limit,
+                    remaining=0,
+                    reset_after=reset_after,
+                    retry_after=reset_after,
+                )
+
+            entry[1] += 1
+            logger.debug(
+                "Fixed window incremented",
+                key=key,
+                current_count=entry[1],
+            )
+            return RateLimitResultDTO(
+                allowed=True,
+                limit=limit,
+                remaining=limit - entry[1],
+                reset_after=reset_after,
+            )
+
+    async def check_token_bucket(
+        self, key: str, capacity: int, refill_rate: float
+    ) -> RateLimitResultDTO:
+        """
+        Check token bucket rate limit for a given key.
+
+        Args:
+            key (str): Unique identifier for the client/endpoint.
+            capacity (int): Bucket size, i.e. the allowed burst.
+            refill_rate (float): Tokens added per second.
+        Returns:
+            RateLimitResultDTO: Decision with remaining tokens.
+        """
+        shard = self._shard(key)
+        async with self._locks[shard]:
+            entries = self._shards[shard]
+            now = time.time()
+            # The entry expires once the bucket would be full again, which
+            # is the same as having no entry. State is [tokens, last_refill].
+            entry = self._get_entry(entries, key, now)
+            if entry is None:
+                entry = [now, [float(capacity), now]]
+                self._add_entry(entries, key, entry)
+            bucket = entry[1]
+            bucket[0] = min(
+                capacity, bucket[0] + (now - bucket[1]) * refill_rate
+            )
+            bucket[1] = now
+
+            if bucket[0] < 1:
+                logger.info(
+                    "Token bucket empty",
+                    key=key,
+                    capacity=capacity,
+                    tokens=bucket[0],
+                )
+                return RateLimitResultDTO(
+                    allowed=False,
+                    limit=capacity,
+                    remaining=0,
+                    reset_after=(capacity - bucket[0]) / refill_rate,
+                    retry_after=(1 - bucket[0]) / refill_rate,
+                )
+
+            bucket[0] -= 1
+            reset_after = (capacity - bucket[0]) / refill_rate
+            entry[0] = now + reset_after
+            logger.debug("Token taken", key=key, tokens=bucket[0])
+            return RateLimitResultDTO(
+                allowed=True,
+                limit=capacity,
+                remaining=math.floor(bucket[0]),
+                reset_after=reset_after,
+            )
@@ -0,0 +1,231 @@
+import uuid
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from typing import Final, List
+
+from abstractions.rate_limit_store import IRateLimitStore
+
+from dtos.stores.rate_limit.result import RateLimitResultDTO
+
+from start_utils import logger
+
+
+class RedisRateLimitStore(IRateLimitStore):
+    """
+    Redis-backed store for rate limiting data, shared by every worker and
+    node that talks to the same Redis.
+
+    Every check is a Lua script that reads, decides and writes in a single
+    atomic round-trip using the Redis server clock, so no client-side lock
+    is needed and clock skew between nodes does not matter. Sliding windows
+    are sorted sets of request ids; fixed windows and token buckets are
+    two-field hashes, so their memory per key is constant.
+    """
+    KEY_PREFIX: Final[str] = "rate_limit:"
+    _NOW_MS: Final[str] = """
+        local time = redis.call('TIME')
+        local now_ms = tonumber(time[1]) * 1000
+            + math.floor(tonumber(time[2]) / 1000)
+    """
+    SLIDING_WINDOW_SCRIPT: Final[str] = _NOW_MS + """
+        local key = KEYS[1]
+        local limit = tonumber(ARGV[1])
+        local window_ms = tonumber(ARGV[2])
+        local member = ARGV[3]
+
+        redis.call('ZREMRANGEBYSCORE', key, '-inf', now_ms - window_ms)
+        local count = redis.call('ZCARD', key)
+        if count >= limit then
+            if count == 0 then
+                return {0, 0, window_ms, window_ms}
+            end
+            local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+            local newest = redis.call('ZRANGE', key, -1, -1, 'WITHSCORES')
+            return {
+                0,
+                0,
+                tonumber(newest[2]) + window_ms - now_ms,
+                tonumber(oldest[2]) + window_ms - now_ms,
+            }
+        end
+
+        redis.call('ZADD', key, now_ms, member)
+        redis.call('PEXPIRE', key, window_ms)
+        return {1, limit - count - 1, window_ms, 0}
+    """
+    FIXED_WINDOW_SCRIPT: Final[str] = _NOW_MS + """
+        local key = KEYS[1]
+        local limit = tonumber(ARGV[1])
+        local window_ms = tonumber(ARGV[2])
+
+        local window_start = now_ms - now_ms % window_ms
+        local reset_ms = window_start + window_ms - now_ms
+        local counter = redis.call('HMGET', key, 'start', 'count')
+        local count = 0
+        if tonumber(counter[1]) == window_start then
+            count = tonumber(counter[2])
+        end
+        if count >= limit then
+            return {0, 0, reset_ms, reset_ms}
+        end
+
+        count = count + 1
+        redis.call('HSET', key, 'start', window_start, 'count', count)
+        redis.call('PEXPIRE', key, reset_ms)
+        return {1, limit - count, reset_ms, 0}
+    """
+    TOKEN_BUCKET_SCRIPT: Final[str] = _NOW_MS + """
+        local key = KEYS[1]
+        local capacity = tonumber(ARGV[1])
+        local refill_per_ms = tonumber(ARGV[2])
+
+        local bucket = redis.call('HMGET', key, 'tokens', 'ts')
+        local tokens = tonumber(bucket[1])
+        local last_ms = tonumber(bucket[2])
+        if tokens == nil or last_ms == nil then
+            tokens = capacity
+            last_ms = now_ms
+        end
+        tokens = math.min(
+            capacity, tokens + math.max(0, now_ms - last_ms) * refill_per_ms
+        )
+
+        local allowed = 0
+        local retry_ms = 0
+        if tokens >= 1 then
+            tokens = tokens - 1
+            allowed = 1
+        else
+            retry_ms = math.ceil((1 - tokens) / refill_per_ms)
+        end
+        local reset_ms = math.ceil((capacity - tokens) / refill_per_ms)
+
+        redis.call('HSET', key, 'tokens', tostring(tokens), 'ts', now_ms)
+        redis.call('PEXPIRE', key, reset_ms + 1)
+        return {allowed, math.floor(tokens), reset_ms, retry_ms}
+    """
+
+    def __init__(self, cache: Redis, fail_open: bool = True):
+        """
+        Initialize the RedisRateLimitStore.
+        Args:
+            cache (Redis): asyncio Redis client.
+            fail_open (bool): Allow requests when Redis is unreachable.
+        """
+        self._cache = cache
+        self._fail_open = fail_open
+        self._sliding_window = cache.register_script(
+            self.SLIDING_WINDOW_SCRIPT
+        )
+        self._fixed_window = cache.register_script(self.FIXED_WINDOW_SCRIPT)
+        self._token_bucket = cache.register_script(self.TOKEN_BUCKET_SCRIPT)
+        logger.debug("Initialized RedisRateLimitStore", fail_open=fail_open)
+
+    async def _check(
+        self,
+        strategy: str,
+        script,
+        key: str,
+        args: List,
+        limit: int,
+    ) -> RateLimitResultDTO:
+        """
+        Run a check script and convert its reply. Each script replies with
+        {allowed, remaining, reset_ms, retry_ms}. On Redis errors the
+        request is allowed or denied according to `fail_open`.
+        """
+        try:
+            allowed, remaining, reset_ms, retry_ms = await script(
+                keys=[f"{self.KEY_PREFIX}{key}"],
+                args=args,
+            )
+        except RedisError as err:
+            logger.error(
+                f"Rate limit store unavailable: {err}",
+                key=key,
+                fail_open=self._fail_open,
+            )
+            return RateLimitResultDTO(
+                allowed=self._fail_open,
+                limit=limit,
+                remaining=limit if self._fail_open else 0,
+                reset_after=0,
+            )
+
+        if not allowed:
+            logger.info(
+                f"{strategy} limit exceeded",
+                key=key,
+                limit=limit,
+            )
+        return RateLimitResultDTO(
+            allowed=bool(allowed),
+            limit=limit,
+            remaining=max(0, int(remaining)),
+            reset_after=reset_ms / 1000,
+            retry_after=retry_ms / 1000,
+        )
+
+    async def check_sliding_window(
+        self, key: str, limit: int, window: int
+    ) -> RateLimitResultDTO:
+        """
+        Check sliding window rate limit for a given key.
+
+        Args:
+            key (str): Unique identifier for the client/endpoint.
+            limit (int): Maximum allowed requests in the window.
+            window (int): Window size in seconds.
+        Returns:
+            RateLimitResultDTO: Decision with remaining quota.
+        """
+        return await self._check(
+            "Sliding window",
+            self._sliding_window,
+            key,
+            [limit, int(window * 1000), uuid.uuid4().hex],
+            limit,
+        )
+
+    async def check_fixed_window(
+        self, key: str, limit: int, window: int
+    ) -> RateLimitResultDTO:
+        """
+        Check fixed window rate limit for a given key.
+
+        Args:
+            key (str): Unique identifier for the client/endpoint.
+            limit (int): Maximum allowed requests in the window.
+            window (int): Window size in seconds.
+        Returns:
+            RateLimitResultDTO: Decision with remaining quota.
+        """
+        return await self._check(
+            "Fixed window",
+            self._fixed_window,
+            key,
+            [limit, int(window * 1000)],
+            limit,
+        )
+
+    async def check_token_bucket(
+        self, key: str, capacity: int, refill_rate: float
+    ) -> RateLimitResultDTO:
+        """
+        Check token bucket rate limit for a given key.
+
+        Args:
+            key (str): Unique identifier for the client/endpoint.
+            capacity (int): Bucket size, i.e. the allowed burst.
+            refill_rate (float): Tokens added per second.
+        Returns:
+            RateLimitResultDTO: Decision with remaining tokens.
+        """
+        return await self._check(
+            "Token bucket",
+            self._token_bucket,
+            key,
+            [capacity, repr(refill_rate / 1000)],
+            capacity,
+        )
@@ -85,6 +85,7 @@ class TestIAPIsController(TestIController):
             repository_factory,
             service_factory,
             mock_dictionary_utility_factory,
+            meal_daily_summary_repository=Mock(),
         )
 
         assert response.status_code == error.httpStatusCode
@@ -149,6 +150,7 @@ class TestIAPIsController(TestIController):
             repository_factory,
             service_factory,
             mock_dictionary_utility_factory,
+            meal_daily_summary_repository=Mock(),
         )
 
         assert response.status_code == error.httpStatusCode
@@ -213,6 +215,7 @@ class TestIAPIsController(TestIController):
             repository_factory,
             service_factory,
             mock_dictionary_utility_factory,
+            meal_daily_summary_repository=Mock(),
         )
 
         print("******************************************")
@@ -281,6 +284,7 @@ class TestIAPIsController(TestIController):
             repository_factory,
             service_factory,
             mock_dictionary_utility_factory,
+            meal_daily_summary_repository=Mock(),
         )
 
         assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
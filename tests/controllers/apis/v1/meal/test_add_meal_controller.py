@@ -68,6 +68,7 @@ class TestAddMealAPIController(TestIV1MealAPIsController):
         mock_request,
         mock_session,
         mock_meal_log_repository_factory,
+        mock_meal_daily_summary_repository_factory,
         mock_add_meal_service_factory,
         mock_dictionary_utility_factory,
         successful_response_dto,
@@ -84,6 +85,9 @@ class TestAddMealAPIController(TestIV1MealAPIsController):
             request_payload=valid_add_meal_request_dto,
             session=mock_session,
             meal_log_repository=mock_meal_log_repository_factory,
+            meal_daily_summary_repository=(
+                mock_meal_daily_summary_repository_factory
+            ),
             add_meal_service_factory=mock_add_meal_service_factory,
             dictionary_utility=mock_dictionary_utility_factory,
         )
@@ -133,6 +137,7 @@ class TestAddMealAPIController(TestIV1MealAPIsController):
         mock_request,
         mock_session,
         mock_meal_log_repository_factory,
+        mock_meal_daily_summary_repository_factory,
         mock_add_meal_service_factory,
         mock_dictionary_utility_factory,
     ):
@@ -153,6 +158,9 @@ class TestAddMealAPIController(TestIV1MealAPIsController):
             request_payload=valid_add_meal_request_dto,
             session=mock_session,
             meal_log_repository=mock_meal_log_repository_factory,
+            meal_daily_summary_repository=(
+                mock_meal_daily_summary_repository_factory
+            ),
             add_meal_service_factory=mock_add_meal_service_factory,
             dictionary_utility=mock_dictionary_utility_factory,
         )
@@ -168,6 +176,7 @@ class TestAddMealAPIController(TestIV1MealAPIsController):
         mock_request,
         mock_session,
         mock_meal_log_repository_factory,
+        mock_meal_daily_summary_repository_factory,
         mock_add_meal_service_factory,
         mock_dictionary_utility_factory,
     ):
@@ -188,6 +197,9 @@ class TestAddMealAPIController(TestIV1MealAPIsController):
             request_payload=valid_add_meal_request_dto,
             session=mock_session,
             meal_log_repository=mock_meal_log_repository_factory,
+            meal_daily_summary_repository=(
+                mock_meal_daily_summary_repository_factory
+            ),
             add_meal_service_factory=mock_add_meal_service_factory,
             dictionary_utility=mock_dictionary_utility_factory,
         )
@@ -203,6 +215,7 @@ class TestAddMealAPIController(TestIV1MealAPIsController):
         mock_request,
         mock_session,
         mock_meal_log_repository_factory,
+        mock_meal_daily_summary_repository_factory,
         mock_add_meal_service_factory,
         mock_dictionary_utility_factory,
     ):
@@ -234,6 +247,7 @@ class TestAddMealAPIController(TestIV1MealAPIsController):
         mock_request,
         mock_session,
         mock_meal_log_repository_factory,
+        mock_meal_daily_summary_repository_factory,
         mock_add_meal_service_factory,
         mock_dictionary_utility_factory,
     ):
@@ -263,6 +277,7 @@ class TestAddMealAPIController(TestIV1MealAPIsController):
         mock_request,
         mock_session,
         mock_meal_log_repository_factory,
+        mock_meal_daily_summary_repository_factory,
         mock_add_meal_service_factory,
         mock_dictionary_utility_factory,
         successful_response_dto,
@@ -282,6 +297,9 @@ class TestAddMealAPIController(TestIV1MealAPIsController):
             request_payload=valid_add_meal_request_dto,
             session=mock_session,
             meal_log_repository=mock_meal_log_repository_factory,
+            meal_daily_summary_repository=(
+                mock_meal_daily_summary_repository_factory
+            ),
             add_meal_service_factory=mock_add_meal_service_factory,
             dictionary_utility=mock_dictionary_utility_factory,
         )
@@ -296,6 +314,7 @@ class TestAddMealAPIController(TestIV1MealAPIsController):
         mock_request,
         mock_session,
         mock_meal_log_repository_factory,
+        mock_meal_daily_summary_repository_factory,
         mock_add_meal_service_factory,
         mock_dictionary_utility_factory,
         successful_response_dto,
@@ -315,6 +334,9 @@ class TestAddMealAPIController(TestIV1MealAPIsController):
             request_payload=valid_add_meal_request_dto,
             session=mock_session,
             meal_log_repository=mock_meal_log_repository_factory,
+            meal_daily_summary_repository=(
+                mock_meal_daily_summary_repository_factory
+            ),
             add_meal_service_factory=mock_add_meal_service_factory,
             dictionary_utility=mock_dictionary_utility_factory,
         )
@@ -329,6 +351,7 @@ class TestAddMealAPIController(TestIV1MealAPIsController):
         mock_request,
         mock_session,
         mock_meal_log_repository_factory,
+        mock_meal_daily_summary_repository_factory,
         mock_add_meal_service_factory,
         mock_dictionary_utility_factory,
         successful_response_dto,
@@ -344,16 +367,19 @@ class TestAddMealAPIController(TestIV1MealAPIsController):
             request_payload=valid_add_meal_request_dto,
             session=mock_session,
             meal_log_repository=mock_meal_log_repository_factory,
+            meal_daily_summary_repository=(
+                mock_meal_daily_summary_repository_factory
+            ),
             add_meal_service_factory=mock_add_meal_service_factory,
             dictionary_utility=mock_dictionary_utility_factory,
         )
         utility = mock_dictionary_utility_factory.return_value
         utility.convert_dict_keys_to_camel_case.assert_called_once()
         call_args = utility.convert_dict_keys_to_camel_case.call_args[0][0]
-        assert call_args["transactionUrn"] == (
-            successful_response_dto.transactionUrn
-        )
-        assert call_args["status"] == successful_response_dto.status
+        assert call_args == {
+            "data": successful_response_dto.data,
+            "errors": successful_response_dto.errors,
+        }
 
     async def test_service_factory_called_with_correct_params(
         self,
@@ -361,6 +387,7 @@ class TestAddMealAPIController(TestIV1MealAPIsController):
         mock_request,
         mock_session,
         mock_meal_log_repository_factory,
+        mock_meal_daily_summary_repository_factory,
         mock_add_meal_service_factory,
         mock_dictionary_utility_factory,
         successful_response_dto,
@@ -369,6 +396,8 @@ class TestAddMealAPIController(TestIV1MealAPIsController):
         user_id,
     ):
         """Test that service factory is called with correct parameters."""
+        mock_usda_client = Mock()
+        mock_async_cache = Mock()
 
         controller = AddMealController()
         mock_add_meal_service_factory.return_value.run = AsyncMock(
@@ -380,8 +409,13 @@ class TestAddMealAPIController(TestIV1MealAPIsController):
             request_payload=valid_add_meal_request_dto,
             session=mock_session,
             meal_log_repository=mock_meal_log_repository_factory,
+            meal_daily_summary_repository=(
+                mock_meal_daily_summary_repository_factory
+            ),
             add_meal_service_factory=mock_add_meal_service_factory,
             dictionary_utility=mock_dictionary_utility_factory,
+            usda_client=mock_usda_client,
+            async_cache=mock_async_cache,
         )
 
         mock_add_meal_service_factory.assert_called_once_with(
@@ -391,6 +425,11 @@ class TestAddMealAPIController(TestIV1MealAPIsController):
             user_id=user_id,
             meal_log_repository=mock_meal_log_repository_factory.return_value,
             cache=ANY,
+            usda_client=mock_usda_client,
+            async_cache=mock_async_cache,
+            meal_daily_summary_repository=(
+                mock_meal_daily_summary_repository_factory.return_value
+            ),
         )
 
     async def test_repository_factory_called_with_correct_params(
@@ -399,6 +438,7 @@ class TestAddMealAPIController(TestIV1MealAPIsController):
         mock_request,
         mock_session,
         mock_meal_log_repository_factory,
+        mock_meal_daily_summary_repository_factory,
         mock_add_meal_service_factory,
         mock_dictionary_utility_factory,
         successful_response_dto,
@@ -417,6 +457,9 @@ class TestAddMealAPIController(TestIV1MealAPIsController):
             request_payload=valid_add_meal_request_dto,
             session=mock_session,
             meal_log_repository=mock_meal_log_repository_factory,
+            meal_daily_summary_repository=(
+                mock_meal_daily_summary_repository_factory
+            ),
             add_meal_service_factory=mock_add_meal_service_factory,
             dictionary_utility=mock_dictionary_utility_factory,
         )
@@ -342,10 +342,10 @@ class TestFetchMealAPIController(TestIV1MealAPIsController):
         utility = mock_dictionary_utility_factory.return_value
         utility.convert_dict_keys_to_camel_case.assert_called_once()
         call_args = utility.convert_dict_keys_to_camel_case.call_args[0][0]
-        assert call_args["transactionUrn"] == (
-            successful_response_dto.transactionUrn
-        )
-        assert call_args["status"] == successful_response_dto.status
+        assert call_args == {
+            "data": successful_response_dto.data,
+            "errors": successful_response_dto.errors,
+        }
 
     async def test_service_factory_called_with_correct_params(
         self,
@@ -361,6 +361,8 @@ class TestFetchMealAPIController(TestIV1MealAPIsController):
         user_id,
     ):
         """Test that service factory is called with correct parameters."""
+        mock_usda_client = Mock()
+        mock_async_cache = Mock()
 
         controller = FetchMealController()
         mock_fetch_meal_service_factory.return_value.run = AsyncMock(
@@ -375,6 +377,8 @@ class TestFetchMealAPIController(TestIV1MealAPIsController):
             meal_log_repository=mock_meal_log_repository_factory,
             fetch_meal_service_factory=mock_fetch_meal_service_factory,
             dictionary_utility=mock_dictionary_utility_factory,
+            usda_client=mock_usda_client,
+            async_cache=mock_async_cache,
         )
 
         mock_fetch_meal_service_factory.assert_called_once_with(
@@ -384,6 +388,8 @@ class TestFetchMealAPIController(TestIV1MealAPIsController):
             user_id=user_id,
             meal_log_repository=mock_meal_log_repository_factory.return_value,
             cache=ANY,
+            usda_client=mock_usda_client,
+            async_cache=mock_async_cache,
         )
 
     async def test_repository_factory_called_with_correct_params(
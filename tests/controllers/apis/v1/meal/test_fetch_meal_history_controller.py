@@ -1,7 +1,9 @@
+import json
 import pytest
 
+from fastapi.responses import StreamingResponse
 from http import HTTPStatus
-from unittest.mock import Mock, AsyncMock, ANY
+from unittest.mock import Mock, AsyncMock, ANY, MagicMock, patch
 
 from constants.api_status import APIStatus
 
@@ -83,6 +85,11 @@ class TestFetchMealHistoryAPIController(TestIV1MealAPIsController):
             ),
             from_date=valid_fetch_meal_history_request_dto.from_date,
             to_date=valid_fetch_meal_history_request_dto.to_date,
+            cursor=None,
+            limit=None,
+            stream=False,
+            ingredient=None,
+            min_protein=None,
             session=mock_session,
             cache=Mock(),
             meal_log_repository=mock_meal_log_repository_factory,
@@ -127,6 +134,11 @@ class TestFetchMealHistoryAPIController(TestIV1MealAPIsController):
             ),
             from_date=valid_fetch_meal_history_request_dto.from_date,
             to_date=valid_fetch_meal_history_request_dto.to_date,
+            cursor=None,
+            limit=None,
+            stream=False,
+            ingredient=None,
+            min_protein=None,
             session=mock_session,
             cache=Mock(),
             meal_log_repository=mock_meal_log_repository_factory,
@@ -170,6 +182,11 @@ class TestFetchMealHistoryAPIController(TestIV1MealAPIsController):
             ),
             from_date=valid_fetch_meal_history_request_dto.from_date,
             to_date=valid_fetch_meal_history_request_dto.to_date,
+            cursor=None,
+            limit=None,
+            stream=False,
+            ingredient=None,
+            min_protein=None,
             session=mock_session,
             meal_log_repository=mock_meal_log_repository_factory,
             fetch_meal_history_service_factory=(
@@ -212,6 +229,11 @@ class TestFetchMealHistoryAPIController(TestIV1MealAPIsController):
             ),
             from_date=valid_fetch_meal_history_request_dto.from_date,
             to_date=valid_fetch_meal_history_request_dto.to_date,
+            cursor=None,
+            limit=None,
+            stream=False,
+            ingredient=None,
+            min_protein=None,
             session=mock_session,
             meal_log_repository=mock_meal_log_repository_factory,
             fetch_meal_history_service_factory=(
@@ -249,6 +271,11 @@ class TestFetchMealHistoryAPIController(TestIV1MealAPIsController):
             ),
             from_date=valid_fetch_meal_history_request_dto.from_date,
             to_date=valid_fetch_meal_history_request_dto.to_date,
+            cursor=None,
+            limit=None,
+            stream=False,
+            ingredient=None,
+            min_protein=None,
             session=mock_session,
             meal_log_repository=mock_meal_log_repository_factory,
             fetch_meal_history_service_factory=(
@@ -289,6 +316,11 @@ class TestFetchMealHistoryAPIController(TestIV1MealAPIsController):
             ),
             from_date=valid_fetch_meal_history_request_dto.from_date,
             to_date=valid_fetch_meal_history_request_dto.to_date,
+            cursor=None,
+            limit=None,
+            stream=False,
+            ingredient=None,
+            min_protein=None,
             session=mock_session,
             meal_log_repository=mock_meal_log_repository_factory,
             fetch_meal_history_service_factory=(
@@ -330,6 +362,11 @@ class TestFetchMealHistoryAPIController(TestIV1MealAPIsController):
             ),
             from_date=valid_fetch_meal_history_request_dto.from_date,
             to_date=valid_fetch_meal_history_request_dto.to_date,
+            cursor=None,
+            limit=None,
+            stream=False,
+            ingredient=None,
+            min_protein=None,
             session=mock_session,
             meal_log_repository=mock_meal_log_repository_factory,
             fetch_meal_history_service_factory=(
@@ -367,6 +404,11 @@ class TestFetchMealHistoryAPIController(TestIV1MealAPIsController):
             ),
             from_date=valid_fetch_meal_history_request_dto.from_date,
             to_date=valid_fetch_meal_history_request_dto.to_date,
+            cursor=None,
+            limit=None,
+            stream=False,
+            ingredient=None,
+            min_protein=None,
             session=mock_session,
             meal_log_repository=mock_meal_log_repository_factory,
             fetch_meal_history_service_factory=(
@@ -379,10 +421,10 @@ class TestFetchMealHistoryAPIController(TestIV1MealAPIsController):
         callable.assert_called_once()
         call_args = (mock_dictionary_utility_factory.return_value
                      .convert_dict_keys_to_camel_case.call_args[0][0])
-        assert call_args["transactionUrn"] == (
-            successful_response_dto.transactionUrn
-        )
-        assert call_args["status"] == successful_response_dto.status
+        assert call_args == {
+            "data": successful_response_dto.data,
+            "errors": successful_response_dto.errors,
+        }
 
     async def test_service_factory_called_with_correct_params(
         self,
@@ -411,6 +453,11 @@ class TestFetchMealHistoryAPIController(TestIV1MealAPIsController):
             ),
             from_date=valid_fetch_meal_history_request_dto.from_date,
             to_date=valid_fetch_meal_history_request_dto.to_date,
+            cursor=None,
+            limit=None,
+            stream=False,
+            ingredient=None,
+            min_protein=None,
             session=mock_session,
             cache=Mock(),
             meal_log_repository=mock_meal_log_repository_factory,
@@ -455,6 +502,11 @@ class TestFetchMealHistoryAPIController(TestIV1MealAPIsController):
             ),
             from_date=valid_fetch_meal_history_request_dto.from_date,
             to_date=valid_fetch_meal_history_request_dto.to_date,
+            cursor=None,
+            limit=None,
+            stream=False,
+            ingredient=None,
+            min_protein=None,
             session=mock_session,
             cache=Mock(),
             meal_log_repository=mock_meal_log_repository_factory,
@@ -471,3 +523,79 @@ class TestFetchMealHistoryAPIController(TestIV1MealAPIsController):
             user_id=user_id,
             session=mock_session,
         )
+
+    async def test_fetch_meal_history_api_controller_stream(
+        self,
+        valid_fetch_meal_history_request_dto,
+        mock_request,
+        mock_session,
+        mock_meal_log_repository_factory,
+        mock_fetch_meal_history_service_factory,
+        mock_fetch_meal_history_service,
+        mock_dictionary_utility_factory,
+    ):
+        """Test that stream=True streams day groups as NDJSON."""
+
+        controller = FetchMealHistoryController()
+        days = [
+            {"date": "2021-01-01", "meals": [{"meal_name": "test_meal"}]},
+            {"date": "2021-01-02", "meals": []},
+        ]
+
+        async def stream(request_dto):
+            for day in days:
+                yield day
+
+        mock_fetch_meal_history_service.stream = stream
+        stream_session = MagicMock()
+        stream_session.__aenter__ = AsyncMock(return_value=Mock())
+        stream_session.__aexit__ = AsyncMock(return_value=False)
+
+        response = await controller.get(
+            request=mock_request,
+            reference_number=(
+                valid_fetch_meal_history_request_dto.reference_number
+            ),
+            from_date=valid_fetch_meal_history_request_dto.from_date,
+            to_date=valid_fetch_meal_history_request_dto.to_date,
+            cursor=None,
+            limit=None,
+            stream=True,
+            ingredient=None,
+            min_protein=None,
+            session=mock_session,
+            cache=Mock(),
+            meal_log_repository=mock_meal_log_repository_factory,
+            fetch_meal_history_service_factory=(
+                mock_fetch_meal_history_service_factory
+            ),
+            dictionary_utility=mock_dictionary_utility_factory,
+        )
+
+        assert isinstance(response, StreamingResponse)
+        assert response.media_type == "application/x-ndjson"
+        mock_fetch_meal_history_service.run.assert_not_called()
+        user_id = controller.user_id
+        user_urn = controller.user_urn
+        mock_fetch_meal_history_service_factory.reset_mock()
+
+        # A concurrent request reuses the shared controller before the
+        # stream body is read.
+        controller.urn = "other-urn"
+        controller.user_urn = "other-user-urn"
+        controller.user_id = "other-user-id"
+        controller.dictionary_utility = None
+
+        with patch(
+            "controllers.apis.v1.meal.history.AsyncSessionLocal",
+            return_value=stream_session,
+        ):
+            lines = [line async for line in response.body_iterator]
+
+        assert [json.loads(line) for line in lines] == days
+        stream_session.__aexit__.assert_awaited_once()
+        factory_kwargs = (
+            mock_fetch_meal_history_service_factory.call_args.kwargs
+        )
+        assert factory_kwargs["user_id"] == user_id
+        assert factory_kwargs["user_urn"] == user_urn
@@ -0,0 +1,212 @@
+import datetime
+import pytest
+
+from http import HTTPStatus
+from unittest.mock import Mock, AsyncMock
+
+from constants.api_status import APIStatus
+
+from controllers.apis.v1.meal.summary import FetchMealSummaryController
+
+from dtos.responses.base import BaseResponseDTO
+
+from errors.not_found_error import NotFoundError
+
+from tests.controllers.apis.v1.meal.test_meal_abstraction import (
+    TestIV1MealAPIsController,
+)
+
+
+@pytest.mark.asyncio
+class TestFetchMealSummaryAPIController(TestIV1MealAPIsController):
+
+    @pytest.fixture
+    def from_date(self):
+        return datetime.date.today() - datetime.timedelta(days=6)
+
+    @pytest.fixture
+    def to_date(self):
+        return datetime.date.today()
+
+    @pytest.fixture
+    def mock_fetch_meal_summary_service(self):
+        """Create a mock fetch meal summary service."""
+        service = Mock()
+        service.run = AsyncMock()
+        return service
+
+    @pytest.fixture
+    def mock_fetch_meal_summary_service_factory(
+        self,
+        mock_fetch_meal_summary_service,
+    ):
+        """Create a mock fetch meal summary service factory."""
+        factory = Mock()
+        factory.return_value = mock_fetch_meal_summary_service
+        return factory
+
+    @pytest.fixture
+    def successful_response_dto(self, urn):
+        """Create a successful response DTO."""
+        return BaseResponseDTO(
+            transactionUrn=urn,
+            status=APIStatus.SUCCESS,
+            responseMessage="Successfully fetched the meal summary.",
+            responseKey="success_fetch_meal_summary",
+            data={"days": [], "total_calories": 0},
+        )
+
+    async def test_fetch_meal_summary_api_controller_success(
+        self,
+        reference_number,
+        from_date,
+        to_date,
+        mock_request,
+        mock_session,
+        mock_meal_daily_summary_repository,
+        mock_meal_daily_summary_repository_factory,
+        mock_fetch_meal_summary_service_factory,
+        mock_dictionary_utility_factory,
+        successful_response_dto,
+    ):
+        """Test successful meal summary fetch."""
+        controller = FetchMealSummaryController()
+        mock_service = mock_fetch_meal_summary_service_factory.return_value
+        mock_service.run = AsyncMock(return_value=successful_response_dto)
+
+        response = await controller.get(
+            request=mock_request,
+            reference_number=reference_number,
+            from_date=from_date,
+            to_date=to_date,
+            session=mock_session,
+            cache=Mock(),
+            meal_daily_summary_repository=(
+                mock_meal_daily_summary_repository_factory
+            ),
+            fetch_meal_summary_service_factory=(
+                mock_fetch_meal_summary_service_factory
+            ),
+            dictionary_utility=mock_dictionary_utility_factory,
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        request_dto = mock_service.run.call_args[1]["request_dto"]
+        assert request_dto.from_date == from_date
+        assert request_dto.to_date == to_date
+        factory_kwargs = mock_fetch_meal_summary_service_factory.call_args[1]
+        assert factory_kwargs["meal_daily_summary_repository"] == (
+            mock_meal_daily_summary_repository
+        )
+        assert "success_fetch_meal_summary" in response.body.decode()
+
+    async def test_fetch_meal_summary_api_controller_invalid_range(
+        self,
+        reference_number,
+        from_date,
+        to_date,
+        mock_request,
+        mock_session,
+        mock_meal_daily_summary_repository_factory,
+        mock_fetch_meal_summary_service_factory,
+        mock_dictionary_utility_factory,
+    ):
+        """Test that a range ending before it starts is rejected."""
+        controller = FetchMealSummaryController()
+
+        response = await controller.get(
+            request=mock_request,
+            reference_number=reference_number,
+            from_date=to_date,
+            to_date=from_date,
+            session=mock_session,
+            cache=Mock(),
+            meal_daily_summary_repository=(
+                mock_meal_daily_summary_repository_factory
+            ),
+            fetch_meal_summary_service_factory=(
+                mock_fetch_meal_summary_service_factory
+            ),
+            dictionary_utility=mock_dictionary_utility_factory,
+        )
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert "error_bad_input" in response.body.decode()
+        assert not mock_fetch_meal_summary_service_factory.called
+
+    async def test_fetch_meal_summary_api_controller_not_found_error(
+        self,
+        reference_number,
+        from_date,
+        to_date,
+        mock_request,
+        mock_session,
+        mock_meal_daily_summary_repository_factory,
+        mock_fetch_meal_summary_service_factory,
+        mock_dictionary_utility_factory,
+    ):
+        """Test handling of NotFoundError."""
+        controller = FetchMealSummaryController()
+        not_found_error = NotFoundError(
+            responseMessage="Summary not found",
+            responseKey="error_not_found",
+            httpStatusCode=HTTPStatus.NOT_FOUND
+        )
+        mock_fetch_meal_summary_service_factory.return_value.run = (
+            AsyncMock(side_effect=not_found_error)
+        )
+
+        response = await controller.get(
+            request=mock_request,
+            reference_number=reference_number,
+            from_date=from_date,
+            to_date=to_date,
+            session=mock_session,
+            cache=Mock(),
+            meal_daily_summary_repository=(
+                mock_meal_daily_summary_repository_factory
+            ),
+            fetch_meal_summary_service_factory=(
+                mock_fetch_meal_summary_service_factory
+            ),
+            dictionary_utility=mock_dictionary_utility_factory,
+        )
+
+        assert response.status_code == not_found_error.httpStatusCode
+        assert "error_not_found" in response.body.decode()
+
+    async def test_fetch_meal_summary_api_controller_generic_exception(
+        self,
+        reference_number,
+        from_date,
+        to_date,
+        mock_request,
+        mock_session,
+        mock_meal_daily_summary_repository_factory,
+        mock_fetch_meal_summary_service_factory,
+        mock_dictionary_utility_factory,
+    ):
+        """Test handling of generic exceptions."""
+        controller = FetchMealSummaryController()
+        mock_fetch_meal_summary_service_factory.return_value.run = (
+            AsyncMock(side_effect=Exception("Unexpected error"))
+        )
+
+        response = await controller.get(
+            request=mock_request,
+            reference_number=reference_number,
+            from_date=from_date,
+            to_date=to_date,
+            session=mock_session,
+            cache=Mock(),
+            meal_daily_summary_repository=(
+                mock_meal_daily_summary_repository_factory
+            ),
+            fetch_meal_summary_service_factory=(
+                mock_fetch_meal_summary_service_factory
+            ),
+            dictionary_utility=mock_dictionary_utility_factory,
+        )
+
+        assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+        assert "Failed to fetch meal summary" in response.body.decode()
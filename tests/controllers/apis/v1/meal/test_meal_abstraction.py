@@ -48,3 +48,18 @@ class TestIV1MealAPIsController(TestIV1APIsController):
     def mock_meal_log_repository(self):
         """Create a mock meal log repository."""
         return Mock()
+
+    @pytest.fixture
+    def mock_meal_daily_summary_repository_factory(
+        self,
+        mock_meal_daily_summary_repository,
+    ):
+        """Create a mock meal daily summary repository factory."""
+        factory = Mock()
+        factory.return_value = mock_meal_daily_summary_repository
+        return factory
+
+    @pytest.fixture
+    def mock_meal_daily_summary_repository(self):
+        """Create a mock meal daily summary repository."""
+        return Mock()
@@ -406,10 +406,10 @@ class TestFetchMealRecommendationAPIController(TestIV1MealAPIsController):
         callable.assert_called_once()
         call_args = (mock_dictionary_utility_factory.return_value
                      .convert_dict_keys_to_camel_case.call_args[0][0])
-        assert call_args["transactionUrn"] == (
-            successful_response_dto.transactionUrn
-        )
-        assert call_args["status"] == successful_response_dto.status
+        assert call_args == {
+            "data": successful_response_dto.data,
+            "errors": successful_response_dto.errors,
+        }
 
     async def test_service_factory_called_with_correct_params(
         self,
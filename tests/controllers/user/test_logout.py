@@ -1,7 +1,7 @@
 import pytest
 
 from http import HTTPStatus
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import ANY, Mock, AsyncMock
 
 from constants.api_status import APIStatus
 
@@ -286,10 +286,10 @@ class TestUserLogoutAPIController(TestIUserController):
         callable.assert_called_once()
         call_args = (mock_dictionary_utility_factory.return_value
                      .convert_dict_keys_to_camel_case.call_args[0][0])
-        assert call_args["transactionUrn"] == (
-            successful_response_dto.transactionUrn
-        )
-        assert call_args["status"] == successful_response_dto.status
+        assert call_args == {
+            "data": successful_response_dto.data,
+            "errors": successful_response_dto.errors,
+        }
 
     async def test_service_factory_called_with_correct_params(
         self,
@@ -327,6 +327,7 @@ class TestUserLogoutAPIController(TestIUserController):
             user_id=mock_request.state.user_id,
             jwt_utility=mock_jwt_utility_factory.return_value,
             user_repository=mock_user_repository_factory.return_value,
+            cache=ANY,
         )
 
     async def test_repository_factory_called_with_correct_params(
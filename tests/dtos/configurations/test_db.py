@@ -75,3 +75,29 @@ class TestDBConfigurationDTO(TestIConfigurationDTO):
         assert isinstance(exc_info.value.errors(), list)
         assert len(exc_info.value.errors()) == 6
         assert exc_info.value.errors()[0]["input"] is None
+
+    async def test_db_configurations_dto_pool_defaults(
+        self,
+        user_name: str,
+        password: str,
+        database: str,
+        host: str,
+        port: int,
+        connection_string: str
+    ):
+        configuration_dto = DBConfigurationDTO(
+            user_name=user_name,
+            password=password,
+            database=database,
+            host=host,
+            port=port,
+            connection_string=connection_string,
+        )
+
+        assert configuration_dto.pool_size == 10
+        assert configuration_dto.max_overflow == 20
+        assert configuration_dto.sync_pool_size == 2
+        assert configuration_dto.sync_max_overflow == 3
+        assert configuration_dto.pool_timeout == 30
+        assert configuration_dto.pool_recycle == 1800
+        assert configuration_dto.pool_pre_ping is True
@@ -35,3 +35,17 @@ class TestDBConfigurationDTO(TestIConfigurationDTO):
         assert isinstance(exc_info.value.errors(), list)
         assert len(exc_info.value.errors()) == 1
         assert exc_info.value.errors()[0]["input"] is None
+
+    async def test_usda_configuration_dto_client_defaults(
+        self,
+        url: str,
+    ):
+        configuration_dto = USDAConfigurationDTO(
+            url=url,
+        )
+
+        assert configuration_dto.connect_timeout > 0
+        assert configuration_dto.read_timeout > 0
+        assert configuration_dto.max_connections >= (
+            configuration_dto.max_keepalive_connections
+        )
@@ -0,0 +1,139 @@
+import datetime
+import pytest
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+from jobs.backfill_meal_daily_summary import COLUMNS, backfill
+
+from repositories.async_meal_daily_summary import (
+    AsyncMealDailySummaryRepository,
+)
+from repositories.async_meal_log import AsyncMealLogRepository
+
+from utilities.nutrient_vector import NutrientVectorUtility
+
+
+def meal_row(user_id, created_on, total_calories, protein):
+    return SimpleNamespace(
+        user_id=user_id,
+        servings=1,
+        nutrient_vector=NutrientVectorUtility.encode({
+            "macros": [{"name": "Protein", "amount": protein, "unit": "G"}],
+        }),
+        total_calories=total_calories,
+        calories_unit="KCAL",
+        created_on=created_on,
+    )
+
+
+@pytest.mark.asyncio
+class TestBackfillMealDailySummary:
+
+    @pytest.fixture
+    def meal_rows(self):
+        day = datetime.datetime(2024, 1, 1, 8, 0)
+        return [
+            meal_row(1, day, 300, 10),
+            meal_row(1, day + datetime.timedelta(hours=5), 500, 20),
+            meal_row(1, day + datetime.timedelta(days=1), 400, 5),
+            meal_row(2, day, 250, 8),
+        ]
+
+    async def test_backfill_groups_meals_by_user_and_day(self, meal_rows):
+
+        async def stream_records(*args, **kwargs):
+            for row in meal_rows:
+                yield row
+
+        stream = Mock(side_effect=stream_records)
+        upsert = AsyncMock()
+        commit = AsyncMock()
+        with patch.object(
+            AsyncMealLogRepository, "stream_records", stream
+        ), patch.object(
+            AsyncMealDailySummaryRepository, "upsert_summary", upsert
+        ), patch.object(
+            AsyncMealDailySummaryRepository, "commit", commit
+        ):
+            written = await backfill(
+                read_session=Mock(),
+                write_session=Mock(),
+                batch_size=2,
+                commit_every=2,
+            )
+
+        assert written == 3
+        assert stream.call_args[1] == {"batch_size": 2, "columns": COLUMNS}
+        summaries = [call.args[0] for call in upsert.await_args_list]
+        assert [(s.user_id, s.day) for s in summaries] == [
+            (1, datetime.date(2024, 1, 1)),
+            (1, datetime.date(2024, 1, 2)),
+            (2, datetime.date(2024, 1, 1)),
+        ]
+        assert summaries[0].meal_count == 2
+        assert summaries[0].total_calories == 800
+        assert summaries[0].macros == {
+            "Protein": {"amount": 30, "unit": "G"}
+        }
+        # Once after the second summary and once at the end.
+        assert commit.await_count == 2
+
+    async def test_backfill_uses_utc_days(self):
+        """
+        Test that meals on either side of UTC midnight are split by their
+        UTC day, as when they are applied one at a time.
+        """
+        eastern = datetime.timezone(datetime.timedelta(hours=-5))
+        meal_rows = [
+            meal_row(1, datetime.datetime(2024, 1, 1, 18, 0, tzinfo=eastern),
+                     300, 10),
+            meal_row(1, datetime.datetime(2024, 1, 1, 20, 0, tzinfo=eastern),
+                     500, 20),
+        ]
+
+        async def stream_records(*args, **kwargs):
+            for row in meal_rows:
+                yield row
+
+        upsert = AsyncMock()
+        with patch.object(
+            AsyncMealLogRepository, "stream_records", stream_records
+        ), patch.object(
+            AsyncMealDailySummaryRepository, "upsert_summary", upsert
+        ), patch.object(
+            AsyncMealDailySummaryRepository, "commit", AsyncMock()
+        ):
+            await backfill(
+                read_session=Mock(),
+                write_session=Mock(),
+            )
+
+        summaries = [call.args[0] for call in upsert.await_args_list]
+        assert [s.day for s in summaries] == [
+            datetime.date(2024, 1, 1),
+            datetime.date(2024, 1, 2),
+        ]
+
+    async def test_backfill_without_meals(self):
+
+        async def stream_records(*args, **kwargs):
+            return
+            yield
+
+        upsert = AsyncMock()
+        commit = AsyncMock()
+        with patch.object(
+            AsyncMealLogRepository, "stream_records", stream_records
+        ), patch.object(
+            AsyncMealDailySummaryRepository, "upsert_summary", upsert
+        ), patch.object(
+            AsyncMealDailySummaryRepository, "commit", commit
+        ):
+            written = await backfill(
+                read_session=Mock(),
+                write_session=Mock(),
+            )
+
+        assert written == 0
+        upsert.assert_not_awaited()
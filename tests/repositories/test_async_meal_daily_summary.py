@@ -0,0 +1,187 @@
+import pytest
+
+from datetime import date, datetime, timedelta, timezone
+from sqlalchemy.dialects import postgresql
+from unittest.mock import AsyncMock, Mock
+
+from models.meal_daily_summary import MealDailySummary
+from models.meal_log import MealLog
+
+from repositories.async_meal_daily_summary import (
+    AsyncMealDailySummaryRepository,
+)
+
+from tests.repositories.test_async_repository_abstraction import (
+    TestIAsyncRepository,
+)
+
+
+class TestAsyncMealDailySummaryRepository(TestIAsyncRepository):
+
+    @pytest.fixture
+    def session(self):
+        """Create a mock AsyncSession."""
+        session = Mock()
+        session.flush = AsyncMock()
+        session.execute = AsyncMock()
+        session.scalar = AsyncMock(return_value=None)
+        session.scalars = AsyncMock(
+            return_value=Mock(all=Mock(return_value=[]))
+        )
+        return session
+
+    @pytest.fixture
+    def repository(self, urn, user_urn, api_name, user_id, session):
+        """Create an AsyncMealDailySummaryRepository for testing."""
+        return AsyncMealDailySummaryRepository(
+            urn=urn,
+            user_urn=user_urn,
+            api_name=api_name,
+            session=session,
+            user_id=user_id,
+        )
+
+    @pytest.fixture
+    def meal_log(self, user_id):
+        """Create a meal log of two servings."""
+        return MealLog(
+            user_id=user_id,
+            meal_name="chicken curry",
+            servings=2,
+            nutrients={
+                "macros": [
+                    {"name": "Protein", "amount": 10.5, "unit": "G"},
+                ],
+                "micros": [
+                    {"name": "Sodium, Na", "amount": 200, "unit": "MG"},
+                ],
+            },
+            total_calories=500,
+            calories_unit="KCAL",
+            created_on=datetime(2025, 1, 2, 13, 30),
+        )
+
+    @pytest.fixture
+    def summary(self, user_id):
+        """Create a summary that already holds one meal."""
+        return MealDailySummary(
+            user_id=user_id,
+            day=date(2025, 1, 2),
+            meal_count=1,
+            total_calories=300,
+            calories_unit="KCAL",
+            macros={"Protein": {"amount": 4, "unit": "G"}},
+            micros={},
+        )
+
+    async def test_add_nutrients_scales_by_servings(self):
+        """Test that nutrient amounts are summed per serving eaten."""
+        totals = {"Protein": {"amount": 4, "unit": "G"}}
+
+        result = AsyncMealDailySummaryRepository.add_nutrients(
+            totals=totals,
+            nutrients=[
+                {"name": "Protein", "amount": 10.5, "unit": "G"},
+                {"name": "Total Sugars", "amount": 3, "unit": "G"},
+            ],
+            servings=2,
+        )
+
+        assert result == {
+            "Protein": {"amount": 25.0, "unit": "G"},
+            "Total Sugars": {"amount": 6, "unit": "G"},
+        }
+        assert totals == {"Protein": {"amount": 4, "unit": "G"}}
+
+    async def test_apply_meal_updates_existing_summary(
+        self,
+        repository,
+        session,
+        meal_log,
+        summary,
+    ):
+        """Test that a meal is folded into its day's locked summary."""
+        session.scalar = AsyncMock(return_value=summary)
+
+        result = await repository.apply_meal(meal_log=meal_log)
+
+        assert result is summary
+        assert summary.meal_count == 2
+        assert summary.total_calories == 800
+        assert summary.macros == {"Protein": {"amount": 25.0, "unit": "G"}}
+        assert summary.micros == {"Sodium, Na": {"amount": 400, "unit": "MG"}}
+        session.execute.assert_not_awaited()
+        session.flush.assert_awaited_once()
+        query = str(session.scalar.await_args[0][0])
+        assert "FOR UPDATE" in query
+
+    async def test_apply_meal_creates_summary_for_first_meal(
+        self,
+        repository,
+        session,
+        meal_log,
+        user_id,
+    ):
+        """Test that the day's first meal inserts the summary row."""
+        created = MealDailySummary(
+            user_id=user_id,
+            day=date(2025, 1, 2),
+            meal_count=0,
+            total_calories=0,
+            macros={},
+            micros={},
+        )
+        session.scalar = AsyncMock(side_effect=[None, created])
+
+        result = await repository.apply_meal(meal_log=meal_log)
+
+        assert result is created
+        assert created.meal_count == 1
+        assert created.total_calories == 500
+        insert = session.execute.await_args[0][0]
+        compiled = str(insert.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT ON CONSTRAINT" in compiled
+        assert "DO NOTHING" in compiled
+
+    async def test_apply_meal_uses_utc_day(
+        self,
+        repository,
+        session,
+        meal_log,
+        summary,
+    ):
+        """Test that a meal logged before local midnight uses its UTC day."""
+        meal_log.created_on = datetime(
+            2025, 1, 1, 21, 30, tzinfo=timezone(timedelta(hours=-5))
+        )
+        session.scalar = AsyncMock(return_value=summary)
+
+        await repository.apply_meal(meal_log=meal_log)
+
+        query = session.scalar.await_args[0][0]
+        params = query.compile(dialect=postgresql.dialect()).params
+        assert date(2025, 1, 2) in params.values()
+
+    async def test_retrieve_by_user_id_date_range(
+        self,
+        repository,
+        session,
+        summary,
+        user_id,
+    ):
+        """Test that summaries in the range are returned by day."""
+        session.scalars = AsyncMock(
+            return_value=Mock(all=Mock(return_value=[summary]))
+        )
+
+        records = await repository.retrieve_by_user_id_date_range(
+            user_id=user_id,
+            from_date=date(2025, 1, 1),
+            to_date=date(2025, 1, 7),
+        )
+
+        assert records == [summary]
+        assert "ORDER BY meal_daily_summary.day" in str(
+            session.scalars.await_args[0][0]
+        )
+
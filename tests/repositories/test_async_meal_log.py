@@ -0,0 +1,426 @@
+import pytest
+
+from datetime import date, datetime
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import DBAPIError
+from unittest.mock import AsyncMock, Mock
+
+from models.meal_log import MealLog
+
+from repositories.async_meal_log import AsyncMealLogRepository
+
+from tests.repositories.test_async_repository_abstraction import (
+    TestIAsyncRepository,
+)
+
+from utilities.meal_name_index import MealNameIndexUtility
+
+
+class TestAsyncMealLogRepository(TestIAsyncRepository):
+
+    @pytest.fixture(autouse=True)
+    def reset_meal_name_index(self):
+        """Start every test with an empty meal name index."""
+        MealNameIndexUtility.reset()
+        yield
+        MealNameIndexUtility.reset()
+
+    @pytest.fixture
+    def session(self):
+        """Create a mock AsyncSession."""
+        session = Mock()
+        session.commit = AsyncMock()
+        session.scalar = AsyncMock(return_value=None)
+        session.scalars = AsyncMock(
+            return_value=Mock(all=Mock(return_value=[]))
+        )
+        return session
+
+    @pytest.fixture
+    def repository(self, urn, user_urn, api_name, user_id, session):
+        """Create an AsyncMealLogRepository instance for testing."""
+        return AsyncMealLogRepository(
+            urn=urn,
+            user_urn=user_urn,
+            api_name=api_name,
+            session=session,
+            user_id=user_id,
+        )
+
+    async def test_requires_session(self, urn):
+        """Test that a repository cannot be built without a session."""
+        with pytest.raises(RuntimeError):
+            AsyncMealLogRepository(urn=urn)
+
+    async def test_create_record_commits(self, repository, session):
+        """Test that created records are added and committed."""
+        record = MealLog(meal_name="chicken curry")
+
+        result = await repository.create_record(record=record)
+
+        assert result is record
+        session.add.assert_called_once_with(record)
+        session.commit.assert_awaited_once()
+
+    async def test_update_record_missing_raises(self, repository):
+        """Test that updating an unknown record raises."""
+        with pytest.raises(ValueError):
+            await repository.update_record(id=1, new_data={"servings": 2})
+
+    async def test_retrieve_history_by_user_id_date_range(
+        self,
+        repository,
+        session,
+        user_id,
+    ):
+        """Test that the date range query is awaited on the session."""
+        meal_log = MealLog(meal_name="chicken curry")
+        session.scalars = AsyncMock(
+            return_value=Mock(all=Mock(return_value=[meal_log]))
+        )
+
+        records = await repository.retrieve_history_by_user_id_date_range(
+            user_id=user_id,
+            from_date=date(2025, 1, 1),
+            to_date=date(2025, 1, 7),
+        )
+
+        assert records == [meal_log]
+        session.scalars.assert_awaited_once()
+
+    async def test_history_query_uses_half_open_bounds(
+        self,
+        repository,
+        user_id,
+    ):
+        """Test that the range ends before the day after to_date."""
+        query = repository._history_query(
+            user_id=user_id,
+            from_date=date(2025, 1, 1),
+            to_date=date(2025, 1, 7),
+        )
+
+        compiled = query.compile(dialect=postgresql.dialect())
+
+        assert "meal_log.created_on >= %(created_on_1)s" in str(compiled)
+        assert "meal_log.created_on < %(created_on_2)s" in str(compiled)
+        assert "meal_log.is_deleted = false" in str(compiled)
+        assert compiled.params["created_on_2"] == date(2025, 1, 8)
+
+    async def test_history_query_pushes_filters_down(
+        self,
+        repository,
+        user_id,
+    ):
+        """Test that ingredient and nutrient filters are SQL conditions."""
+        query = repository._history_query(
+            user_id=user_id,
+            from_date=date(2025, 1, 1),
+            to_date=date(2025, 1, 7),
+            ingredient="Rice, white, cooked",
+            min_nutrients={"Protein": 20},
+        )
+
+        compiled = query.compile(dialect=postgresql.dialect())
+
+        assert "meal_log.ingredients @> %(ingredients_1)s::JSONB" in (
+            str(compiled)
+        )
+        assert "meal_log.nutrient_vector[%(nutrient_vector_1)s] >= " in (
+            str(compiled)
+        )
+        assert compiled.params["ingredients_1"] == [
+            {"name": "Rice, white, cooked"}
+        ]
+        assert compiled.params["nutrient_vector_1"] == 1
+        assert compiled.params["param_1"] == 20
+
+    async def test_history_query_rejects_unknown_nutrient(
+        self,
+        repository,
+        user_id,
+    ):
+        """Test that only nutrients of the vector can be filtered on."""
+        with pytest.raises(ValueError):
+            repository._history_query(
+                user_id=user_id,
+                from_date=date(2025, 1, 1),
+                to_date=date(2025, 1, 7),
+                min_nutrients={"Caffeine": 10},
+            )
+
+    @pytest.mark.integration
+    async def test_history_query_plan_uses_partial_index(
+        self,
+        async_db_session,
+        urn,
+        user_id,
+    ):
+        """Test that Postgres plans the history query as an index scan."""
+        repository = AsyncMealLogRepository(
+            urn=urn,
+            session=async_db_session,
+            user_id=user_id,
+        )
+        query = repository._history_query(
+            user_id=user_id,
+            from_date=date(2025, 1, 1),
+            to_date=date(2025, 1, 7),
+        )
+        sql = query.compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+
+        async with async_db_session as session:
+            try:
+                await session.connection()
+            except (OSError, DBAPIError):
+                pytest.skip("PostgreSQL is not available")
+            # Test tables are small enough for a sequential scan to win.
+            await session.execute(text("SET LOCAL enable_seqscan = off"))
+            await session.execute(text("SET LOCAL enable_bitmapscan = off"))
+            plan = "\n".join(
+                (await session.scalars(text(f"EXPLAIN {sql}"))).all()
+            )
+            await session.rollback()
+
+        assert "Index Scan using ix_meal_log_user_id_created_on" in plan
+
+    async def test_retrieve_history_page_after_cursor(
+        self,
+        repository,
+        session,
+        user_id,
+    ):
+        """Test that a page query seeks past the cursor and is limited."""
+        meal_log = MealLog(meal_name="chicken curry")
+        session.scalars = AsyncMock(
+            return_value=Mock(all=Mock(return_value=[meal_log]))
+        )
+
+        records = await repository.retrieve_history_page_by_user_id_date_range(
+            user_id=user_id,
+            from_date=date(2025, 1, 1),
+            to_date=date(2025, 1, 7),
+            limit=10,
+            after=(datetime(2025, 1, 2, 8, 30), 42),
+        )
+
+        assert records == [meal_log]
+        query = session.scalars.await_args[0][0]
+        compiled = str(query.compile())
+        assert "(meal_log.created_on, meal_log.id) >" in compiled
+        assert query._limit == 10
+
+    async def test_stream_history_yields_records(
+        self,
+        repository,
+        session,
+        user_id,
+    ):
+        """Test that history is streamed in batches from the session."""
+        meal_logs = [MealLog(meal_name="poha"), MealLog(meal_name="dal")]
+
+        async def scalars():
+            for meal_log in meal_logs:
+                yield meal_log
+
+        session.stream_scalars = AsyncMock(return_value=scalars())
+
+        records = [
+            record async for record in
+            repository.stream_history_by_user_id_date_range(
+                user_id=user_id,
+                from_date=date(2025, 1, 1),
+                to_date=date(2025, 1, 7),
+                batch_size=50,
+            )
+        ]
+
+        assert records == meal_logs
+        query = session.stream_scalars.await_args[0][0]
+        assert query.get_execution_options()["yield_per"] == 50
+
+    async def test_retrieve_history_projects_requested_columns(
+        self,
+        repository,
+        session,
+        user_id,
+    ):
+        """Test that a column projection returns untracked rows."""
+        row = ("chicken curry", 2)
+        session.execute = AsyncMock(
+            return_value=Mock(all=Mock(return_value=[row]))
+        )
+
+        records = await repository.retrieve_history_by_user_id_date_range(
+            user_id=user_id,
+            from_date=date(2025, 1, 1),
+            to_date=date(2025, 1, 7),
+            columns=("meal_name", "servings"),
+        )
+
+        assert records == [row]
+        session.scalars.assert_not_awaited()
+        query = session.execute.await_args[0][0]
+        assert [column.name for column in query.selected_columns] == [
+            "meal_name", "servings",
+        ]
+
+    async def test_stream_history_projects_requested_columns(
+        self,
+        repository,
+        session,
+        user_id,
+    ):
+        """Test that a projected stream reads rows, not entities."""
+        rows = [("poha",), ("dal",)]
+
+        async def result():
+            for row in rows:
+                yield row
+
+        session.stream = AsyncMock(return_value=result())
+        session.stream_scalars = AsyncMock()
+
+        records = [
+            record async for record in
+            repository.stream_history_by_user_id_date_range(
+                user_id=user_id,
+                from_date=date(2025, 1, 1),
+                to_date=date(2025, 1, 7),
+                columns=("meal_name",),
+            )
+        ]
+
+        assert records == rows
+        session.stream_scalars.assert_not_awaited()
+        query = session.stream.await_args[0][0]
+        assert "instructions" not in str(query)
+
+    async def test_retrieve_history_empty_returns_none(
+        self,
+        repository,
+        user_id,
+    ):
+        """Test that an empty history is returned as None."""
+        assert await repository.retrieve_history_by_user_id(
+            user_id=user_id
+        ) is None
+
+    async def test_search_meal_names_ranks_distinct_names(
+        self,
+        repository,
+        session,
+    ):
+        """Test that distinct names are ranked with scores."""
+        session.scalars = AsyncMock(
+            return_value=Mock(all=Mock(return_value=[
+                "chicken curry", "chicken biryani", "paneer tikka",
+            ]))
+        )
+
+        matches = await repository.search_meal_names(
+            meal_name="chiken curry",
+            limit=2,
+            threshold=60,
+        )
+
+        assert [name for name, _ in matches][0] == "chicken curry"
+        assert all(score >= 60 for _, score in matches)
+        assert "paneer tikka" not in [name for name, _ in matches]
+
+    async def test_search_meal_names_uses_trigram_index_on_postgres(
+        self,
+        repository,
+        session,
+    ):
+        """Test that deleted-record searches use the trigram query."""
+        dialect = Mock()
+        dialect.name = "postgresql"
+        session.get_bind = Mock(return_value=Mock(dialect=dialect))
+        session.begin_nested = Mock(return_value=AsyncMock())
+        session.scalars = AsyncMock(
+            return_value=Mock(all=Mock(return_value=["chicken curry"]))
+        )
+
+        matches = await repository.search_meal_names(
+            meal_name="chicken curry",
+            is_deleted=True,
+        )
+
+        assert matches == [("chicken curry", 100.0)]
+        session.scalars.assert_awaited_once()
+        assert "%" in str(session.scalars.await_args.args[0])
+
+    async def test_retrieve_record_by_fuzzy_meal_name(
+        self,
+        repository,
+        session,
+    ):
+        """Test that the best match is loaded by its exact name."""
+        meal_log = MealLog(meal_name="chicken curry")
+        session.scalars = AsyncMock(
+            return_value=Mock(all=Mock(return_value=["chicken curry"]))
+        )
+        session.scalar = AsyncMock(return_value=meal_log)
+
+        record = await repository.retrieve_record_by_fuzzy_meal_name(
+            meal_name="chicken cury"
+        )
+
+        assert record is meal_log
+
+    async def test_retrieve_record_by_fuzzy_meal_name_no_match(
+        self,
+        repository,
+        session,
+    ):
+        """Test that no record is returned below the threshold."""
+        session.scalars = AsyncMock(
+            return_value=Mock(all=Mock(return_value=["paneer tikka"]))
+        )
+
+        assert await repository.retrieve_record_by_fuzzy_meal_name(
+            meal_name="chicken curry"
+        ) is None
+
+    async def test_search_meal_names_loads_index_once(
+        self,
+        repository,
+        session,
+    ):
+        """Test that repeated searches are answered from the index."""
+        session.scalars = AsyncMock(
+            return_value=Mock(all=Mock(return_value=[
+                "chicken curry", "chicken curry", "paneer tikka",
+            ]))
+        )
+
+        await repository.search_meal_names(meal_name="chicken curry")
+        matches = await repository.search_meal_names(
+            meal_name="paneer tika"
+        )
+
+        assert matches[0][0] == "paneer tikka"
+        session.scalars.assert_awaited_once()
+        assert MealNameIndexUtility().stats()["size"] == 2
+
+    async def test_search_meal_names_oversized_index_falls_back(
+        self,
+        repository,
+        session,
+    ):
+        """Test that a vocabulary over the cap is searched in the DB."""
+        names = [f"meal {index}" for index in range(5)]
+        session.scalars = AsyncMock(
+            return_value=Mock(all=Mock(return_value=names))
+        )
+        MealNameIndexUtility(max_names=2).load(names)
+
+        matches = await repository.search_meal_names(meal_name="meal 3")
+
+        assert matches[0] == ("meal 3", 100.0)
+        session.scalars.assert_awaited_once()
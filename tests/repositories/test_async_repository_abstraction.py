@@ -0,0 +1,6 @@
+import pytest
+
+
+@pytest.mark.asyncio
+class TestIAsyncRepository:
+    pass
@@ -0,0 +1,56 @@
+import json
+import numpy as np
+import pytest
+
+from datetime import date, datetime
+
+from dtos.responses.base import BaseResponseDTO
+
+from responses.dto import DTOResponse
+
+
+@pytest.mark.asyncio
+class TestDTOResponse:
+
+    async def test_renders_response_dto(self):
+        """Test that a DTO is rendered without dumping it to a dict."""
+        response = DTOResponse(
+            content=BaseResponseDTO(
+                transactionUrn="urn",
+                status="SUCCESS",
+                responseMessage="ok",
+                responseKey="success",
+                data={
+                    "day": date(2026, 1, 5),
+                    "createdOn": datetime(2026, 1, 5, 8, 30),
+                },
+            ),
+            status_code=201,
+        )
+
+        assert response.status_code == 201
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {
+            "transactionUrn": "urn",
+            "status": "SUCCESS",
+            "responseMessage": "ok",
+            "responseKey": "success",
+            "data": {"day": "2026-01-05", "createdOn": "2026-01-05T08:30:00"},
+            "errors": None,
+        }
+
+    async def test_renders_plain_content(self):
+        """Test that dicts with datetimes and NumPy values are rendered."""
+        response = DTOResponse(
+            content={
+                "at": datetime(2026, 1, 5, 8, 30),
+                "totals": np.array([1.5, 2.0]),
+                1: "non-string key",
+            }
+        )
+
+        assert json.loads(response.body) == {
+            "at": "2026-01-05T08:30:00",
+            "totals": [1.5, 2.0],
+            "1": "non-string key",
+        }
@@ -0,0 +1,51 @@
+import json
+import pytest
+
+from serializers.cache.orjson_codec import OrjsonCacheCodec
+
+
+@pytest.mark.asyncio
+class TestOrjsonCacheCodec:
+
+    @pytest.fixture
+    def codec(self):
+        """Create a codec compressing payloads from 64 bytes up."""
+        return OrjsonCacheCodec(
+            compression_threshold_bytes=64,
+            compression_level=3,
+        )
+
+    async def test_small_payload_is_not_compressed(self, codec):
+        """Test that small values get the plain orjson header."""
+        payload = codec.encode({"meal_name": "dal"})
+
+        assert payload[0] == OrjsonCacheCodec.HEADER_ORJSON
+        assert codec.decode(payload) == {"meal_name": "dal"}
+
+    async def test_large_payload_is_compressed(self, codec):
+        """Test that large values are zstd-compressed and read back."""
+        value = {"instructions_per_serving": ["Stir the pot."] * 100}
+
+        payload = codec.encode(value)
+
+        assert payload[0] == OrjsonCacheCodec.HEADER_ORJSON_ZSTD
+        assert len(payload) < len(json.dumps(value))
+        assert codec.decode(payload) == value
+
+    @pytest.mark.parametrize(
+        "legacy",
+        ['{"meal_name": "dal"}', b'{"meal_name": "dal"}'],
+    )
+    async def test_headerless_json_is_read(self, codec, legacy):
+        """Test that payloads written with json.dumps are still read."""
+        assert codec.decode(legacy) == {"meal_name": "dal"}
+
+    async def test_corrupt_payload_raises_value_error(self, codec):
+        """Test that unreadable payloads raise ValueError."""
+        with pytest.raises(ValueError):
+            codec.decode(
+                bytes((OrjsonCacheCodec.HEADER_ORJSON_ZSTD,)) + b"garbage"
+            )
+
+        with pytest.raises(ValueError):
+            codec.decode(bytes((OrjsonCacheCodec.HEADER_ORJSON,)) + b"{")
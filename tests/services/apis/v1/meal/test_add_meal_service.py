@@ -13,6 +13,8 @@ from tests.services.apis.v1.meal.test_v1_meal_api_abstraction import (
     TestIV1MealAPIService
 )
 
+from utilities.meal_name_index import MealNameIndexUtility
+
 
 @pytest.mark.asyncio
 class TestAddMealService(TestIV1MealAPIService):
@@ -74,11 +76,13 @@ class TestAddMealService(TestIV1MealAPIService):
                 "calories_unit": calories_unit
             }
         )
-        service.meal_log_repository.create_record = Mock(
+        service.meal_log_repository.create_record = AsyncMock(
             return_value=mock_meal_log
         )
+        service.meal_daily_summary_repository.apply_meal = AsyncMock()
 
         service.cache = Mock()
+        service.cache.get = Mock(return_value=None)
         service.cache.delete = Mock(return_value=None)
         service.cache.set = Mock(return_value=None)
         result = await service.run(
@@ -133,11 +137,13 @@ class TestAddMealService(TestIV1MealAPIService):
                 "calories_unit": calories_unit
             }
         )
-        service.meal_log_repository.create_record = Mock(
+        service.meal_log_repository.create_record = AsyncMock(
             return_value=mock_meal_log
         )
+        service.meal_daily_summary_repository.apply_meal = AsyncMock()
 
         service.cache = Mock()
+        service.cache.get = Mock(return_value=None)
         service.cache.delete = Mock(return_value=None)
         service.cache.set = Mock(return_value=None)
         result = await service.run(
@@ -195,3 +201,118 @@ class TestAddMealService(TestIV1MealAPIService):
             "Calories cannot be negative."
         )
         assert exc_info.value.responseKey == "error_negative_calories"
+
+    async def test_added_meal_name_is_indexed(
+        self,
+        valid_add_meal_data_without_instructions,
+        meal_name,
+        mock_meal_log,
+    ):
+        MealNameIndexUtility.reset()
+        MealNameIndexUtility().load(["dal makhani"])
+        service = self.add_meal_service
+        service.make_api_request = AsyncMock(return_value={})
+        service.process_meal_details = AsyncMock(return_value={
+            "meal_name": meal_name,
+            "servings": 1,
+            "nutrients": {},
+            "ingredients": [],
+            "instructions": [],
+            "total_calories": 100,
+            "calories_unit": "kcal"
+        })
+        service.meal_log_repository.create_record = AsyncMock(
+            return_value=mock_meal_log
+        )
+        service.meal_daily_summary_repository.apply_meal = AsyncMock()
+        service.cache = Mock()
+        service.cache.get = Mock(return_value=None)
+
+        try:
+            await service.run(
+                request_dto=valid_add_meal_data_without_instructions
+            )
+
+            matches = MealNameIndexUtility().search(meal_name)
+            assert matches[0][0] == meal_name
+        finally:
+            MealNameIndexUtility.reset()
+
+    async def test_meal_and_summary_commit_together(
+        self,
+        valid_add_meal_data_without_instructions,
+        meal_name,
+        mock_meal_log,
+    ):
+        """Test that the meal log and its day summary share a commit."""
+        service = self.add_meal_service
+        service.make_api_request = AsyncMock(return_value={})
+        service.process_meal_details = AsyncMock(return_value={
+            "meal_name": meal_name,
+            "servings": 1,
+            "nutrients": {},
+            "ingredients": [],
+            "instructions": [],
+            "total_calories": 100,
+            "calories_unit": "kcal"
+        })
+        calls = Mock()
+        service.meal_log_repository.create_record = AsyncMock(
+            return_value=mock_meal_log
+        )
+        service.meal_log_repository.commit = AsyncMock()
+        service.meal_daily_summary_repository.apply_meal = AsyncMock()
+        calls.attach_mock(
+            service.meal_log_repository.create_record, "create_record"
+        )
+        calls.attach_mock(
+            service.meal_daily_summary_repository.apply_meal, "apply_meal"
+        )
+        calls.attach_mock(service.meal_log_repository.commit, "commit")
+        service.cache = Mock()
+        service.cache.get = Mock(return_value=None)
+
+        await service.run(
+            request_dto=valid_add_meal_data_without_instructions
+        )
+
+        assert [call[0] for call in calls.mock_calls] == [
+            "create_record", "apply_meal", "commit",
+        ]
+        assert calls.mock_calls[0].kwargs["commit"] is False
+        assert calls.mock_calls[1].kwargs["meal_log"] is mock_meal_log
+
+    async def test_summary_failure_rolls_back_meal(
+        self,
+        valid_add_meal_data_without_instructions,
+        meal_name,
+        mock_meal_log,
+    ):
+        """Test that a failed summary update discards the meal log."""
+        service = self.add_meal_service
+        service.make_api_request = AsyncMock(return_value={})
+        service.process_meal_details = AsyncMock(return_value={
+            "meal_name": meal_name,
+            "servings": 1,
+            "nutrients": {},
+            "ingredients": [],
+            "instructions": [],
+            "total_calories": 100,
+            "calories_unit": "kcal"
+        })
+        service.meal_log_repository.create_record = AsyncMock(
+            return_value=mock_meal_log
+        )
+        service.meal_log_repository.commit = AsyncMock()
+        service.meal_log_repository.rollback = AsyncMock()
+        service.meal_daily_summary_repository.apply_meal = AsyncMock(
+            side_effect=RuntimeError("lock timeout")
+        )
+
+        with pytest.raises(RuntimeError):
+            await service.run(
+                request_dto=valid_add_meal_data_without_instructions
+            )
+
+        service.meal_log_repository.commit.assert_not_awaited()
+        service.meal_log_repository.rollback.assert_awaited_once()
@@ -1,11 +1,13 @@
 import datetime
 import pytest
 
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 from constants.api_status import APIStatus
 
 from dtos.requests.apis.v1.meal.history import FetchMealHistoryRequestDTO
+
+from errors.bad_input_error import BadInputError
 from models.meal_log import MealLog
 
 from services.apis.v1.meal.history import FetchMealHistoryService
@@ -175,7 +177,7 @@ class TestFetchMealHistoryService(TestIV1APIService):
     ):
         service = self.fetch_meal_history_service
         fn = service.meal_log_repository
-        fn.retrieve_history_by_user_id_date_range = Mock(
+        fn.retrieve_history_by_user_id_date_range = AsyncMock(
             return_value=mock_meal_logs
         )
 
@@ -187,6 +189,7 @@ class TestFetchMealHistoryService(TestIV1APIService):
             from_date=valid_fetch_meal_history_data.from_date,
             to_date=valid_fetch_meal_history_data.to_date,
             is_deleted=False,
+            columns=service.COLUMNS,
         )
 
         assert result.status == APIStatus.SUCCESS
@@ -219,7 +222,7 @@ class TestFetchMealHistoryService(TestIV1APIService):
     ):
         service = self.fetch_meal_history_service
         fn = service.meal_log_repository
-        fn.retrieve_history_by_user_id_date_range = Mock(
+        fn.retrieve_history_by_user_id_date_range = AsyncMock(
             return_value=[]
         )
 
@@ -238,7 +241,7 @@ class TestFetchMealHistoryService(TestIV1APIService):
         service = self.fetch_meal_history_service
         single_meal = [mock_meal_logs[0]]
         fn = service.meal_log_repository
-        fn.retrieve_history_by_user_id_date_range = Mock(
+        fn.retrieve_history_by_user_id_date_range = AsyncMock(
             return_value=single_meal
         )
 
@@ -259,7 +262,7 @@ class TestFetchMealHistoryService(TestIV1APIService):
     ):
         service = self.fetch_meal_history_service
         fn = service.meal_log_repository
-        fn.retrieve_history_by_user_id_date_range = Mock(
+        fn.retrieve_history_by_user_id_date_range = AsyncMock(
             side_effect=Exception("Database error")
         )
 
@@ -310,7 +313,7 @@ class TestFetchMealHistoryService(TestIV1APIService):
 
         service = self.fetch_meal_history_service
         repository = service.meal_log_repository
-        repository.retrieve_history_by_user_id_date_range = Mock(
+        repository.retrieve_history_by_user_id_date_range = AsyncMock(
             return_value=[]
         )
 
@@ -323,6 +326,7 @@ class TestFetchMealHistoryService(TestIV1APIService):
             from_date=datetime.date.today(),
             to_date=datetime.date.today(),
             is_deleted=False,
+            columns=service.COLUMNS,
         )
 
     async def test_meal_history_with_deleted_meals(
@@ -351,7 +355,7 @@ class TestFetchMealHistoryService(TestIV1APIService):
 
         all_meals = mock_meal_logs + [deleted_meal]
         fn = service.meal_log_repository
-        fn.retrieve_history_by_user_id_date_range = Mock(
+        fn.retrieve_history_by_user_id_date_range = AsyncMock(
             return_value=all_meals
         )
 
@@ -411,7 +415,7 @@ class TestFetchMealHistoryService(TestIV1APIService):
         )
 
         fn = service.meal_log_repository
-        fn.retrieve_history_by_user_id_date_range = Mock(
+        fn.retrieve_history_by_user_id_date_range = AsyncMock(
             return_value=[meal_today, meal_yesterday]
         )
 
@@ -426,3 +430,131 @@ class TestFetchMealHistoryService(TestIV1APIService):
         for date_key in date_keys:
             meals_for_date = result.data[date_key]
             assert len(meals_for_date) == 1
+
+    async def test_paginated_history_returns_next_cursor(
+        self,
+        reference_number,
+        mock_meal_logs,
+    ):
+        service = self.fetch_meal_history_service
+        repository = service.meal_log_repository
+        repository.retrieve_history_page_by_user_id_date_range = AsyncMock(
+            return_value=mock_meal_logs
+        )
+        request_dto = FetchMealHistoryRequestDTO(
+            reference_number=reference_number,
+            limit=1,
+        )
+
+        result = await service.run(request_dto=request_dto)
+
+        method = repository.retrieve_history_page_by_user_id_date_range
+        method.assert_awaited_once_with(
+            user_id=service.user_id,
+            from_date=request_dto.from_date,
+            to_date=request_dto.to_date,
+            limit=2,
+            after=None,
+            is_deleted=False,
+            columns=service.COLUMNS,
+        )
+        assert result.responseKey == "success_fetch_meal"
+        meals = [
+            meal for day in result.data["meals"].values() for meal in day
+        ]
+        assert [meal["meal_name"] for meal in meals] == [
+            mock_meal_logs[0].meal_name
+        ]
+        assert service.decode_cursor(result.data["next_cursor"]) == (
+            mock_meal_logs[0].created_on,
+            mock_meal_logs[0].id,
+        )
+
+    async def test_paginated_history_last_page(
+        self,
+        reference_number,
+        mock_meal_logs,
+    ):
+        service = self.fetch_meal_history_service
+        repository = service.meal_log_repository
+        repository.retrieve_history_page_by_user_id_date_range = AsyncMock(
+            return_value=mock_meal_logs[1:]
+        )
+        cursor = service.encode_cursor(mock_meal_logs[0])
+        request_dto = FetchMealHistoryRequestDTO(
+            reference_number=reference_number,
+            cursor=cursor,
+        )
+
+        result = await service.run(request_dto=request_dto)
+
+        method = repository.retrieve_history_page_by_user_id_date_range
+        assert method.await_args.kwargs["after"] == (
+            mock_meal_logs[0].created_on,
+            mock_meal_logs[0].id,
+        )
+        assert result.data["next_cursor"] is None
+
+    async def test_invalid_cursor(
+        self,
+        reference_number,
+    ):
+        service = self.fetch_meal_history_service
+        request_dto = FetchMealHistoryRequestDTO(
+            reference_number=reference_number,
+            cursor="not-a-cursor",
+        )
+
+        with pytest.raises(BadInputError) as exc_info:
+            await service.run(request_dto=request_dto)
+
+        assert exc_info.value.responseKey == "error_invalid_cursor"
+
+    async def test_stream_yields_day_groups(
+        self,
+        valid_fetch_meal_history_data,
+        mock_meal_logs,
+    ):
+        service = self.fetch_meal_history_service
+        yesterday_meal = mock_meal_logs[0]
+        yesterday_meal.created_on = (
+            yesterday_meal.created_on - datetime.timedelta(days=1)
+        )
+
+        async def stream_history(**kwargs):
+            for meal in mock_meal_logs:
+                yield meal
+
+        repository = service.meal_log_repository
+        repository.stream_history_by_user_id_date_range = stream_history
+
+        days = [
+            day async for day in service.stream(
+                request_dto=valid_fetch_meal_history_data
+            )
+        ]
+
+        assert [len(day["meals"]) for day in days] == [1, 1]
+        assert days[0]["date"] == str(yesterday_meal.created_on.date())
+
+    async def test_filters_are_passed_to_repository(
+        self,
+        reference_number,
+        mock_meal_logs,
+    ):
+        service = self.fetch_meal_history_service
+        request_dto = FetchMealHistoryRequestDTO(
+            reference_number=reference_number,
+            ingredient="pasta",
+            min_protein=12.5,
+        )
+        fn = service.meal_log_repository
+        fn.retrieve_history_by_user_id_date_range = AsyncMock(
+            return_value=mock_meal_logs
+        )
+
+        await service.run(request_dto=request_dto)
+
+        kwargs = fn.retrieve_history_by_user_id_date_range.call_args[1]
+        assert kwargs["ingredient"] == "pasta"
+        assert kwargs["min_nutrients"] == {"Protein": 12.5}
@@ -1,5 +1,7 @@
+import asyncio
 import json
 import pytest
+import time
 
 from http import HTTPStatus
 from unittest.mock import AsyncMock, Mock
@@ -15,10 +17,22 @@ from tests.services.apis.v1.test_v1_api_service_abstraction import (
     TestIV1APIService
 )
 
+from utilities.meal_details_cache import MealDetailsCacheUtility
+
 
 @pytest.mark.asyncio
 class TestFetchMealService(TestIV1APIService):
 
+    @staticmethod
+    def cache_entry(details, fresh_for=3600):
+        """
+        Serialize per-serving details as a cache entry, fresh for
+        `fresh_for` seconds (stale if negative).
+        """
+        return json.dumps(
+            {"fresh_until": time.time() + fresh_for, "details": details}
+        )
+
     @pytest.fixture
     def meal_name(self):
         """
@@ -323,14 +337,12 @@ class TestFetchMealService(TestIV1APIService):
             }
         )
 
-        service.cache.get = Mock(return_value=json.dumps({
+        service.cache.get = Mock(return_value=self.cache_entry({
                 "meal_name": meal_name,
-                "servings": servings,
                 "nutrients_per_serving": nutrients,
                 "ingredients_per_serving": ingredients,
                 "instructions_per_serving": instructions,
                 "total_calories_per_serving": 0,
-                "total_calories": 0,
                 "calories_unit": "kcal"
             }
         ))
@@ -375,13 +387,12 @@ class TestFetchMealService(TestIV1APIService):
             }
         )
 
-        service.cache.get = Mock(return_value=json.dumps({
+        service.cache.get = Mock(return_value=self.cache_entry({
                 "meal_name": meal_name,
-                "servings": large_servings,
                 "nutrients_per_serving": nutrients,
                 "ingredients_per_serving": ingredients,
                 "instructions_per_serving": instructions,
-                "total_calories": 240,
+                "total_calories_per_serving": total_calories_per_serving,
                 "calories_unit": calories_unit
             }
         ))
@@ -418,9 +429,8 @@ class TestFetchMealService(TestIV1APIService):
             }
         )
 
-        service.cache.get = Mock(return_value=json.dumps({
+        service.cache.get = Mock(return_value=self.cache_entry({
                 "meal_name": meal_name,
-                "servings": servings,
                 "nutrients_per_serving": nutrients,
                 "ingredients_per_serving": ingredients,
                 "instructions_per_serving": instructions,
@@ -461,13 +471,12 @@ class TestFetchMealService(TestIV1APIService):
                 "calories_unit": calories_unit
             }
         )
-        service.cache.get = Mock(return_value=json.dumps({
+        service.cache.get = Mock(return_value=self.cache_entry({
                 "meal_name": meal_name,
-                "servings": servings,
                 "nutrients_per_serving": {},
                 "ingredients_per_serving": [],
                 "instructions_per_serving": instructions,
-                "total_calories": total_calories_per_serving,
+                "total_calories_per_serving": total_calories_per_serving,
                 "calories_unit": calories_unit
             }
         ))
@@ -480,3 +489,203 @@ class TestFetchMealService(TestIV1APIService):
         assert result.data["nutrients_per_serving"] == {}
         assert result.data["ingredients_per_serving"] == []
         assert result.data["instructions_per_serving"] == instructions
+
+    async def test_cached_details_are_scaled_to_servings(
+        self,
+        meal_name,
+        nutrients,
+        ingredients,
+        instructions,
+        total_calories_per_serving,
+        calories_unit,
+        reference_number,
+    ):
+        """
+        Test one cached entry serves every serving count and every way of
+        typing the meal name.
+        """
+        service = self.fetch_meal_service
+        service.make_api_request = AsyncMock(return_value={})
+        service.cache.get = Mock(return_value=self.cache_entry({
+                "meal_name": meal_name,
+                "nutrients_per_serving": nutrients,
+                "ingredients_per_serving": ingredients,
+                "instructions_per_serving": instructions,
+                "total_calories_per_serving": total_calories_per_serving,
+                "calories_unit": calories_unit
+            }
+        ))
+
+        result = await service.run(
+            request_dto=FetchMealRequestDTO(
+                reference_number=reference_number,
+                meal_name="  Chicken   BIRYANI ",
+                servings=3,
+                get_instructions=True,
+            )
+        )
+
+        service.cache.get.assert_called_once_with(
+            "meal_details_v2_chicken biryani"
+        )
+        service.make_api_request.assert_not_called()
+        assert result.data["servings"] == 3
+        assert result.data["total_calories"] == (
+            total_calories_per_serving * 3
+        )
+
+    async def test_fetched_details_are_cached_per_serving(
+        self,
+        valid_fetch_meal_data_with_instructions,
+        nutrients,
+        ingredients,
+        instructions,
+        total_calories_per_serving,
+        calories_unit,
+    ):
+        """Test the cached entry has a TTL and no serving totals."""
+        service = self.fetch_meal_service
+        service.cache.get = Mock(return_value=None)
+        service.make_api_request = AsyncMock(return_value={})
+        service.process_meal_details = AsyncMock(
+            return_value={
+                "nutrients": nutrients,
+                "ingredients": ingredients,
+                "instructions": instructions,
+                "total_calories": total_calories_per_serving,
+                "calories_unit": calories_unit
+            }
+        )
+
+        await service.run(request_dto=valid_fetch_meal_data_with_instructions)
+
+        key, value = service.cache.set.call_args.args
+        cached = MealDetailsCacheUtility.DEFAULT_CODEC.decode(value)[
+            "details"
+        ]
+        assert key == "meal_details_v2_chicken biryani"
+        assert service.cache.set.call_args.kwargs["ex"] > 0
+        assert "servings" not in cached
+        assert "total_calories" not in cached
+        assert cached["total_calories_per_serving"] == (
+            total_calories_per_serving
+        )
+
+    async def test_stale_details_are_served_and_refreshed(
+        self,
+        valid_fetch_meal_data_with_instructions,
+        meal_name,
+        nutrients,
+        ingredients,
+        instructions,
+        total_calories_per_serving,
+        calories_unit,
+    ):
+        """
+        Test stale details are returned at once and refreshed once in the
+        background.
+        """
+        service = self.fetch_meal_service
+        service.cache.get = Mock(return_value=self.cache_entry({
+                "meal_name": meal_name,
+                "nutrients_per_serving": nutrients,
+                "ingredients_per_serving": ingredients,
+                "instructions_per_serving": [],
+                "total_calories_per_serving": total_calories_per_serving,
+                "calories_unit": calories_unit
+            },
+            fresh_for=-1,
+        ))
+        service.cache.set = Mock(return_value=True)
+        service.make_api_request = AsyncMock(return_value={})
+        service.process_meal_details = AsyncMock(
+            return_value={
+                "nutrients": nutrients,
+                "ingredients": ingredients,
+                "instructions": instructions,
+                "total_calories": total_calories_per_serving + 10,
+                "calories_unit": calories_unit
+            }
+        )
+
+        result = await service.run(
+            request_dto=valid_fetch_meal_data_with_instructions
+        )
+
+        assert result.data["total_calories_per_serving"] == (
+            total_calories_per_serving
+        )
+        lock_call = service.cache.set.call_args_list[0]
+        assert lock_call.args[0] == (
+            "meal_details_refresh_v2_chicken biryani"
+        )
+        assert lock_call.kwargs["nx"] is True
+
+        await asyncio.gather(*FetchMealService._refreshes)
+
+        service.process_meal_details.assert_awaited_once()
+        # The entry had no instructions, so none are generated.
+        assert service.process_meal_details.call_args.kwargs[
+            "get_instructions"
+        ] is False
+        key, value = service.cache.set.call_args.args
+        assert key == "meal_details_v2_chicken biryani"
+        assert MealDetailsCacheUtility.DEFAULT_CODEC.decode(value)[
+            "details"
+        ]["total_calories_per_serving"] == total_calories_per_serving + 10
+
+    async def test_stale_details_refresh_lock_held_elsewhere(
+        self,
+        valid_fetch_meal_data_with_instructions,
+        meal_name,
+        total_calories_per_serving,
+    ):
+        """Test no refresh is scheduled when another worker holds it."""
+        service = self.fetch_meal_service
+        service.cache.get = Mock(return_value=self.cache_entry({
+                "meal_name": meal_name,
+                "total_calories_per_serving": total_calories_per_serving,
+            },
+            fresh_for=-1,
+        ))
+        service.cache.set = Mock(return_value=None)
+        service.make_api_request = AsyncMock(return_value={})
+
+        result = await service.run(
+            request_dto=valid_fetch_meal_data_with_instructions
+        )
+
+        assert result.status == APIStatus.SUCCESS
+        assert not FetchMealService._refreshes
+        service.make_api_request.assert_not_called()
+
+    async def test_failed_refresh_keeps_stale_details(
+        self,
+        valid_fetch_meal_data_with_instructions,
+        meal_name,
+        total_calories_per_serving,
+    ):
+        """Test a USDA error during a refresh is logged, not raised."""
+        service = self.fetch_meal_service
+        service.cache.get = Mock(return_value=self.cache_entry({
+                "meal_name": meal_name,
+                "total_calories_per_serving": total_calories_per_serving,
+            },
+            fresh_for=-1,
+        ))
+        service.cache.set = Mock(return_value=True)
+        service.build_meal_details = AsyncMock(
+            side_effect=UnexpectedResponseError(
+                responseMessage="External API error",
+                responseKey="error_external_api",
+                httpStatusCode=HTTPStatus.BAD_GATEWAY
+            )
+        )
+
+        await service.run(request_dto=valid_fetch_meal_data_with_instructions)
+        tasks = list(FetchMealService._refreshes)
+        await asyncio.gather(*tasks)
+
+        assert all(task.exception() is None for task in tasks)
+        # Only the refresh lock was written.
+        service.cache.set.assert_called_once()
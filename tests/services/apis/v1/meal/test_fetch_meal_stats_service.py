@@ -0,0 +1,114 @@
+import datetime
+import pytest
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+from constants.api_status import APIStatus
+
+from dtos.requests.apis.v1.meal.stats import FetchMealStatsRequestDTO
+
+from services.apis.v1.meal.stats import FetchMealStatsService
+
+from tests.services.apis.v1.test_v1_api_service_abstraction import (
+    TestIV1APIService
+)
+
+from utilities.nutrient_vector import NutrientVectorUtility
+
+
+@pytest.mark.asyncio
+class TestFetchMealStatsService(TestIV1APIService):
+
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        urn,
+        user_urn,
+        api_name,
+        user_id,
+    ):
+        self.fetch_meal_stats_service = FetchMealStatsService(
+            urn=urn,
+            user_urn=user_urn,
+            api_name=api_name,
+            user_id=user_id,
+            meal_log_repository=Mock(),
+        )
+
+    @pytest.fixture
+    def valid_fetch_meal_stats_data(self, reference_number):
+        today = datetime.date.today()
+        return FetchMealStatsRequestDTO(
+            reference_number=reference_number,
+            from_date=today - datetime.timedelta(days=2),
+            to_date=today,
+            window=2,
+        )
+
+    @pytest.fixture
+    def meal_logs(self):
+        created_on = datetime.datetime.combine(
+            datetime.date.today(), datetime.time(hour=0)
+        )
+        return [
+            SimpleNamespace(
+                servings=2,
+                nutrient_vector=NutrientVectorUtility.encode({
+                    "macros": [
+                        {"name": "Protein", "amount": 12, "unit": "G"}
+                    ],
+                }),
+                total_calories=600,
+                calories_unit="KCAL",
+                created_on=created_on,
+            ),
+        ]
+
+    async def test_successful_fetch_meal_stats(
+        self,
+        valid_fetch_meal_stats_data,
+        meal_logs,
+    ):
+        service = self.fetch_meal_stats_service
+        repository = service.meal_log_repository
+        repository.retrieve_history_by_user_id_date_range = AsyncMock(
+            return_value=meal_logs
+        )
+
+        result = await service.run(request_dto=valid_fetch_meal_stats_data)
+
+        retrieve = repository.retrieve_history_by_user_id_date_range
+        retrieve.assert_awaited_once_with(
+            user_id=service.user_id,
+            from_date=valid_fetch_meal_stats_data.from_date,
+            to_date=valid_fetch_meal_stats_data.to_date,
+            columns=service.COLUMNS,
+        )
+        assert result.status == APIStatus.SUCCESS
+        assert result.responseKey == "success_fetch_meal_stats"
+        assert result.data["window"] == 2
+        assert result.data["daily"]["totals"]["Protein"] == [0.0, 0.0, 24.0]
+        assert result.data["daily"]["rolling_averages"]["Calories"] == [
+            0.0, 0.0, 300.0
+        ]
+        assert result.data["totals"]["Calories"] == 600.0
+
+    async def test_no_meals(self, valid_fetch_meal_stats_data):
+        service = self.fetch_meal_stats_service
+        repository = service.meal_log_repository
+        repository.retrieve_history_by_user_id_date_range = AsyncMock(
+            return_value=None
+        )
+
+        result = await service.run(request_dto=valid_fetch_meal_stats_data)
+
+        assert result.status == APIStatus.SUCCESS
+        assert result.data["daily"]["totals"]["Calories"] == [0.0, 0.0, 0.0]
+
+    async def test_window_out_of_range_is_rejected(self, reference_number):
+        with pytest.raises(ValueError):
+            FetchMealStatsRequestDTO(
+                reference_number=reference_number,
+                window=0,
+            )
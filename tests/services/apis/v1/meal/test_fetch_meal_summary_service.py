@@ -0,0 +1,121 @@
+import datetime
+import pytest
+
+from unittest.mock import AsyncMock, Mock
+
+from constants.api_status import APIStatus
+
+from dtos.requests.apis.v1.meal.summary import FetchMealSummaryRequestDTO
+from models.meal_daily_summary import MealDailySummary
+
+from services.apis.v1.meal.summary import FetchMealSummaryService
+
+from tests.services.apis.v1.test_v1_api_service_abstraction import (
+    TestIV1APIService
+)
+
+
+@pytest.mark.asyncio
+class TestFetchMealSummaryService(TestIV1APIService):
+
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        urn,
+        user_urn,
+        api_name,
+        user_id,
+    ):
+        self.fetch_meal_summary_service = FetchMealSummaryService(
+            urn=urn,
+            user_urn=user_urn,
+            api_name=api_name,
+            user_id=user_id,
+            meal_daily_summary_repository=Mock(),
+        )
+
+    @pytest.fixture
+    def valid_fetch_meal_summary_data(self, reference_number):
+        today = datetime.date.today()
+        return FetchMealSummaryRequestDTO(
+            reference_number=reference_number,
+            from_date=today - datetime.timedelta(days=6),
+            to_date=today,
+        )
+
+    @pytest.fixture
+    def summaries(self, user_id):
+        today = datetime.date.today()
+        return [
+            MealDailySummary(
+                user_id=user_id,
+                day=today - datetime.timedelta(days=1),
+                meal_count=2,
+                total_calories=900.5,
+                calories_unit="KCAL",
+                macros={"Protein": {"amount": 40, "unit": "G"}},
+                micros={"Sodium, Na": {"amount": 800, "unit": "MG"}},
+            ),
+            MealDailySummary(
+                user_id=user_id,
+                day=today,
+                meal_count=1,
+                total_calories=350,
+                calories_unit="KCAL",
+                macros={},
+                micros={},
+            ),
+        ]
+
+    async def test_successful_fetch_meal_summary(
+        self,
+        valid_fetch_meal_summary_data,
+        summaries,
+    ):
+        service = self.fetch_meal_summary_service
+        repository = service.meal_daily_summary_repository
+        repository.retrieve_by_user_id_date_range = AsyncMock(
+            return_value=summaries
+        )
+
+        result = await service.run(request_dto=valid_fetch_meal_summary_data)
+
+        repository.retrieve_by_user_id_date_range.assert_awaited_once_with(
+            user_id=service.user_id,
+            from_date=valid_fetch_meal_summary_data.from_date,
+            to_date=valid_fetch_meal_summary_data.to_date,
+        )
+        assert result.status == APIStatus.SUCCESS
+        assert result.responseKey == "success_fetch_meal_summary"
+        assert result.data["total_calories"] == 1250.5
+        assert [day["date"] for day in result.data["days"]] == [
+            str(summary.day) for summary in summaries
+        ]
+        assert result.data["days"][0]["meal_count"] == 2
+        assert result.data["days"][0]["macros"] == [
+            {"name": "Protein", "amount": 40, "unit": "G"}
+        ]
+
+    async def test_empty_range(self, valid_fetch_meal_summary_data):
+        service = self.fetch_meal_summary_service
+        repository = service.meal_daily_summary_repository
+        repository.retrieve_by_user_id_date_range = AsyncMock(
+            return_value=[]
+        )
+
+        result = await service.run(request_dto=valid_fetch_meal_summary_data)
+
+        assert result.status == APIStatus.SUCCESS
+        assert result.data == {"days": [], "total_calories": 0}
+
+    async def test_range_longer_than_limit_is_rejected(
+        self,
+        reference_number,
+    ):
+        today = datetime.date.today()
+        with pytest.raises(ValueError):
+            FetchMealSummaryRequestDTO(
+                reference_number=reference_number,
+                from_date=today - datetime.timedelta(days=400),
+                to_date=today,
+            )
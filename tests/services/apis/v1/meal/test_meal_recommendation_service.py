@@ -11,7 +11,7 @@ from dtos.requests.apis.v1.meal.recommendation import (
 )
 from dtos.services.apis.v1.meal.recommendation import MealRecommendationDTO
 from models.meal_log import MealLog
-from repositories.meal_log import MealLogRepository
+from repositories.async_meal_log import AsyncMealLogRepository
 
 from services.apis.v1.meal.recommendation import FetchMealRecommendationService
 
@@ -108,16 +108,16 @@ class TestFetchMealRecommendationService(TestIV1APIService):
         user_urn,
         api_name,
         user_id,
-        db_session,
+        async_db_session,
     ):
         """
         Meal Log repository.
         """
-        return MealLogRepository(
+        return AsyncMealLogRepository(
             urn=urn,
             user_urn=user_urn,
             api_name=api_name,
-            session=db_session,
+            session=async_db_session,
             user_id=user_id,
         )
 
@@ -188,7 +188,7 @@ class TestFetchMealRecommendationService(TestIV1APIService):
     ):
         service = self.fetch_meal_recommendation_service
         repository = service.meal_log_repository
-        repository.retrieve_history_by_user_id_date_range = Mock(
+        repository.retrieve_history_by_user_id_date_range = AsyncMock(
             return_value=mock_meal_logs
         )
         service.process_meal_recommendation = AsyncMock(
@@ -211,6 +211,7 @@ class TestFetchMealRecommendationService(TestIV1APIService):
             from_date=expected_from_date,
             to_date=expected_to_date,
             is_deleted=False,
+            columns=service.COLUMNS,
         )
         service.process_meal_recommendation.assert_awaited_once_with(
             mock_meal_logs, MealCategory.KETO
@@ -231,7 +232,7 @@ class TestFetchMealRecommendationService(TestIV1APIService):
     ):
         service = self.fetch_meal_recommendation_service
         repository = service.meal_log_repository
-        repository.retrieve_history_by_user_id_date_range = Mock(
+        repository.retrieve_history_by_user_id_date_range = AsyncMock(
             return_value=[]
         )
         service.process_meal_recommendation = AsyncMock(
@@ -271,7 +272,7 @@ class TestFetchMealRecommendationService(TestIV1APIService):
 
             service = self.fetch_meal_recommendation_service
             repository = service.meal_log_repository
-            repository.retrieve_history_by_user_id_date_range = Mock(
+            repository.retrieve_history_by_user_id_date_range = AsyncMock(
                 return_value=mock_meal_logs
             )
             service.process_meal_recommendation = AsyncMock(
@@ -293,7 +294,7 @@ class TestFetchMealRecommendationService(TestIV1APIService):
     ):
         service = self.fetch_meal_recommendation_service
         repository = service.meal_log_repository
-        repository.retrieve_history_by_user_id_date_range = Mock(
+        repository.retrieve_history_by_user_id_date_range = AsyncMock(
             side_effect=Exception("Database error")
         )
 
@@ -309,7 +310,7 @@ class TestFetchMealRecommendationService(TestIV1APIService):
     ):
         service = self.fetch_meal_recommendation_service
         repository = service.meal_log_repository
-        repository.retrieve_history_by_user_id_date_range = Mock(
+        repository.retrieve_history_by_user_id_date_range = AsyncMock(
             return_value=mock_meal_logs
         )
         service.process_meal_recommendation = AsyncMock(
@@ -459,7 +460,7 @@ class TestFetchMealRecommendationService(TestIV1APIService):
 
         service = self.fetch_meal_recommendation_service
         repository = service.meal_log_repository
-        repository.retrieve_history_by_user_id_date_range = Mock(
+        repository.retrieve_history_by_user_id_date_range = AsyncMock(
             return_value=complex_meal_logs
         )
         service.process_meal_recommendation = AsyncMock(
@@ -1,5 +1,8 @@
+import httpx
 import json
 import pytest
+
+from http import HTTPStatus
 from unittest.mock import AsyncMock, Mock, patch
 
 from dtos.requests.apis.v1.meal.add import AddMealRequestDTO
@@ -9,10 +12,15 @@ from dtos.services.apis.v1.meal.instructions import (
 )
 from dtos.services.apis.v1.meal.recommendation import MealRecommendationDTO
 
+from errors.bad_input_error import BadInputError
 from errors.not_found_error import NotFoundError
+from errors.service_unavailable_error import ServiceUnavailableError
 from errors.unexpected_response_error import UnexpectedResponseError
 
-from repositories.meal_log import MealLogRepository
+from repositories.async_meal_daily_summary import (
+    AsyncMealDailySummaryRepository,
+)
+from repositories.async_meal_log import AsyncMealLogRepository
 
 from services.apis.v1.meal.add import AddMealService
 
@@ -20,6 +28,9 @@ from tests.services.apis.v1.test_v1_api_service_abstraction import (
     TestIV1APIService
 )
 
+from utilities.instructions_cache import InstructionsCacheUtility
+from utilities.negative_cache import NegativeCacheUtility
+
 
 @pytest.mark.asyncio
 class TestIV1MealAPIService(TestIV1APIService):
@@ -101,16 +112,36 @@ class TestIV1MealAPIService(TestIV1APIService):
         user_urn,
         api_name,
         user_id,
-        db_session,
+        async_db_session,
     ):
         """
         Meal Log repository.
         """
-        return MealLogRepository(
+        return AsyncMealLogRepository(
             urn=urn,
             user_urn=user_urn,
             api_name=api_name,
-            session=db_session,
+            session=async_db_session,
+            user_id=user_id,
+        )
+
+    @pytest.fixture
+    def meal_daily_summary_repository(
+        self,
+        urn,
+        user_urn,
+        api_name,
+        user_id,
+        async_db_session,
+    ):
+        """
+        Meal daily summary repository.
+        """
+        return AsyncMealDailySummaryRepository(
+            urn=urn,
+            user_urn=user_urn,
+            api_name=api_name,
+            session=async_db_session,
             user_id=user_id,
         )
 
@@ -254,14 +285,22 @@ class TestIV1MealAPIService(TestIV1APIService):
         user_urn,
         api_name,
         meal_log_repository,
+        meal_daily_summary_repository,
     ):
-        self.meal_log_repository: MealLogRepository = meal_log_repository
+        self.meal_log_repository: AsyncMealLogRepository = meal_log_repository
         self.add_meal_service = AddMealService(
             urn=urn,
             user_urn=user_urn,
             api_name=api_name,
             meal_log_repository=self.meal_log_repository,
-            cache=Mock(),
+            meal_daily_summary_repository=meal_daily_summary_repository,
+            cache=Mock(
+                get=Mock(return_value=None),
+                pipeline=Mock(return_value=Mock(
+                    execute=Mock(return_value=[True, 1, 0, 1])
+                )),
+            ),
+            async_cache=AsyncMock(get=AsyncMock(return_value=None)),
         )
 
     @pytest.fixture
@@ -294,13 +333,17 @@ class TestIV1MealAPIService(TestIV1APIService):
             get_instructions=get_instructions_false
         )
 
-    @patch('services.apis.v1.meal.abstraction.requests.request')
-    async def test_make_api_request_success(self, mock_request):
+    def mock_usda_client(self, handler):
+        """
+        USDA client backed by an in-memory transport.
+        """
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def test_make_api_request_success(self):
         """Test successful API request."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"foods": []}
-        mock_request.return_value = mock_response
+        self.add_meal_service.usda_client = self.mock_usda_client(
+            lambda request: httpx.Response(200, json={"foods": []})
+        )
 
         result = await self.add_meal_service.make_api_request(
             url="https://api.nal.usda.gov/fdc/v1/foods/search",
@@ -309,14 +352,31 @@ class TestIV1MealAPIService(TestIV1APIService):
         )
 
         assert result == {"foods": []}
-        mock_request.assert_called_once()
 
-    @patch('services.apis.v1.meal.abstraction.requests.request')
-    async def test_make_api_request_not_found(self, mock_request):
+    async def test_make_api_request_uses_shared_client(self):
+        """Test API request is sent through the injected client."""
+        usda_client = Mock()
+        usda_client.request = AsyncMock(
+            return_value=httpx.Response(
+                200,
+                json={"foods": []},
+                request=httpx.Request("GET", "https://usda.test"),
+            )
+        )
+        self.add_meal_service.usda_client = usda_client
+
+        await self.add_meal_service.make_api_request(
+            url="https://usda.test",
+            method="GET",
+        )
+
+        usda_client.request.assert_awaited_once()
+
+    async def test_make_api_request_not_found(self):
         """Test API request with 404 response."""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_request.return_value = mock_response
+        self.add_meal_service.usda_client = self.mock_usda_client(
+            lambda request: httpx.Response(404)
+        )
 
         with pytest.raises(NotFoundError) as exc_info:
             await self.add_meal_service.make_api_request(
@@ -326,29 +386,26 @@ class TestIV1MealAPIService(TestIV1APIService):
 
         assert exc_info.value.responseKey == "error_not_found"
 
-    @patch('services.apis.v1.meal.abstraction.requests.request')
-    async def test_make_api_request_http_error(self, mock_request):
+    async def test_make_api_request_http_error(self):
         """Test API request with HTTP error."""
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.raise_for_status.side_effect = Exception("HTTP Error")
-        mock_request.return_value = mock_response
+        self.add_meal_service.usda_client = self.mock_usda_client(
+            lambda request: httpx.Response(500)
+        )
 
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(BadInputError) as exc_info:
             await self.add_meal_service.make_api_request(
                 url="https://api.nal.usda.gov/fdc/v1/foods/search",
                 method="GET"
             )
 
-        assert exc_info.value.args[0] == "HTTP Error"
+        assert exc_info.value.responseKey == "error_http_error"
+        assert exc_info.value.httpStatusCode == 500
 
-    @patch('services.apis.v1.meal.abstraction.requests.request')
-    async def test_make_api_request_invalid_json(self, mock_request):
+    async def test_make_api_request_invalid_json(self):
         """Test API request with invalid JSON response."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.side_effect = Exception("Invalid JSON")
-        mock_request.return_value = mock_response
+        self.add_meal_service.usda_client = self.mock_usda_client(
+            lambda request: httpx.Response(200, content=b"not json")
+        )
 
         with pytest.raises(UnexpectedResponseError) as exc_info:
             await self.add_meal_service.make_api_request(
@@ -358,18 +415,35 @@ class TestIV1MealAPIService(TestIV1APIService):
 
         assert exc_info.value.responseKey == "error_invalid_json"
 
-    @patch('services.apis.v1.meal.abstraction.requests.request')
-    async def test_make_api_request_connection_error(self, mock_request):
+    async def test_make_api_request_connection_error(self):
         """Test API request with connection error."""
-        mock_request.side_effect = Exception("Connection failed")
+        def handler(request):
+            raise httpx.ConnectError("Connection failed", request=request)
 
-        with pytest.raises(Exception) as exc_info:
+        self.add_meal_service.usda_client = self.mock_usda_client(handler)
+
+        with pytest.raises(UnexpectedResponseError) as exc_info:
+            await self.add_meal_service.make_api_request(
+                url="https://api.nal.usda.gov/fdc/v1/foods/search",
+                method="GET"
+            )
+
+        assert exc_info.value.responseKey == "error_request_failed"
+
+    async def test_make_api_request_timeout(self):
+        """Test API request with a read timeout."""
+        def handler(request):
+            raise httpx.ReadTimeout("Timed out", request=request)
+
+        self.add_meal_service.usda_client = self.mock_usda_client(handler)
+
+        with pytest.raises(UnexpectedResponseError) as exc_info:
             await self.add_meal_service.make_api_request(
                 url="https://api.nal.usda.gov/fdc/v1/foods/search",
                 method="GET"
             )
 
-        assert exc_info.value.args[0] == "Connection failed"
+        assert exc_info.value.responseKey == "error_request_failed"
 
     async def test_select_food_record_with_ingredients_and_nutrients_success(
         self
@@ -410,7 +484,7 @@ class TestIV1MealAPIService(TestIV1APIService):
                 "instructions": meal_instructions
             }
         )
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.ainvoke = AsyncMock(return_value=mock_response)
 
         ingredients = [{"name": "chicken", "quantity_grams": 100}]
 
@@ -422,10 +496,62 @@ class TestIV1MealAPIService(TestIV1APIService):
         assert isinstance(result, InstructionsDTO)
         assert result.instructions[0].model_dump() == meal_instructions[0]
 
+    @patch('services.apis.v1.meal.abstraction.llm')
+    async def test_generate_instructions_cache_hit(
+        self,
+        mock_llm,
+        meal_instructions,
+    ):
+        """Test cached instructions are served without calling the LLM."""
+        self.add_meal_service.cache.get = Mock(
+            return_value=json.dumps({"instructions": meal_instructions})
+        )
+        mock_llm.ainvoke = AsyncMock()
+
+        result = await self.add_meal_service.generate_instructions(
+            meal_name="chicken biryani",
+            ingredients=[{"name": "chicken", "quantity_grams": 100}]
+        )
+
+        assert result.instructions[0].model_dump() == meal_instructions[0]
+        mock_llm.ainvoke.assert_not_awaited()
+
+    @patch('services.apis.v1.meal.abstraction.llm')
+    async def test_generate_instructions_cache_miss_stores_result(
+        self,
+        mock_llm,
+        meal_instructions,
+    ):
+        """Test generated instructions are written to the cache."""
+        mock_response = Mock()
+        mock_response.content = json.dumps(
+            {
+                "instructions": meal_instructions
+            }
+        )
+        mock_llm.ainvoke = AsyncMock(return_value=mock_response)
+        pipeline = Mock(execute=Mock(return_value=[True, 1, 0, 1]))
+        self.add_meal_service.cache.pipeline = Mock(return_value=pipeline)
+        ingredients = [{"name": "chicken", "quantity_grams": 100}]
+
+        await self.add_meal_service.generate_instructions(
+            meal_name="chicken biryani",
+            ingredients=ingredients
+        )
+
+        mock_llm.ainvoke.assert_awaited_once()
+        pipeline.set.assert_called_once()
+        assert pipeline.set.call_args[0][0] == (
+            InstructionsCacheUtility.build_key(
+                meal_name="chicken biryani",
+                ingredients=ingredients,
+            )
+        )
+
     @patch('services.apis.v1.meal.abstraction.llm')
     async def test_generate_instructions_failure(self, mock_llm):
         """Test instruction generation failure."""
-        mock_llm.invoke.side_effect = Exception("LLM Error")
+        mock_llm.ainvoke = AsyncMock(side_effect=Exception("LLM Error"))
 
         ingredients = [{"name": "chicken", "quantity_grams": 100}]
 
@@ -450,7 +576,7 @@ class TestIV1MealAPIService(TestIV1APIService):
                 "meals": meal_recommendation
             }
         )
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.ainvoke = AsyncMock(return_value=mock_response)
 
         meal_history = [{"meal_name": "pasta", "calories": 300}]
 
@@ -465,7 +591,7 @@ class TestIV1MealAPIService(TestIV1APIService):
     @patch('services.apis.v1.meal.abstraction.llm')
     async def test_generate_meal_recommendation_failure(self, mock_llm):
         """Test meal recommendation generation failure."""
-        mock_llm.invoke.side_effect = Exception("LLM Error")
+        mock_llm.ainvoke = AsyncMock(side_effect=Exception("LLM Error"))
 
         meal_history = [{"meal_name": "pasta", "calories": 300}]
 
@@ -477,6 +603,62 @@ class TestIV1MealAPIService(TestIV1APIService):
 
         assert "LLM Error" in str(exc_info.value)
 
+    @patch('services.apis.v1.meal.abstraction.LLMUtility')
+    @patch('services.apis.v1.meal.abstraction.llm')
+    async def test_generate_instructions_over_budget_fallback(
+        self,
+        mock_llm,
+        mock_llm_utility,
+    ):
+        """Test instructions fall back to empty when the LLM is busy."""
+        mock_llm_utility.return_value.invoke = AsyncMock(
+            side_effect=ServiceUnavailableError(
+                responseMessage="LLM is busy. Please try again later.",
+                responseKey="error_llm_queue_full",
+                httpStatusCode=HTTPStatus.SERVICE_UNAVAILABLE,
+            )
+        )
+
+        result = await self.add_meal_service.generate_instructions(
+            meal_name="chicken biryani",
+            ingredients=[{"name": "chicken", "quantity_grams": 100}]
+        )
+
+        assert result == InstructionsDTO(instructions=[])
+
+    @patch('services.apis.v1.meal.abstraction.LLMUtility')
+    @patch('services.apis.v1.meal.abstraction.llm')
+    async def test_generate_meal_recommendation_over_budget_fallback(
+        self,
+        mock_llm,
+        mock_llm_utility,
+    ):
+        """Test recommendations fall back to empty when the LLM is busy."""
+        mock_llm_utility.return_value.invoke = AsyncMock(
+            side_effect=ServiceUnavailableError(
+                responseMessage="LLM timed out. Please try again later.",
+                responseKey="error_llm_timeout",
+                httpStatusCode=HTTPStatus.GATEWAY_TIMEOUT,
+            )
+        )
+
+        result = await self.add_meal_service.generate_meal_recommendation(
+            food_category="lunch",
+            meal_history=[{"meal_name": "pasta", "calories": 300}]
+        )
+
+        assert result == MealRecommendationDTO(meals=[])
+
+    @patch('services.apis.v1.meal.abstraction.llm', None)
+    async def test_generate_meal_recommendation_without_llm(self):
+        """Test recommendations are empty when no LLM is configured."""
+        result = await self.add_meal_service.generate_meal_recommendation(
+            food_category="lunch",
+            meal_history=[]
+        )
+
+        assert result == MealRecommendationDTO(meals=[])
+
     async def test_extract_essential_nutrients_success(self, meal_data: dict):
         """Test successful nutrient extraction."""
 
@@ -733,6 +915,61 @@ class TestIV1MealAPIService(TestIV1APIService):
             )
 
         assert exc_info.value.responseKey == "error_no_meal_data_found"
+        key, _ = self.add_meal_service.async_cache.set.call_args.args
+        assert key == NegativeCacheUtility.build_key("chicken biryani")
+
+    async def test_search_meal_details_negative_cache_hit(self):
+        """Test a recently failed search fails again without USDA."""
+        service = self.add_meal_service
+        service.async_cache.get = AsyncMock(return_value=json.dumps({
+            "reason": NegativeCacheUtility.NOT_FOUND,
+            "responseMessage": "No meal data found",
+            "responseKey": "error_no_meal_data_found",
+            "httpStatusCode": HTTPStatus.NOT_FOUND,
+        }))
+        service.make_api_request = AsyncMock()
+
+        with pytest.raises(NotFoundError) as exc_info:
+            await service.search_meal_details(meal_name="xyz dish")
+
+        assert exc_info.value.responseKey == "error_no_meal_data_found"
+        service.make_api_request.assert_not_awaited()
+        service.cache.get.assert_not_called()
+
+    async def test_search_meal_details_bypasses_negative_cache(self):
+        """Test a bypass drops the cached failure and calls USDA."""
+        service = self.add_meal_service
+        service.make_api_request = AsyncMock(return_value={"foods": []})
+
+        result = await service.search_meal_details(
+            meal_name="xyz dish",
+            bypass_negative_cache=True,
+        )
+
+        assert result == {"foods": []}
+        service.async_cache.delete.assert_awaited_once_with(
+            NegativeCacheUtility.build_key("xyz dish")
+        )
+        service.make_api_request.assert_awaited_once()
+
+    async def test_search_meal_details_caches_invalid_json(self):
+        """Test a malformed USDA response is negatively cached."""
+        service = self.add_meal_service
+        service.make_api_request = AsyncMock(
+            side_effect=UnexpectedResponseError(
+                responseMessage="Invalid JSON response",
+                responseKey="error_invalid_json",
+                httpStatusCode=HTTPStatus.OK,
+            )
+        )
+
+        with pytest.raises(UnexpectedResponseError):
+            await service.search_meal_details(meal_name="xyz dish")
+
+        service.async_cache.set.assert_awaited_once()
+        key, _ = service.async_cache.set.call_args.args
+        assert key == NegativeCacheUtility.build_key("xyz dish")
+        assert service.async_cache.set.call_args.kwargs["ex"] > 0
 
     async def test_process_meal_details_instructions_generation_failure(self):
         """Test meal details processing when instruction generation fails."""
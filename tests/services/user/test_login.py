@@ -2,11 +2,11 @@ import datetime
 import pytest
 import uuid
 
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 from errors.not_found_error import NotFoundError
 from models.user import User
-from repositories.user import UserRepository
+from repositories.async_user import AsyncUserRepository
 from services.user.login import UserLoginService
 from errors.bad_input_error import BadInputError
 from dtos.requests.user.login import UserLoginRequestDTO
@@ -25,7 +25,7 @@ class TestUserLoginService(TestIUserService):
         mock_jwt_utility,
         user_repository,
     ):
-        self.user_repository: UserRepository = user_repository
+        self.user_repository: AsyncUserRepository = user_repository
         self.login_service: UserLoginService = UserLoginService(
             urn=urn,
             user_urn=user_urn,
@@ -77,10 +77,11 @@ class TestUserLoginService(TestIUserService):
         mock_user,
         jwt_token,
     ):
-        self.login_service.user_repository.retrieve_record_by_email = Mock(
+        ls = self.login_service
+        ls.user_repository.retrieve_record_by_email = AsyncMock(
             return_value=mock_user
         )
-        self.login_service.user_repository.update_record = Mock(
+        self.login_service.user_repository.update_record = AsyncMock(
             return_value=mock_user
         )
         self.login_service.jwt_utility.create_access_token = Mock(
@@ -94,6 +95,48 @@ class TestUserLoginService(TestIUserService):
         assert result.data["token"] == jwt_token
         assert result.data["user_urn"] == mock_user.urn
 
+    @pytest.fixture
+    def offline_login_data(
+        self,
+        reference_number,
+        email,
+        password,
+    ):
+        """Login data validated without the email DNS lookup."""
+        with patch(
+            "dtos.requests.user.login.ValidationUtility"
+            ".validate_email_format",
+            return_value={"is_valid": True, "normalized_email": email},
+        ):
+            return UserLoginRequestDTO(
+                reference_number=reference_number,
+                email=email,
+                password=password,
+            )
+
+    async def test_login_caches_logged_in_session_state(
+        self,
+        offline_login_data,
+        mock_user,
+        jwt_token,
+    ):
+        ls = self.login_service
+        ls.cache = AsyncMock()
+        ls.user_repository.retrieve_record_by_email = AsyncMock(
+            return_value=mock_user
+        )
+        ls.user_repository.update_record = AsyncMock(
+            return_value=mock_user
+        )
+        ls.jwt_utility.create_access_token = Mock(return_value=jwt_token)
+
+        await ls.run(offline_login_data)
+
+        ls.cache.set.assert_awaited_once_with(
+            f"user_session_state_{mock_user.id}", b"1", ex=300
+        )
+        ls.cache.delete.assert_not_awaited()
+
     async def test_user_not_found(self):
 
         ls = self.login_service
@@ -104,7 +147,7 @@ class TestUserLoginService(TestIUserService):
         )
 
         ls.user_repository.retrieve_record_by_email = (
-            Mock(return_value=None)
+            AsyncMock(return_value=None)
         )
 
         with pytest.raises(NotFoundError) as exc_info:
@@ -124,7 +167,7 @@ class TestUserLoginService(TestIUserService):
             password="WrongPassword123!",
         )
         ls.user_repository.retrieve_record_by_email = (
-            Mock(return_value=mock_user)
+            AsyncMock(return_value=mock_user)
         )
 
         with pytest.raises(BadInputError) as exc_info:
@@ -140,9 +183,9 @@ class TestUserLoginService(TestIUserService):
         jwt_token: str,
     ):
         self.login_service.user_repository.retrieve_record_by_email = (
-            Mock(return_value=mock_user)
+            AsyncMock(return_value=mock_user)
         )
-        self.login_service.user_repository.update_record = Mock(
+        self.login_service.user_repository.update_record = AsyncMock(
             return_value=mock_user
         )
         self.login_service.jwt_utility.create_access_token = Mock(
@@ -164,9 +207,9 @@ class TestUserLoginService(TestIUserService):
     ):
         ls = self.login_service
         ls.user_repository.retrieve_record_by_email = (
-            Mock(return_value=mock_user)
+            AsyncMock(return_value=mock_user)
         )
-        ls.user_repository.update_record = Mock(
+        ls.user_repository.update_record = AsyncMock(
             return_value=mock_user
         )
         ls.jwt_utility.create_access_token = (
@@ -1,13 +1,13 @@
 import datetime
 import pytest
 
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 from dtos.requests.user.logout import UserLogoutRequestDTO
 
 from models.user import User
 
-from repositories.user import UserRepository
+from repositories.async_user import AsyncUserRepository
 
 from services.user.logout import UserLogoutService
 
@@ -25,7 +25,7 @@ class TestUserLogoutService(TestIUserService):
         mock_jwt_utility,
         user_repository,
     ):
-        self.user_repository: UserRepository = user_repository
+        self.user_repository: AsyncUserRepository = user_repository
         self.logout_service = UserLogoutService(
             urn=urn,
             user_urn=user_urn,
@@ -73,10 +73,10 @@ class TestUserLogoutService(TestIUserService):
         mock_logged_out_user,
     ):
         ls = self.logout_service
-        ls.user_repository.retrieve_record_by_id_is_logged_in = Mock(
+        ls.user_repository.retrieve_record_by_id_is_logged_in = AsyncMock(
             return_value=mock_logged_in_user
         )
-        ls.user_repository.update_record = Mock(
+        ls.user_repository.update_record = AsyncMock(
             return_value=mock_logged_out_user
         )
 
@@ -84,3 +84,24 @@ class TestUserLogoutService(TestIUserService):
 
         assert result.status == "SUCCESS"
         assert result.data["status"] == mock_logged_out_user.is_logged_in
+
+    async def test_logout_caches_logged_out_session_state(
+        self,
+        mock_logged_in_user,
+        mock_logged_out_user,
+    ):
+        ls = self.logout_service
+        ls.cache = AsyncMock()
+        ls.user_repository.retrieve_record_by_id_is_logged_in = AsyncMock(
+            return_value=mock_logged_in_user
+        )
+        ls.user_repository.update_record = AsyncMock(
+            return_value=mock_logged_out_user
+        )
+
+        await ls.run()
+
+        ls.cache.set.assert_awaited_once_with(
+            f"user_session_state_{mock_logged_out_user.id}", b"0", ex=300
+        )
+        ls.cache.delete.assert_not_awaited()
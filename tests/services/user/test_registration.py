@@ -1,7 +1,7 @@
 import datetime
 import pytest
 
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 from constants.api_status import APIStatus
 from dtos.requests.user.registration import UserRegistrationRequestDTO
@@ -9,7 +9,7 @@ from dtos.requests.user.registration import UserRegistrationRequestDTO
 from errors.bad_input_error import BadInputError
 from models.user import User
 
-from repositories.user import UserRepository
+from repositories.async_user import AsyncUserRepository
 
 from services.user.registration import UserRegistrationService
 
@@ -26,7 +26,7 @@ class TestUserRegistrationService(TestIUserService):
         api_name,
         user_repository,
     ):
-        self.user_repository: UserRepository = user_repository
+        self.user_repository: AsyncUserRepository = user_repository
         self.registration_service = UserRegistrationService(
             urn=urn,
             user_urn=user_urn,
@@ -77,10 +77,10 @@ class TestUserRegistrationService(TestIUserService):
         mock_registered_user,
     ):
         service = self.registration_service
-        service.user_repository.retrieve_record_by_email = Mock(
+        service.user_repository.retrieve_record_by_email = AsyncMock(
             return_value=None
         )
-        service.user_repository.create_record = Mock(
+        service.user_repository.create_record = AsyncMock(
             return_value=mock_registered_user
         )
 
@@ -95,10 +95,10 @@ class TestUserRegistrationService(TestIUserService):
         mock_existing_user,
     ):
         service = self.registration_service
-        service.user_repository.retrieve_record_by_email = Mock(
+        service.user_repository.retrieve_record_by_email = AsyncMock(
             return_value=mock_existing_user
         )
-        service.user_repository.create_record = Mock(
+        service.user_repository.create_record = AsyncMock(
             return_value=None
         )
 
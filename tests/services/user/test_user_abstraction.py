@@ -4,7 +4,7 @@ import uuid
 
 from unittest.mock import Mock
 
-from repositories.user import UserRepository
+from repositories.async_user import AsyncUserRepository
 
 from tests.services.test_service_abstraction import TestIService
 
@@ -62,15 +62,15 @@ class TestIUserService(TestIService):
         user_urn,
         api_name,
         user_id,
-        db_session,
+        async_db_session,
     ):
         """
         User repository for the user.
         """
-        return UserRepository(
+        return AsyncUserRepository(
             urn=urn,
             user_urn=user_urn,
             api_name=api_name,
-            session=db_session,
+            session=async_db_session,
             user_id=user_id,
         )
@@ -0,0 +1,127 @@
+import asyncio
+import pytest
+
+from stores.rate_limit.memory_store import MemoryRateLimitStore
+
+
+@pytest.mark.asyncio
+class TestMemoryRateLimitStore:
+
+    async def test_sliding_window_allows_until_limit(self):
+        """Test that requests are allowed up to the limit."""
+        store = MemoryRateLimitStore()
+
+        results = [
+            await store.check_sliding_window("client", limit=3, window=60)
+            for _ in range(4)
+        ]
+
+        assert [result.allowed for result in results] == [
+            True, True, True, False
+        ]
+        assert [result.remaining for result in results] == [2, 1, 0, 0]
+        assert 0 < results[-1].retry_after <= 60
+
+    async def test_keys_are_independent(self):
+        """Test that each key has its own window."""
+        store = MemoryRateLimitStore()
+
+        await store.check_sliding_window("a", limit=1, window=60)
+        result = await store.check_sliding_window("b", limit=1, window=60)
+
+        assert result.allowed is True
+        assert result.remaining == 0
+
+    async def test_sliding_window_expires(self):
+        """Test that requests outside the window no longer count."""
+        store = MemoryRateLimitStore()
+
+        await store.check_sliding_window("client", limit=1, window=0.01)
+        await asyncio.sleep(0.02)
+        result = await store.check_sliding_window(
+            "client", limit=1, window=0.01
+        )
+
+        assert result.allowed is True
+
+    async def test_fixed_window_counts_in_constant_memory(self):
+        """Test that a fixed window keeps one counter per key."""
+        store = MemoryRateLimitStore()
+
+        results = [
+            await store.check_fixed_window("client", limit=2, window=60)
+            for _ in range(3)
+        ]
+
+        assert [result.allowed for result in results] == [True, True, False]
+        assert results[1].remaining == 0
+        assert results[2].retry_after == results[2].reset_after
+
+    async def test_token_bucket_honors_burst(self):
+        """Test that a full bucket allows exactly `capacity` requests."""
+        store = MemoryRateLimitStore()
+
+        results = [
+            await store.check_token_bucket(
+                "client", capacity=3, refill_rate=1
+            )
+            for _ in range(4)
+        ]
+
+        assert [result.allowed for result in results] == [
+            True, True, True, False
+        ]
+        assert [result.remaining for result in results[:3]] == [2, 1, 0]
+        assert 0 < results[-1].retry_after <= 1
+
+    async def test_token_bucket_refills(self):
+        """Test that tokens are added back at the refill rate."""
+        store = MemoryRateLimitStore()
+
+        await store.check_token_bucket("client", capacity=1, refill_rate=100)
+        await asyncio.sleep(0.02)
+        result = await store.check_token_bucket(
+            "client", capacity=1, refill_rate=100
+        )
+
+        assert result.allowed is True
+
+    async def test_key_cap_evicts_least_recently_used(self):
+        """Test that the number of tracked keys is bounded."""
+        store = MemoryRateLimitStore(shards=1, max_keys=2)
+
+        await store.check_fixed_window("a", limit=1, window=60)
+        await store.check_fixed_window("b", limit=1, window=60)
+        await store.check_fixed_window("a", limit=1, window=60)
+        await store.check_fixed_window("c", limit=1, window=60)
+
+        assert len(store) == 2
+        # "a" is still tracked and over its limit.
+        result = await store.check_fixed_window("a", limit=1, window=60)
+        assert result.allowed is False
+        # "b" was least recently used, so its quota starts over.
+        result = await store.check_fixed_window("b", limit=1, window=60)
+        assert result.allowed is True
+
+    async def test_idle_keys_expire_on_access(self):
+        """Test that expired keys are dropped by later accesses."""
+        store = MemoryRateLimitStore(shards=1)
+
+        await store.check_fixed_window("a", limit=1, window=0.01)
+        await store.check_token_bucket("b", capacity=1, refill_rate=100)
+        await asyncio.sleep(0.02)
+        await store.check_sliding_window("c", limit=1, window=60)
+
+        assert len(store) == 1
+
+    async def test_keys_are_spread_over_shards(self):
+        """Test that keys land in more than one shard."""
+        store = MemoryRateLimitStore(shards=4)
+
+        for index in range(32):
+            await store.check_fixed_window(
+                f"client-{index}", limit=1, window=60
+            )
+
+        assert len(store) == 32
+        assert sum(1 for entries in store._shards if entries) > 1
@@ -0,0 +1,104 @@
+import pytest
+
+from redis.exceptions import ConnectionError
+from unittest.mock import AsyncMock, Mock
+
+from stores.rate_limit.redis_store import RedisRateLimitStore
+
+
+@pytest.mark.asyncio
+class TestRedisRateLimitStore:
+
+    @pytest.fixture
+    def script(self):
+        """Create a mock registered Lua script."""
+        return AsyncMock(return_value=[1, 4, 60000, 0])
+
+    @pytest.fixture
+    def cache(self, script):
+        """Create a mock asyncio Redis client."""
+        cache = Mock()
+        cache.register_script = Mock(return_value=script)
+        return cache
+
+    async def test_registers_scripts_once(self, cache):
+        """Test that the Lua scripts are registered at construction."""
+        RedisRateLimitStore(cache=cache)
+
+        assert [call.args[0] for call in
+                cache.register_script.call_args_list] == [
+            RedisRateLimitStore.SLIDING_WINDOW_SCRIPT,
+            RedisRateLimitStore.FIXED_WINDOW_SCRIPT,
+            RedisRateLimitStore.TOKEN_BUCKET_SCRIPT,
+        ]
+
+    async def test_sliding_window_allowed(self, cache, script):
+        """Test that an allowed request runs one script call."""
+        store = RedisRateLimitStore(cache=cache)
+
+        result = await store.check_sliding_window(
+            "client:GET:/api", limit=5, window=60
+        )
+
+        assert result.allowed is True
+        assert result.remaining == 4
+        assert result.reset_after == 60
+        script.assert_awaited_once()
+        kwargs = script.await_args.kwargs
+        assert kwargs["keys"] == ["rate_limit:client:GET:/api"]
+        assert kwargs["args"][:2] == [5, 60000]
+
+    async def test_request_ids_are_unique(self, cache, script):
+        """Test that concurrent requests add distinct set members."""
+        store = RedisRateLimitStore(cache=cache)
+
+        await store.check_sliding_window("client", limit=5, window=60)
+        await store.check_sliding_window("client", limit=5, window=60)
+
+        first, second = [call.kwargs["args"][2]
+                         for call in script.await_args_list]
+        assert first != second
+
+    async def test_denied(self, cache, script):
+        """Test that a denied reply carries the retry delay."""
+        script.return_value = [0, 0, 30000, 1500]
+        store = RedisRateLimitStore(cache=cache)
+
+        result = await store.check_fixed_window("client", limit=5, window=60)
+
+        assert result.allowed is False
+        assert result.remaining == 0
+        assert result.retry_after == 1.5
+
+    async def test_token_bucket_arguments(self, cache, script):
+        """Test that the refill rate is sent per millisecond."""
+        store = RedisRateLimitStore(cache=cache)
+
+        result = await store.check_token_bucket(
+            "client", capacity=10, refill_rate=2
+        )
+
+        assert script.await_args.kwargs["args"] == [10, "0.002"]
+        assert result.limit == 10
+
+    async def test_fails_open_when_redis_unavailable(self, cache, script):
+        """Test that Redis errors allow the request by default."""
+        script.side_effect = ConnectionError("down")
+        store = RedisRateLimitStore(cache=cache)
+
+        result = await store.check_sliding_window(
+            "client", limit=5, window=60
+        )
+
+        assert result.allowed is True
+
+    async def test_fails_closed_when_configured(self, cache, script):
+        """Test that Redis errors deny the request when fail_open=False."""
+        script.side_effect = ConnectionError("down")
+        store = RedisRateLimitStore(cache=cache, fail_open=False)
+
+        result = await store.check_token_bucket(
+            "client", capacity=5, refill_rate=1
+        )
+
+        assert result.allowed is False
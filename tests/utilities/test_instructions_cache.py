@@ -0,0 +1,215 @@
+import pytest
+
+from unittest.mock import Mock
+
+from constants.meal.prompt.instructions import MealInstructionsPrompt
+
+from dtos.services.apis.v1.meal.instructions import InstructionsDTO
+
+from redis import RedisError
+
+from tests.utilities.test_utility_abstraction import TestIUtility
+
+from utilities.instructions_cache import InstructionsCacheUtility
+
+
+class TestInstructionsCacheUtility(TestIUtility):
+
+    @pytest.fixture
+    def ingredients(self):
+        """Ingredients as returned by extract_ingredients."""
+        return [
+            {
+                "foodDescription": "Chicken, breast",
+                "gramWeight": 100,
+                "portionDescription": "1 piece",
+                "amount": 1,
+                "unit": "piece",
+            }
+        ]
+
+    @pytest.fixture
+    def instructions(self):
+        """Generated instructions."""
+        return InstructionsDTO(instructions=[])
+
+    @pytest.fixture
+    def pipeline(self):
+        """Create a mock Redis pipeline reporting the index size."""
+        return Mock(execute=Mock(return_value=[True, 1, 0, 1]))
+
+    @pytest.fixture
+    def cache(self, pipeline):
+        """Create a mock Redis cache."""
+        cache = Mock()
+        cache.get = Mock(return_value=None)
+        cache.pipeline = Mock(return_value=pipeline)
+        return cache
+
+    @pytest.fixture
+    def instructions_cache_utility(self, cache):
+        """Create an InstructionsCacheUtility instance for testing."""
+        return InstructionsCacheUtility(
+            urn="test-urn",
+            cache=cache,
+            ttl_seconds=60,
+            max_entries=2,
+        )
+
+    async def test_build_key_is_stable(self, ingredients):
+        """Test that equivalent meals share a key."""
+        assert InstructionsCacheUtility.build_key(
+            meal_name="Chicken  Curry",
+            ingredients=ingredients,
+        ) == InstructionsCacheUtility.build_key(
+            meal_name=" chicken curry",
+            ingredients=[dict(reversed(ingredients[0].items()))],
+        )
+
+    async def test_build_key_depends_on_content(self, ingredients):
+        """Test that ingredients and prompt version change the key."""
+        key = InstructionsCacheUtility.build_key(
+            meal_name="chicken curry",
+            ingredients=ingredients,
+        )
+
+        assert key.startswith(InstructionsCacheUtility.KEY_PREFIX)
+        assert key != InstructionsCacheUtility.build_key(
+            meal_name="chicken curry",
+            ingredients=[],
+        )
+        assert key != InstructionsCacheUtility.build_key(
+            meal_name="chicken curry",
+            ingredients=ingredients,
+            prompt_version=MealInstructionsPrompt.VERSION + "-next",
+        )
+
+    async def test_get_miss(self, instructions_cache_utility, ingredients):
+        """Test that a miss returns None."""
+        assert instructions_cache_utility.get(
+            meal_name="chicken curry",
+            ingredients=ingredients,
+        ) is None
+
+    async def test_get_hit_refreshes_recency(
+        self,
+        instructions_cache_utility,
+        cache,
+        pipeline,
+        ingredients,
+        instructions,
+    ):
+        """
+        Test that a hit returns the DTO, marks it recently used and
+        extends its TTL.
+        """
+        cache.get = Mock(return_value=instructions.model_dump_json())
+        key = InstructionsCacheUtility.build_key(
+            meal_name="chicken curry",
+            ingredients=ingredients,
+        )
+
+        result = instructions_cache_utility.get(
+            meal_name="chicken curry",
+            ingredients=ingredients,
+        )
+
+        assert result == instructions
+        pipeline.zadd.assert_called_once()
+        assert pipeline.zadd.call_args[0][0] == (
+            InstructionsCacheUtility.INDEX_KEY
+        )
+        pipeline.expire.assert_called_once_with(key, 60)
+        pipeline.execute.assert_called_once()
+
+    async def test_get_redis_error_is_a_miss(
+        self,
+        instructions_cache_utility,
+        cache,
+        ingredients,
+    ):
+        """Test that Redis failures degrade to a miss."""
+        cache.get = Mock(side_effect=RedisError("down"))
+
+        assert instructions_cache_utility.get(
+            meal_name="chicken curry",
+            ingredients=ingredients,
+        ) is None
+
+    async def test_set_stores_with_ttl(
+        self,
+        instructions_cache_utility,
+        cache,
+        pipeline,
+        ingredients,
+        instructions,
+    ):
+        """Test that instructions are stored with the configured TTL."""
+        instructions_cache_utility.set(
+            meal_name="chicken curry",
+            ingredients=ingredients,
+            instructions=instructions,
+        )
+
+        pipeline.set.assert_called_once_with(
+            InstructionsCacheUtility.build_key(
+                meal_name="chicken curry",
+                ingredients=ingredients,
+            ),
+            instructions.model_dump_json(),
+            ex=60,
+        )
+        cache.zpopmin.assert_not_called()
+
+    async def test_set_evicts_least_recently_used(
+        self,
+        instructions_cache_utility,
+        cache,
+        pipeline,
+        ingredients,
+        instructions,
+    ):
+        """Test that entries beyond the cap are evicted oldest first."""
+        pipeline.execute = Mock(side_effect=[[True, 1, 0, 3], [1, 1, 1]])
+        cache.zrange = Mock(return_value=[b"instructions_old", b"a", b"b"])
+        cache.zpopmin = Mock(return_value=[(b"instructions_old", 1.0)])
+
+        instructions_cache_utility.set(
+            meal_name="chicken curry",
+            ingredients=ingredients,
+            instructions=instructions,
+        )
+
+        cache.zpopmin.assert_called_once_with(
+            InstructionsCacheUtility.INDEX_KEY, 1
+        )
+        cache.delete.assert_called_once_with(b"instructions_old")
+
+    async def test_set_prunes_missing_entries_before_evicting(
+        self,
+        instructions_cache_utility,
+        cache,
+        pipeline,
+        ingredients,
+        instructions,
+    ):
+        """
+        Test that index members of missing keys are pruned first and do
+        not push live entries out.
+        """
+        pipeline.execute = Mock(side_effect=[[True, 1, 0, 3], [1, 0, 1]])
+        cache.zrange = Mock(
+            return_value=[b"instructions_old", b"instructions_gone", b"new"]
+        )
+
+        instructions_cache_utility.set(
+            meal_name="chicken curry",
+            ingredients=ingredients,
+            instructions=instructions,
+        )
+
+        cache.zrem.assert_called_once_with(
+            InstructionsCacheUtility.INDEX_KEY, b"instructions_gone"
+        )
+        cache.zpopmin.assert_not_called()
+        cache.delete.assert_not_called()
@@ -0,0 +1,107 @@
+import asyncio
+import pytest
+
+from unittest.mock import AsyncMock, Mock
+
+from errors.service_unavailable_error import ServiceUnavailableError
+
+from tests.utilities.test_utility_abstraction import TestIUtility
+
+from utilities.llm import LLMUtility
+
+
+class TestLLMUtility(TestIUtility):
+
+    @pytest.fixture(autouse=True)
+    def reset_limits(self):
+        """Reset the per-worker LLM limiter between tests."""
+        LLMUtility._semaphore = None
+        LLMUtility._waiting = 0
+        yield
+        LLMUtility._semaphore = None
+        LLMUtility._waiting = 0
+
+    def slow_llm(self, delay: float):
+        """Create a mock LLM whose calls take `delay` seconds."""
+        async def ainvoke(prompt):
+            await asyncio.sleep(delay)
+            return Mock(content=f"response to {prompt}")
+
+        llm = Mock()
+        llm.ainvoke = AsyncMock(side_effect=ainvoke)
+        return llm
+
+    async def test_invoke_returns_content(self):
+        """Test that the response content is returned."""
+        utility = LLMUtility(urn="test-urn", llm=self.slow_llm(0))
+
+        result = await utility.invoke("prompt")
+
+        assert result == "response to prompt"
+        assert not LLMUtility._semaphore.locked()
+
+    async def test_invoke_limits_concurrency(self):
+        """Test that no more than max_concurrency calls run at once."""
+        running = 0
+        peak = 0
+
+        async def ainvoke(prompt):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return Mock(content=prompt)
+
+        llm = Mock()
+        llm.ainvoke = AsyncMock(side_effect=ainvoke)
+
+        await asyncio.gather(*[
+            LLMUtility(
+                urn="test-urn",
+                llm=llm,
+                max_concurrency=2,
+                max_queue_depth=10,
+                timeout_seconds=1,
+            ).invoke(str(index))
+            for index in range(6)
+        ])
+
+        assert peak == 2
+
+    async def test_invoke_rejects_when_queue_full(self):
+        """Test that callers beyond the queue depth fail fast."""
+        llm = self.slow_llm(0.05)
+
+        results = await asyncio.gather(*[
+            LLMUtility(
+                urn="test-urn",
+                llm=llm,
+                max_concurrency=1,
+                max_queue_depth=1,
+                timeout_seconds=1,
+            ).invoke(str(index))
+            for index in range(3)
+        ], return_exceptions=True)
+
+        rejected = [
+            result for result in results
+            if isinstance(result, ServiceUnavailableError)
+        ]
+        assert len(rejected) == 1
+        assert rejected[0].responseKey == "error_llm_queue_full"
+        assert LLMUtility._waiting == 0
+
+    async def test_invoke_times_out(self):
+        """Test that a slow LLM call is cut off at the time budget."""
+        utility = LLMUtility(
+            urn="test-urn",
+            llm=self.slow_llm(1),
+            timeout_seconds=0.01,
+        )
+
+        with pytest.raises(ServiceUnavailableError) as exc_info:
+            await utility.invoke("prompt")
+
+        assert exc_info.value.responseKey == "error_llm_timeout"
+        assert not LLMUtility._semaphore.locked()
@@ -0,0 +1,35 @@
+from datetime import date, datetime, timedelta, timezone
+
+from tests.utilities.test_utility_abstraction import TestIUtility
+
+from utilities.meal_day import MealDayUtility
+
+
+class TestMealDayUtility(TestIUtility):
+
+    async def test_to_utc_converts_aware_timestamps(self):
+        """Test that aware timestamps become naive UTC."""
+        eastern = timezone(timedelta(hours=-5))
+
+        assert MealDayUtility.to_utc(
+            datetime(2025, 1, 2, 21, 30, tzinfo=eastern)
+        ) == datetime(2025, 1, 3, 2, 30)
+
+    async def test_to_utc_keeps_naive_timestamps(self):
+        """Test that naive timestamps are taken as UTC."""
+        assert MealDayUtility.to_utc(datetime(2025, 1, 2, 21, 30)) == (
+            datetime(2025, 1, 2, 21, 30)
+        )
+
+    async def test_day_of_crosses_midnight_in_utc(self):
+        """Test that the day is the UTC day, whatever the offset."""
+        eastern = timezone(timedelta(hours=-5))
+        created_on = datetime(2025, 1, 2, 21, 30, tzinfo=eastern)
+
+        assert MealDayUtility.day_of(created_on) == date(2025, 1, 3)
+        assert MealDayUtility.day_of(
+            created_on.astimezone(timezone.utc)
+        ) == date(2025, 1, 3)
+        assert MealDayUtility.day_of(
+            created_on.astimezone(timezone.utc).replace(tzinfo=None)
+        ) == date(2025, 1, 3)
@@ -0,0 +1,274 @@
+import json
+import pytest
+import time
+
+from redis import RedisError
+from unittest.mock import Mock
+
+from tests.utilities.test_utility_abstraction import TestIUtility
+
+from utilities.meal_details_cache import MealDetailsCacheUtility
+
+
+class TestMealDetailsCacheUtility(TestIUtility):
+
+    @pytest.fixture
+    def details(self):
+        """Per-serving meal details."""
+        return {"meal_name": "dal", "total_calories_per_serving": 180}
+
+    @pytest.fixture
+    def entry(self, details):
+        """A fresh cache entry of the details."""
+        return json.dumps(
+            {"fresh_until": time.time() + 3600, "details": details}
+        )
+
+    @pytest.fixture
+    def cache(self):
+        """Create a mock Redis cache."""
+        cache = Mock()
+        cache.get = Mock(return_value=None)
+        return cache
+
+    @pytest.fixture
+    def subscribed(self):
+        """Enable the local tier, as when the listener is subscribed."""
+        MealDetailsCacheUtility.clear_local()
+        MealDetailsCacheUtility._subscribed = True
+        yield
+        MealDetailsCacheUtility._subscribed = False
+        MealDetailsCacheUtility.clear_local()
+
+    @pytest.fixture
+    def meal_details_cache(self, cache):
+        """Create a MealDetailsCacheUtility instance for testing."""
+        return MealDetailsCacheUtility(
+            urn="test-urn",
+            cache=cache,
+            ttl_seconds=3600,
+            soft_ttl_seconds=600,
+            refresh_lock_seconds=30,
+            local_ttl_seconds=60,
+            local_max_entries=2,
+        )
+
+    async def test_build_key_is_normalized_and_versioned(self):
+        """Test that case and whitespace variants share one key."""
+        assert MealDetailsCacheUtility.build_key("  Chicken   Curry ") == (
+            "meal_details_v2_chicken curry"
+        )
+
+    async def test_set_writes_redis_with_ttl_and_publishes(
+        self,
+        meal_details_cache,
+        cache,
+        details,
+    ):
+        """Test that writes expire and are broadcast to other workers."""
+        meal_details_cache.set("Dal", details)
+
+        key, payload = cache.set.call_args.args
+        assert key == "meal_details_v2_dal"
+        envelope = MealDetailsCacheUtility.DEFAULT_CODEC.decode(payload)
+        assert envelope["details"] == details
+        assert envelope["fresh_until"] == pytest.approx(
+            time.time() + 600, abs=5
+        )
+        assert cache.set.call_args.kwargs["ex"] == 3600
+        channel, message = cache.publish.call_args.args
+        assert channel == MealDetailsCacheUtility.CHANNEL
+        assert message.endswith(":meal_details_v2_dal")
+
+    async def test_local_tier_unused_when_not_subscribed(
+        self,
+        meal_details_cache,
+        cache,
+        details,
+        entry,
+    ):
+        """Test that every read goes to Redis without invalidations."""
+        cache.get = Mock(return_value=entry)
+
+        meal_details_cache.get("dal")
+        meal_details_cache.get("dal")
+
+        assert cache.get.call_count == 2
+
+    async def test_local_hit_skips_redis(
+        self,
+        subscribed,
+        meal_details_cache,
+        cache,
+        details,
+        entry,
+    ):
+        """Test that a hot meal is served without a network hop."""
+        cache.get = Mock(return_value=entry)
+
+        assert meal_details_cache.get("dal") == details
+        assert meal_details_cache.get("DAL ") == details
+        cache.get.assert_called_once_with("meal_details_v2_dal")
+
+    async def test_local_entries_expire(
+        self,
+        subscribed,
+        cache,
+        details,
+        entry,
+    ):
+        """Test that local entries are reread after the local TTL."""
+        meal_details_cache = MealDetailsCacheUtility(
+            cache=cache, local_ttl_seconds=0
+        )
+        cache.get = Mock(return_value=entry)
+
+        meal_details_cache.get("dal")
+        meal_details_cache.get("dal")
+
+        assert cache.get.call_count == 2
+
+    async def test_local_tier_evicts_least_recently_used(
+        self,
+        subscribed,
+        meal_details_cache,
+        details,
+    ):
+        """Test that the local tier is capped at local_max_entries."""
+        meal_details_cache.set("dal", details)
+        meal_details_cache.set("rice", details)
+        meal_details_cache.get("dal")
+        meal_details_cache.set("roti", details)
+
+        assert list(MealDetailsCacheUtility._local) == [
+            "meal_details_v2_dal", "meal_details_v2_roti"
+        ]
+
+    async def test_invalidate_clears_every_tier(
+        self,
+        subscribed,
+        meal_details_cache,
+        cache,
+        details,
+    ):
+        """Test that invalidation deletes, evicts and publishes."""
+        meal_details_cache.set("dal", details)
+
+        meal_details_cache.invalidate("Dal")
+
+        assert "meal_details_v2_dal" not in MealDetailsCacheUtility._local
+        cache.delete.assert_called_once_with("meal_details_v2_dal")
+        assert cache.publish.call_count == 2
+
+    async def test_evict_ignores_own_messages(
+        self,
+        subscribed,
+        meal_details_cache,
+        details,
+    ):
+        """Test that only other workers' messages evict local entries."""
+        meal_details_cache.set("dal", details)
+        key = "meal_details_v2_dal"
+
+        MealDetailsCacheUtility.evict(
+            f"{MealDetailsCacheUtility._worker_id}:{key}"
+        )
+        assert key in MealDetailsCacheUtility._local
+
+        MealDetailsCacheUtility.evict(f"other:{key}".encode("utf-8"))
+        assert key not in MealDetailsCacheUtility._local
+
+    async def test_lookup_reports_staleness(
+        self,
+        meal_details_cache,
+        cache,
+        details,
+    ):
+        """Test that entries past their soft TTL are returned as stale."""
+        cache.get = Mock(return_value=json.dumps(
+            {"fresh_until": time.time() - 1, "details": details}
+        ))
+
+        assert meal_details_cache.lookup("dal") == (details, True)
+
+    async def test_lookup_fresh(self, meal_details_cache, cache, entry):
+        """Test that entries within their soft TTL are fresh."""
+        cache.get = Mock(return_value=entry)
+
+        _, stale = meal_details_cache.lookup("dal")
+
+        assert stale is False
+
+    async def test_lookup_miss(self, meal_details_cache):
+        """Test that a miss is neither details nor stale."""
+        assert meal_details_cache.lookup("dal") == (None, False)
+
+    async def test_older_layout_is_a_miss(
+        self,
+        meal_details_cache,
+        cache,
+        details,
+    ):
+        """Test that bare details without an envelope are not served."""
+        cache.get = Mock(return_value=json.dumps(details))
+
+        assert meal_details_cache.get("dal") is None
+
+    @pytest.mark.parametrize(
+        "acquired, expected",
+        [(True, True), (None, False)],
+    )
+    async def test_acquire_refresh(
+        self,
+        meal_details_cache,
+        cache,
+        acquired,
+        expected,
+    ):
+        """Test that only the caller winning the lock refreshes."""
+        cache.set = Mock(return_value=acquired)
+
+        assert meal_details_cache.acquire_refresh(" Dal ") is expected
+        cache.set.assert_called_once_with(
+            "meal_details_refresh_v2_dal",
+            MealDetailsCacheUtility._worker_id,
+            nx=True,
+            ex=30,
+        )
+
+    async def test_acquire_refresh_redis_error(
+        self,
+        meal_details_cache,
+        cache,
+    ):
+        """Test that nobody refreshes while Redis is unavailable."""
+        cache.set = Mock(side_effect=RedisError("down"))
+
+        assert meal_details_cache.acquire_refresh("dal") is False
+
+    async def test_redis_error_is_a_miss(self, meal_details_cache, cache):
+        """Test that Redis failures fall back to fetching the meal."""
+        cache.get = Mock(side_effect=RedisError("down"))
+
+        assert meal_details_cache.get("dal") is None
+
+    async def test_unreadable_entry_is_a_miss(
+        self,
+        meal_details_cache,
+        cache,
+    ):
+        """Test that a corrupt payload is refetched instead of failing."""
+        cache.get = Mock(return_value=b"\x02garbage")
+
+        assert meal_details_cache.get("dal") is None
+
+    async def test_redis_write_error_is_ignored(
+        self,
+        meal_details_cache,
+        cache,
+        details,
+    ):
+        """Test that a failed write does not fail the request."""
+        cache.set = Mock(side_effect=RedisError("down"))
+
+        meal_details_cache.set("dal", details)
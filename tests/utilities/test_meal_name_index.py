@@ -0,0 +1,96 @@
+import pytest
+
+from unittest.mock import Mock
+
+from tests.utilities.test_utility_abstraction import TestIUtility
+
+from utilities.meal_name_index import MealNameIndexUtility
+
+
+class TestMealNameIndexUtility(TestIUtility):
+
+    @pytest.fixture(autouse=True)
+    def reset_meal_name_index(self):
+        """Start every test with an empty meal name index."""
+        MealNameIndexUtility.reset()
+        yield
+        MealNameIndexUtility.reset()
+
+    @pytest.fixture
+    def meal_name_index(self):
+        """Create a MealNameIndexUtility instance for testing."""
+        return MealNameIndexUtility(
+            urn="test-urn",
+            max_names=3,
+            refresh_seconds=60,
+        )
+
+    async def test_unloaded_index_is_stale(self, meal_name_index):
+        """Test that a fresh index must be loaded before use."""
+        assert meal_name_index.is_stale is True
+        assert meal_name_index.is_usable is False
+
+    async def test_load_deduplicates(self, meal_name_index):
+        """Test that duplicate names are stored once."""
+        assert meal_name_index.load(
+            ["chicken curry", "chicken curry", "dal"]
+        ) is True
+
+        assert meal_name_index.is_stale is False
+        assert meal_name_index.stats()["size"] == 2
+
+    async def test_load_over_cap_is_unusable(self, meal_name_index):
+        """Test that a vocabulary over max_names is not kept."""
+        assert meal_name_index.load(["a", "b", "c", "d"]) is False
+
+        assert meal_name_index.is_usable is False
+        assert meal_name_index.stats()["oversized"] is True
+
+    async def test_add_is_shared_across_instances(self, meal_name_index):
+        """Test that added names are visible to every instance."""
+        meal_name_index.load(["chicken curry"])
+
+        MealNameIndexUtility(urn="other-urn").add("paneer tikka")
+
+        assert meal_name_index.search("paneer tika")[0][0] == "paneer tikka"
+
+    async def test_add_before_load_is_ignored(self, meal_name_index):
+        """Test that names are not added to an unloaded index."""
+        meal_name_index.add("paneer tikka")
+
+        assert meal_name_index.stats()["size"] == 0
+
+    async def test_add_past_cap_marks_stale(self, meal_name_index):
+        """Test that a full index is reloaded rather than grown."""
+        meal_name_index.load(["a", "b", "c"])
+
+        meal_name_index.add("d")
+
+        assert meal_name_index.is_stale is True
+
+    async def test_search_tracks_hits_and_misses(self, meal_name_index):
+        """Test that searches are counted as hits or misses."""
+        meal_name_index.load(["chicken curry", "dal makhani"])
+
+        matches = meal_name_index.search("chiken curry", threshold=80)
+        meal_name_index.search("pizza", threshold=80)
+
+        assert matches[0][0] == "chicken curry"
+        stats = meal_name_index.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["memory_bytes"] > 0
+
+    async def test_reload_logs_stats(self, meal_name_index):
+        """Test that each reload logs the counters of the index."""
+        meal_name_index.load(["chicken curry"])
+        meal_name_index.search("chiken curry", threshold=80)
+        meal_name_index.logger = Mock()
+
+        meal_name_index.load(["chicken curry", "dal makhani"])
+
+        logged = meal_name_index.logger.info.call_args.args[0]
+        assert logged.startswith("Meal name index stats: ")
+        assert "'size': 2" in logged
+        assert "'hits': 1" in logged
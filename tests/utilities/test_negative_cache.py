@@ -0,0 +1,168 @@
+import asyncio
+import json
+import pytest
+
+from http import HTTPStatus
+from redis import RedisError
+from unittest.mock import AsyncMock, patch
+
+from errors.bad_input_error import BadInputError
+from errors.not_found_error import NotFoundError
+from errors.unexpected_response_error import UnexpectedResponseError
+
+from tests.utilities.test_utility_abstraction import TestIUtility
+
+from utilities.negative_cache import NegativeCacheUtility
+
+
+class TestNegativeCacheUtility(TestIUtility):
+
+    @pytest.fixture(autouse=True)
+    def counters(self):
+        """Start every test from zeroed counters."""
+        NegativeCacheUtility.reset()
+        yield
+        NegativeCacheUtility.reset()
+
+    @pytest.fixture
+    def cache(self):
+        """Create a mock async Redis cache."""
+        cache = AsyncMock()
+        cache.get = AsyncMock(return_value=None)
+        return cache
+
+    @pytest.fixture
+    def negative_cache(self, cache):
+        """Create a NegativeCacheUtility instance for testing."""
+        return NegativeCacheUtility(
+            urn="test-urn",
+            cache=cache,
+            not_found_ttl_seconds=600,
+            invalid_response_ttl_seconds=60,
+        )
+
+    @pytest.fixture
+    def not_found(self):
+        return NotFoundError(
+            responseMessage="No meal data found",
+            responseKey="error_no_meal_data_found",
+            httpStatusCode=HTTPStatus.NOT_FOUND,
+        )
+
+    async def test_build_key_is_normalized(self):
+        """Test that case and whitespace variants share one key."""
+        assert NegativeCacheUtility.build_key("  Xyz   Dish ") == (
+            "usda_negative_xyz dish"
+        )
+
+    async def test_set_stores_not_found_with_its_ttl(
+        self, negative_cache, cache, not_found
+    ):
+        """Test a not-found search is cached for the not-found TTL."""
+        await negative_cache.set("Xyz Dish", not_found)
+
+        key, value = cache.set.call_args.args
+        assert key == "usda_negative_xyz dish"
+        assert cache.set.call_args.kwargs["ex"] == 600
+        assert NegativeCacheUtility.DEFAULT_CODEC.decode(value)["reason"] == (
+            NegativeCacheUtility.NOT_FOUND
+        )
+        assert negative_cache.stats()["stores"] == {
+            "not_found": 1,
+            "invalid_response": 0,
+        }
+
+    async def test_set_stores_invalid_json_with_its_ttl(
+        self, negative_cache, cache
+    ):
+        """Test a malformed response is cached for the shorter TTL."""
+        await negative_cache.set(
+            "dal",
+            UnexpectedResponseError(
+                responseMessage="Invalid JSON response",
+                responseKey="error_invalid_json",
+                httpStatusCode=HTTPStatus.OK,
+            ),
+        )
+
+        assert cache.set.call_args.kwargs["ex"] == 60
+        assert negative_cache.stats()["stores"]["invalid_response"] == 1
+
+    async def test_set_ignores_other_errors(self, negative_cache, cache):
+        """Test errors other than not-found or invalid JSON are not kept."""
+        await negative_cache.set(
+            "dal",
+            BadInputError(
+                responseMessage="HTTP error occurred",
+                responseKey="error_http_error",
+                httpStatusCode=HTTPStatus.TOO_MANY_REQUESTS,
+            ),
+        )
+
+        cache.set.assert_not_awaited()
+
+    async def test_get_rebuilds_cached_error(
+        self, negative_cache, cache, not_found
+    ):
+        """Test a hit returns the original error and is counted."""
+        await negative_cache.set("dal", not_found)
+        cache.get = AsyncMock(return_value=cache.set.call_args.args[1])
+
+        error = await negative_cache.get("Dal")
+
+        assert isinstance(error, NotFoundError)
+        assert error.responseKey == "error_no_meal_data_found"
+        assert error.httpStatusCode == HTTPStatus.NOT_FOUND
+        assert negative_cache.stats()["hits"]["not_found"] == 1
+
+    @pytest.mark.parametrize(
+        "cached",
+        [None, json.dumps({"fresh_until": 0, "details": {}}), b"\x01{"],
+    )
+    async def test_get_misses(self, negative_cache, cache, cached):
+        """Test absent, foreign and unreadable entries are misses."""
+        cache.get = AsyncMock(return_value=cached)
+
+        assert await negative_cache.get("dal") is None
+        assert negative_cache.stats()["hits"] == {
+            "not_found": 0,
+            "invalid_response": 0,
+        }
+
+    async def test_bypass_drops_entry(self, negative_cache, cache):
+        """Test a bypass deletes the entry and is counted."""
+        await negative_cache.bypass("Dal")
+
+        cache.delete.assert_awaited_once_with("usda_negative_dal")
+        assert negative_cache.stats()["bypasses"] == 1
+
+    async def test_redis_errors_are_swallowed(
+        self, negative_cache, cache, not_found
+    ):
+        """Test Redis failures degrade to calling USDA."""
+        cache.get = AsyncMock(side_effect=RedisError("down"))
+        cache.set = AsyncMock(side_effect=RedisError("down"))
+        cache.delete = AsyncMock(side_effect=RedisError("down"))
+
+        assert await negative_cache.get("dal") is None
+        await negative_cache.set("dal", not_found)
+        await negative_cache.bypass("dal")
+
+        assert negative_cache.stats()["stores"]["not_found"] == 0
+
+    async def test_report_logs_stats_periodically(
+        self, negative_cache, not_found
+    ):
+        """Test the reporter logs the counters after each interval."""
+        await negative_cache.set("dal", not_found)
+        sleep = AsyncMock(side_effect=[None, asyncio.CancelledError()])
+
+        with patch("utilities.negative_cache.asyncio.sleep", sleep), \
+                patch("utilities.negative_cache.logger") as logger:
+            with pytest.raises(asyncio.CancelledError):
+                await NegativeCacheUtility.report(interval_seconds=30)
+
+        sleep.assert_awaited_with(30)
+        logged = logger.info.call_args.args[0]
+        assert logged.startswith("Negative cache stats: ")
+        assert "'not_found': 1" in logged
@@ -0,0 +1,81 @@
+import pytest
+
+from constants.meal.nutrients import Nutrients
+
+from models.meal_log import MealLog
+
+from tests.utilities.test_utility_abstraction import TestIUtility
+
+from utilities.nutrient_vector import NutrientVectorUtility
+
+
+class TestNutrientVectorUtility(TestIUtility):
+
+    @pytest.fixture
+    def nutrients(self):
+        return {
+            "macros": [
+                {"name": "Protein", "amount": 12.5, "unit": "G"},
+                {"name": "Carbohydrate, by difference", "amount": 30,
+                 "unit": "G"},
+            ],
+            "micros": [
+                {"name": "Vitamin B-12", "amount": 0.6, "unit": "UG"},
+                {"name": "Sodium, Na", "amount": 410, "unit": "MG"},
+            ],
+        }
+
+    async def test_round_trip(self, nutrients):
+        """
+        Test that decoding restores the API nutrient lists, in catalog order.
+        """
+        vector = NutrientVectorUtility.encode(nutrients)
+
+        assert len(vector) == len(Nutrients.VECTOR)
+        assert NutrientVectorUtility.decode(vector) == nutrients
+
+    async def test_encode_converts_mass_units(self):
+        """Test that amounts are stored in the catalog unit."""
+        vector = NutrientVectorUtility.encode({
+            "micros": [{"name": "Sodium, Na", "amount": 0.5, "unit": "g"}],
+        })
+
+        position = Nutrients.VECTOR.index("Sodium, Na")
+        assert vector[position] == 500.0
+
+    async def test_encode_skips_untracked_and_unconvertible(self):
+        """Test that nutrients outside the catalog are left out."""
+        vector = NutrientVectorUtility.encode({
+            "micros": [
+                {"name": "Caffeine", "amount": 80, "unit": "MG"},
+                {"name": "Vitamin A, RAE", "amount": 100, "unit": "IU"},
+            ],
+        })
+
+        assert not any(vector)
+        assert NutrientVectorUtility.decode(vector) == {
+            "macros": [], "micros": []
+        }
+
+    async def test_decode_short_vector(self):
+        """Test that vectors shorter than the catalog decode."""
+        assert NutrientVectorUtility.decode([0.0, 3.0]) == {
+            "macros": [
+                {"name": "Total lipid (fat)", "amount": 3.0, "unit": "G"}
+            ],
+            "micros": [],
+        }
+
+    async def test_none(self):
+        """Test that missing nutrients stay missing."""
+        assert NutrientVectorUtility.encode(None) is None
+        assert NutrientVectorUtility.decode(None) is None
+
+    async def test_meal_log_nutrients_property(self, nutrients):
+        """Test that MealLog reads and writes nutrients as the vector."""
+        meal_log = MealLog(nutrients=nutrients)
+
+        assert meal_log.nutrient_vector == (
+            NutrientVectorUtility.encode(nutrients)
+        )
+        assert meal_log.nutrients == nutrients
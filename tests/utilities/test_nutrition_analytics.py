@@ -0,0 +1,151 @@
+import datetime
+import pytest
+
+from types import SimpleNamespace
+
+from tests.utilities.test_utility_abstraction import TestIUtility
+
+from utilities.nutrient_vector import NutrientVectorUtility
+from utilities.nutrition_analytics import NutritionAnalyticsUtility
+
+
+def meal_row(created_on, servings, total_calories, macros, micros=()):
+    return SimpleNamespace(
+        servings=servings,
+        nutrient_vector=NutrientVectorUtility.encode(
+            {"macros": list(macros), "micros": list(micros)}
+        ),
+        total_calories=total_calories,
+        calories_unit="KCAL",
+        created_on=created_on,
+    )
+
+
+class TestNutritionAnalyticsUtility(TestIUtility):
+
+    @pytest.fixture
+    def nutrition_analytics(self):
+        """Create a NutritionAnalyticsUtility instance for testing."""
+        return NutritionAnalyticsUtility(urn="test-urn")
+
+    @pytest.fixture
+    def meal_logs(self):
+        monday = datetime.datetime(2024, 1, 1, 8, 0)
+        protein = {"name": "Protein", "amount": 10, "unit": "G"}
+        sodium = {"name": "Sodium, Na", "amount": 100, "unit": "MG"}
+        return [
+            meal_row(monday, 2, 500, [protein], [sodium]),
+            meal_row(monday.replace(hour=20), 1, 300, [protein]),
+            meal_row(
+                monday + datetime.timedelta(days=8),
+                1,
+                200,
+                [{"name": "Protein", "amount": 5, "unit": "G"}],
+                [{"name": "Caffeine", "amount": 80, "unit": "MG"}],
+            ),
+        ]
+
+    async def test_build_frame_scales_by_servings(
+        self,
+        nutrition_analytics,
+        meal_logs,
+    ):
+        """Test that nutrients are per serving and calories are totals."""
+        frame = nutrition_analytics.build_frame(meal_logs)
+
+        assert list(frame.columns) == NutritionAnalyticsUtility.COLUMNS
+        assert frame["Protein"].tolist() == [20.0, 10.0, 5.0]
+        assert frame["Sodium, Na"].tolist() == [200.0, 0.0, 0.0]
+        assert frame["Calories"].tolist() == [500.0, 300.0, 200.0]
+        assert "Caffeine" not in frame.columns
+
+    async def test_build_frame_accepts_short_vectors(
+        self,
+        nutrition_analytics,
+    ):
+        """Test that vectors shorter than the catalog are zero-padded."""
+        meal_log = SimpleNamespace(
+            servings=1,
+            nutrient_vector=[4.0, 2.0],
+            total_calories=100,
+            created_on=datetime.datetime(2024, 1, 1),
+        )
+
+        frame = nutrition_analytics.build_frame([meal_log])
+
+        assert frame.iloc[0].tolist()[:4] == [100.0, 4.0, 2.0, 0.0]
+
+    async def test_compute_stats(self, nutrition_analytics, meal_logs):
+        """Test daily, weekly and rolling statistics."""
+        stats = nutrition_analytics.compute_stats(
+            meal_logs=meal_logs,
+            from_date=datetime.date(2024, 1, 1),
+            to_date=datetime.date(2024, 1, 10),
+            window=3,
+        )
+
+        assert {"name": "Sodium, Na", "unit": "MG"} in stats["nutrients"]
+
+        daily = stats["daily"]
+        assert daily["dates"][0] == "2024-01-01"
+        assert len(daily["dates"]) == 10
+        assert daily["totals"]["Protein"] == [
+            30.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 5.0, 0.0
+        ]
+        assert daily["rolling_averages"]["Calories"][:3] == [
+            800.0, 400.0, 266.6667
+        ]
+        assert stats["weekly"]["weeks"] == ["2024-01-01", "2024-01-08"]
+        assert stats["weekly"]["totals"]["Calories"] == [800.0, 200.0]
+        # The second week has three days in the range.
+        assert stats["weekly"]["daily_averages"]["Calories"] == [
+            114.2857, 66.6667
+        ]
+        assert stats["totals"]["Calories"] == 1000.0
+        assert stats["daily_averages"]["Protein"] == 3.5
+
+    async def test_compute_stats_with_aware_timestamps(
+        self,
+        nutrition_analytics,
+    ):
+        """
+        Test that aware timestamps, as read from the database, are counted
+        on their UTC day.
+        """
+        eastern = datetime.timezone(datetime.timedelta(hours=-5))
+        protein = {"name": "Protein", "amount": 10, "unit": "G"}
+        meal_logs = [
+            meal_row(
+                datetime.datetime(
+                    2024, 1, 1, 8, 0, tzinfo=datetime.timezone.utc
+                ),
+                1, 500, [protein],
+            ),
+            meal_row(
+                datetime.datetime(2024, 1, 1, 21, 0, tzinfo=eastern),
+                1, 300, [protein],
+            ),
+        ]
+
+        stats = nutrition_analytics.compute_stats(
+            meal_logs=meal_logs,
+            from_date=datetime.date(2024, 1, 1),
+            to_date=datetime.date(2024, 1, 2),
+            window=7,
+        )
+
+        assert stats["daily"]["totals"]["Calories"] == [500.0, 300.0]
+        assert stats["totals"]["Protein"] == 20.0
+
+    async def test_compute_stats_without_meals(self, nutrition_analytics):
+        """Test that a range without meals is all zeros."""
+        stats = nutrition_analytics.compute_stats(
+            meal_logs=[],
+            from_date=datetime.date(2024, 1, 1),
+            to_date=datetime.date(2024, 1, 2),
+            window=7,
+        )
+
+        assert stats["daily"]["dates"] == ["2024-01-01", "2024-01-02"]
+        assert stats["daily"]["totals"]["Calories"] == [0.0, 0.0]
+        assert stats["totals"]["Protein"] == 0.0
@@ -0,0 +1,76 @@
+import pytest
+
+from redis import RedisError
+from unittest.mock import AsyncMock
+
+from tests.utilities.test_utility_abstraction import TestIUtility
+
+from utilities.session_state import SessionStateUtility
+
+
+class TestSessionStateUtility(TestIUtility):
+
+    @pytest.fixture
+    def cache(self):
+        """Create a mock async Redis cache."""
+        cache = AsyncMock()
+        cache.get = AsyncMock(return_value=None)
+        return cache
+
+    @pytest.fixture
+    def session_state_utility(self, cache):
+        """Create a SessionStateUtility instance for testing."""
+        return SessionStateUtility(
+            urn="test-urn",
+            cache=cache,
+            ttl_seconds=60,
+        )
+
+    async def test_get_miss(self, session_state_utility, cache):
+        """Test that an uncached user returns None."""
+        assert await session_state_utility.get(user_id=1) is None
+        cache.get.assert_awaited_once_with("user_session_state_1")
+
+    @pytest.mark.parametrize(
+        "cached, expected",
+        [(b"1", True), (b"0", False)],
+    )
+    async def test_get_hit(
+        self,
+        session_state_utility,
+        cache,
+        cached,
+        expected,
+    ):
+        """Test that cached logged-in and logged-out states are read."""
+        cache.get = AsyncMock(return_value=cached)
+
+        assert await session_state_utility.get(user_id=1) is expected
+
+    async def test_get_redis_error_is_a_miss(
+        self,
+        session_state_utility,
+        cache,
+    ):
+        """Test that Redis failures fall back to the database path."""
+        cache.get = AsyncMock(side_effect=RedisError("down"))
+
+        assert await session_state_utility.get(user_id=1) is None
+
+    async def test_set_uses_ttl(self, session_state_utility, cache):
+        """Test that the state is cached with the configured TTL."""
+        await session_state_utility.set(user_id=1, is_logged_in=False)
+
+        cache.set.assert_awaited_once_with(
+            "user_session_state_1", b"0", ex=60
+        )
+
+    async def test_fill_does_not_overwrite(
+        self, session_state_utility, cache
+    ):
+        """Test that a database read only fills a missing entry."""
+        await session_state_utility.fill(user_id=1, is_logged_in=True)
+
+        cache.set.assert_awaited_once_with(
+            "user_session_state_1", b"1", ex=60, nx=True
+        )
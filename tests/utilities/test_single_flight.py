@@ -0,0 +1,227 @@
+import asyncio
+import json
+import pytest
+
+from http import HTTPStatus
+from unittest.mock import AsyncMock, Mock
+
+from errors.not_found_error import NotFoundError
+
+from tests.utilities.test_utility_abstraction import TestIUtility
+
+from utilities.single_flight import SingleFlightUtility
+
+
+class TestSingleFlightUtility(TestIUtility):
+
+    @pytest.fixture
+    def lock(self):
+        """Create a mock Redis lock."""
+        lock = Mock()
+        lock.acquire = Mock(return_value=True)
+        lock.release = Mock(return_value=None)
+        return lock
+
+    @pytest.fixture
+    def cache(self, lock):
+        """Create a mock Redis cache."""
+        cache = Mock()
+        cache.get = Mock(return_value=None)
+        cache.set = Mock(return_value=True)
+        cache.exists = Mock(return_value=1)
+        cache.lock = Mock(return_value=lock)
+        return cache
+
+    @pytest.fixture
+    def single_flight_utility(self, cache):
+        """Create a SingleFlightUtility instance for testing."""
+        return SingleFlightUtility(
+            urn="test-urn",
+            user_urn="test-user-urn",
+            api_name="TEST_API",
+            user_id="123",
+            cache=cache,
+            wait_timeout_seconds=0.05,
+            poll_interval_seconds=0.01,
+        )
+
+    async def test_normalize_key(self):
+        """Test that equivalent meal names normalize to the same key."""
+        assert SingleFlightUtility.normalize_key("  Chicken   Curry ") == (
+            "chicken curry"
+        )
+
+    async def test_concurrent_calls_share_one_execution(self):
+        """Test that concurrent callers in a worker share one call."""
+        utility = SingleFlightUtility(urn="test-urn")
+        calls = 0
+
+        async def search():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"foods": [calls]}
+
+        results = await asyncio.gather(
+            *[utility.run(key="chicken curry", callable=search)
+              for _ in range(5)]
+        )
+
+        assert calls == 1
+        assert all(result == {"foods": [1]} for result in results)
+
+    async def test_different_keys_are_not_coalesced(self):
+        """Test that different keys run independently."""
+        utility = SingleFlightUtility(urn="test-urn")
+        search = AsyncMock(return_value={"foods": []})
+
+        await asyncio.gather(
+            utility.run(key="chicken curry", callable=search),
+            utility.run(key="paneer tikka", callable=search),
+        )
+
+        assert search.await_count == 2
+
+    async def test_error_is_shared_with_joined_callers(self):
+        """Test that a failing call raises for every joined caller."""
+        utility = SingleFlightUtility(urn="test-urn")
+
+        async def search():
+            await asyncio.sleep(0.01)
+            raise NotFoundError(
+                responseMessage="Resource not found",
+                responseKey="error_not_found",
+                httpStatusCode=HTTPStatus.NOT_FOUND,
+            )
+
+        results = await asyncio.gather(
+            utility.run(key="chicken curry", callable=search),
+            utility.run(key="chicken curry", callable=search),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, NotFoundError) for result in results)
+        assert "chicken curry" not in SingleFlightUtility._in_flight
+
+    async def test_joined_callers_retry_when_leader_is_cancelled(self):
+        """Test that cancelling the running caller does not cancel the
+        callers that joined it."""
+        utility = SingleFlightUtility(urn="test-urn")
+        calls = 0
+
+        async def search():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"foods": [calls]}
+
+        leader = asyncio.create_task(
+            utility.run(key="chicken curry", callable=search)
+        )
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(
+            utility.run(key="chicken curry", callable=search)
+        )
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        assert await follower == {"foods": [2]}
+        assert leader.cancelled()
+        assert "chicken curry" not in SingleFlightUtility._in_flight
+
+    async def test_leader_shares_result_and_releases_lock(
+        self,
+        single_flight_utility,
+        cache,
+        lock,
+    ):
+        """Test that the lock holder publishes its result."""
+        search = AsyncMock(return_value={"foods": ["biryani"]})
+
+        result = await single_flight_utility.run(
+            key="usda_search_biryani",
+            callable=search,
+        )
+
+        assert result == {"foods": ["biryani"]}
+        search.assert_awaited_once()
+        cache.set.assert_called_once()
+        assert cache.set.call_args[0][0] == (
+            "single_flight_result_usda_search_biryani"
+        )
+        assert json.loads(cache.set.call_args[0][1]) == result
+        lock.release.assert_called_once()
+
+    async def test_existing_shared_result_skips_call(
+        self,
+        single_flight_utility,
+        cache,
+    ):
+        """Test that a published result is reused without a call."""
+        cache.get = Mock(return_value=json.dumps({"foods": ["cached"]}))
+        search = AsyncMock()
+
+        result = await single_flight_utility.run(
+            key="usda_search_biryani",
+            callable=search,
+        )
+
+        assert result == {"foods": ["cached"]}
+        search.assert_not_awaited()
+
+    async def test_follower_waits_for_leader_result(
+        self,
+        single_flight_utility,
+        cache,
+        lock,
+    ):
+        """Test that a follower picks up the leader's result."""
+        lock.acquire = Mock(return_value=False)
+        cache.get = Mock(
+            side_effect=[None, None, json.dumps({"foods": ["leader"]})]
+        )
+        search = AsyncMock()
+
+        result = await single_flight_utility.run(
+            key="usda_search_biryani",
+            callable=search,
+        )
+
+        assert result == {"foods": ["leader"]}
+        search.assert_not_awaited()
+
+    async def test_follower_calls_directly_when_leader_gone(
+        self,
+        single_flight_utility,
+        cache,
+        lock,
+    ):
+        """Test that a follower falls back when the lock disappears."""
+        lock.acquire = Mock(return_value=False)
+        cache.exists = Mock(return_value=0)
+        search = AsyncMock(return_value={"foods": ["direct"]})
+
+        result = await single_flight_utility.run(
+            key="usda_search_biryani",
+            callable=search,
+        )
+
+        assert result == {"foods": ["direct"]}
+        search.assert_awaited_once()
+
+    async def test_follower_calls_directly_after_wait_timeout(
+        self,
+        single_flight_utility,
+        lock,
+    ):
+        """Test that a follower does not wait past the timeout."""
+        lock.acquire = Mock(return_value=False)
+        search = AsyncMock(return_value={"foods": ["direct"]})
+
+        result = await single_flight_utility.run(
+            key="usda_search_biryani",
+            callable=search,
+        )
+
+        assert result == {"foods": ["direct"]}
+        search.assert_awaited_once()
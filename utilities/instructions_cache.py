@@ -0,0 +1,197 @@
+"""
+Utility for caching LLM-generated cooking instructions in Redis, keyed by a
+content hash of the meal, its ingredients and the prompt version.
+"""
+import hashlib
+import json
+import time
+
+from redis import Redis, RedisError
+from typing import Any, Dict, List
+
+from abstractions.utility import IUtility
+
+from constants.meal.prompt.instructions import MealInstructionsPrompt
+
+from dtos.services.apis.v1.meal.instructions import InstructionsDTO
+
+from start_utils import cache_configuration
+
+
+class InstructionsCacheUtility(IUtility):
+    """
+    Utility for reading and writing generated instructions.
+
+    Entries expire `ttl_seconds` after they were last read or written. A
+    sorted set indexes every entry by its last access time, so once more
+    than `max_entries` are stored the least recently used ones are evicted.
+    Index members whose entry is gone, e.g. evicted by Redis itself, are
+    pruned before evicting anything.
+    """
+    KEY_PREFIX: str = "instructions_"
+    INDEX_KEY: str = "instructions_index"
+
+    def __init__(
+        self,
+        urn: str = None,
+        user_urn: str = None,
+        api_name: str = None,
+        user_id: str = None,
+        cache: Redis = None,
+        ttl_seconds: int = cache_configuration.instructions.ttl_seconds,
+        max_entries: int = cache_configuration.instructions.max_entries,
+    ) -> None:
+        super().__init__(
+            urn=urn,
+            user_urn=user_urn,
+            api_name=api_name,
+            user_id=user_id,
+        )
+        self._urn: str = urn
+        self._user_urn: str = user_urn
+        self._api_name: str = api_name
+        self._user_id: str = user_id
+        self._cache: Redis = cache
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self.logger.debug(
+            f"InstructionsCacheUtility initialized for "
+            f"user_id={user_id}, urn={urn}, api_name={api_name}"
+        )
+
+    @property
+    def cache(self):
+        return self._cache
+
+    @cache.setter
+    def cache(self, value):
+        self._cache = value
+
+    @classmethod
+    def build_key(
+        cls,
+        meal_name: str,
+        ingredients: List[Dict[str, Any]],
+        prompt_version: str = MealInstructionsPrompt.VERSION,
+    ) -> str:
+        """
+        Build the content-addressed cache key for a meal.
+        Args:
+            meal_name (str): Name of the meal.
+            ingredients (List[Dict]): Ingredients from extract_ingredients.
+            prompt_version (str): Version of the instructions prompt.
+        Returns:
+            str: Cache key derived from a SHA-256 of the content.
+        """
+        content = json.dumps(
+            {
+                "meal_name": " ".join(meal_name.lower().split()),
+                "ingredients": ingredients,
+                "prompt_version": prompt_version,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return f"{cls.KEY_PREFIX}{digest}"
+
+    def get(
+        self,
+        meal_name: str,
+        ingredients: List[Dict[str, Any]],
+    ) -> InstructionsDTO | None:
+        """
+        Return cached instructions for the meal, if any.
+        Args:
+            meal_name (str): Name of the meal.
+            ingredients (List[Dict]): Ingredients from extract_ingredients.
+        Returns:
+            InstructionsDTO | None: Cached instructions, or None on a miss.
+        """
+        key = self.build_key(meal_name=meal_name, ingredients=ingredients)
+        try:
+            cached = self.cache.get(key)
+            if not cached:
+                self.logger.info("Instructions cache miss")
+                return None
+            pipeline = self.cache.pipeline()
+            pipeline.zadd(self.INDEX_KEY, {key: time.time()})
+            pipeline.expire(key, self._ttl_seconds)
+            pipeline.execute()
+        except RedisError as err:
+            self.logger.error(f"Instructions cache read failed: {err}")
+            return None
+
+        self.logger.info("Instructions cache hit")
+        return InstructionsDTO.model_validate_json(cached)
+
+    def set(
+        self,
+        meal_name: str,
+        ingredients: List[Dict[str, Any]],
+        instructions: InstructionsDTO,
+    ) -> None:
+        """
+        Cache instructions for the meal and evict the least recently used
+        entries beyond the size cap.
+        Args:
+            meal_name (str): Name of the meal.
+            ingredients (List[Dict]): Ingredients from extract_ingredients.
+            instructions (InstructionsDTO): Generated instructions.
+        """
+        key = self.build_key(meal_name=meal_name, ingredients=ingredients)
+        now = time.time()
+        try:
+            pipeline = self.cache.pipeline()
+            pipeline.set(
+                key,
+                instructions.model_dump_json(),
+                ex=self._ttl_seconds,
+            )
+            pipeline.zadd(self.INDEX_KEY, {key: now})
+            # Entries not read for a full TTL have already expired.
+            pipeline.zremrangebyscore(
+                self.INDEX_KEY, "-inf", now - self._ttl_seconds
+            )
+            pipeline.zcard(self.INDEX_KEY)
+            size = pipeline.execute()[-1]
+
+            overflow = size - self._max_entries
+            if overflow > 0:
+                overflow -= self._prune_missing()
+            if overflow > 0:
+                evicted = [
+                    member for member, _ in
+                    self.cache.zpopmin(self.INDEX_KEY, overflow)
+                ]
+                self.cache.delete(*evicted)
+                self.logger.info(
+                    f"Evicted {len(evicted)} cached instruction sets"
+                )
+        except RedisError as err:
+            self.logger.error(f"Instructions cache write failed: {err}")
+
+    def _prune_missing(self) -> int:
+        """
+        Remove index members whose entry no longer exists, so they do not
+        count toward `max_entries`. This checks every member, which is
+        cheap next to the LLM call that precedes every write.
+        Returns:
+            int: Number of members removed.
+        """
+        members = self.cache.zrange(self.INDEX_KEY, 0, -1)
+        if not members:
+            return 0
+        pipeline = self.cache.pipeline()
+        for member in members:
+            pipeline.exists(member)
+        missing = [
+            member for member, exists in zip(members, pipeline.execute())
+            if not exists
+        ]
+        if missing:
+            self.cache.zrem(self.INDEX_KEY, *missing)
+            self.logger.info(
+                f"Pruned {len(missing)} expired instruction index entries"
+            )
+        return len(missing)
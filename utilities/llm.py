@@ -0,0 +1,135 @@
+"""
+Utility for invoking the LLM without blocking the event loop, behind a
+per-worker concurrency limit, a bounded wait queue and a time budget.
+"""
+import asyncio
+
+from http import HTTPStatus
+from langchain_core.language_models.chat_models import BaseChatModel
+
+from abstractions.utility import IUtility
+
+from errors.service_unavailable_error import ServiceUnavailableError
+
+from start_utils import llm_configuration
+
+
+class LLMUtility(IUtility):
+    """
+    Utility for rate-controlled, asynchronous LLM calls.
+
+    At most `max_concurrency` calls run at once per worker and at most
+    `max_queue_depth` callers wait for a free slot. Callers beyond the queue
+    depth, or whose wait plus call exceeds `timeout_seconds`, get a
+    ServiceUnavailableError immediately instead of holding the worker.
+    """
+    _semaphore: asyncio.Semaphore = None
+    _waiting: int = 0
+
+    def __init__(
+        self,
+        urn: str = None,
+        user_urn: str = None,
+        api_name: str = None,
+        user_id: str = None,
+        llm: BaseChatModel = None,
+        max_concurrency: int = llm_configuration.max_concurrency,
+        max_queue_depth: int = llm_configuration.max_queue_depth,
+        timeout_seconds: float = llm_configuration.timeout_seconds,
+    ) -> None:
+        super().__init__(
+            urn=urn,
+            user_urn=user_urn,
+            api_name=api_name,
+            user_id=user_id,
+        )
+        self._urn: str = urn
+        self._user_urn: str = user_urn
+        self._api_name: str = api_name
+        self._user_id: str = user_id
+        self._llm: BaseChatModel = llm
+        self._max_concurrency = max_concurrency
+        self._max_queue_depth = max_queue_depth
+        self._timeout_seconds = timeout_seconds
+        if LLMUtility._semaphore is None:
+            LLMUtility._semaphore = asyncio.Semaphore(max_concurrency)
+        self.logger.debug(
+            f"LLMUtility initialized for "
+            f"user_id={user_id}, urn={urn}, api_name={api_name}"
+        )
+
+    @property
+    def llm(self):
+        return self._llm
+
+    @llm.setter
+    def llm(self, value):
+        self._llm = value
+
+    async def invoke(self, prompt: str) -> str:
+        """
+        Invoke the LLM asynchronously within the worker's budget.
+        Args:
+            prompt (str): Prompt to send to the LLM.
+        Returns:
+            str: Content of the LLM response.
+        Raises:
+            ServiceUnavailableError: If the queue is full or the time budget
+            is exceeded.
+        """
+        semaphore = LLMUtility._semaphore
+        if (
+            semaphore.locked() and
+            LLMUtility._waiting >= self._max_queue_depth
+        ):
+            self.logger.warning(
+                f"LLM queue full ({LLMUtility._waiting} waiting); "
+                f"rejecting call"
+            )
+            raise ServiceUnavailableError(
+                responseMessage="LLM is busy. Please try again later.",
+                responseKey="error_llm_queue_full",
+                httpStatusCode=HTTPStatus.SERVICE_UNAVAILABLE,
+            )
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._timeout_seconds
+
+        if not semaphore.locked():
+            # A free slot is taken without suspending, so the slot count seen
+            # by the next caller's queue check is accurate.
+            await semaphore.acquire()
+        else:
+            LLMUtility._waiting += 1
+            try:
+                await asyncio.wait_for(
+                    semaphore.acquire(),
+                    timeout=self._timeout_seconds,
+                )
+            except asyncio.TimeoutError:
+                self.logger.warning("Timed out waiting for an LLM slot")
+                raise ServiceUnavailableError(
+                    responseMessage="LLM is busy. Please try again later.",
+                    responseKey="error_llm_timeout",
+                    httpStatusCode=HTTPStatus.SERVICE_UNAVAILABLE,
+                )
+            finally:
+                LLMUtility._waiting -= 1
+
+        try:
+            self.logger.info("Invoking LLM")
+            response = await asyncio.wait_for(
+                self.llm.ainvoke(prompt),
+                timeout=max(deadline - loop.time(), 0),
+            )
+            self.logger.info("LLM invoked")
+            return response.content
+        except asyncio.TimeoutError:
+            self.logger.warning("LLM call exceeded its time budget")
+            raise ServiceUnavailableError(
+                responseMessage="LLM timed out. Please try again later.",
+                responseKey="error_llm_timeout",
+                httpStatusCode=HTTPStatus.GATEWAY_TIMEOUT,
+            )
+        finally:
+            semaphore.release()
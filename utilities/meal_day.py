@@ -0,0 +1,43 @@
+"""
+Utility deciding the day a meal log belongs to, shared by every path that
+groups meal logs by day.
+"""
+from datetime import date, datetime, timezone
+
+from abstractions.utility import IUtility
+
+
+class MealDayUtility(IUtility):
+    """
+    Utility normalizing meal log timestamps to UTC.
+
+    `meal_log.created_on` is a timestamptz column: it is read back from the
+    database as an aware datetime, while new meal logs may still carry the
+    value they were created with. Naive values are taken as UTC, as in the
+    `datetime.utcnow` column defaults, so a meal lands on the same day
+    whichever path groups it.
+    """
+
+    @staticmethod
+    def to_utc(created_on: datetime) -> datetime:
+        """
+        Convert a timestamp to a naive UTC datetime.
+        Args:
+            created_on (datetime): Aware, or naive UTC, timestamp.
+        Returns:
+            datetime: The naive UTC datetime.
+        """
+        if created_on.tzinfo is None:
+            return created_on
+        return created_on.astimezone(timezone.utc).replace(tzinfo=None)
+
+    @staticmethod
+    def day_of(created_on: datetime) -> date:
+        """
+        Return the UTC day of a timestamp.
+        Args:
+            created_on (datetime): Aware, or naive UTC, timestamp.
+        Returns:
+            date: The UTC day.
+        """
+        return MealDayUtility.to_utc(created_on).date()
@@ -0,0 +1,313 @@
+"""
+Utility for the two-tier meal details cache: a small per-worker LRU in
+front of Redis, kept coherent by invalidations broadcast over Redis pub/sub.
+"""
+import asyncio
+import time
+import uuid
+
+from collections import OrderedDict
+from loguru import logger
+from redis import Redis, RedisError
+from redis.asyncio import Redis as AsyncRedis
+from typing import Any, Dict, Final, Tuple
+
+from abstractions.cache_codec import ICacheCodec
+from abstractions.utility import IUtility
+
+from serializers.cache.orjson_codec import OrjsonCacheCodec
+
+from start_utils import cache_configuration
+
+
+class MealDetailsCacheUtility(IUtility):
+    """
+    Utility for reading and writing per-serving meal details.
+
+    Keys are the normalized meal name (lower case, single spaces) behind a
+    schema version, so differently typed names share one entry and entries
+    of an older layout are never read. Redis payloads are written by
+    `codec`, orjson with zstd for large payloads by default.
+
+    Entries are served stale-while-revalidate: they are fresh for
+    `soft_ttl_seconds`, then served as stale until they expire from Redis
+    after `ttl_seconds`. The first reader of a stale entry across workers
+    wins a refresh lock held for `refresh_lock_seconds` and refreshes it;
+    a failed refresh is retried once the lock expires.
+
+    The local tier is shared by every instance in the worker and holds up
+    to `local_max_entries` entries for `local_ttl_seconds`. It is only used
+    while the worker is subscribed to the invalidation channel: every write
+    or invalidation is published there, and other workers drop their local
+    copy on receipt.
+    """
+    SCHEMA_VERSION: Final[str] = "v2"
+    KEY_PREFIX: Final[str] = f"meal_details_{SCHEMA_VERSION}_"
+    REFRESH_KEY_PREFIX: Final[str] = f"meal_details_refresh_{SCHEMA_VERSION}_"
+    CHANNEL: Final[str] = "meal_details_invalidations"
+    RETRY_SECONDS: Final[float] = 1.0
+    DEFAULT_CODEC: Final[ICacheCodec] = OrjsonCacheCodec()
+
+    _worker_id: str = uuid.uuid4().hex
+    _local: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    _subscribed: bool = False
+
+    def __init__(
+        self,
+        urn: str = None,
+        user_urn: str = None,
+        api_name: str = None,
+        user_id: str = None,
+        cache: Redis = None,
+        ttl_seconds: int = cache_configuration.meal_details.ttl_seconds,
+        soft_ttl_seconds: int = (
+            cache_configuration.meal_details.soft_ttl_seconds
+        ),
+        refresh_lock_seconds: int = (
+            cache_configuration.meal_details.refresh_lock_seconds
+        ),
+        local_ttl_seconds: float = (
+            cache_configuration.meal_details.local_ttl_seconds
+        ),
+        local_max_entries: int = (
+            cache_configuration.meal_details.local_max_entries
+        ),
+        codec: ICacheCodec = None,
+    ) -> None:
+        super().__init__(
+            urn=urn,
+            user_urn=user_urn,
+            api_name=api_name,
+            user_id=user_id,
+        )
+        self._urn: str = urn
+        self._user_urn: str = user_urn
+        self._api_name: str = api_name
+        self._user_id: str = user_id
+        self._cache: Redis = cache
+        self._ttl_seconds = ttl_seconds
+        self._soft_ttl_seconds = soft_ttl_seconds
+        self._refresh_lock_seconds = refresh_lock_seconds
+        self._local_ttl_seconds = local_ttl_seconds
+        self._local_max_entries = local_max_entries
+        self._codec: ICacheCodec = codec or self.DEFAULT_CODEC
+        self.logger.debug(
+            f"MealDetailsCacheUtility initialized for "
+            f"user_id={user_id}, urn={urn}, api_name={api_name}"
+        )
+
+    @property
+    def cache(self):
+        return self._cache
+
+    @cache.setter
+    def cache(self, value):
+        self._cache = value
+
+    @classmethod
+    def build_key(cls, meal_name: str) -> str:
+        """
+        Build the versioned cache key of a meal.
+        Args:
+            meal_name (str): Name of the meal, as typed.
+        Returns:
+            str: Cache key of the normalized name.
+        """
+        return f"{cls.KEY_PREFIX}{cls.normalize_name(meal_name)}"
+
+    @staticmethod
+    def normalize_name(meal_name: str) -> str:
+        """Lower-case a meal name and collapse its whitespace."""
+        return " ".join(meal_name.lower().split())
+
+    @classmethod
+    def clear_local(cls) -> None:
+        """Drop every entry of the worker's local tier."""
+        cls._local.clear()
+
+    def _get_local(self, key: str) -> Dict[str, Any] | None:
+        if not MealDetailsCacheUtility._subscribed:
+            return None
+        entry = MealDetailsCacheUtility._local.get(key)
+        if entry is None:
+            return None
+        expires_at, envelope = entry
+        if expires_at <= time.monotonic():
+            MealDetailsCacheUtility._local.pop(key, None)
+            return None
+        MealDetailsCacheUtility._local.move_to_end(key)
+        return envelope
+
+    def _set_local(self, key: str, envelope: Dict[str, Any]) -> None:
+        if not MealDetailsCacheUtility._subscribed:
+            return
+        local = MealDetailsCacheUtility._local
+        local[key] = (time.monotonic() + self._local_ttl_seconds, envelope)
+        local.move_to_end(key)
+        while len(local) > self._local_max_entries:
+            local.popitem(last=False)
+
+    def _publish(self, key: str) -> None:
+        self.cache.publish(
+            self.CHANNEL, f"{MealDetailsCacheUtility._worker_id}:{key}"
+        )
+
+    def lookup(self, meal_name: str) -> Tuple[Dict[str, Any] | None, bool]:
+        """
+        Return the cached per-serving details of a meal and whether they
+        are past their soft TTL.
+        Args:
+            meal_name (str): Name of the meal.
+        Returns:
+            Tuple[dict | None, bool]: Cached details, shared with other
+            requests of the worker and not to be mutated, or None on a
+            miss; and whether they are stale.
+        """
+        key = self.build_key(meal_name)
+        envelope = self._get_local(key)
+        if envelope is not None:
+            self.logger.info("Meal details local cache hit")
+        else:
+            envelope = self._get_remote(key)
+            if envelope is None:
+                return None, False
+            self.logger.info("Meal details cache hit")
+            self._set_local(key, envelope)
+
+        stale = envelope["fresh_until"] <= time.time()
+        if stale:
+            self.logger.info("Meal details are stale")
+        return envelope["details"], stale
+
+    def get(self, meal_name: str) -> Dict[str, Any] | None:
+        """
+        Return the cached per-serving details of a meal, fresh or stale.
+        Args:
+            meal_name (str): Name of the meal.
+        Returns:
+            dict | None: Cached details, or None on a miss.
+        """
+        return self.lookup(meal_name)[0]
+
+    def _get_remote(self, key: str) -> Dict[str, Any] | None:
+        try:
+            cached = self.cache.get(key)
+        except RedisError as err:
+            self.logger.error(f"Meal details cache read failed: {err}")
+            return None
+        if not cached:
+            self.logger.info("Meal details cache miss")
+            return None
+
+        try:
+            envelope = self._codec.decode(cached)
+        except ValueError as err:
+            self.logger.error(f"Meal details cache entry unreadable: {err}")
+            return None
+        if not isinstance(envelope, dict) or "details" not in envelope:
+            self.logger.error("Meal details cache entry malformed")
+            return None
+        return envelope
+
+    def set(self, meal_name: str, details: Dict[str, Any]) -> None:
+        """
+        Cache the per-serving details of a meal as fresh and make other
+        workers drop their local copy.
+        Args:
+            meal_name (str): Name of the meal.
+            details (dict): Per-serving details of the meal.
+        """
+        key = self.build_key(meal_name)
+        envelope = {
+            "fresh_until": time.time() + self._soft_ttl_seconds,
+            "details": details,
+        }
+        self._set_local(key, envelope)
+        try:
+            self.cache.set(
+                key, self._codec.encode(envelope), ex=self._ttl_seconds
+            )
+            self._publish(key)
+        except RedisError as err:
+            self.logger.error(f"Meal details cache write failed: {err}")
+
+    def acquire_refresh(self, meal_name: str) -> bool:
+        """
+        Claim the refresh of a stale meal across workers.
+        Args:
+            meal_name (str): Name of the meal.
+        Returns:
+            bool: Whether the caller should refresh the meal. Only one
+            caller wins until the lock expires.
+        """
+        lock_key = (
+            f"{self.REFRESH_KEY_PREFIX}{self.normalize_name(meal_name)}"
+        )
+        try:
+            return bool(
+                self.cache.set(
+                    lock_key,
+                    MealDetailsCacheUtility._worker_id,
+                    nx=True,
+                    ex=self._refresh_lock_seconds,
+                )
+            )
+        except RedisError as err:
+            self.logger.error(f"Meal details refresh lock failed: {err}")
+            return False
+
+    def invalidate(self, meal_name: str) -> None:
+        """
+        Remove the cached details of a meal from every tier and worker.
+        Args:
+            meal_name (str): Name of the meal.
+        """
+        key = self.build_key(meal_name)
+        MealDetailsCacheUtility._local.pop(key, None)
+        try:
+            self.cache.delete(key)
+            self._publish(key)
+        except RedisError as err:
+            self.logger.error(f"Meal details cache invalidation failed: {err}")
+
+    @classmethod
+    def evict(cls, message: bytes | str) -> None:
+        """
+        Apply an invalidation message published by another worker.
+        Args:
+            message (bytes | str): "<worker id>:<key>".
+        """
+        if isinstance(message, bytes):
+            message = message.decode("utf-8")
+        worker_id, _, key = message.partition(":")
+        if worker_id != cls._worker_id:
+            cls._local.pop(key, None)
+
+    @classmethod
+    async def listen(cls, cache: AsyncRedis) -> None:
+        """
+        Subscribe to invalidations until cancelled. The local tier is
+        enabled while subscribed, and emptied whenever the subscription is
+        lost, as invalidations may have been missed.
+        Args:
+            cache (AsyncRedis): Async Redis client.
+        """
+        while True:
+            pubsub = cache.pubsub()
+            try:
+                await pubsub.subscribe(cls.CHANNEL)
+                cls.clear_local()
+                cls._subscribed = True
+                logger.info("Subscribed to meal details invalidations")
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        cls.evict(message["data"])
+            except RedisError as err:
+                logger.error(
+                    f"Meal details invalidation subscription lost: {err}"
+                )
+            finally:
+                cls._subscribed = False
+                cls.clear_local()
+                await pubsub.aclose()
+            await asyncio.sleep(cls.RETRY_SECONDS)
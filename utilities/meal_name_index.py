@@ -0,0 +1,195 @@
+"""
+Utility for fuzzy matching meal names against a per-worker, in-memory
+vocabulary of distinct meal names.
+"""
+import sys
+import time
+
+from rapidfuzz import fuzz, process
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from abstractions.utility import IUtility
+
+from start_utils import cache_configuration
+
+
+class MealNameIndexUtility(IUtility):
+    """
+    Utility holding the distinct meal names of the meal_log table.
+
+    The vocabulary is shared by every instance in the worker. It is loaded
+    from the database once, extended in place as meals are added, and
+    reloaded every `refresh_seconds` to pick up names added by other
+    workers. A vocabulary larger than `max_names` is not kept, and callers
+    fall back to searching the database. The index statistics are logged
+    on every load, so once per refresh.
+    """
+    _names: List[str] = []
+    _known: Set[str] = set()
+    _loaded_at: float = None
+    _oversized: bool = False
+    _hits: int = 0
+    _misses: int = 0
+
+    def __init__(
+        self,
+        urn: str = None,
+        user_urn: str = None,
+        api_name: str = None,
+        user_id: str = None,
+        max_names: int = cache_configuration.meal_name_index.max_names,
+        refresh_seconds: int = (
+            cache_configuration.meal_name_index.refresh_seconds
+        ),
+    ) -> None:
+        super().__init__(
+            urn=urn,
+            user_urn=user_urn,
+            api_name=api_name,
+            user_id=user_id,
+        )
+        self._urn: str = urn
+        self._user_urn: str = user_urn
+        self._api_name: str = api_name
+        self._user_id: str = user_id
+        self._max_names = max_names
+        self._refresh_seconds = refresh_seconds
+        self.logger.debug(
+            f"MealNameIndexUtility initialized for "
+            f"user_id={user_id}, urn={urn}, api_name={api_name}"
+        )
+
+    @property
+    def max_names(self):
+        return self._max_names
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the vocabulary should be (re)loaded."""
+        loaded_at = MealNameIndexUtility._loaded_at
+        return (
+            loaded_at is None or
+            time.monotonic() - loaded_at >= self._refresh_seconds
+        )
+
+    @property
+    def is_usable(self) -> bool:
+        """Whether searches can be answered from memory."""
+        return (
+            MealNameIndexUtility._loaded_at is not None and
+            not MealNameIndexUtility._oversized
+        )
+
+    def load(self, names: Iterable[str]) -> bool:
+        """
+        Replace the vocabulary with the given meal names.
+        Args:
+            names (Iterable[str]): Meal names; duplicates are dropped.
+        Returns:
+            bool: False if there were more than `max_names` names, in which
+            case the vocabulary is left empty and unusable.
+        """
+        known = set()
+        unique = []
+        for name in names:
+            if name and name not in known:
+                known.add(name)
+                unique.append(name)
+
+        oversized = len(unique) > self._max_names
+        if oversized:
+            self.logger.warning(
+                f"Meal name vocabulary exceeds {self._max_names} names; "
+                f"not indexing in memory"
+            )
+            known, unique = set(), []
+
+        MealNameIndexUtility._names = unique
+        MealNameIndexUtility._known = known
+        MealNameIndexUtility._oversized = oversized
+        MealNameIndexUtility._loaded_at = time.monotonic()
+        self.logger.info(f"Loaded {len(unique)} meal names into the index")
+        self.logger.info(f"Meal name index stats: {self.stats()}")
+        return not oversized
+
+    def add(self, name: str) -> None:
+        """
+        Add a meal name to a loaded vocabulary, if it is new.
+        Args:
+            name (str): Meal name that was just stored.
+        """
+        if not self.is_usable or not name:
+            return
+        if name in MealNameIndexUtility._known:
+            return
+        if len(MealNameIndexUtility._names) >= self._max_names:
+            self.logger.warning("Meal name index is full; marking stale")
+            MealNameIndexUtility._loaded_at = None
+            return
+        MealNameIndexUtility._known.add(name)
+        MealNameIndexUtility._names.append(name)
+        self.logger.debug(f"Added meal name to the index: {name}")
+
+    def search(
+        self,
+        meal_name: str,
+        limit: int = 5,
+        threshold: int = 80,
+    ) -> List[Tuple[str, float]]:
+        """
+        Find the indexed meal names closest to `meal_name`.
+        Args:
+            meal_name (str): Name of the meal to search for.
+            limit (int): Maximum number of candidates to return.
+            threshold (int): Minimum rapidfuzz ratio (0-100).
+        Returns:
+            list[tuple[str, float]]: (meal_name, score), best first.
+        """
+        matches = [
+            (match, score) for match, score, _ in process.extract(
+                meal_name,
+                MealNameIndexUtility._names,
+                scorer=fuzz.ratio,
+                limit=limit,
+                score_cutoff=threshold,
+            )
+        ]
+        if matches:
+            MealNameIndexUtility._hits += 1
+        else:
+            MealNameIndexUtility._misses += 1
+        return matches
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report the vocabulary size, memory footprint and hit counts.
+        Returns:
+            dict: Index statistics.
+        """
+        names = MealNameIndexUtility._names
+        known = MealNameIndexUtility._known
+        queries = MealNameIndexUtility._hits + MealNameIndexUtility._misses
+        return {
+            "size": len(names),
+            "memory_bytes": (
+                sys.getsizeof(names) +
+                sys.getsizeof(known) +
+                sum(sys.getsizeof(name) for name in names)
+            ),
+            "hits": MealNameIndexUtility._hits,
+            "misses": MealNameIndexUtility._misses,
+            "hit_rate": (
+                MealNameIndexUtility._hits / queries if queries else 0.0
+            ),
+            "oversized": MealNameIndexUtility._oversized,
+        }
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop the vocabulary and counters, e.g. between tests."""
+        MealNameIndexUtility._names = []
+        MealNameIndexUtility._known = set()
+        MealNameIndexUtility._loaded_at = None
+        MealNameIndexUtility._oversized = False
+        MealNameIndexUtility._hits = 0
+        MealNameIndexUtility._misses = 0
@@ -0,0 +1,223 @@
+"""
+Utility for short-lived negative cache entries of USDA searches that found
+no meal or returned a malformed response.
+"""
+import asyncio
+
+from loguru import logger
+from redis import RedisError
+from redis.asyncio import Redis as AsyncRedis
+from typing import Any, Dict, Final, Type
+
+from abstractions.cache_codec import ICacheCodec
+from abstractions.error import IError
+from abstractions.utility import IUtility
+
+from errors.not_found_error import NotFoundError
+from errors.unexpected_response_error import UnexpectedResponseError
+
+from serializers.cache.orjson_codec import OrjsonCacheCodec
+
+from start_utils import cache_configuration
+
+
+class NegativeCacheUtility(IUtility):
+    """
+    Utility remembering failed USDA searches, so repeated searches for
+    typos and unknown dishes are answered without calling USDA.
+
+    Entries are keyed by the normalized meal name and hold the error to
+    raise again. Not-found entries expire after `not_found_ttl_seconds`
+    and malformed-response entries, which are more likely transient,
+    after `invalid_response_ttl_seconds`. Other errors are never cached.
+
+    Hits, stores and bypasses are counted per reason in every worker,
+    reported by `stats` and logged periodically by `report`. Redis is
+    reached through the async client, as every lookup sits on the request
+    path.
+    """
+    KEY_PREFIX: Final[str] = "usda_negative_"
+    NOT_FOUND: Final[str] = "not_found"
+    INVALID_RESPONSE: Final[str] = "invalid_response"
+    REASONS: Final[Dict[str, str]] = {
+        "error_not_found": NOT_FOUND,
+        "error_no_meal_data_found": NOT_FOUND,
+        "error_invalid_json": INVALID_RESPONSE,
+    }
+    ERRORS: Final[Dict[str, Type[IError]]] = {
+        NOT_FOUND: NotFoundError,
+        INVALID_RESPONSE: UnexpectedResponseError,
+    }
+    DEFAULT_CODEC: Final[ICacheCodec] = OrjsonCacheCodec()
+
+    _hits: Dict[str, int] = {NOT_FOUND: 0, INVALID_RESPONSE: 0}
+    _stores: Dict[str, int] = {NOT_FOUND: 0, INVALID_RESPONSE: 0}
+    _bypasses: int = 0
+
+    def __init__(
+        self,
+        urn: str = None,
+        user_urn: str = None,
+        api_name: str = None,
+        user_id: str = None,
+        cache: AsyncRedis = None,
+        not_found_ttl_seconds: int = (
+            cache_configuration.negative.not_found_ttl_seconds
+        ),
+        invalid_response_ttl_seconds: int = (
+            cache_configuration.negative.invalid_response_ttl_seconds
+        ),
+        codec: ICacheCodec = None,
+    ) -> None:
+        super().__init__(
+            urn=urn,
+            user_urn=user_urn,
+            api_name=api_name,
+            user_id=user_id,
+        )
+        self._urn: str = urn
+        self._user_urn: str = user_urn
+        self._api_name: str = api_name
+        self._user_id: str = user_id
+        self._cache: AsyncRedis = cache
+        self._ttl_seconds: Dict[str, int] = {
+            self.NOT_FOUND: not_found_ttl_seconds,
+            self.INVALID_RESPONSE: invalid_response_ttl_seconds,
+        }
+        self._codec: ICacheCodec = codec or self.DEFAULT_CODEC
+        self.logger.debug(
+            f"NegativeCacheUtility initialized for "
+            f"user_id={user_id}, urn={urn}, api_name={api_name}"
+        )
+
+    @property
+    def cache(self):
+        return self._cache
+
+    @cache.setter
+    def cache(self, value):
+        self._cache = value
+
+    @classmethod
+    def build_key(cls, meal_name: str) -> str:
+        """
+        Build the cache key of a meal search.
+        Args:
+            meal_name (str): Name of the meal, as typed.
+        Returns:
+            str: Cache key of the normalized name.
+        """
+        return f"{cls.KEY_PREFIX}{' '.join(meal_name.lower().split())}"
+
+    async def get(self, meal_name: str) -> IError | None:
+        """
+        Return the cached error of a failed search for the meal, if any.
+        Args:
+            meal_name (str): Name of the meal.
+        Returns:
+            IError | None: The error to raise, or None on a miss.
+        """
+        try:
+            cached = await self.cache.get(self.build_key(meal_name))
+        except RedisError as err:
+            self.logger.error(f"Negative cache read failed: {err}")
+            return None
+        if not cached:
+            return None
+
+        try:
+            entry = self._codec.decode(cached)
+        except ValueError as err:
+            self.logger.error(f"Negative cache entry unreadable: {err}")
+            return None
+        error_class = (
+            self.ERRORS.get(entry.get("reason"))
+            if isinstance(entry, dict) else None
+        )
+        if error_class is None:
+            return None
+
+        NegativeCacheUtility._hits[entry["reason"]] += 1
+        self.logger.info(f"Negative cache hit: {entry['reason']}")
+        return error_class(
+            responseMessage=entry["responseMessage"],
+            responseKey=entry["responseKey"],
+            httpStatusCode=entry["httpStatusCode"],
+        )
+
+    async def set(self, meal_name: str, error: IError) -> None:
+        """
+        Cache a failed search for the meal, if its error is cacheable.
+        Args:
+            meal_name (str): Name of the meal.
+            error (IError): Error raised by the search.
+        """
+        reason = self.REASONS.get(getattr(error, "responseKey", None))
+        if reason is None:
+            return
+        try:
+            await self.cache.set(
+                self.build_key(meal_name),
+                self._codec.encode(
+                    {
+                        "reason": reason,
+                        "responseMessage": error.responseMessage,
+                        "responseKey": error.responseKey,
+                        "httpStatusCode": int(error.httpStatusCode),
+                    }
+                ),
+                ex=self._ttl_seconds[reason],
+            )
+        except RedisError as err:
+            self.logger.error(f"Negative cache write failed: {err}")
+            return
+        NegativeCacheUtility._stores[reason] += 1
+        self.logger.info(f"Negative cache store: {reason}")
+
+    async def bypass(self, meal_name: str) -> None:
+        """
+        Drop the cached failure of the meal, for a request that asked to
+        search USDA regardless. The new outcome is cached again.
+        Args:
+            meal_name (str): Name of the meal.
+        """
+        NegativeCacheUtility._bypasses += 1
+        try:
+            await self.cache.delete(self.build_key(meal_name))
+        except RedisError as err:
+            self.logger.error(f"Negative cache bypass failed: {err}")
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """
+        Report the negative cache counters of this worker.
+        Returns:
+            dict: Hits and stores per reason, and bypasses.
+        """
+        return {
+            "hits": dict(NegativeCacheUtility._hits),
+            "stores": dict(NegativeCacheUtility._stores),
+            "bypasses": NegativeCacheUtility._bypasses,
+        }
+
+    @classmethod
+    async def report(
+        cls,
+        interval_seconds: int = cache_configuration.negative.stats_log_seconds,
+    ) -> None:
+        """
+        Log the counters of this worker every `interval_seconds`, until
+        cancelled.
+        Args:
+            interval_seconds (int): Seconds between two logs.
+        """
+        while True:
+            await asyncio.sleep(interval_seconds)
+            logger.info(f"Negative cache stats: {cls.stats()}")
+
+    @classmethod
+    def reset(cls) -> None:
+        """Reset the counters, e.g. between tests."""
+        NegativeCacheUtility._hits = dict.fromkeys(cls.ERRORS, 0)
+        NegativeCacheUtility._stores = dict.fromkeys(cls.ERRORS, 0)
+        NegativeCacheUtility._bypasses = 0
@@ -0,0 +1,121 @@
+"""
+Utility for the compact nutrient encoding of meal logs: a fixed vector of
+amounts ordered by Nutrients.VECTOR, with names and units kept once in the
+nutrient table.
+"""
+from typing import Any, Dict, Final, List, Sequence
+
+from abstractions.utility import IUtility
+
+from constants.meal.nutrients import Nutrients
+
+
+class NutrientVectorUtility(IUtility):
+    """
+    Utility converting between the {"macros", "micros"} nutrient lists of
+    the API and the nutrient vector stored in meal_log.
+
+    Amounts are stored in the unit of Nutrients.UNITS; mass amounts in
+    another unit are converted. A zero amount stands for a nutrient that
+    was not reported, as zero amounts are never listed.
+    """
+    _positions: Final[Dict[str, int]] = {
+        name: position for position, name in enumerate(Nutrients.VECTOR)
+    }
+    _macros: Final[frozenset] = frozenset(Nutrients.MACROS_LIST)
+
+    def __init__(
+        self,
+        urn: str = None,
+        user_urn: str = None,
+        api_name: str = None,
+        user_id: str = None,
+    ) -> None:
+        super().__init__(
+            urn=urn,
+            user_urn=user_urn,
+            api_name=api_name,
+            user_id=user_id,
+        )
+        self._urn: str = urn
+        self._user_urn: str = user_urn
+        self._api_name: str = api_name
+        self._user_id: str = user_id
+        self.logger.debug(
+            f"NutrientVectorUtility initialized for "
+            f"user_id={user_id}, urn={urn}, api_name={api_name}"
+        )
+
+    @staticmethod
+    def convert(amount: float, unit: str, name: str) -> float | None:
+        """
+        Convert an amount to the unit of the nutrient.
+        Returns:
+            float | None: The amount, or None if the unit cannot be
+            converted.
+        """
+        target = Nutrients.UNITS[name]
+        unit = (unit or target).upper()
+        if unit == target:
+            return amount
+        if unit not in Nutrients.MASS_UNITS:
+            return None
+        return (
+            amount * Nutrients.MASS_UNITS[unit] / Nutrients.MASS_UNITS[target]
+        )
+
+    @classmethod
+    def encode(cls, nutrients: Dict[str, Any] | None) -> List[float] | None:
+        """
+        Encode nutrient lists as a nutrient vector.
+        Args:
+            nutrients (dict): {"macros": [...], "micros": [...]} of
+            {"name", "amount", "unit"} entries.
+        Returns:
+            list[float] | None: Amounts ordered by Nutrients.VECTOR, or None
+            when there are no nutrients. Untracked nutrients and
+            unconvertible units are left out.
+        """
+        if nutrients is None:
+            return None
+        vector = [0.0] * len(Nutrients.VECTOR)
+        for nutrient in (
+            (nutrients.get("macros") or []) +
+            (nutrients.get("micros") or [])
+        ):
+            name = nutrient.get("name")
+            position = cls._positions.get(name)
+            if position is None or not nutrient.get("amount"):
+                continue
+            amount = cls.convert(
+                nutrient["amount"], nutrient.get("unit"), name
+            )
+            if amount is not None:
+                vector[position] += amount
+        return vector
+
+    @classmethod
+    def decode(
+        cls,
+        vector: Sequence[float] | None,
+    ) -> Dict[str, List[Dict[str, Any]]] | None:
+        """
+        Decode a nutrient vector into nutrient lists.
+        Args:
+            vector (Sequence[float]): Amounts ordered by Nutrients.VECTOR.
+            Shorter vectors, written before nutrients were appended, are
+            accepted.
+        Returns:
+            dict | None: {"macros": [...], "micros": [...]} of
+            {"name", "amount", "unit"} entries for the non-zero amounts.
+        """
+        if vector is None:
+            return None
+        nutrients = {"macros": [], "micros": []}
+        for name, amount in zip(Nutrients.VECTOR, vector):
+            if not amount:
+                continue
+            nutrients["macros" if name in cls._macros else "micros"].append(
+                {"name": name, "amount": amount, "unit": Nutrients.UNITS[name]}
+            )
+        return nutrients
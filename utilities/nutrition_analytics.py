@@ -0,0 +1,186 @@
+"""
+Utility for vectorized nutrition statistics over a user's meal logs, built
+on NumPy arrays and pandas frames with one column per tracked nutrient.
+"""
+import numpy as np
+import pandas as pd
+
+from datetime import date
+from sqlalchemy import Row
+from typing import Any, Dict, Final, List, Sequence
+
+from abstractions.utility import IUtility
+
+from constants.meal.nutrients import Nutrients
+
+from models.meal_log import MealLog
+
+from utilities.meal_day import MealDayUtility
+
+
+class NutritionAnalyticsUtility(IUtility):
+    """
+    Utility turning meal logs into columnar nutrient arrays.
+
+    Each meal becomes one row of a (meals x nutrients) matrix: calories
+    followed by the meal's nutrient vector, in Nutrients.VECTOR order,
+    scaled by servings. Daily, weekly and rolling
+    statistics are then computed on whole columns.
+    """
+    CALORIES: Final[str] = "Calories"
+    COLUMNS: Final[List[str]] = [CALORIES] + Nutrients.VECTOR
+    UNITS: Final[Dict[str, str]] = {CALORIES: "KCAL", **Nutrients.UNITS}
+
+    def __init__(
+        self,
+        urn: str = None,
+        user_urn: str = None,
+        api_name: str = None,
+        user_id: str = None,
+    ) -> None:
+        super().__init__(
+            urn=urn,
+            user_urn=user_urn,
+            api_name=api_name,
+            user_id=user_id,
+        )
+        self._urn: str = urn
+        self._user_urn: str = user_urn
+        self._api_name: str = api_name
+        self._user_id: str = user_id
+        self.logger.debug(
+            f"NutritionAnalyticsUtility initialized for "
+            f"user_id={user_id}, urn={urn}, api_name={api_name}"
+        )
+
+    def build_frame(
+        self,
+        meal_logs: Sequence[MealLog | Row],
+    ) -> pd.DataFrame:
+        """
+        Build the meal x nutrient frame of the meal logs.
+        Args:
+            meal_logs (Sequence[MealLog | Row]): Meal logs, or rows with
+            servings, nutrient_vector, total_calories and created_on.
+        Returns:
+            pd.DataFrame: The frame, indexed by created_on in UTC.
+        """
+        count = len(meal_logs)
+        matrix = np.zeros((count, len(self.COLUMNS)), dtype=np.float64)
+        for row, meal_log in enumerate(meal_logs):
+            vector = meal_log.nutrient_vector
+            if vector:
+                # Vectors written before nutrients were appended are shorter.
+                matrix[row, 1:len(vector) + 1] = vector
+        servings = np.fromiter(
+            (meal_log.servings or 1 for meal_log in meal_logs),
+            dtype=np.float64,
+            count=count,
+        )
+        matrix *= servings[:, np.newaxis]
+        # total_calories already covers every serving.
+        matrix[:, 0] = np.fromiter(
+            (meal_log.total_calories or 0 for meal_log in meal_logs),
+            dtype=np.float64,
+            count=count,
+        )
+
+        # created_on is aware when read from the database, and the days
+        # to reindex on are naive, so the index is kept in naive UTC.
+        index = pd.DatetimeIndex(
+            [
+                MealDayUtility.to_utc(meal_log.created_on)
+                for meal_log in meal_logs
+            ],
+            name="created_on",
+        )
+        return pd.DataFrame(matrix, index=index, columns=self.COLUMNS)
+
+    @staticmethod
+    def daily_totals(
+        frame: pd.DataFrame,
+        from_date: date,
+        to_date: date,
+    ) -> pd.DataFrame:
+        """
+        Sum the frame per day, with a zero row for each day without meals.
+        """
+        days = pd.date_range(from_date, to_date, freq="D", name="day")
+        return (
+            frame.groupby(frame.index.normalize())
+            .sum()
+            .reindex(days, fill_value=0.0)
+        )
+
+    @staticmethod
+    def weekly(daily: pd.DataFrame) -> pd.core.groupby.DataFrameGroupBy:
+        """
+        Group daily totals by the Monday starting their week.
+        """
+        return daily.groupby(daily.index.to_period("W-SUN").start_time)
+
+    @staticmethod
+    def rolling_averages(daily: pd.DataFrame, window: int) -> pd.DataFrame:
+        """
+        Average daily totals over the trailing `window` days. The first
+        days of the range average over the days available.
+        """
+        return daily.rolling(window=window, min_periods=1).mean()
+
+    @staticmethod
+    def to_columns(frame: pd.DataFrame) -> Dict[str, List[float]]:
+        """Serialize a frame as {nutrient: [values]}."""
+        values = frame.to_numpy().round(4).T.tolist()
+        return dict(zip(frame.columns, values))
+
+    @staticmethod
+    def to_values(series: pd.Series) -> Dict[str, float]:
+        """Serialize a series as {nutrient: value}."""
+        return dict(zip(series.index, series.to_numpy().round(4).tolist()))
+
+    def compute_stats(
+        self,
+        meal_logs: Sequence[MealLog | Row],
+        from_date: date,
+        to_date: date,
+        window: int,
+    ) -> Dict[str, Any]:
+        """
+        Compute daily, weekly and rolling nutrient statistics.
+        Args:
+            meal_logs (Sequence[MealLog | Row]): Meal logs of the range.
+            from_date (date): First day, inclusive.
+            to_date (date): Last day, inclusive.
+            window (int): Days in the rolling average.
+        Returns:
+            dict: Columnar statistics, with one list entry per day or week
+            for every nutrient.
+        """
+        frame = self.build_frame(meal_logs)
+        daily = self.daily_totals(frame, from_date, to_date)
+        weeks = self.weekly(daily)
+        weekly_totals = weeks.sum()
+        self.logger.info(
+            f"Computed stats of {len(frame)} meals over {len(daily)} days"
+        )
+
+        return {
+            "nutrients": [
+                {"name": name, "unit": self.UNITS.get(name)}
+                for name in self.COLUMNS
+            ],
+            "totals": self.to_values(daily.sum()),
+            "daily_averages": self.to_values(daily.mean()),
+            "daily": {
+                "dates": [str(day.date()) for day in daily.index],
+                "totals": self.to_columns(daily),
+                "rolling_averages": self.to_columns(
+                    self.rolling_averages(daily, window)
+                ),
+            },
+            "weekly": {
+                "weeks": [str(week.date()) for week in weekly_totals.index],
+                "totals": self.to_columns(weekly_totals),
+                "daily_averages": self.to_columns(weeks.mean()),
+            },
+        }
@@ -0,0 +1,116 @@
+"""
+Utility for caching whether a user is logged in, so that authenticating a
+request does not need a database round-trip.
+"""
+from redis import RedisError
+from redis.asyncio import Redis as AsyncRedis
+
+from abstractions.utility import IUtility
+
+from start_utils import cache_configuration
+
+
+class SessionStateUtility(IUtility):
+    """
+    Utility for reading and writing the cached logged-in status of a user.
+
+    Both logged-in and logged-out states are cached for `ttl_seconds`.
+    Login and logout overwrite the entry with the new state, while a cache
+    miss during authentication is only filled if no entry exists. A request
+    that read the database before a logout committed therefore cannot put
+    the logged-in state back. Redis is reached through the async client,
+    as the status is read by the authentication middleware on every
+    protected request.
+    """
+    KEY_PREFIX: str = "user_session_state_"
+    LOGGED_IN: bytes = b"1"
+    LOGGED_OUT: bytes = b"0"
+
+    def __init__(
+        self,
+        urn: str = None,
+        user_urn: str = None,
+        api_name: str = None,
+        user_id: str = None,
+        cache: AsyncRedis = None,
+        ttl_seconds: int = cache_configuration.session_state.ttl_seconds,
+    ) -> None:
+        super().__init__(
+            urn=urn,
+            user_urn=user_urn,
+            api_name=api_name,
+            user_id=user_id,
+        )
+        self._urn: str = urn
+        self._user_urn: str = user_urn
+        self._api_name: str = api_name
+        self._user_id: str = user_id
+        self._cache: AsyncRedis = cache
+        self._ttl_seconds = ttl_seconds
+        self.logger.debug(
+            f"SessionStateUtility initialized for "
+            f"user_id={user_id}, urn={urn}, api_name={api_name}"
+        )
+
+    @property
+    def cache(self):
+        return self._cache
+
+    @cache.setter
+    def cache(self, value):
+        self._cache = value
+
+    def _key(self, user_id: int) -> str:
+        return f"{self.KEY_PREFIX}{user_id}"
+
+    async def get(self, user_id: int) -> bool | None:
+        """
+        Return the cached logged-in status of a user.
+        Args:
+            user_id (int): User's ID.
+        Returns:
+            bool | None: Cached status, or None when it is not cached.
+        """
+        try:
+            cached = await self.cache.get(self._key(user_id))
+        except RedisError as err:
+            self.logger.error(f"Session state read failed: {err}")
+            return None
+
+        if cached is None:
+            return None
+        return cached == self.LOGGED_IN
+
+    async def set(self, user_id: int, is_logged_in: bool) -> None:
+        """
+        Cache the logged-in status of a user.
+        Args:
+            user_id (int): User's ID.
+            is_logged_in (bool): Whether the user is logged in.
+        """
+        try:
+            await self.cache.set(
+                self._key(user_id),
+                self.LOGGED_IN if is_logged_in else self.LOGGED_OUT,
+                ex=self._ttl_seconds,
+            )
+        except RedisError as err:
+            self.logger.error(f"Session state write failed: {err}")
+
+    async def fill(self, user_id: int, is_logged_in: bool) -> None:
+        """
+        Cache the logged-in status of a user read from the database,
+        unless a login or logout has cached a newer one meanwhile.
+        Args:
+            user_id (int): User's ID.
+            is_logged_in (bool): Whether the user is logged in.
+        """
+        try:
+            await self.cache.set(
+                self._key(user_id),
+                self.LOGGED_IN if is_logged_in else self.LOGGED_OUT,
+                ex=self._ttl_seconds,
+                nx=True,
+            )
+        except RedisError as err:
+            self.logger.error(f"Session state write failed: {err}")
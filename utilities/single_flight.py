@@ -0,0 +1,219 @@
+"""
+Utility for coalescing concurrent identical calls (single-flight), within a
+worker through a shared future and across workers through a Redis lock.
+"""
+import asyncio
+import json
+
+from redis import Redis, RedisError
+from redis.exceptions import LockError
+from typing import Any, Awaitable, Callable, Dict
+
+from abstractions.utility import IUtility
+
+from start_utils import cache_configuration
+
+
+class _LeaderCancelled(Exception):
+    """
+    Set on a shared call's future when the caller running it is cancelled,
+    so the callers that joined it retry instead of being cancelled too.
+    """
+
+
+class SingleFlightUtility(IUtility):
+    """
+    Utility that lets concurrent callers asking for the same key share one
+    execution of an expensive call.
+
+    Callers in the same worker await the future of the call already in
+    flight. Across workers, the caller that wins a Redis lock runs the call
+    and publishes its result under a short-lived result key, which the other
+    workers poll for a bounded time before falling back to their own call.
+    If the caller running a shared call is cancelled, e.g. because its
+    client disconnected, the callers that joined it run the call again.
+    """
+    _in_flight: Dict[str, asyncio.Future] = {}
+
+    def __init__(
+        self,
+        urn: str = None,
+        user_urn: str = None,
+        api_name: str = None,
+        user_id: str = None,
+        cache: Redis = None,
+        lock_timeout_seconds: int = (
+            cache_configuration.single_flight.lock_timeout_seconds
+        ),
+        wait_timeout_seconds: float = (
+            cache_configuration.single_flight.wait_timeout_seconds
+        ),
+        poll_interval_seconds: float = (
+            cache_configuration.single_flight.poll_interval_seconds
+        ),
+        result_ttl_seconds: int = (
+            cache_configuration.single_flight.result_ttl_seconds
+        ),
+    ) -> None:
+        super().__init__(
+            urn=urn,
+            user_urn=user_urn,
+            api_name=api_name,
+            user_id=user_id,
+        )
+        self._urn: str = urn
+        self._user_urn: str = user_urn
+        self._api_name: str = api_name
+        self._user_id: str = user_id
+        self._cache: Redis = cache
+        self._lock_timeout_seconds = lock_timeout_seconds
+        self._wait_timeout_seconds = wait_timeout_seconds
+        self._poll_interval_seconds = poll_interval_seconds
+        self._result_ttl_seconds = result_ttl_seconds
+        self.logger.debug(
+            f"SingleFlightUtility initialized for "
+            f"user_id={user_id}, urn={urn}, api_name={api_name}"
+        )
+
+    @property
+    def cache(self):
+        return self._cache
+
+    @cache.setter
+    def cache(self, value):
+        self._cache = value
+
+    @staticmethod
+    def normalize_key(value: str) -> str:
+        """
+        Normalize a lookup value so that equivalent requests share a key.
+        Args:
+            value (str): Raw lookup value, e.g. a meal name.
+        Returns:
+            str: Lower-cased value with collapsed whitespace.
+        """
+        return " ".join(value.lower().split())
+
+    async def run(
+        self,
+        key: str,
+        callable: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        Run the callable once per key, sharing its result with every
+        concurrent caller of the same key.
+        Args:
+            key (str): Coalescing key.
+            callable (Callable): Zero-argument coroutine function returning
+            a JSON-serializable dictionary.
+        Returns:
+            dict: Result of the (possibly shared) call.
+        """
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self.logger.info(f"Joining in-flight call for key: {key}")
+            try:
+                return await asyncio.shield(in_flight)
+            except _LeaderCancelled:
+                self.logger.info(
+                    f"In-flight call cancelled for key: {key}; retrying"
+                )
+                return await self.run(key=key, callable=callable)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await self._run_across_workers(key, callable)
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except BaseException as err:
+            future.set_exception(err)
+            # Mark the exception as retrieved when nobody joined the call.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._in_flight.pop(key, None)
+
+    async def _run_across_workers(
+        self,
+        key: str,
+        callable: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        Elect one leader across workers through a Redis lock. Followers
+        wait briefly on the leader's result key.
+        """
+        if self.cache is None:
+            return await callable()
+
+        result_key = f"single_flight_result_{key}"
+        lock_key = f"single_flight_lock_{key}"
+
+        try:
+            result = self._get_result(result_key)
+            if result is not None:
+                self.logger.info(f"Shared result found for key: {key}")
+                return result
+            lock = self.cache.lock(
+                lock_key,
+                timeout=self._lock_timeout_seconds,
+                blocking=False,
+            )
+            is_leader = lock.acquire()
+        except RedisError as err:
+            self.logger.error(f"Single-flight lock unavailable: {err}")
+            return await callable()
+
+        if is_leader:
+            self.logger.debug(f"Acquired single-flight lock for key: {key}")
+            try:
+                result = await callable()
+                self._set_result(result_key, result)
+                return result
+            finally:
+                try:
+                    lock.release()
+                except (LockError, RedisError) as err:
+                    self.logger.error(
+                        f"Failed to release single-flight lock: {err}"
+                    )
+
+        self.logger.info(f"Waiting for another worker on key: {key}")
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._wait_timeout_seconds
+        while loop.time() < deadline:
+            await asyncio.sleep(self._poll_interval_seconds)
+            try:
+                result = self._get_result(result_key)
+                if result is not None:
+                    self.logger.info(f"Shared result found for key: {key}")
+                    return result
+                if not self.cache.exists(lock_key):
+                    break
+            except RedisError as err:
+                self.logger.error(f"Single-flight poll failed: {err}")
+                break
+
+        self.logger.info(f"No shared result for key: {key}; calling directly")
+        return await callable()
+
+    def _get_result(self, result_key: str) -> Dict[str, Any] | None:
+        cached = self.cache.get(result_key)
+        if not cached:
+            return None
+        return json.loads(cached)
+
+    def _set_result(self, result_key: str, result: Dict[str, Any]) -> None:
+        try:
+            self.cache.set(
+                result_key,
+                json.dumps(result),
+                ex=self._result_ttl_seconds,
+            )
+        except RedisError as err:
+            self.logger.error(f"Failed to share single-flight result: {err}")